@@ -0,0 +1,166 @@
+""" Microbenchmark of the spreadsheet data cleaning (_clean_data).
+"""
+from contextlib import contextmanager
+import copy
+import json
+import os
+import re
+import sys
+import time
+import types
+
+import lotr
+
+
+ITERATIONS = 5
+
+
+class UncompiledPattern:
+    """ Pattern which goes through the re module functions (and their
+    cache) on every call, like the inline patterns did before they were
+    precompiled.
+    """
+
+    def __init__(self, pattern, flags=0):
+        self.pattern = pattern
+        self.flags = flags
+
+    def search(self, string, *args):
+        """ re.search """
+        return re.search(self.pattern, string, self.flags, *args)
+
+    def match(self, string):
+        """ re.match """
+        return re.match(self.pattern, string, self.flags)
+
+    def fullmatch(self, string):
+        """ re.fullmatch """
+        return re.fullmatch(self.pattern, string, self.flags)
+
+    def sub(self, repl, string, count=0):
+        """ re.sub """
+        return re.sub(self.pattern, repl, string, count, self.flags)
+
+    def subn(self, repl, string, count=0):
+        """ re.subn """
+        return re.subn(self.pattern, repl, string, count, self.flags)
+
+    def split(self, string, maxsplit=0):
+        """ re.split """
+        return re.split(self.pattern, string, maxsplit, self.flags)
+
+    def findall(self, string):
+        """ re.findall """
+        return re.findall(self.pattern, string, self.flags)
+
+    def finditer(self, string):
+        """ re.finditer """
+        return re.finditer(self.pattern, string, self.flags)
+
+
+def _uncompile(value):
+    """ Replace compiled patterns in the value with uncompiled ones.
+    """
+    if isinstance(value, re.Pattern):
+        return UncompiledPattern(value.pattern, value.flags)
+
+    if isinstance(value, dict):
+        return {k:_uncompile(v) for k, v in value.items()}
+
+    if isinstance(value, list):
+        return [_uncompile(v) for v in value]
+
+    if isinstance(value, tuple):
+        return tuple(_uncompile(v) for v in value)
+
+    return value
+
+
+@contextmanager
+def uncompiled_patterns():
+    """ Temporarily make lotr.py compile its patterns on every call (the
+    baseline before the precompiled patterns).
+    """
+    saved = {}
+    for name, value in vars(lotr).items():
+        if name.isupper() and (name.endswith(('_RE', '_RES', '_STEPS')) or
+                               name == 'SHADOW_PREFIXES'):
+            saved[name] = value
+
+    saved['get_compiled_regex'] = lotr.get_compiled_regex
+    saved['re'] = lotr.re
+    fake_re = types.ModuleType('re')
+    fake_re.__dict__.update(vars(re))
+    fake_re.compile = UncompiledPattern
+    try:
+        for name, value in saved.items():
+            if name not in {'get_compiled_regex', 're'}:
+                setattr(lotr, name, _uncompile(value))
+
+        lotr.NUMBER_TRANSLATIONS_RES = {}
+        lotr.get_compiled_regex = UncompiledPattern
+        lotr.re = fake_re
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(lotr, name, value)
+
+
+def _run_clean_data(conf, data, lang, iterations):
+    """ Run _clean_data over the sheet several times and return the best
+    time.
+    """
+    timings = []
+    for _ in range(iterations):
+        rows = copy.deepcopy(data)
+        timestamp = time.perf_counter()
+        lotr._clean_data(conf, rows, lang)  # pylint: disable=W0212
+        timings.append(time.perf_counter() - timestamp)
+
+    return min(timings)
+
+
+def benchmark_clean_data(path, lang, iterations):
+    """ Run _clean_data over the sheet several times with precompiled and
+    uncompiled (baseline) patterns and print throughput.
+    """
+    with open(path, 'r', encoding='utf-8') as fobj:
+        data = json.load(fobj)
+
+    data = lotr._transform_to_dict(data)  # pylint: disable=W0212
+    for row in data:
+        row[lotr.CARD_SCRATCH] = None
+
+    values = sum(1 for row in data for value in row.values()
+                 if isinstance(value, str))
+    conf = {'ignore_ignore_flags': False, 'output_languages': [lang]}
+    lotr._extract_all_card_names(data, lang)  # pylint: disable=W0212
+
+    with uncompiled_patterns():
+        baseline = _run_clean_data(conf, data, lang, iterations)
+
+    best = _run_clean_data(conf, data, lang, iterations)
+    print('{}: {} rows, {} values'.format(path, len(data), values))
+    for label, timing in (('baseline (uncompiled)', baseline),
+                          ('precompiled', best)):
+        print('{}, best of {}: {}s ({} rows/s, {} values/s)'.format(
+            label, iterations, round(timing, 3), round(len(data) / timing),
+            round(values / timing)))
+
+    print('speedup: {}x'.format(round(baseline / best, 2)))
+
+
+def main():
+    """ Main function.
+    """
+    path = (sys.argv[1] if len(sys.argv) > 1
+            else os.path.join(lotr.DOWNLOAD_PATH,
+                              '{}.json'.format(lotr.CARD_SHEET)))
+    lang = sys.argv[2] if len(sys.argv) > 2 else lotr.L_ENGLISH
+    iterations = int(sys.argv[3]) if len(sys.argv) > 3 else ITERATIONS
+    benchmark_clean_data(path, lang, iterations)
+
+
+if __name__ == '__main__':
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    main()
@@ -0,0 +1,87 @@
+""" Microbenchmark of card property lookups in the generated set XML files.
+"""
+import glob
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+import lotr
+
+
+ITERATIONS = 5
+PROPERTY_NAMES = ('Type', 'Sphere', 'Encounter Set', 'Artwork', 'Artwork Size',
+                  'Artwork Modified', 'Artist', 'Text', 'PanX', 'PanY',
+                  'Scale', 'Flags', 'Collection Icon',
+                  'Additional Encounter Sets', 'Custom Image_0')
+
+
+def _scan_properties(card):
+    """ Look up the properties with a linear scan per name.
+    """
+    for name in PROPERTY_NAMES:
+        properties = [p for p in card if p.attrib.get('name') == name]
+        if properties:
+            properties[0].attrib.get('value')
+
+
+def _view_properties(card):
+    """ Look up the properties through a single-pass property view.
+    """
+    properties = lotr.CardProperties(card)
+    for name in PROPERTY_NAMES:
+        properties.get(name)
+
+
+def _measure(func, cards, iterations):
+    """ Return the best time of several runs over all cards.
+    """
+    timings = []
+    for _ in range(iterations):
+        timestamp = time.perf_counter()
+        for card in cards:
+            func(card)
+
+        timings.append(time.perf_counter() - timestamp)
+
+    return min(timings)
+
+
+def benchmark_xml_properties(pattern, iterations):
+    """ Compare linear scans with the property view and print throughput.
+    """
+    cards = []
+    paths = sorted(glob.glob(pattern))
+    for path in paths:
+        root = ET.parse(path).getroot()
+        for card in root[0]:
+            cards.append(card)
+            cards.extend(a for a in card if a.attrib.get('type') == 'B')
+
+    if not cards:
+        print('No cards found in {}'.format(pattern))
+        return
+
+    scan = _measure(_scan_properties, cards, iterations)
+    view = _measure(_view_properties, cards, iterations)
+    print('{}: {} file(s), {} card element(s), {} lookups per card'.format(
+        pattern, len(paths), len(cards), len(PROPERTY_NAMES)))
+    print('linear scan, best of {}: {}s ({} cards/s)'.format(
+        iterations, round(scan, 3), round(len(cards) / scan)))
+    print('property view, best of {}: {}s ({} cards/s)'.format(
+        iterations, round(view, 3), round(len(cards) / view)))
+    print('speedup: {}x'.format(round(scan / view, 2)))
+
+
+def main():
+    """ Main function.
+    """
+    pattern = (sys.argv[1] if len(sys.argv) > 1
+               else os.path.join(lotr.SET_EONS_PATH, '*.xml'))
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else ITERATIONS
+    benchmark_xml_properties(pattern, iterations)
+
+
+if __name__ == '__main__':
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    main()
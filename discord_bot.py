@@ -4,6 +4,7 @@
 """
 import asyncio
 import codecs
+from collections import OrderedDict
 import csv
 from datetime import datetime
 from email.header import Header
@@ -13,10 +14,12 @@ import os
 import random
 import re
 import shutil
+import signal
 import sys
 import time
 import uuid
 import xml.etree.ElementTree as ET
+from multiprocessing import Pool
 
 import aiohttp
 import discord
@@ -49,16 +52,17 @@ RCLONE_ART_CMD = "rclone copy '{}' 'ALePCardImages:/'"
 RCLONE_ART_FOLDER_CMD = "rclone lsjson 'ALePCardImages:/{}/'"
 RCLONE_COPY_KEEP_ART_CMD = \
     "rclone copy 'ALePCardImages:/{}/{}/' '{}/{}/{}/'"
-RCLONE_COPY_IMAGE_CMD = "rclone copy 'ALePRenderedImages:/{}/{}' '{}/'"
-RCLONE_COPY_CLOUD_FOLDER_CMD = \
-    "rclone copy 'ALePRenderedImages:/{}/' 'ALePRenderedImages:/{}/'"
-RCLONE_COPY_CLOUD_IMAGE_CMD = \
-    "rclone copy 'ALePRenderedImages:/{}/{}' 'ALePRenderedImages:/{}/'"
+RCLONE_COPY_IMAGES_CMD = \
+    "rclone copy '{}/{}/' '{}/' --files-from-raw '{}' " \
+    "--no-traverse --transfers {}"
+RCLONE_COPY_CLOUD_FOLDER_CMD = "rclone copy '{0}/{1}/' '{0}/{2}/'"
+RCLONE_COPY_CLOUD_IMAGE_CMD = "rclone copy '{0}/{1}/{2}' '{0}/{3}/'"
 RCLONE_GENERATED_CMD = "rclone copy '{}' 'ALePCardImages:/generated/'"
 RCLONE_LOGS_CMD = "rclone copy 'ALePLogs:/' '{}/'"
 RCLONE_MOVE_CLOUD_ART_CMD = \
     "rclone move 'ALePCardImages:/{}/{}' 'ALePCardImages:/{}/'"
-RCLONE_RENDERED_FOLDER_CMD = "rclone lsjson 'ALePRenderedImages:/{}/'"
+RCLONE_RENDERED_FOLDER_CMD = "rclone lsjson '{}/{}/'"
+RCLONE_RENDERED_IMAGES_REMOTE = 'ALePRenderedImages:'
 RCLONE_RENDERER_CMD = './rclone_renderer.sh'
 REMOTE_CRON_TIMESTAMP_CMD = './remote_cron_timestamp.sh "{}"'
 RESTART_BOT_CMD = './restart_discord_bot.sh'
@@ -78,6 +82,7 @@ TEST_CHANNELS_SLEEP_TIME = 14400
 WATCH_CHANGES_SLEEP_TIME = 5
 WATCH_SANITY_CHECK_SLEEP_TIME = 120
 CHECK_USER_CHANGES_SLEEP_TIME = 86400
+LOOP_LAG_SLEEP_TIME = 1
 
 IMAGE_MIN_SIZE = 1024
 ARTWORK_JPG_MIN_SIZE = 250000
@@ -94,6 +99,12 @@ UPDATES_CHANNEL = 'spreadsheet-updates'
 KEEP_FOLDER = '_Keep'
 SCRATCH_FOLDER = '_Scratch'
 
+ANALYSIS_CACHE_MAX_ITEMS = 200
+ANALYSIS_CACHE_MAX_SIZE = 16777216
+ANALYSIS_CONCURRENCY = 2
+ANALYSIS_MAX_TASKS_PER_CHILD = 100
+ANALYSIS_PROCESSES = 2
+ANALYSIS_TIMEOUT = 300
 ARCHIVE_CATEGORY = 'Archive'
 CARD_DECK_SECTION = '_Deck Section'
 CHANNEL_LIMIT = 500
@@ -102,9 +113,12 @@ GENERAL_CATEGORIES = {
     'Rules', 'Voice Channels', 'Archive'
 }
 LOG_LEVEL = logging.INFO
+LOOP_LAG_WARNING = 5
 MAIL_QUOTA = 50
 MAX_PINS = 50
 PREVIEW_URL = 'https://drive.google.com/file/d/{}/preview'
+RCLONE_TRANSFERS = 8
+RENDERED_IMAGES_CACHE_TTL = 86400
 RENDERED_IMAGES_TTL = 600
 
 AI_ARTIST = 'AI'
@@ -247,6 +261,7 @@ List of **!stat** commands:
 **!stat assistants** - display the list of assistants (all Discord users except for those who have a role)
 **!stat channels** - display the number of Discord channels and free channel slots
 **!stat dragncards build** - display information about the latest DragnCards build
+**!stat lag** - display the event loop lag of the bot
 ` `
 **!stat help** - display this help message
 """,
@@ -377,10 +392,11 @@ HELP_STAT_QUESTS = """
 `thr L     ` average player's threat at the end of the play (defeats)
 """
 
+ANALYSIS_CACHE = OrderedDict()
+ANALYSIS_POOL = {}
 CARD_DATA = {}
 CONF = {}
-EXTERNAL_DATA = {}
-EXTERNAL_FILES = set()
+LOOP_LAG = {'count': 0, 'max': 0, 'total': 0}
 RENDERED_IMAGES = {}
 TIMESTAMPS = {}
 
@@ -407,6 +423,8 @@ check_users_changes_lock = asyncio.Lock()
 playtest_lock = asyncio.Lock()
 art_lock = asyncio.Lock()
 generate_lock = asyncio.Lock()
+loop_lag_lock = asyncio.Lock()
+analysis_semaphore = asyncio.Semaphore(ANALYSIS_CONCURRENCY)
 
 
 class CommunicationError(Exception):
@@ -646,6 +664,20 @@ async def read_json_data(path):
     return data
 
 
+def _cache_card_data(data, size, mtime):
+    """ Build lookup indexes of the card data and cache it.
+    """
+    ANALYSIS_CACHE.clear()
+    data['dict'] = {r[lotr.CARD_ID]:r for r in data['data']}
+    data['index'] = build_card_index(data['data'])
+    data['traits'] = set(data['traits'])
+
+    CARD_DATA['cache'] = data
+    CARD_DATA['size'] = size
+    CARD_DATA['mtime'] = mtime
+    return data
+
+
 async def read_card_data():
     """ Read card data generated by the cron job.
     """
@@ -655,12 +687,27 @@ async def read_card_data():
         return CARD_DATA['cache']
 
     data = await read_json_data(lotr.DISCORD_CARD_DATA_PATH)
-    data['dict'] = {r[lotr.CARD_ID]:r for r in data['data']}
+    return _cache_card_data(data, size, mtime)
 
-    CARD_DATA['cache'] = data
-    CARD_DATA['size'] = size
-    CARD_DATA['mtime'] = mtime
-    return data
+
+def read_card_data_sync():
+    """ Read card data generated by the cron job in an analysis worker
+    process.
+    """
+    size = os.path.getsize(lotr.DISCORD_CARD_DATA_PATH)
+    mtime = os.path.getmtime(lotr.DISCORD_CARD_DATA_PATH)
+    if size == CARD_DATA.get('size') and mtime == CARD_DATA.get('mtime'):
+        return CARD_DATA['cache']
+
+    try:
+        with open(lotr.DISCORD_CARD_DATA_PATH, 'r', encoding='utf-8') as obj:
+            data = json.load(obj)
+    except Exception:
+        time.sleep(IO_SLEEP_TIME)
+        with open(lotr.DISCORD_CARD_DATA_PATH, 'r', encoding='utf-8') as obj:
+            data = json.load(obj)
+
+    return _cache_card_data(data, size, mtime)
 
 
 async def load_timestamps_data():
@@ -681,54 +728,86 @@ async def load_timestamps_data():
 def read_external_data():
     """ Read external card data.
     """
-    new_files = set()
-    for _, _, filenames in os.walk(lotr.URL_CACHE_PATH):
-        for filename in filenames:
-            if filename.endswith('.xml.cache'):
-                new_files.add(filename)
-
-        break
+    return lotr.get_external_card_dict()
 
-    new_files = new_files.difference(EXTERNAL_FILES)
-    for new_file in new_files:
-        EXTERNAL_FILES.add(new_file)
-        data = lotr.load_external_xml(re.sub(r'\.xml\.cache$', '', new_file))
-        EXTERNAL_DATA.update({r[lotr.CARD_ID]:r for r in data})
 
-    return EXTERNAL_DATA
+def get_name_keys(name):
+    """ Get all search names matching a normalized card name with their match
+    numbers: 1 for the full name, 2 for its leading words and 3 for any other
+    words.
+    """
+    segments = name.split('-')
+    keys = {name: 1}
+    for i in range(len(segments)):
+        for j in range(i + 1, len(segments) + 1):
+            if i == 0 and j == len(segments):
+                continue
 
+            key = '-'.join(segments[i:j])
+            value = 2 if i == 0 else 3
+            keys[key] = min(value, keys.get(key, value))
 
-def card_match(card_name, card_back_name, search_name):
-    """ Compare a search name with a card name.
-    """
-    if search_name in {card_name, card_back_name}:
-        return 1
+    return keys
 
-    if (card_name.startswith(search_name + '-') or
-            card_back_name.startswith(search_name + '-')):
-        return 2
 
-    if ('-' + search_name + '-' in card_name or
-            '-' + search_name + '-' in card_back_name):
-        return 3
+def build_card_index(cards):
+    """ Build lookup indexes of the card data.
+    """
+    index = {'channel': {}, 'hob_code': {}, 'name': {}, 'row': {}, 'set': {},
+             'set_name': {}}
+    for card in cards:
+        index['channel'].setdefault(
+            card.get(lotr.CARD_DISCORD_CHANNEL, ''), []).append(card)
+        index['hob_code'].setdefault(
+            card.get(lotr.CARD_SET_HOB_CODE, '').lower(), []).append(card)
+        index['row'].setdefault(card[lotr.ROW_COLUMN], []).append(card)
+        index['set'].setdefault(
+            re.sub(r'^alep---', '',
+                   lotr.normalized_name(card[lotr.CARD_SET_NAME])),
+            []).append(card)
+        index['set_name'].setdefault(card[lotr.CARD_SET_NAME],
+                                     []).append(card)
+
+        keys = get_name_keys(card[lotr.CARD_NORMALIZED_NAME])
+        for key, value in get_name_keys(
+                card.get(lotr.BACK_PREFIX + lotr.CARD_NORMALIZED_NAME,
+                         '')).items():
+            keys[key] = min(value, keys.get(key, value))
+
+        for key, value in keys.items():
+            index['name'].setdefault(key, []).append((card, value))
+
+    return index
+
+
+def get_set_cards(data, value, condition=None, set_code=None):
+    """ Get the cards of the set by its name or HoB code.
+    """
+    set_name = re.sub(r'^alep---', '', lotr.normalized_name(value))
+    if set_code is None:
+        set_code = value.lower()
 
-    if (card_name.endswith('-' + search_name) or
-            card_back_name.endswith('-' + search_name)):
-        return 3
+    for cards in (data['index']['set'].get(set_name, []),
+                  data['index']['set'].get('the-{}'.format(set_name), []),
+                  data['index']['hob_code'].get(set_code, [])):
+        matches = [card for card in cards
+                   if condition is None or condition(card)]
+        if matches:
+            return matches
 
-    return 0
+    return []
 
 
 def find_card_matches(data, command, this=False):
     """ Find all card matches and return the match number.
     """
     if this:
-        matches = [(card, 1) for card in data['data']
-                   if card.get(lotr.CARD_DISCORD_CHANNEL, '') == command]
+        matches = [(card, 1) for card
+                   in data['index']['channel'].get(command, [])]
         num = 1
     elif re.match(r'^[0-9]+$', command):
-        matches = [(card, 1) for card in data['data']
-                   if card[lotr.ROW_COLUMN] == int(command)]
+        matches = [(card, 1) for card
+                   in data['index']['row'].get(int(command), [])]
         num = 1
     elif re.match(
             r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
@@ -756,12 +835,7 @@ def find_card_matches(data, command, this=False):
             set_code = None
 
         name = lotr.normalized_name(name)
-        matches = [m for m in [
-            (card, card_match(
-                card[lotr.CARD_NORMALIZED_NAME],
-                card.get(lotr.BACK_PREFIX + lotr.CARD_NORMALIZED_NAME, ''),
-                name))
-            for card in data['data']] if m[1] > 0]
+        matches = list(data['index']['name'].get(name, []))
 
         if set_code:
             matches = [
@@ -1421,27 +1495,107 @@ def clear_rendered_images():
         break
 
 
+def clear_expired_rendered_images():
+    """ Clear local rendered images of the sets not requested for a while.
+    """
+    for set_name in list(RENDERED_IMAGES.keys()):
+        if (time.time() - RENDERED_IMAGES_CACHE_TTL >
+                RENDERED_IMAGES[set_name]['ts']):
+            lotr.delete_folder(os.path.join(IMAGES_PATH,
+                                            lotr.escape_filename(set_name)))
+            del RENDERED_IMAGES[set_name]
+
+
+def get_rendered_images_remote():
+    """ Get the RClone remote (or local folder) with rendered images.
+    """
+    return (CONF.get('rendered_images_remote') or
+            RCLONE_RENDERED_IMAGES_REMOTE).rstrip('/')
+
+
+async def fetch_rendered_images(set_name, filenames):
+    """ Download the missing rendered images for the set in one batch and
+    return the filenames that failed to download.
+    """
+    timestamp = time.time()
+    local_path = os.path.join(IMAGES_PATH, lotr.escape_filename(set_name))
+    missing = [f for f in filenames
+               if not os.path.exists(os.path.join(local_path, f))]
+    if not missing:
+        return []
+
+    lotr.create_folder(local_path)
+    lotr.create_folder(TEMP_PATH)
+    files_path = os.path.join(TEMP_PATH, '{}.txt'.format(uuid.uuid4()))
+    with open(files_path, 'w', encoding='utf-8') as obj:
+        obj.write(''.join('{}\n'.format(f) for f in missing))
+
+    try:
+        stdout, stderr = await run_shell(RCLONE_COPY_IMAGES_CMD.format(
+            get_rendered_images_remote(),
+            lotr.escape_filename('{}.English'.format(set_name)), local_path,
+            files_path, RCLONE_TRANSFERS))
+    finally:
+        os.remove(files_path)
+
+    failed = [f for f in missing
+              if not os.path.exists(os.path.join(local_path, f))]
+    if failed:
+        message = ('RClone failed (rendered images), failed files: {}, '
+                   'stdout: {}, stderr: {}'.format(', '.join(failed),
+                                                   stdout, stderr))
+        logging.error(message)
+        create_mail(ERROR_SUBJECT_TEMPLATE.format(message), message)
+
+    logging.info('Downloaded %s rendered image(s) for set %s (%ss)',
+                 len(missing) - len(failed), set_name,
+                 round(time.time() - timestamp, 3))
+    return failed
+
+
+async def fetch_rendered_card_images(set_name, filenames):
+    """ Download the rendered images and the download time file for the set
+    in one batch and return the filenames that failed to download and the
+    download time.
+    """
+    download_time_file = RENDERED_IMAGES[set_name]['download_time_file']
+    if download_time_file:
+        filenames = filenames + [download_time_file]
+
+    failed = await fetch_rendered_images(set_name, filenames)
+    download_time = None
+    if download_time_file and download_time_file not in failed:
+        local_path = os.path.join(IMAGES_PATH, lotr.escape_filename(set_name))
+        with open(os.path.join(local_path, download_time_file), 'r',
+                  encoding='utf-8') as obj:
+            download_time = obj.read()
+
+    return [f for f in failed if f != download_time_file], download_time
+
+
 async def get_rendered_images(set_name):  # pylint: disable=R0914
-    """ Get rendered images for the set.
+    """ Get the list of rendered images for the set.
     """
+    clear_expired_rendered_images()
+    local_path = os.path.join(IMAGES_PATH, lotr.escape_filename(set_name))
     if set_name not in RENDERED_IMAGES:
         RENDERED_IMAGES[set_name] = {'data': {},
-                                     'download_time': None,
+                                     'download_time_file': None,
+                                     'files': {},
                                      'ts': 0}
+        lotr.clear_folder(local_path)
 
     if (RENDERED_IMAGES[set_name]['data'] and
             time.time() - RENDERED_IMAGES_TTL <=
             RENDERED_IMAGES[set_name]['ts']):
-        return (RENDERED_IMAGES[set_name]['data'],
-                RENDERED_IMAGES[set_name]['download_time'])
+        return RENDERED_IMAGES[set_name]['data']
 
-    local_path = os.path.join(IMAGES_PATH, lotr.escape_filename(set_name))
-    lotr.clear_folder(local_path)
     lotr.create_folder(local_path)
 
     download_time_file = os.path.split(lotr.DOWNLOAD_TIME_PATH)[-1]
     folder = lotr.escape_filename('{}.English'.format(set_name))
-    stdout, stderr = await run_shell(RCLONE_RENDERED_FOLDER_CMD.format(folder))
+    stdout, stderr = await run_shell(RCLONE_RENDERED_FOLDER_CMD.format(
+        get_rendered_images_remote(), folder))
     try:
         items = sorted(json.loads(stdout),
                        key=lambda i: i['Name']
@@ -1457,36 +1611,30 @@ async def get_rendered_images(set_name):  # pylint: disable=R0914
             logging.error(message)
             create_mail(ERROR_SUBJECT_TEMPLATE.format(message), message)
 
-        return {}, None
+        return {}
+
+    files = {i['Name']: (i['Size'], i['ModTime']) for i in items}
+    for filename, value in RENDERED_IMAGES[set_name]['files'].items():
+        file_path = os.path.join(local_path, filename)
+        if files.get(filename) != value and os.path.exists(file_path):
+            os.remove(file_path)
+
+    RENDERED_IMAGES[set_name]['files'] = files
 
     card_data = await read_card_data()
     empty_rules_backs = {
-        row[lotr.CARD_ID] for row in card_data['data']
-        if row[lotr.CARD_SET_NAME] == set_name and
-        row[lotr.CARD_TYPE] == lotr.T_RULES and
+        row[lotr.CARD_ID]
+        for row in card_data['index']['set_name'].get(set_name, [])
+        if row[lotr.CARD_TYPE] == lotr.T_RULES and
         not row.get(lotr.BACK_PREFIX + lotr.CARD_TEXT) and
         not row.get(lotr.BACK_PREFIX + lotr.CARD_VICTORY)}
 
     data = {}
-    download_time = None
+    RENDERED_IMAGES[set_name]['download_time_file'] = None
     for item in items:
         filename = item['Name']
         if filename == download_time_file:
-            file_path = os.path.join(local_path, filename)
-            stdout, stderr = await run_shell(
-                RCLONE_COPY_IMAGE_CMD.format(folder, filename, local_path))
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as obj:
-                    download_time = obj.read()
-            else:
-                if stdout or stderr:
-                    message = ('RClone failed (rendered images), '
-                               'stdout: {}, stderr: {}'
-                               .format(stdout, stderr))
-                    logging.error(message)
-                    create_mail(ERROR_SUBJECT_TEMPLATE.format(message),
-                                message)
-
+            RENDERED_IMAGES[set_name]['download_time_file'] = filename
             continue
 
         if not filename.endswith('.png') or not '----' in filename:
@@ -1501,9 +1649,8 @@ async def get_rendered_images(set_name):  # pylint: disable=R0914
              'modified': item['ModTime'].replace('T', ' ').split('.')[0]})
 
     RENDERED_IMAGES[set_name]['data'] = data
-    RENDERED_IMAGES[set_name]['download_time'] = download_time
     RENDERED_IMAGES[set_name]['ts'] = time.time()
-    return data, download_time
+    return data
 
 
 async def get_attachment_content(message):
@@ -1525,30 +1672,16 @@ async def get_dragncards_player_cards_stat(set_name, start_date, full_data):  #
     """ Get DragnCards player cards statistics for the set.
     """
     data = await read_card_data()
-    set_name = re.sub(r'^alep---', '', lotr.normalized_name(set_name))
-    matches = [card for card in data['data'] if re.sub(
-        r'^alep---', '',
-        lotr.normalized_name(card[lotr.CARD_SET_NAME])) == set_name and
-        card[lotr.CARD_TYPE] in lotr.CARD_TYPES_PLAYER and
-        lotr.F_PROMO not in lotr.extract_flags(card.get(lotr.CARD_FLAGS))]
-
-    if not matches:
-        new_set_name = 'the-{}'.format(set_name)
-        matches = [card for card in data['data'] if re.sub(
-            r'^alep---', '',
-            lotr.normalized_name(card[lotr.CARD_SET_NAME])) == new_set_name and
+    set_code = re.sub(r'^alep---', '',
+                      lotr.normalized_name(set_name)).lower()
+    matches = get_set_cards(
+        data, set_name,
+        lambda card: (
             card[lotr.CARD_TYPE] in lotr.CARD_TYPES_PLAYER and
-            lotr.F_PROMO not in lotr.extract_flags(card.get(lotr.CARD_FLAGS))]
-
+            lotr.F_PROMO not in lotr.extract_flags(card.get(lotr.CARD_FLAGS))),
+        set_code=set_code)
     if not matches:
-        set_code = set_name.lower()
-        matches = [
-            card for card in data['data']
-            if card.get(lotr.CARD_SET_HOB_CODE, '').lower() == set_code and
-            card[lotr.CARD_TYPE] in lotr.CARD_TYPES_PLAYER and
-            lotr.F_PROMO not in lotr.extract_flags(card.get(lotr.CARD_FLAGS))]
-        if not matches:
-            return 'no cards found for the set'
+        return 'no cards found for the set'
 
     set_name = matches[0][lotr.CARD_SET_NAME]
     try:
@@ -1805,32 +1938,31 @@ def detect_names(text, card_type):  # pylint: disable=R0912,R0915
     return names
 
 
-def get_all_names(card_type, all_card_names, all_set_and_quest_names,
-                  all_encounter_set_names):
-    """ Collect all known names that can be mentioned on the card.
+def get_name_index(data, card_type=None):
+    """ Get the index of all known names that can be mentioned on the card
+    of the given type (or only card names), once per card data version.
     """
-    all_names = set(all_card_names)
-    if card_type == lotr.T_RULES:
-        all_names.update(all_set_and_quest_names)
-        all_names.update(
-            ['“{}”'.format(n) for n in all_set_and_quest_names])
-        all_names.update(all_encounter_set_names)
-        all_names.update(lotr.ALLOWED_RULES_NAMES)
-    elif card_type == lotr.T_CAMPAIGN:
-        all_names.update(all_encounter_set_names)
-        all_names.update(lotr.ALLOWED_CAMPAIGN_NAMES)
-    elif card_type == lotr.T_QUEST:
-        all_names.update(all_encounter_set_names)
+    if 'allowed_names' not in data:
+        data['allowed_names'] = lotr.get_allowed_names(
+            data['set_and_quest_names'], data['encounter_set_names'])
 
-    return all_names
+    if card_type not in data['allowed_names']:
+        card_type = None
 
+    indexes = data.setdefault('name_indexes', {})
+    if card_type not in indexes:
+        names = set(data['card_names'])
+        if card_type:
+            names.update(data['allowed_names'][card_type])
 
-def verify_known_name(pos, name, card_type, all_card_names,  # pylint: disable=R0911,R0912,R0913
-                      all_set_and_quest_names, all_encounter_set_names):
+        indexes[card_type] = lotr.NameIndex(names)
+
+    return indexes[card_type]
+
+
+def verify_known_name(pos, name, all_names):  # pylint: disable=R0911,R0912
     """ Check whether the name is known or not.
     """
-    all_names = get_all_names(card_type, all_card_names,
-                              all_set_and_quest_names, all_encounter_set_names)
     if name in all_names:
         return True
 
@@ -1904,8 +2036,7 @@ def get_flavour_errors(text, field, card, res):
         res.setdefault(error, []).append(data)
 
 
-def get_unknown_names(text, field, card, res, all_card_names,  # pylint: disable=R0913
-                      all_set_and_quest_names, all_encounter_set_names):
+def get_unknown_names(text, field, card, res, card_data):
     """ Detect unknown names in the text.
     """
     text = re.sub(r'(^|\n)(?:\[[^\]]+\])*\[i\](?!\[b\]Rumor\[\/b\]|Example:)'
@@ -1915,12 +2046,11 @@ def get_unknown_names(text, field, card, res, all_card_names,  # pylint: disable
     if 'developed by A Long-extended Party' in text:
         return
 
+    all_names = get_name_index(card_data, card[lotr.CARD_TYPE])
     unknown_names = set()
     names = detect_names(text, card[lotr.CARD_TYPE])
     for pos, name in names:
-        if not verify_known_name(pos, name, card[lotr.CARD_TYPE],
-                                 all_card_names, all_set_and_quest_names,
-                                 all_encounter_set_names):
+        if not verify_known_name(pos, name, all_names):
             unknown_names.add(name)
 
     if unknown_names:
@@ -1933,8 +2063,7 @@ def get_unknown_names(text, field, card, res, all_card_names,  # pylint: disable
 
 
 def get_rules_precedents(text, field, card, res, keywords_regex,  # pylint: disable=R0912,R0913,R0914,R0915
-                         all_card_names, all_set_and_quest_names,
-                         all_encounter_set_names, all_traits):
+                         card_data):
     """ Detect text rules precedents.
     """
     text = re.sub(r'(^|\n)(?:\[[^\]]+\])*\[i\](?!\[b\]Rumor\[\/b\]|Example:)'
@@ -1944,14 +2073,15 @@ def get_rules_precedents(text, field, card, res, keywords_regex,  # pylint: disa
     if not paragraphs:
         return
 
-    all_names = get_all_names(card[lotr.CARD_TYPE], all_card_names,
-                              all_set_and_quest_names, all_encounter_set_names)
+    all_names = get_name_index(card_data, card[lotr.CARD_TYPE])
+    card_names = get_name_index(card_data)
 
     for paragraph in paragraphs:
         paragraph = paragraph.replace('\n', ' ')
 
         traits = detect_traits(paragraph)
-        traits = sorted([t for t in traits if t not in all_traits and
+        traits = sorted([t for t in traits
+                         if t not in card_data['traits'] and
                          t not in lotr.COMMON_TRAITS])
         if traits:
             traits_regex = (r'(?<=\[bi\])(' +
@@ -2019,7 +2149,7 @@ def get_rules_precedents(text, field, card, res, keywords_regex,  # pylint: disa
         match = re.search(keywords_regex, value)
         if match:
             similar_names = lotr.get_similar_names_regex(match[0],
-                                                         all_card_names)
+                                                         card_names)
             for similar_name in similar_names:
                 value = re.sub(similar_name, '', value)
 
@@ -2108,10 +2238,7 @@ def get_rules_precedents(text, field, card, res, keywords_regex,  # pylint: disa
         if re.search(
                 r'\b(?:one|two|three|four|five|six|seven|eight|nine|ten)\b',
                 paragraph, flags=re.IGNORECASE):
-            temp_paragraph = paragraph
-            for name in all_names:
-                temp_paragraph = re.sub(lotr.get_regex(name), 'Name',
-                                        temp_paragraph)
+            temp_paragraph = all_names.replace(paragraph, 'Name')
 
             if re.search(
                     r'\b(?:one|two|three|four|five|six|seven|eight|nine|ten)\b',
@@ -2230,6 +2357,426 @@ def get_rules_precedents(text, field, card, res, keywords_regex,  # pylint: disa
                 res.setdefault('Capitalization after a colon', []).append(data)
 
 
+def init_analysis_worker():
+    """ Ignore CTRL+C in the analysis worker process.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _get_analysis_pool():
+    """ Get the pool of analysis worker processes.
+    """
+    if 'pool' not in ANALYSIS_POOL:
+        ANALYSIS_POOL['pool'] = Pool(
+            processes=ANALYSIS_PROCESSES, initializer=init_analysis_worker,
+            maxtasksperchild=ANALYSIS_MAX_TASKS_PER_CHILD)
+        ANALYSIS_POOL['futures'] = set()
+
+    return ANALYSIS_POOL['pool']
+
+
+def _retire_analysis_pool(futures):
+    """ Stop sending analyses to the pool with a timed out analysis.  Its
+    other analyses keep running, and the pool is terminated once they are
+    finished.
+    """
+    if ANALYSIS_POOL.get('futures') is futures:
+        ANALYSIS_POOL.setdefault('retired', []).append(
+            (ANALYSIS_POOL.pop('pool'), ANALYSIS_POOL.pop('futures')))
+
+
+def _terminate_pool(pool):
+    """ Terminate the pool of worker processes and wait for them.
+    """
+    pool.terminate()
+    pool.join()
+
+
+async def _terminate_idle_analysis_pools():
+    """ Terminate the retired pools of analysis worker processes without
+    running analyses.
+    """
+    loop = asyncio.get_running_loop()
+    retired = ANALYSIS_POOL.get('retired', [])
+    for pool, futures in [r for r in retired if not r[1]]:
+        retired.remove((pool, futures))
+        await loop.run_in_executor(None, _terminate_pool, pool)
+
+
+async def run_analysis(func, *args, timeout=ANALYSIS_TIMEOUT):
+    """ Run a CPU-heavy analysis in a worker process without blocking the
+    event loop.
+    """
+    async with analysis_semaphore:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def _set_result(res):
+            if not future.done():
+                future.set_result(res)
+
+        def _set_exception(exc):
+            if not future.done():
+                future.set_exception(exc)
+
+        pool = _get_analysis_pool()
+        futures = ANALYSIS_POOL['futures']
+        futures.add(future)
+        pool.apply_async(
+            func, args,
+            callback=lambda res: loop.call_soon_threadsafe(_set_result, res),
+            error_callback=lambda exc: loop.call_soon_threadsafe(
+                _set_exception, exc))
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError as exc:
+            message = '{} timed out after {} seconds'.format(func.__name__,
+                                                            timeout)
+            logging.error(message)
+            _retire_analysis_pool(futures)
+            raise DiscordError(message) from exc
+        finally:
+            futures.discard(future)
+            await _terminate_idle_analysis_pools()
+
+
+def get_keywords_regex(data):
+    """ Get a regular expression matching all known keywords, once per card
+    data version.
+    """
+    if 'keywords_regex' in data:
+        return data['keywords_regex']
+
+    keywords = [lotr.extract_keywords(
+                    card.get(lotr.CARD_KEYWORDS), card=card)
+                for card in data['data']]
+    keywords.extend(
+        [lotr.extract_keywords(
+            card.get(lotr.BACK_PREFIX + lotr.CARD_KEYWORDS), card=card,
+            back_side=True) for card in data['data']])
+    keywords = [item for sublist in keywords for item in sublist]
+    keywords = {lotr.simplify_keyword(k) for k in keywords}
+    keywords = keywords.union(lotr.COMMON_KEYWORDS)
+    data['keywords_regex'] = (r'(?<!\.) (' +
+                              '|'.join([re.escape(k) for k in keywords]) + r')\b')
+    return data['keywords_regex']
+
+
+def analyze_flavour(value):
+    """ Analyze possible flavour text issues for a set.
+    """
+    data = read_card_data_sync()
+
+    matches = get_set_cards(data, value)
+    if not matches:
+        return 'no cards found for the set'
+
+    matches.sort(key=lambda card: card[lotr.ROW_COLUMN])
+    res = {}
+    for card in matches:
+        if card.get(lotr.CARD_FLAVOUR) is not None:
+            get_flavour_errors(
+                card[lotr.CARD_FLAVOUR], lotr.CARD_FLAVOUR, card, res)
+
+        if card.get(lotr.BACK_PREFIX + lotr.CARD_FLAVOUR) is not None:
+            get_flavour_errors(
+                card[lotr.BACK_PREFIX + lotr.CARD_FLAVOUR],
+                     lotr.BACK_PREFIX + lotr.CARD_FLAVOUR, card, res)
+
+    output = []
+    for rule, card_list in res.items():
+        rule_output = (
+            '\\_\\_\\_\\_\\_\\_\\_\\_\\_\\_\n**{}**:\n'
+            '\\_\\_\\_\\_\\_\\_\\_\\_\\_\\_'.format(rule))
+        for card_data in card_list:
+            row_url = '<{}&range=A{}>'.format(data['url'],
+                                              card_data['row'])
+            rule_output += '\n` `\n*{}* (**{}**):\n{}\n{}'.format(
+                card_data['name'], card_data['field'].replace('_', ' '),
+                card_data['text'], row_url)
+
+        output.append(rule_output)
+
+    output = '\n` `\n'.join(sorted(output))
+    if output:
+        output = '{}\n` `\nDone.'.format(output)
+    else:
+        output = 'no flavour text issues found'
+
+    return output
+
+
+def analyze_names(value):
+    """ Analyze potentially unknown or misspelled names for a set.
+    """
+    data = read_card_data_sync()
+
+    matches = get_set_cards(
+        data, value,
+        lambda card: (card[lotr.CARD_TYPE] != lotr.T_PRESENTATION and
+                      card.get(lotr.CARD_SPHERE) != lotr.S_BACK))
+    if not matches:
+        return 'no cards found for the set'
+
+    matches.sort(key=lambda card: card[lotr.ROW_COLUMN])
+    res = {}
+    for card in matches:
+        if card.get(lotr.CARD_TEXT) is not None:
+            get_unknown_names(
+                card[lotr.CARD_TEXT], lotr.CARD_TEXT, card, res, data)
+
+        if card.get(lotr.BACK_PREFIX + lotr.CARD_TEXT) is not None:
+            get_unknown_names(
+                card[lotr.BACK_PREFIX + lotr.CARD_TEXT],
+                lotr.BACK_PREFIX + lotr.CARD_TEXT, card, res, data)
+
+        if card.get(lotr.CARD_SHADOW) is not None:
+            get_unknown_names(
+                card[lotr.CARD_SHADOW], lotr.CARD_SHADOW, card, res, data)
+
+        if card.get(lotr.BACK_PREFIX + lotr.CARD_SHADOW) is not None:
+            get_unknown_names(
+                card[lotr.BACK_PREFIX + lotr.CARD_SHADOW],
+                lotr.BACK_PREFIX + lotr.CARD_SHADOW, card, res, data)
+
+    output = []
+    for rule, card_list in res.items():
+        rule_output = (
+            '\\_\\_\\_\\_\\_\\_\\_\\_\\_\\_\n**{}**:\n'
+            '\\_\\_\\_\\_\\_\\_\\_\\_\\_\\_'.format(rule))
+        for card_data in card_list:
+            row_url = '<{}&range=A{}>'.format(data['url'],
+                                              card_data['row'])
+            rule_output += '\n` `\n*{}* (**{}**):\n{}\n{}'.format(
+                card_data['name'], card_data['field'].replace('_', ' '),
+                card_data['text'], row_url)
+
+        output.append(rule_output)
+
+    output = '\n` `\n'.join(sorted(output))
+    if output:
+        output = '{}\n` `\nDone.'.format(output)
+    else:
+        output = 'no unknown names found'
+
+    return output
+
+
+def analyze_text(value):  # pylint: disable=R0912,R0914
+    """ Analyze text that may be a subject of editing rules for a set.
+    """
+    data = read_card_data_sync()
+
+    matches = get_set_cards(
+        data, value,
+        lambda card: (card[lotr.CARD_TYPE] != lotr.T_PRESENTATION and
+                      card.get(lotr.CARD_SPHERE) != lotr.S_BACK))
+    if not matches:
+        return 'no cards found for the set'
+
+    keywords_regex = get_keywords_regex(data)
+
+    matches.sort(key=lambda card: card[lotr.ROW_COLUMN])
+    res = {}
+    for card in matches:
+        if (card.get(lotr.CARD_NAME) is not None and
+                card.get(lotr.BACK_PREFIX + lotr.CARD_NAME)
+                    is not None and
+                card[lotr.CARD_NAME] !=
+                    card[lotr.BACK_PREFIX + lotr.CARD_NAME]):
+            precedent = {'name': card[lotr.CARD_NAME],
+                         'field': lotr.BACK_PREFIX + lotr.CARD_NAME,
+                         'text': '__**{}**__ (instead of *{}*)'.format(
+                             card[lotr.BACK_PREFIX + lotr.CARD_NAME],
+                             card[lotr.CARD_NAME]),
+                         'row': card[lotr.ROW_COLUMN]}
+            res.setdefault('Different card names on each side',
+                           []).append(precedent)
+
+        if card.get(lotr.CARD_TEXT) is not None:
+            get_rules_precedents(
+                card[lotr.CARD_TEXT], lotr.CARD_TEXT, card, res,
+                keywords_regex, data)
+
+        if card.get(lotr.BACK_PREFIX + lotr.CARD_TEXT) is not None:
+            get_rules_precedents(
+                card[lotr.BACK_PREFIX + lotr.CARD_TEXT],
+                lotr.BACK_PREFIX + lotr.CARD_TEXT, card, res,
+                keywords_regex, data)
+
+        if card.get(lotr.CARD_SHADOW) is not None:
+            get_rules_precedents(
+                card[lotr.CARD_SHADOW], lotr.CARD_SHADOW, card, res,
+                keywords_regex, data)
+
+        if card.get(lotr.BACK_PREFIX + lotr.CARD_SHADOW) is not None:
+            get_rules_precedents(
+                card[lotr.BACK_PREFIX + lotr.CARD_SHADOW],
+                lotr.BACK_PREFIX + lotr.CARD_SHADOW, card, res,
+                keywords_regex, data)
+
+    output = []
+    for rule, card_list in res.items():
+        rule_output = (
+            '\\_\\_\\_\\_\\_\\_\\_\\_\\_\\_\n**{}**:\n'
+            '\\_\\_\\_\\_\\_\\_\\_\\_\\_\\_'.format(rule))
+        for card_data in card_list:
+            row_url = '<{}&range=A{}>'.format(data['url'],
+                                              card_data['row'])
+            rule_output += '\n` `\n*{}* (**{}**):\n{}\n{}'.format(
+                card_data['name'], card_data['field'].replace('_', ' '),
+                card_data['text'], row_url)
+
+        output.append(rule_output)
+
+    output = '\n` `\n'.join(sorted(output))
+    if output:
+        output = '{}\n` `\nDone.'.format(output)
+    else:
+        output = 'no text rules precedents found'
+
+    return output
+
+
+def analyze_traits(value):  # pylint: disable=R0912,R0914
+    """ Analyze possible trait issues for a set.
+    """
+    data = read_card_data_sync()
+
+    matches = get_set_cards(data, value)
+    if not matches:
+        return 'no cards found for the set'
+
+    matches.sort(key=lambda card: card[lotr.ROW_COLUMN])
+    res = {}
+    for card in matches:
+        if card.get(lotr.CARD_TRAITS) is not None:
+            traits = lotr.extract_traits(card[lotr.CARD_TRAITS])
+            unknown_traits = sorted(
+                [t for t in traits if t not in lotr.COMMON_TRAITS])
+            if unknown_traits:
+                precedent = {
+                    'name': card[lotr.CARD_NAME],
+                    'field': lotr.CARD_TRAITS,
+                    'text': '__**{}**__ in *{}*'.format(
+                        ' '.join(['{}.'.format(t)
+                                  for t in unknown_traits]),
+                        re.sub(r'\[[^\]]+\]', '', card[lotr.CARD_TRAITS])),
+                    'row': card[lotr.ROW_COLUMN]}
+                res.setdefault('Unknown traits', []).append(precedent)
+            else:
+                test = lotr.verify_traits_order(
+                    re.sub(r'\[[^\]]+\]', '', card[lotr.CARD_TRAITS]))
+                if not test[0]:
+                    precedent = {
+                        'name': card[lotr.CARD_NAME],
+                        'field': lotr.CARD_TRAITS,
+                        'text': '__**{}**__ (instead of *{}*)'.format(
+                            re.sub(r'\[[^\]]+\]', '',
+                                   card[lotr.CARD_TRAITS]), test[1]),
+                        'row': card[lotr.ROW_COLUMN]}
+                    res.setdefault('Potentially incorrect order of traits',
+                                   []).append(precedent)
+
+        if card.get(lotr.BACK_PREFIX + lotr.CARD_TRAITS) is not None:
+            traits = lotr.extract_traits(
+                card[lotr.BACK_PREFIX + lotr.CARD_TRAITS])
+            unknown_traits = sorted(
+                [t for t in traits if t not in lotr.COMMON_TRAITS])
+            if unknown_traits:
+                precedent = {
+                    'name': card[lotr.CARD_NAME],
+                    'field': lotr.BACK_PREFIX + lotr.CARD_TRAITS,
+                    'text': '__**{}**__ in *{}*'.format(
+                        ' '.join(['{}.'.format(t)
+                                  for t in unknown_traits]),
+                        re.sub(r'\[[^\]]+\]', '',
+                               card[lotr.BACK_PREFIX + lotr.CARD_TRAITS])),
+                    'row': card[lotr.ROW_COLUMN]}
+                res.setdefault('Unknown traits', []).append(precedent)
+            else:
+                test = lotr.verify_traits_order(
+                    re.sub(r'\[[^\]]+\]', '',
+                           card[lotr.BACK_PREFIX + lotr.CARD_TRAITS]))
+                if not test[0]:
+                    precedent = {
+                        'name': card[lotr.CARD_NAME],
+                        'field': lotr.BACK_PREFIX + lotr.CARD_TRAITS,
+                        'text': '__**{}**__ (instead of *{}*)'.format(
+                            re.sub(r'\[[^\]]+\]', '',
+                                   card[lotr.BACK_PREFIX +
+                                        lotr.CARD_TRAITS]),
+                            test[1]),
+                        'row': card[lotr.ROW_COLUMN]}
+                    res.setdefault('Potentially incorrect order of traits',
+                                   []).append(precedent)
+
+    output = []
+    for rule, card_list in res.items():
+        rule_output = (
+            '\\_\\_\\_\\_\\_\\_\\_\\_\\_\\_\n**{}**:\n'
+            '\\_\\_\\_\\_\\_\\_\\_\\_\\_\\_'.format(rule))
+        for card_data in card_list:
+            row_url = '<{}&range=A{}>'.format(data['url'],
+                                              card_data['row'])
+            rule_output += '\n` `\n*{}* (**{}**):\n{}\n{}'.format(
+                card_data['name'], card_data['field'].replace('_', ' '),
+                card_data['text'], row_url)
+
+        output.append(rule_output)
+
+    output = '\n` `\n'.join(sorted(output))
+    if output:
+        output = '{}\n` `\nDone.'.format(output)
+    else:
+        output = 'no trait issues found'
+
+    return output
+
+
+def _get_cached_analysis(key):
+    """ Get the analysis result from the cache.
+    """
+    if key not in ANALYSIS_CACHE:
+        return None
+
+    ANALYSIS_CACHE.move_to_end(key)
+    return ANALYSIS_CACHE[key]
+
+
+def _cache_analysis(key, res):
+    """ Save the analysis result to the cache and evict the least recently
+    used results above the limits.
+    """
+    ANALYSIS_CACHE[key] = res
+    ANALYSIS_CACHE.move_to_end(key)
+    size = sum(len(value) for value in ANALYSIS_CACHE.values())
+    while (len(ANALYSIS_CACHE) > ANALYSIS_CACHE_MAX_ITEMS or
+           size > ANALYSIS_CACHE_MAX_SIZE) and len(ANALYSIS_CACHE) > 1:
+        _, value = ANALYSIS_CACHE.popitem(last=False)
+        size -= len(value)
+
+
+async def get_set_analysis(func, value):
+    """ Get the analysis of the set from the cache or run it.  The result is
+    cached by the set ID, so the set name and its HoB code share it.
+    """
+    data = await read_card_data()
+    version = (CARD_DATA['size'], CARD_DATA['mtime'])
+    set_ids = tuple(sorted({card[lotr.CARD_SET] for card
+                            in get_set_cards(data, value)}))
+    key = (func.__name__, set_ids or value.strip().lower()) + version
+    res = _get_cached_analysis(key)
+    if res is not None:
+        return res
+
+    res = await run_analysis(func, value)
+    if (CARD_DATA['size'], CARD_DATA['mtime']) == version:
+        _cache_analysis(key, res)
+
+    return res
+
+
 class MyClient(discord.Client):  # pylint: disable=R0902
     """ My bot class.
     """
@@ -2240,6 +2787,7 @@ class MyClient(discord.Client):  # pylint: disable=R0902
     remote_cron_timestamp_schedule_id = None
     watch_sanity_check_schedule_id = None
     check_users_changes_schedule_id = None
+    loop_lag_schedule_id = None
     archive_category = None
     cron_channel = None
     notifications_channel = None
@@ -2346,6 +2894,7 @@ class MyClient(discord.Client):  # pylint: disable=R0902
         self.loop.create_task(self._remote_cron_timestamp_schedule())
         self.loop.create_task(self._watch_sanity_check_schedule())
         self.loop.create_task(self._check_users_changes_schedule())
+        self.loop.create_task(self._loop_lag_schedule())
         read_external_data()
         await read_card_data()
         await load_timestamps_data()
@@ -2542,6 +3091,33 @@ class MyClient(discord.Client):  # pylint: disable=R0902
             await asyncio.sleep(CHECK_USER_CHANGES_SLEEP_TIME)
 
 
+    async def _loop_lag_schedule(self):
+        logging.info('Starting loop lag schedule...')
+        my_id = incremental_id()
+        while True:
+            async with loop_lag_lock:
+                if (not self.loop_lag_schedule_id or
+                        self.loop_lag_schedule_id < my_id):
+                    self.loop_lag_schedule_id = my_id
+                    logging.info('Acquiring loop lag schedule id: %s', my_id)
+                elif self.loop_lag_schedule_id > my_id:
+                    logging.info(
+                        'Detected a new loop lag schedule id: %s, '
+                        'exiting with the old id: %s',
+                        self.loop_lag_schedule_id, my_id)
+                    break
+
+            timestamp = time.monotonic()
+            await asyncio.sleep(LOOP_LAG_SLEEP_TIME)
+            lag = max(time.monotonic() - timestamp - LOOP_LAG_SLEEP_TIME, 0)
+            LOOP_LAG['count'] += 1
+            LOOP_LAG['total'] += lag
+            LOOP_LAG['max'] = max(LOOP_LAG['max'], lag)
+            if lag > LOOP_LAG_WARNING:
+                logging.warning('Event loop was blocked for %ss',
+                                round(lag, 3))
+
+
     async def _test_channels(self):
         self.categories, self.channels, self.general_channels = (
             await self._load_channels())
@@ -2604,11 +3180,13 @@ class MyClient(discord.Client):  # pylint: disable=R0902
 
                 logging.info('Processing files: %s', filenames)
                 await load_timestamps_data()
+                card_ids = set()
                 for filename in filenames:
                     path = os.path.join(CHANGES_PATH, filename)
                     try:
                         data = await read_json_data(path)
                         logging.info('Processing changes: %s', data)
+                        card_ids.update(data['card_ids'])
                         for card_id in data['card_ids']:
                             TIMESTAMPS['data'][card_id] = data['utc_time']
 
@@ -2645,6 +3223,10 @@ class MyClient(discord.Client):  # pylint: disable=R0902
                     else:
                         os.remove(path)
 
+                if card_ids:
+                    self.loop.create_task(
+                        self._warm_analysis_cache(card_ids))
+
                 break
         except Exception as exc:
             message = ('Unexpected error during watching for changes: {}: {}'
@@ -2653,6 +3235,26 @@ class MyClient(discord.Client):  # pylint: disable=R0902
             create_mail(ERROR_SUBJECT_TEMPLATE.format(message), message)
 
 
+    async def _warm_analysis_cache(self, card_ids):
+        """ Pre-warm the analysis cache for the recently edited sets.
+        """
+        try:
+            data = await read_card_data()
+            values = {}
+            for card_id in card_ids:
+                card = data['dict'].get(card_id)
+                if card:
+                    values[card[lotr.CARD_SET]] = card[lotr.CARD_SET_NAME]
+
+            for value in sorted(values.values()):
+                for func in (analyze_flavour, analyze_names, analyze_text,
+                             analyze_traits):
+                    await get_set_analysis(func, value)
+        except Exception as exc:
+            logging.exception('Error pre-warming the analysis cache: %s',
+                              str(exc))
+
+
     async def _rclone_art(self):
         if not self.rclone_art:
             return
@@ -3170,8 +3772,9 @@ Card "{}" has been updated:
             new_folder_name = lotr.escape_filename(
                 '{}.English'.format(new_set_name))
             stdout, stderr = await run_shell(
-                RCLONE_COPY_CLOUD_FOLDER_CMD.format(old_folder_name,
-                                                    new_folder_name))
+                RCLONE_COPY_CLOUD_FOLDER_CMD.format(
+                    get_rendered_images_remote(), old_folder_name,
+                    new_folder_name))
             if (stdout or stderr) and 'directory not found' not in stderr:
                 message = ('RClone failed (set names), stdout: {}, '
                            'stderr: {}'.format(stdout, stderr))
@@ -3778,7 +4381,8 @@ Targets removed.
                             cards = await read_deck_xml(
                                 os.path.join(path, filename))
                             if cards:
-                                quests[quest_name] = get_quest_stat(cards)
+                                quests[quest_name] = await run_analysis(
+                                    get_quest_stat, cards)
 
                     break
 
@@ -3966,6 +4570,16 @@ Targets removed.
                     'unexpected error: {}'.format(str(exc)))
                 return
 
+            await self._send_channel(message.channel, res)
+        elif command.lower() == 'lag':
+            if LOOP_LAG['count']:
+                res = ('Event loop lag: {}ms on average, {}ms at most '
+                       '({} measurements)'.format(
+                           round(LOOP_LAG['total'] / LOOP_LAG['count'] * 1000),
+                           round(LOOP_LAG['max'] * 1000), LOOP_LAG['count']))
+            else:
+                res = 'no event loop lag measurements yet'
+
             await self._send_channel(message.channel, res)
         elif command.lower() == 'assistants':
             try:
@@ -4735,7 +5349,8 @@ Targets removed.
         """ Get the list of rendered images for the set.
         """
         stdout, stderr = await run_shell(
-            RCLONE_RENDERED_FOLDER_CMD.format(set_folder))
+            RCLONE_RENDERED_FOLDER_CMD.format(get_rendered_images_remote(),
+                                              set_folder))
         try:
             filenames = [f['Name'] for f in json.loads(stdout)]
         except Exception as exc:
@@ -4796,7 +5411,8 @@ Targets removed.
 
             stdout, stderr = await run_shell(
                 RCLONE_COPY_CLOUD_IMAGE_CMD.format(
-                    old_set_folder, filename, new_set_folder))
+                    get_rendered_images_remote(), old_set_folder, filename,
+                    new_set_folder))
             if stdout or stderr:
                 message = ('RClone failed (rendered images), stdout: {}, '
                            'stderr: {}'.format(stdout, stderr))
@@ -4810,30 +5426,12 @@ Targets removed.
         """
         data = await read_card_data()
 
-        set_name = re.sub(r'^alep---', '', lotr.normalized_name(value))
-        matches = [card for card in data['data'] if re.sub(
-            r'^alep---', '',
-            lotr.normalized_name(card[lotr.CARD_SET_NAME])) == set_name and
-            card[lotr.CARD_TYPE] not in {lotr.T_PRESENTATION, lotr.T_RULES}]
-
-        if not matches:
-            new_set_name = 'the-{}'.format(set_name)
-            matches = [card for card in data['data'] if re.sub(
-                r'^alep---', '',
-                lotr.normalized_name(
-                    card[lotr.CARD_SET_NAME])) == new_set_name and
-                card[lotr.CARD_TYPE] not in {
-                    lotr.T_PRESENTATION, lotr.T_RULES}]
-
+        matches = get_set_cards(
+            data, value,
+            lambda card: card[lotr.CARD_TYPE] not in {
+                lotr.T_PRESENTATION, lotr.T_RULES})
         if not matches:
-            set_code = value.lower()
-            matches = [
-                card for card in data['data']
-                if card.get(lotr.CARD_SET_HOB_CODE, '').lower() == set_code and
-                card[lotr.CARD_TYPE] not in {
-                    lotr.T_PRESENTATION, lotr.T_RULES}]
-            if not matches:
-                return 'no cards found for the set'
+            return 'no cards found for the set'
 
         matches.sort(key=lambda card: card[lotr.ROW_COLUMN])
         filenames = await self._get_artwork_files(matches[0][lotr.CARD_SET],
@@ -4945,28 +5543,12 @@ Targets removed.
         """
         data = await read_card_data()
 
-        set_name = re.sub(r'^alep---', '', lotr.normalized_name(value))
-        matches = [card for card in data['data'] if re.sub(
-            r'^alep---', '',
-            lotr.normalized_name(card[lotr.CARD_SET_NAME])) == set_name and
-            card[lotr.CARD_TYPE] not in {lotr.T_PRESENTATION, lotr.T_RULES}]
-        if not matches:
-            new_set_name = 'the-{}'.format(set_name)
-            matches = [card for card in data['data'] if re.sub(
-                r'^alep---', '',
-                lotr.normalized_name(card[lotr.CARD_SET_NAME])) == new_set_name
-                and card[lotr.CARD_TYPE] not in {
-                    lotr.T_PRESENTATION, lotr.T_RULES}]
-
+        matches = get_set_cards(
+            data, value,
+            lambda card: card[lotr.CARD_TYPE] not in {
+                lotr.T_PRESENTATION, lotr.T_RULES})
         if not matches:
-            set_code = value.lower()
-            matches = [
-                card for card in data['data']
-                if card.get(lotr.CARD_SET_HOB_CODE, '').lower() == set_code and
-                card[lotr.CARD_TYPE] not in {
-                    lotr.T_PRESENTATION, lotr.T_RULES}]
-            if not matches:
-                return 'no cards found for the set'
+            return 'no cards found for the set'
 
         matches.sort(key=lambda card: (card[lotr.ROW_COLUMN]))
         filenames = await self._get_artwork_files(matches[0][lotr.CARD_SET])
@@ -5246,34 +5828,22 @@ Targets removed.
         """
         data = await read_card_data()
 
-        set_name = re.sub(r'^alep---', '', lotr.normalized_name(value))
-        matches = [card for card in data['data'] if re.sub(
-            r'^alep---', '',
-            lotr.normalized_name(card[lotr.CARD_SET_NAME])) == set_name]
-
-        if not matches:
-            new_set_name = 'the-{}'.format(set_name)
-            matches = [card for card in data['data'] if re.sub(
-                r'^alep---', '',
-                lotr.normalized_name(card[lotr.CARD_SET_NAME])) ==
-                new_set_name]
-
+        matches = get_set_cards(data, value)
         if not matches:
-            set_code = value.lower()
-            matches = [
-                card for card in data['data']
-                if card.get(lotr.CARD_SET_HOB_CODE, '').lower() == set_code]
-
-            if not matches:
-                return 'no cards found for the set'
+            return 'no cards found for the set'
 
         set_name = matches[0][lotr.CARD_SET_NAME]
-        images, download_time = await get_rendered_images(set_name)
+        images = await get_rendered_images(set_name)
         if not images:
             return 'no rendered images found for the set'
 
         await load_timestamps_data()
         local_path = os.path.join(IMAGES_PATH, lotr.escape_filename(set_name))
+        failed, download_time = await fetch_rendered_card_images(
+            set_name,
+            [image['filename'] for card in matches
+             for image in images.get(card[lotr.CARD_ID], [])])
+        failed = set(failed)
         for card in matches:
             if card[lotr.CARD_ID] not in images:
                 continue
@@ -5298,24 +5868,10 @@ Targets removed.
             for image in images[card[lotr.CARD_ID]]:
                 image_path = os.path.join(local_path, image['filename'])
                 modified_times.append(image['modified'])
-                if not os.path.exists(image_path):
-                    stdout, stderr = await run_shell(
-                        RCLONE_COPY_IMAGE_CMD.format(
-                            lotr.escape_filename('{}.English'.format(set_name)),
-                            image['filename'], local_path))
-                    if not os.path.exists(image_path):
-                        if stdout or stderr:
-                            message = ('RClone failed (rendered images), '
-                                       'stdout: {}, stderr: {}'
-                                       .format(stdout, stderr))
-                            logging.error(message)
-                            create_mail(ERROR_SUBJECT_TEMPLATE.format(message),
-                                        message)
-
-                        await self._send_channel(
-                            channel,
-                            "Can't download the image from Google Drive")
-                        continue
+                if image['filename'] in failed:
+                    await self._send_channel(
+                        channel, "Can't download the image from Google Drive")
+                    continue
 
                 await channel.send(file=discord.File(image_path))
 
@@ -5345,7 +5901,7 @@ Targets removed.
 
         card = matches[num - 1][0]
         set_name = card[lotr.CARD_SET_NAME]
-        images, download_time = await get_rendered_images(set_name)
+        images = await get_rendered_images(set_name)
         if not images or card[lotr.CARD_ID] not in images:
             if channel.name == 'general':
                 return ('no rendered images found for the card {}'
@@ -5355,26 +5911,16 @@ Targets removed.
 
         await load_timestamps_data()
         local_path = os.path.join(IMAGES_PATH, lotr.escape_filename(set_name))
+        failed, download_time = await fetch_rendered_card_images(
+            set_name,
+            [image['filename'] for image in images[card[lotr.CARD_ID]]])
+        if failed:
+            return "Can't download the image from Google Drive"
+
         modified_times = []
         for image in images[card[lotr.CARD_ID]]:
             image_path = os.path.join(local_path, image['filename'])
             modified_times.append(image['modified'])
-            if not os.path.exists(image_path):
-                stdout, stderr = await run_shell(RCLONE_COPY_IMAGE_CMD.format(
-                    lotr.escape_filename('{}.English'.format(set_name)),
-                    image['filename'], local_path))
-
-                if not os.path.exists(image_path):
-                    if stdout or stderr:
-                        message = ('RClone failed (rendered images), '
-                                   'stdout: {}, stderr: {}'
-                                   .format(stdout, stderr))
-                        logging.error(message)
-                        create_mail(ERROR_SUBJECT_TEMPLATE.format(message),
-                                    message)
-
-                    return "Can't download the image from Google Drive"
-
             await channel.send(file=discord.File(image_path))
 
         modified_time = download_time or max(modified_times)
@@ -5478,143 +6024,13 @@ Targets removed.
     async def _display_flavour(self, value):
         """ Display possible flavour text issues for a set.
         """
-        data = await read_card_data()
-
-        set_name = re.sub(r'^alep---', '', lotr.normalized_name(value))
-        matches = [card for card in data['data'] if re.sub(
-            r'^alep---', '',
-            lotr.normalized_name(card[lotr.CARD_SET_NAME])) == set_name]
-
-        if not matches:
-            new_set_name = 'the-{}'.format(set_name)
-            matches = [card for card in data['data'] if re.sub(
-                r'^alep---', '',
-                lotr.normalized_name(card[lotr.CARD_SET_NAME])) ==
-                new_set_name]
-
-        if not matches:
-            set_code = value.lower()
-            matches = [
-                card for card in data['data']
-                if card.get(lotr.CARD_SET_HOB_CODE, '').lower() == set_code]
-            if not matches:
-                return 'no cards found for the set'
-
-        matches.sort(key=lambda card: card[lotr.ROW_COLUMN])
-        res = {}
-        for card in matches:
-            if card.get(lotr.CARD_FLAVOUR) is not None:
-                get_flavour_errors(
-                    card[lotr.CARD_FLAVOUR], lotr.CARD_FLAVOUR, card, res)
-
-            if card.get(lotr.BACK_PREFIX + lotr.CARD_FLAVOUR) is not None:
-                get_flavour_errors(
-                    card[lotr.BACK_PREFIX + lotr.CARD_FLAVOUR],
-                         lotr.BACK_PREFIX + lotr.CARD_FLAVOUR, card, res)
-
-        output = []
-        for rule, card_list in res.items():
-            rule_output = (
-                '\\_\\_\\_\\_\\_\\_\\_\\_\\_\\_\n**{}**:\n'
-                '\\_\\_\\_\\_\\_\\_\\_\\_\\_\\_'.format(rule))
-            for card_data in card_list:
-                row_url = '<{}&range=A{}>'.format(data['url'],
-                                                  card_data['row'])
-                rule_output += '\n` `\n*{}* (**{}**):\n{}\n{}'.format(
-                    card_data['name'], card_data['field'].replace('_', ' '),
-                    card_data['text'], row_url)
-
-            output.append(rule_output)
-
-        output = '\n` `\n'.join(sorted(output))
-        if output:
-            output = '{}\n` `\nDone.'.format(output)
-        else:
-            output = 'no flavour text issues found'
-
-        return output
+        return await get_set_analysis(analyze_flavour, value)
 
 
     async def _display_names(self, value):
         """ Display potentially unknown or misspelled names for a set.
         """
-        data = await read_card_data()
-
-        set_name = re.sub(r'^alep---', '', lotr.normalized_name(value))
-        matches = [card for card in data['data'] if re.sub(
-            r'^alep---', '',
-            lotr.normalized_name(card[lotr.CARD_SET_NAME])) == set_name and
-            card[lotr.CARD_TYPE] != lotr.T_PRESENTATION and
-            card.get(lotr.CARD_SPHERE) != lotr.S_BACK]
-
-        if not matches:
-            new_set_name = 'the-{}'.format(set_name)
-            matches = [card for card in data['data'] if re.sub(
-                r'^alep---', '',
-                lotr.normalized_name(card[lotr.CARD_SET_NAME])) == new_set_name
-                and card[lotr.CARD_TYPE] != lotr.T_PRESENTATION
-                and card.get(lotr.CARD_SPHERE) != lotr.S_BACK]
-
-        if not matches:
-            set_code = value.lower()
-            matches = [
-                card for card in data['data']
-                if card.get(lotr.CARD_SET_HOB_CODE, '').lower() == set_code and
-                card[lotr.CARD_TYPE] != lotr.T_PRESENTATION and
-                card.get(lotr.CARD_SPHERE) != lotr.S_BACK]
-            if not matches:
-                return 'no cards found for the set'
-
-        matches.sort(key=lambda card: card[lotr.ROW_COLUMN])
-        res = {}
-        for card in matches:
-            if card.get(lotr.CARD_TEXT) is not None:
-                get_unknown_names(
-                    card[lotr.CARD_TEXT], lotr.CARD_TEXT, card, res,
-                    data['card_names'], data['set_and_quest_names'],
-                    data['encounter_set_names'])
-
-            if card.get(lotr.BACK_PREFIX + lotr.CARD_TEXT) is not None:
-                get_unknown_names(
-                    card[lotr.BACK_PREFIX + lotr.CARD_TEXT],
-                         lotr.BACK_PREFIX + lotr.CARD_TEXT, card, res,
-                         data['card_names'], data['set_and_quest_names'],
-                         data['encounter_set_names'])
-
-            if card.get(lotr.CARD_SHADOW) is not None:
-                get_unknown_names(
-                    card[lotr.CARD_SHADOW], lotr.CARD_SHADOW, card, res,
-                    data['card_names'], data['set_and_quest_names'],
-                    data['encounter_set_names'])
-
-            if card.get(lotr.BACK_PREFIX + lotr.CARD_SHADOW) is not None:
-                get_unknown_names(
-                    card[lotr.BACK_PREFIX + lotr.CARD_SHADOW],
-                         lotr.BACK_PREFIX + lotr.CARD_SHADOW, card, res,
-                         data['card_names'], data['set_and_quest_names'],
-                         data['encounter_set_names'])
-
-        output = []
-        for rule, card_list in res.items():
-            rule_output = (
-                '\\_\\_\\_\\_\\_\\_\\_\\_\\_\\_\n**{}**:\n'
-                '\\_\\_\\_\\_\\_\\_\\_\\_\\_\\_'.format(rule))
-            for card_data in card_list:
-                row_url = '<{}&range=A{}>'.format(data['url'],
-                                                  card_data['row'])
-                rule_output += '\n` `\n*{}* (**{}**):\n{}\n{}'.format(
-                    card_data['name'], card_data['field'].replace('_', ' '),
-                    card_data['text'], row_url)
-
-            output.append(rule_output)
-
-        output = '\n` `\n'.join(sorted(output))
-        if output:
-            output = '{}\n` `\nDone.'.format(output)
-        else:
-            output = 'no unknown names found'
-
-        return output
+        return await get_set_analysis(analyze_names, value)
 
 
     async def _display_numbers(self, value):  # pylint: disable=R0912,R0914,R0915
@@ -5622,25 +6038,9 @@ Targets removed.
         """
         data = await read_card_data()
 
-        set_name = re.sub(r'^alep---', '', lotr.normalized_name(value))
-        matches = [card for card in data['data'] if re.sub(
-            r'^alep---', '',
-            lotr.normalized_name(card[lotr.CARD_SET_NAME])) == set_name]
-
-        if not matches:
-            new_set_name = 'the-{}'.format(set_name)
-            matches = [card for card in data['data'] if re.sub(
-                r'^alep---', '',
-                lotr.normalized_name(card[lotr.CARD_SET_NAME])) ==
-                new_set_name]
-
+        matches = get_set_cards(data, value)
         if not matches:
-            set_code = value.lower()
-            matches = [
-                card for card in data['data']
-                if card.get(lotr.CARD_SET_HOB_CODE, '').lower() == set_code]
-            if not matches:
-                return 'no cards found for the set'
+            return 'no cards found for the set'
 
         matches.sort(key=lambda card: card[lotr.ROW_COLUMN])
         res = {}
@@ -5773,25 +6173,9 @@ Targets removed.
         """
         data = await read_card_data()
 
-        set_name = re.sub(r'^alep---', '', lotr.normalized_name(value))
-        matches = [card for card in data['data'] if re.sub(
-            r'^alep---', '',
-            lotr.normalized_name(card[lotr.CARD_SET_NAME])) == set_name]
-
-        if not matches:
-            new_set_name = 'the-{}'.format(set_name)
-            matches = [card for card in data['data'] if re.sub(
-                r'^alep---', '',
-                lotr.normalized_name(card[lotr.CARD_SET_NAME])) ==
-                new_set_name]
-
+        matches = get_set_cards(data, value)
         if not matches:
-            set_code = value.lower()
-            matches = [
-                card for card in data['data']
-                if card.get(lotr.CARD_SET_HOB_CODE, '').lower() == set_code]
-            if not matches:
-                return 'no cards found for the set'
+            return 'no cards found for the set'
 
         matches.sort(key=lambda card: card[lotr.ROW_COLUMN])
         res = {}
@@ -5863,25 +6247,9 @@ Targets removed.
         """
         data = await read_card_data()
 
-        set_name = re.sub(r'^alep---', '', lotr.normalized_name(value))
-        matches = [card for card in data['data'] if re.sub(
-            r'^alep---', '',
-            lotr.normalized_name(card[lotr.CARD_SET_NAME])) == set_name]
-
+        matches = get_set_cards(data, value)
         if not matches:
-            new_set_name = 'the-{}'.format(set_name)
-            matches = [card for card in data['data'] if re.sub(
-                r'^alep---', '',
-                lotr.normalized_name(card[lotr.CARD_SET_NAME])) ==
-                new_set_name]
-
-        if not matches:
-            set_code = value.lower()
-            matches = [
-                card for card in data['data']
-                if card.get(lotr.CARD_SET_HOB_CODE, '').lower() == set_code]
-            if not matches:
-                return 'no cards found for the set'
+            return 'no cards found for the set'
 
         matches.sort(key=lambda card: card[lotr.ROW_COLUMN])
         res = {}
@@ -5936,229 +6304,16 @@ Targets removed.
         return output
 
 
-    async def _display_text(self, value):  # pylint: disable=R0912,R0914
+    async def _display_text(self, value):
         """ Display text that may be a subject of editing rules for a set.
         """
-        data = await read_card_data()
-
-        set_name = re.sub(r'^alep---', '', lotr.normalized_name(value))
-        matches = [card for card in data['data'] if re.sub(
-            r'^alep---', '',
-            lotr.normalized_name(card[lotr.CARD_SET_NAME])) == set_name and
-            card[lotr.CARD_TYPE] != lotr.T_PRESENTATION and
-            card.get(lotr.CARD_SPHERE) != lotr.S_BACK]
-
-        if not matches:
-            new_set_name = 'the-{}'.format(set_name)
-            matches = [card for card in data['data'] if re.sub(
-                r'^alep---', '',
-                lotr.normalized_name(card[lotr.CARD_SET_NAME])) == new_set_name
-                and card[lotr.CARD_TYPE] != lotr.T_PRESENTATION
-                and card.get(lotr.CARD_SPHERE) != lotr.S_BACK]
-
-        if not matches:
-            set_code = value.lower()
-            matches = [
-                card for card in data['data']
-                if card.get(lotr.CARD_SET_HOB_CODE, '').lower() == set_code and
-                card[lotr.CARD_TYPE] != lotr.T_PRESENTATION and
-                card.get(lotr.CARD_SPHERE) != lotr.S_BACK]
-            if not matches:
-                return 'no cards found for the set'
-
-        keywords = [lotr.extract_keywords(
-                        card.get(lotr.CARD_KEYWORDS), card=card)
-                    for card in data['data']]
-        keywords.extend(
-            [lotr.extract_keywords(
-                card.get(lotr.BACK_PREFIX + lotr.CARD_KEYWORDS), card=card,
-                back_side=True) for card in data['data']])
-        keywords = [item for sublist in keywords for item in sublist]
-        keywords = {lotr.simplify_keyword(k) for k in keywords}
-        keywords.union(lotr.COMMON_KEYWORDS)
-        keywords_regex = (r'(?<!\.) (' +
-                          '|'.join([re.escape(k) for k in keywords]) + r')\b')
-
-        matches.sort(key=lambda card: card[lotr.ROW_COLUMN])
-        res = {}
-        for card in matches:
-            if (card.get(lotr.CARD_NAME) is not None and
-                    card.get(lotr.BACK_PREFIX + lotr.CARD_NAME)
-                        is not None and
-                    card[lotr.CARD_NAME] !=
-                        card[lotr.BACK_PREFIX + lotr.CARD_NAME]):
-                precedent = {'name': card[lotr.CARD_NAME],
-                             'field': lotr.BACK_PREFIX + lotr.CARD_NAME,
-                             'text': '__**{}**__ (instead of *{}*)'.format(
-                                 card[lotr.BACK_PREFIX + lotr.CARD_NAME],
-                                 card[lotr.CARD_NAME]),
-                             'row': card[lotr.ROW_COLUMN]}
-                res.setdefault('Different card names on each side',
-                               []).append(precedent)
-
-            if card.get(lotr.CARD_TEXT) is not None:
-                get_rules_precedents(
-                    card[lotr.CARD_TEXT], lotr.CARD_TEXT, card, res,
-                    keywords_regex, data['card_names'],
-                    data['set_and_quest_names'], data['encounter_set_names'],
-                    data['traits'])
-
-            if card.get(lotr.BACK_PREFIX + lotr.CARD_TEXT) is not None:
-                get_rules_precedents(
-                    card[lotr.BACK_PREFIX + lotr.CARD_TEXT],
-                    lotr.BACK_PREFIX + lotr.CARD_TEXT, card, res,
-                    keywords_regex, data['card_names'],
-                    data['set_and_quest_names'], data['encounter_set_names'],
-                    data['traits'])
-
-            if card.get(lotr.CARD_SHADOW) is not None:
-                get_rules_precedents(
-                    card[lotr.CARD_SHADOW], lotr.CARD_SHADOW, card, res,
-                    keywords_regex, data['card_names'],
-                    data['set_and_quest_names'], data['encounter_set_names'],
-                    data['traits'])
-
-            if card.get(lotr.BACK_PREFIX + lotr.CARD_SHADOW) is not None:
-                get_rules_precedents(
-                    card[lotr.BACK_PREFIX + lotr.CARD_SHADOW],
-                    lotr.BACK_PREFIX + lotr.CARD_SHADOW, card, res,
-                    keywords_regex, data['card_names'],
-                    data['set_and_quest_names'], data['encounter_set_names'],
-                    data['traits'])
+        return await get_set_analysis(analyze_text, value)
 
-        output = []
-        for rule, card_list in res.items():
-            rule_output = (
-                '\\_\\_\\_\\_\\_\\_\\_\\_\\_\\_\n**{}**:\n'
-                '\\_\\_\\_\\_\\_\\_\\_\\_\\_\\_'.format(rule))
-            for card_data in card_list:
-                row_url = '<{}&range=A{}>'.format(data['url'],
-                                                  card_data['row'])
-                rule_output += '\n` `\n*{}* (**{}**):\n{}\n{}'.format(
-                    card_data['name'], card_data['field'].replace('_', ' '),
-                    card_data['text'], row_url)
 
-            output.append(rule_output)
-
-        output = '\n` `\n'.join(sorted(output))
-        if output:
-            output = '{}\n` `\nDone.'.format(output)
-        else:
-            output = 'no text rules precedents found'
-
-        return output
-
-
-    async def _display_traits(self, value):  # pylint: disable=R0912,R0914
+    async def _display_traits(self, value):
         """ Display possible trait issues for a set.
         """
-        data = await read_card_data()
-
-        set_name = re.sub(r'^alep---', '', lotr.normalized_name(value))
-        matches = [card for card in data['data'] if re.sub(
-            r'^alep---', '',
-            lotr.normalized_name(card[lotr.CARD_SET_NAME])) == set_name]
-
-        if not matches:
-            new_set_name = 'the-{}'.format(set_name)
-            matches = [card for card in data['data'] if re.sub(
-                r'^alep---', '',
-                lotr.normalized_name(card[lotr.CARD_SET_NAME])) ==
-                new_set_name]
-
-        if not matches:
-            set_code = value.lower()
-            matches = [
-                card for card in data['data']
-                if card.get(lotr.CARD_SET_HOB_CODE, '').lower() == set_code]
-            if not matches:
-                return 'no cards found for the set'
-
-        matches.sort(key=lambda card: card[lotr.ROW_COLUMN])
-        res = {}
-        for card in matches:
-            if card.get(lotr.CARD_TRAITS) is not None:
-                traits = lotr.extract_traits(card[lotr.CARD_TRAITS])
-                unknown_traits = sorted(
-                    [t for t in traits if t not in lotr.COMMON_TRAITS])
-                if unknown_traits:
-                    precedent = {
-                        'name': card[lotr.CARD_NAME],
-                        'field': lotr.CARD_TRAITS,
-                        'text': '__**{}**__ in *{}*'.format(
-                            ' '.join(['{}.'.format(t)
-                                      for t in unknown_traits]),
-                            re.sub(r'\[[^\]]+\]', '', card[lotr.CARD_TRAITS])),
-                        'row': card[lotr.ROW_COLUMN]}
-                    res.setdefault('Unknown traits', []).append(precedent)
-                else:
-                    test = lotr.verify_traits_order(
-                        re.sub(r'\[[^\]]+\]', '', card[lotr.CARD_TRAITS]))
-                    if not test[0]:
-                        precedent = {
-                            'name': card[lotr.CARD_NAME],
-                            'field': lotr.CARD_TRAITS,
-                            'text': '__**{}**__ (instead of *{}*)'.format(
-                                re.sub(r'\[[^\]]+\]', '',
-                                       card[lotr.CARD_TRAITS]), test[1]),
-                            'row': card[lotr.ROW_COLUMN]}
-                        res.setdefault('Potentially incorrect order of traits',
-                                       []).append(precedent)
-
-            if card.get(lotr.BACK_PREFIX + lotr.CARD_TRAITS) is not None:
-                traits = lotr.extract_traits(
-                    card[lotr.BACK_PREFIX + lotr.CARD_TRAITS])
-                unknown_traits = sorted(
-                    [t for t in traits if t not in lotr.COMMON_TRAITS])
-                if unknown_traits:
-                    precedent = {
-                        'name': card[lotr.CARD_NAME],
-                        'field': lotr.BACK_PREFIX + lotr.CARD_TRAITS,
-                        'text': '__**{}**__ in *{}*'.format(
-                            ' '.join(['{}.'.format(t)
-                                      for t in unknown_traits]),
-                            re.sub(r'\[[^\]]+\]', '',
-                                   card[lotr.BACK_PREFIX + lotr.CARD_TRAITS])),
-                        'row': card[lotr.ROW_COLUMN]}
-                    res.setdefault('Unknown traits', []).append(precedent)
-                else:
-                    test = lotr.verify_traits_order(
-                        re.sub(r'\[[^\]]+\]', '',
-                               card[lotr.BACK_PREFIX + lotr.CARD_TRAITS]))
-                    if not test[0]:
-                        precedent = {
-                            'name': card[lotr.CARD_NAME],
-                            'field': lotr.BACK_PREFIX + lotr.CARD_TRAITS,
-                            'text': '__**{}**__ (instead of *{}*)'.format(
-                                re.sub(r'\[[^\]]+\]', '',
-                                       card[lotr.BACK_PREFIX +
-                                            lotr.CARD_TRAITS]),
-                                test[1]),
-                            'row': card[lotr.ROW_COLUMN]}
-                        res.setdefault('Potentially incorrect order of traits',
-                                       []).append(precedent)
-
-        output = []
-        for rule, card_list in res.items():
-            rule_output = (
-                '\\_\\_\\_\\_\\_\\_\\_\\_\\_\\_\n**{}**:\n'
-                '\\_\\_\\_\\_\\_\\_\\_\\_\\_\\_'.format(rule))
-            for card_data in card_list:
-                row_url = '<{}&range=A{}>'.format(data['url'],
-                                                  card_data['row'])
-                rule_output += '\n` `\n*{}* (**{}**):\n{}\n{}'.format(
-                    card_data['name'], card_data['field'].replace('_', ' '),
-                    card_data['text'], row_url)
-
-            output.append(rule_output)
-
-        output = '\n` `\n'.join(sorted(output))
-        if output:
-            output = '{}\n` `\nDone.'.format(output)
-        else:
-            output = 'no trait issues found'
-
-        return output
+        return await get_set_analysis(analyze_traits, value)
 
 
     async def _process_edit_command(self, message):  # pylint: disable=R0911,R0912,R0915
@@ -3,24 +3,32 @@
 """ Helper functions for LotR workflow.
 """
 import codecs
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 import copy
 import csv
 from datetime import datetime
 import hashlib
-from io import StringIO
+import inspect
+from io import BytesIO, TextIOWrapper
 import json
 import logging
 import math
+from multiprocessing import Pool, cpu_count
 import os
+import pickle
 import re
 import shutil
+import signal
+import sqlite3
 import ssl
+import struct
 import subprocess
 import time
 import uuid
 import xml.etree.ElementTree as ET
 import zipfile
+import zlib
 
 import paramiko
 import requests
@@ -34,6 +42,11 @@ try:
 except ModuleNotFoundError:
     pass
 
+try:
+    from PIL import Image  # pylint: disable=E0401
+except ModuleNotFoundError:
+    Image = None
+
 try:
     import py7zr  # pylint: disable=E0401
     PY7ZR_FILTERS = [{'id': py7zr.FILTER_LZMA2,
@@ -48,8 +61,6 @@ try:
 except ModuleNotFoundError:
     pass
 
-re._MAXCACHE = 1000  # pylint: disable=W0212
-
 
 SET_SHEET = 'Sets'
 CARD_SHEET = 'Card Data'
@@ -520,6 +531,31 @@ PNG_300_MIN_SIZE = 50000
 PNG_480_MIN_SIZE = 300000
 PNG_800_MIN_SIZE = 2000000
 
+# Image size tables of GIMP/scripts.py (portrait sizes, landscape sizes
+# are looked up by swapping width and height)
+IMAGE_ROTATION_SIZES = {
+    (750, 1050), (826, 1126), (1200, 1680), (1320, 1800), (1321, 1801),
+    (1500, 2100), (1650, 2250), (1652, 2252), (2000, 2800), (2200, 3000),
+    (2202, 3002), (3000, 4200), (3300, 4500), (3304, 4504)}
+IMAGE_BLEED_MARGIN_SIZES = {
+    (826, 1126): 38, (1320, 1800): 60, (1321, 1801): 60.5, (1650, 2250): 75,
+    (1652, 2252): 76, (2200, 3000): 100, (2202, 3002): 101,
+    (3300, 4500): 150, (3304, 4504): 152}
+IMAGE_PDF_CLIP_SIZES = {
+    (826, 1126): 0.5, (1650, 2250): 0.5, (1652, 2252): 1, (2200, 3000): 0,
+    (2202, 3002): 1, (3300, 4500): 0, (3304, 4504): 2}
+IMAGE_ENGINE_JPG_PROCEDURES = {'python-prepare-drivethrucards-jpg-folder',
+                               'python-prepare-mbprint-jpg-folder'}
+IMAGE_ENGINE_PROCEDURES = {'python-cut-bleed-margins-folder',
+                           'python-prepare-drivethrucards-jpg-folder',
+                           'python-prepare-generic-png-folder',
+                           'python-prepare-mbprint-jpg-folder',
+                           'python-prepare-pdf-back-folder',
+                           'python-prepare-pdf-front-folder'}
+IMAGE_DTC_CLIP_SIZES = {
+    (826, 1126): 0.5, (1650, 2250): 0, (1652, 2252): 1, (2200, 3000): 0,
+    (2202, 3002): 1, (3300, 4500): 0, (3304, 4504): 2}
+
 DRAGNCARDS_MENU_LABEL = 'ALeP - Playtest'
 EASY_PREFIX = 'Easy '
 GENERATED_FOLDER = 'generated'
@@ -546,6 +582,140 @@ KEYWORDS_REGEX = (r'^(?: ?[A-Z][A-Za-z\'\-]+(?: [0-9X]+(?:\[pp\])?)?\.|'
                   r' ?Guarded \(enemy or location\)\.| ?Fate -1\.)+$')
 UUID_REGEX = r'^[0-9a-h]{8}-[0-9a-h]{4}-[0-9a-h]{4}-[0-9a-h]{4}-[0-9a-h]{12}$'
 
+CARD_NAME_REFERENCE_RE = re.compile(CARD_NAME_REFERENCE_REGEX)
+CLEAN_VALUE_TRANSLATION = str.maketrans({
+    '\t': ' ', '{': '[bi]', '}': '[/bi]', '`': "'", '\xa0': ' '})
+CLEAN_VALUE_QUOTES_TRANSLATION = str.maketrans({
+    "'": '’', '“': '"', '”': '"', '„': '"'})
+CLEAN_VALUE_DASH_RE = re.compile(r'(?<![A-Za-z0-9])[-—](?=[0-9]|X\b)')
+CLEAN_VALUE_QUOTES_RE = re.compile(r'"([^"]*)"')
+CLEAN_VALUE_TAG_CHARS_RE = re.compile(r'[“”’…—–][^\[]*\]')
+CLEAN_VALUE_TAG_CHARS_STEPS = [
+    (re.compile(r'[“”]([^\[]*)\]'), '"\\1]'),
+    (re.compile(r'’([^\[]*)\]'), "'\\1]"),
+    (re.compile(r'…([^\[]*)\]'), "...\\1]"),
+    (re.compile(r'—([^\[]*)\]'), "---\\1]"),
+    (re.compile(r'–([^\[]*)\]'), "--\\1]")]
+SPACES_BEFORE_NEWLINE_RE = re.compile(r' +(?=\n)')
+MULTIPLE_SPACES_RE = re.compile(r' +')
+SINGLE_NEWLINE_RE = re.compile(r'(?<!\n)\n(?!\n)')
+MULTIPLE_NEWLINES_RE = re.compile(r'\n+')
+INLINE_NEWLINES_RE = re.compile(r'\[inline\]\n+')
+HTML_TAGS_RE = re.compile(r'(?:<b>|<\/b>|<i>|<\/i>)')
+NORMALIZED_NAME_RE = re.compile(r'[^a-z0-9\-]')
+WORD_CHARACTER_RE = re.compile(r'\w')
+WORD_START_RE = re.compile(r'^\w')
+WORD_END_RE = re.compile(r'\w$')
+LEADING_TAG_RE = re.compile(r'^\[[^\]]+\]')
+TRAILING_TAG_RE = re.compile(r'\[[^\]]+\]$')
+LEADING_NOBR_RE = re.compile(r'^\[nobr\]')
+TRAILING_NOBR_RE = re.compile(r'\[nobr\]$')
+WHITESPACES_RE = re.compile(r'\s+')
+FLAVOUR_INDENT_RE = re.compile(r'\n +')
+FLAVOUR_RIGHT_SOURCE_RE = re.compile(
+    r'\[right\](\s*[—–].+?)(?:\[\/right\])?$', flags=re.DOTALL)
+FLAVOUR_NOBR_SOURCE_RE = re.compile(r'([—–])\[nobr\]([^—–]+)$')
+FLAVOUR_SHORT_DASH_RE = re.compile(r'\s-|-\s')
+FLAVOUR_DASH_RE = re.compile(r'[—–]')
+FLAVOUR_FALSE_SPLIT_RE = re.compile(r'\s–\s[^–]+$')
+FLAVOUR_OPENING_QUOTE_RE = re.compile(r'^((?:\[[^\]]+\])?)')
+FLAVOUR_CLOSING_QUOTE_RE = re.compile(r'(.)((?:\[[^\]]+\])?)$')
+FLAVOUR_CENTER_RE = re.compile(r'\n?\[center\]\n')
+FLAVOUR_RIGHT_RE = re.compile(r'\n?\[right\]\n')
+TAGS_WITH_ATTRIBUTES_RES = [
+    re.compile(r'\[lotr [^\]]+\]'),
+    re.compile(r'\[lotrheader [^\]]+\]'),
+    re.compile(r'\[size [^\]]+\]'),
+    re.compile(r'\[defaultsize [^\]]+\]'),
+    re.compile(r'\[img [^\]]+\]')]
+AUTOMATIC_TAGS_RES = {
+    L_ENGLISH: [
+        (re.compile(r'\b(Valour )?(Resource |Planning |Quest |Travel '
+                    r'|Encounter |Combat |Refresh )?(Action):'),
+         '[b]\\1\\2\\3[/b]:'),
+        (re.compile(r'\b(When Revealed|Forced|Valour Response|Response'
+                    r'|Travel|Shadow|Resolution):'), '[b]\\1[/b]:'),
+        (re.compile(r'\b(Setup)( \([^\)]+\))?:'), '[b]\\1[/b]\\2:'),
+        (re.compile(r'\b(Condition)\b'), '[bi]\\1[/bi]')],
+    L_FRENCH: [
+        (re.compile(r'(\[Vaillance\] )?(\[Ressource\] |\[Organisation\] '
+                    r'|\[Quête\] |\[Voyage\] |\[Rencontre\] '
+                    r'|\[Combat\] |\[Restauration\] )?\b(Action) ?:'),
+         '[b]\\1\\2\\3[/b] :'),
+        (re.compile(r'\b(Une fois révélée|Forcé'
+                    r'|\[Vaillance\] Réponse|Réponse|Trajet|Ombre'
+                    r'|Résolution) ?:'), '[b]\\1[/b] :'),
+        (re.compile(r'\b(Mise en place)( \([^\)]+\))? ?:'),
+         '[b]\\1[/b]\\2 :'),
+        (re.compile(r'\b(Condition)\b'), '[bi]\\1[/bi]')],
+    L_GERMAN: [
+        (re.compile(r'\b(Ehrenvolle )?(Ressourcenaktion|Planungsaktion'
+                    r'|Abenteueraktion|Reiseaktion|Begegnungsaktion'
+                    r'|Kampfaktion|Auffrischungsaktion|Aktion):'),
+         '[b]\\1\\2[/b]:'),
+        (re.compile(r'\b(Wenn aufgedeckt|Erzwungen|Ehrenvolle Reaktion'
+                    r'|Reaktion|Reise|Schatten|Auflösung):'),
+         '[b]\\1[/b]:'),
+        (re.compile(r'\b(Vorbereitung)( \([^\)]+\))?:'), '[b]\\1[/b]\\2:'),
+        (re.compile(r'\b(Zustand)\b'), '[bi]\\1[/bi]')],
+    L_ITALIAN: [
+        (re.compile(r'\b(Azione)( Valorosa)?( di Risorse| di Pianificazione'
+                    r'| di Ricerca| di Viaggio| di Incontri'
+                    r'| di Combattimento| di Riordino)?:'),
+         '[b]\\1\\2\\3[/b]:'),
+        (re.compile(r'\b(Quando Rivelata|Obbligato|Risposta Valorosa'
+                    r'|Risposta|Viaggio|Ombra|Risoluzione):'), '[b]\\1[/b]:'),
+        (re.compile(r'\b(Preparazione)( \([^\)]+\))?:'), '[b]\\1[/b]\\2:'),
+        (re.compile(r'\b(Condizione)\b'), '[bi]\\1[/bi]')],
+    L_POLISH: [
+        (re.compile(r'\b(Akcja)( Zasobów| Planowania| Wyprawy'
+                    r'| Podróży| Spotkania| Walki| Odpoczynku)?'
+                    r'( Męstwa)?:'), '[b]\\1\\2\\3[/b]:'),
+        (re.compile(r'\b(Po odkryciu|Wymuszony|Odpowiedź Męstwa'
+                    r'|Odpowiedź|Podróż|Cień'
+                    r'|Następstwa):'), '[b]\\1[/b]:'),
+        (re.compile(r'\b(Przygotowanie)( \([^\)]+\))?:'), '[b]\\1[/b]\\2:'),
+        (re.compile(r'\b(Stan)\b'), '[bi]\\1[/bi]')],
+    L_PORTUGUESE: [
+        (re.compile(r'\b(Ação)( Valorosa)?( de Recursos'
+                    r'| de Planejamento| de Missão| de Viagem'
+                    r'| de Encontro| de Combate| de Renovação)?:'),
+         '[b]\\1\\2\\3[/b]:'),
+        (re.compile(r'\b(Efeito Revelado|Efeito Forçado'
+                    r'|Resposta Valorosa|Resposta|Viagem|Efeito Sombrio'
+                    r'|Resolução):'), '[b]\\1[/b]:'),
+        (re.compile(r'\b(Preparação)( \([^\)]+\))?:'),
+         '[b]\\1[/b]\\2:'),
+        (re.compile(r'\b(Condição)\b'), '[bi]\\1[/bi]')],
+    L_SPANISH: [
+        (re.compile(r'\b(Acción)( de Recursos| de Planificación'
+                    r'| de Misión| de Viaje| de Encuentro| de Combate'
+                    r'| de Recuperación)?( de Valor)?:'),
+         '[b]\\1\\2\\3[/b]:'),
+        (re.compile(r'\b(Al ser revelada|Obligado|Respuesta de Valor'
+                    r'|Respuesta|Viaje|Sombra|Resolución):'),
+         '[b]\\1[/b]:'),
+        (re.compile(r'\b(Preparación)( \([^\)]+\))?:'),
+         '[b]\\1[/b]\\2:'),
+        (re.compile(r'\b(Estado)\b'), '[bi]\\1[/bi]')]
+}
+SHADOW_PREFIXES = {
+    L_ENGLISH: ('Shadow', re.compile(
+        r'^(?:\[[^\]]+\])?Shadow(?:\[[^\]]+\])?:')),
+    L_FRENCH: ('Ombre', re.compile(
+        r'^(?:\[[^\]]+\])?Ombre(?:\[[^\]]+\])? ?:')),
+    L_GERMAN: ('Schatten', re.compile(
+        r'^(?:\[[^\]]+\])?Schatten(?:\[[^\]]+\])? ?:')),
+    L_ITALIAN: ('Ombra', re.compile(
+        r'^(?:\[[^\]]+\])?Ombra(?:\[[^\]]+\])? ?:')),
+    L_POLISH: ('Cień', re.compile(
+        r'^(?:\[[^\]]+\])?Cień(?:\[[^\]]+\])? ?:')),
+    L_PORTUGUESE: ('Efeito Sombrio', re.compile(
+        r'^(?:\[[^\]]+\])?Efeito Sombrio(?:\[[^\]]+\])? ?:')),
+    L_SPANISH: ('Sombra', re.compile(
+        r'^(?:\[[^\]]+\])?Sombra(?:\[[^\]]+\])? ?:'))
+}
+
 JPG300BLEEDDTC = 'jpg300BleedDTC'
 JPG800BLEEDMBPRINT = 'jpg800BleedMBPrint'
 PNG300BLEED = 'png300Bleed'
@@ -599,15 +769,20 @@ DOWNLOAD_PATH = 'Download'
 DOWNLOAD_TIME_PATH = os.path.join(DATA_PATH, 'download_time.txt')
 DRAGNCARDS_FILES_CHECKSUM_PATH = os.path.join(DATA_PATH, 'dragncards_files.json')
 DRAGNCARDS_FOLDER_PATH = os.path.join(TEMP_ROOT_PATH, 'dragncards_folder.txt')
+DRAGNCARDS_IMAGES_MANIFEST_PATH = os.path.join(DATA_PATH,
+                                               'dragncards_images.json')
 DRAGNCARDS_TIMESTAMPS_JSON_PATH = os.path.join(DATA_PATH,
                                                'dragncards_timestamps.json')
 DRIVETHRUCARDS_PDF = os.path.join(DOCS_PATH, 'DriveThruCards.pdf')
+EXTRACT_CACHE_PATH = os.path.join(DATA_PATH, 'extract_cache.pickle')
+EXTERNAL_XML_CACHE_PATH = os.path.join(DATA_PATH, 'external_xml_cache.pickle')
 EXPIRE_DRAGNCARDS_JSON_PATH = os.path.join(TEMP_ROOT_PATH,
                                            'expire_dragncards.json')
 GENERATE_DRAGNCARDS_JSON_PATH = os.path.join(DATA_PATH,
                                              'generate_dragncards.json')
 GENERATE_DRAGNCARDS_LOG_PATH = os.path.join(RENDERER_PATH, 'Output',
                                             'generate_dragncards.txt')
+GIMP_SCRIPTS_PATH = os.path.join('GIMP', 'scripts.py')
 IMAGES_BACK_PATH = 'imagesBack'
 IMAGES_CUSTOM_PATH = os.path.join(PROJECT_PATH, 'imagesCustom')
 IMAGES_ICONS_PATH = os.path.join(PROJECT_PATH, 'imagesIcons')
@@ -648,17 +823,23 @@ OUTPUT_TTS_PATH = os.path.join(OUTPUT_PATH, 'TTS')
 PIPELINE_STARTED_PATH = 'pipeline_STARTED'
 RENDERER_GENERATED_IMAGES_PATH = os.path.join(RENDERER_PATH, 'GeneratedImages')
 RENDERER_OUTPUT_PATH = os.path.join(RENDERER_PATH, 'Output')
+RENDER_CACHE_PATH = 'renderCache'
 REPROCESS_ALL_PATH = 'REPROCESS_ALL'
 REPROCESS_COUNT_PATH = os.path.join(TEMP_ROOT_PATH, 'reprocess_count.json')
 RINGSDB_COOKIES_PATH = 'ringsdb_test_cookies.json'
 RINGSDB_JSON_PATH = os.path.join(DATA_PATH, 'ringsdb_sets.json')
 RUN_BEFORE_SE_STARTED_PATH = 'runBeforeSE_STARTED'
+SANITY_CHECK_CACHE_PATH = os.path.join(DATA_PATH,
+                                       'sanity_check_cache.pickle')
 SANITY_CHECK_PATH = os.path.join(DATA_PATH, 'sanity_check.txt')
 SEPROJECT_PATH = 'setGenerator.seproject'
 SEPROJECT_CREATED_PATH = 'setGenerator_CREATED'
+SEPROJECT_INDEX_PATH = os.path.join(DATA_PATH, 'seproject_index.pickle')
+SEPROJECT_MANIFEST_PATH = os.path.join(DATA_PATH, 'seproject_manifest.json')
 SET_EONS_PATH = 'setEons'
 SET_OCTGN_PATH = 'setOCTGN'
 SHEETS_JSON_PATH = os.path.join(DATA_PATH, 'sheets.json')
+TIMINGS_PATH = os.path.join(DATA_PATH, 'timings.sqlite3')
 URL_CACHE_PATH = 'urlCache'
 XML_PATH = os.path.join(PROJECT_PATH, 'XML')
 XML_ZIP_PATH = '{}/XML/'.format(os.path.split(PROJECT_PATH)[-1])
@@ -674,8 +855,17 @@ SCP_SLEEP = 30
 URL_TIMEOUT = 15
 URL_RETRIES = 3
 URL_SLEEP = 10
+SHEET_DOWNLOAD_THREADS = 8
+NAME_INDEX_CACHE_SIZE = 16
+REGEX_CACHE_SIZE = 4096
+SANITY_CHECK_MIN_ROWS_PER_PROCESS = 250
+MIN_IMAGES_PER_SHARD = 10
+SEPROJECT_CHUNK_SIZE = 1048576
+TIMINGS_BASELINE_RUNS = 10
+RENDER_CACHE_DAYS = 30
 
 ALLOWED_NON_INT = {'-', 'X', 'G'}
+SEPROJECT_STORED_EXTENSIONS = {'.jpeg', '.jpg', '.png'}
 
 O8D_TEMPLATE = """<deck game="a21af4e8-be4b-4cda-a6b6-534f9717391f"
     sleeveid="0">
@@ -1230,17 +1420,38 @@ ALL_SCRATCH_TRAITS = set()
 ALL_SET_AND_QUEST_NAMES = set()
 ALL_TRAITS = set()
 CHOSEN_SETS = []
+CPU_BUDGET = {}
+DATA_INDEX = {}
+EXTERNAL_CARD_DICT = {}
+EXTERNAL_XML_CACHE = {}
+EXTERNAL_XML_INDEX = {}
 FLAVOUR_BOOKS = {}
 FLAVOUR_WARNINGS = {'missing_quotes': set(), 'redundant_quotes': set()}
 FOUND_SCRATCH_SETS = set()
 FOUND_SETS = set()
 IMAGE_CACHE = {}
 JSON_CACHE = {}
+NAME_INDEXES = {}
+NUMBER_TRANSLATIONS_RES = {}
+REGEX_CACHE = {}
+SHEET_CHECKSUMS = {}
 PRE_SANITY_CHECK = {'name': {}, 'ref': {}, 'flavour': {}, 'shadow': {}}
+RENDER_ENGINE_VERSIONS = {}
 RINGSDB_COOKIES = {}
+SANITY_CHECK_WORKER = {}
 SELECTED_CARDS = set()
+SEPROJECT_INDEX = {}
+TIMINGS = {}
 TRANSLATIONS = {}
-XML_CACHE = {}
+
+SANITY_CHECK_STATE = [
+    'ACCENTS', 'ALL_CARD_NAMES', 'ALL_ENCOUNTER_SET_NAMES', 'ALL_NAMES',
+    'ALL_SCRATCH_CARD_NAMES', 'ALL_SCRATCH_TRAITS', 'ALL_SET_AND_QUEST_NAMES',
+    'ALL_TRAITS', 'CARD_COLUMNS', 'FLAVOUR_BOOKS', 'FLAVOUR_WARNINGS',
+    'FOUND_SCRATCH_SETS', 'FOUND_SETS', 'PRE_SANITY_CHECK', 'SELECTED_CARDS',
+    'SETS', 'TRANSLATIONS']
+
+DATA_STATE = sorted(SANITY_CHECK_STATE + ['CHOSEN_SETS', 'DATA', 'SHEET_IDS'])
 
 
 class SheetError(Exception):
@@ -1294,6 +1505,203 @@ class TLSAdapter(requests.adapters.HTTPAdapter):  # pylint: disable=R0903
             ssl_context=ctx)
 
 
+class NameIndex:
+    """ Aho-Corasick automaton over known names with the same word boundary
+    rules as get_regex.
+    """
+
+    def __init__(self, names):
+        self.names = frozenset(n for n in names if n)
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+        self._boundaries = {}
+        self._containing = None
+        self._containing_other = {}
+
+        for name in self.names:
+            self._boundaries[name] = (
+                bool(WORD_CHARACTER_RE.match(name[0])),
+                bool(WORD_CHARACTER_RE.match(name[-1])))
+            node = 0
+            for char in name:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+
+                node = next_node
+
+            self._output[node] = (name,)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, next_node in self._goto[node].items():
+                queue.append(next_node)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+
+                fail = self._goto[fail].get(char, 0)
+                self._fail[next_node] = fail
+                self._output[next_node] += self._output[fail]
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def __len__(self):
+        return len(self.names)
+
+    def find(self, text):
+        """ Find all occurrences of known names in the text as
+        (start, end, name) tuples.
+        """
+        res = []
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        node = 0
+        for pos, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+
+            node = goto[node].get(char, 0)
+            for name in output[node]:
+                start = pos + 1 - len(name)
+                word_start, word_end = self._boundaries[name]
+                if (word_start and start > 0 and
+                        WORD_CHARACTER_RE.match(text[start - 1])):
+                    continue
+
+                if (word_end and pos + 1 < len(text) and
+                        WORD_CHARACTER_RE.match(text[pos + 1])):
+                    continue
+
+                res.append((start, pos + 1, name))
+
+        return res
+
+    def find_names(self, text):
+        """ Find all known names mentioned in the text.
+        """
+        return {name for _, _, name in self.find(text)}
+
+    def replace(self, text, replacement):
+        """ Replace all occurrences of known names in the text (overlapping
+        occurrences are replaced together).
+        """
+        parts = []
+        last_end = 0
+        span_start = None
+        span_end = None
+        for start, end, _ in sorted(self.find(text)):
+            if span_end is not None and start < span_end:
+                span_end = max(span_end, end)
+                continue
+
+            if span_end is not None:
+                parts.append(text[last_end:span_start])
+                parts.append(replacement)
+                last_end = span_end
+
+            span_start = start
+            span_end = end
+
+        if span_end is not None:
+            parts.append(text[last_end:span_start])
+            parts.append(replacement)
+            last_end = span_end
+
+        parts.append(text[last_end:])
+        return ''.join(parts)
+
+    def containing(self, value):
+        """ Find all known names (except the value itself) which contain
+        the value.
+        """
+        if value in self.names:
+            if self._containing is None:
+                self._containing = {}
+                for name in self.names:
+                    for found in self.find_names(name):
+                        if found != name:
+                            self._containing.setdefault(found, set()).add(
+                                name)
+
+            return set(self._containing.get(value, ()))
+
+        if value not in self._containing_other:
+            value_regex = get_regex(value)
+            self._containing_other[value] = {
+                n for n in self.names if re.search(value_regex, n)}
+
+        return set(self._containing_other[value])
+
+
+class CardProperties:
+    """ Property view of a card (or alternate) XML element, indexed in
+    a single pass.
+    """
+
+    def __init__(self, element):
+        self.element = element
+        self.alternate = None
+        self._properties = {}
+        if element is None:
+            return
+
+        for child in element:
+            if child.tag == 'property':
+                self._properties.setdefault(
+                    child.attrib.get('name'), []).append(child)
+            elif (child.tag == 'alternate' and self.alternate is None and
+                  child.attrib.get('type') == 'B'):
+                self.alternate = child
+
+    def __contains__(self, name):
+        return name in self._properties
+
+    def find(self, name):
+        """ Find properties with a given name.
+        """
+        return list(self._properties.get(name, ()))
+
+    def get(self, name, default=None):
+        """ Get the value of the first property with a given name.
+        """
+        properties = self._properties.get(name)
+        if not properties:
+            return default
+
+        return properties[0].attrib.get('value', default)
+
+    def get_property(self, name):
+        """ Get new or existing property with a given name.
+        """
+        properties = self._properties.get(name)
+        if properties:
+            return properties[0]
+
+        prop = ET.SubElement(self.element, 'property')
+        prop.set('name', name)
+        self._properties[name] = [prop]
+        return prop
+
+    def set(self, name, value, tail=None):
+        """ Set the value of new or existing property with a given name.
+        """
+        prop = self.get_property(name)
+        prop.set('value', value)
+        if tail is not None:
+            prop.tail = tail
+
+        return prop
+
+
 def _read_ringsdb_cookies(conf):
     """ Read RingsDB cookies (either from a local cache or from a file).
     """
@@ -1335,7 +1743,7 @@ def normalized_name(value):
     """
     value = _update_card_name(value)
     value = unidecode.unidecode(str(value)).lower().replace(' ', '-')
-    value = re.sub(r'[^a-z0-9\-]', '', value)[:98]
+    value = NORMALIZED_NAME_RE.sub('', value)[:98]
     return value
 
 
@@ -1505,11 +1913,8 @@ def _clean_tags(text):  # pylint: disable=R0915
     text = text.replace('[rfb]', '')
     text = text.replace('[split]', '')
 
-    text = re.sub(r'\[lotr [^\]]+\]', '', text)
-    text = re.sub(r'\[lotrheader [^\]]+\]', '', text)
-    text = re.sub(r'\[size [^\]]+\]', '', text)
-    text = re.sub(r'\[defaultsize [^\]]+\]', '', text)
-    text = re.sub(r'\[img [^\]]+\]', '', text)
+    for pattern in TAGS_WITH_ATTRIBUTES_RES:
+        text = pattern.sub('', text)
 
     text = text.replace('[/lotr]', '')
     text = text.replace('[/lotrheader]', '')
@@ -1567,36 +1972,9 @@ def _update_card_text(text, lang=L_ENGLISH, skip_rules=False,  # pylint: disable
     """ Update card text for RingsDB, Hall of Beorn and Spanish DBs.
     """
     text = str(text)
-    if lang == L_SPANISH and not skip_rules:
-        text = re.sub(r'\b(Acci\u00f3n)( de Recursos| de Planificaci\u00f3n'
-                      r'| de Misi\u00f3n| de Viaje| de Encuentro| de Combate'
-                      r'| de Recuperaci\u00f3n)?( de Valor)?:',
-                      '[b]\\1\\2\\3[/b]:', text)
-        text = re.sub(r'\b(Al ser revelada|Obligado|Respuesta de Valor'
-                      r'|Respuesta|Viaje|Sombra|Resoluci\u00f3n):',
-                      '[b]\\1[/b]:', text)
-        text = re.sub(r'\b(Preparaci\u00f3n)( \([^\)]+\))?:', '[b]\\1[/b]\\2:',
-                      text)
-        text = re.sub(r'\b(Estado)\b', '[bi]\\1[/bi]', text)
-    if lang == L_FRENCH and not skip_rules:
-        text = re.sub(r'(\[Vaillance\] )?(\[Ressource\] |\[Organisation\] '
-                      r'|\[Qu\u00eate\] |\[Voyage\] |\[Rencontre\] '
-                      r'|\[Combat\] |\[Restauration\] )?\b(Action) ?:',
-                      '[b]\\1\\2\\3[/b] :', text)
-        text = re.sub(r'\b(Une fois r\u00e9v\u00e9l\u00e9e|Forc\u00e9'
-                      r'|\[Vaillance\] R\u00e9ponse|R\u00e9ponse|Trajet'
-                      r'|Ombre|R\u00e9solution) ?:', '[b]\\1[/b] :', text)
-        text = re.sub(r'\b(Mise en place)( \([^\)]+\))? ?:', '[b]\\1[/b]\\2 :',
-                      text)
-        text = re.sub(r'\b(Condition)\b', '[bi]\\1[/bi]', text)
-    elif lang == L_ENGLISH and not skip_rules:
-        text = re.sub(r'\b(Valour )?(Resource |Planning |Quest |Travel '
-                      r'|Encounter |Combat |Refresh )?(Action):',
-                      '[b]\\1\\2\\3[/b]:', text)
-        text = re.sub(r'\b(When Revealed|Forced|Valour Response|Response'
-                      r'|Travel|Shadow|Resolution):', '[b]\\1[/b]:', text)
-        text = re.sub(r'\b(Setup)( \([^\)]+\))?:', '[b]\\1[/b]\\2:', text)
-        text = re.sub(r'\b(Condition)\b', '[bi]\\1[/bi]', text)
+    if (lang in {L_ENGLISH, L_FRENCH, L_SPANISH} and not skip_rules):
+        for pattern, replacement in AUTOMATIC_TAGS_RES[lang]:
+            text = pattern.sub(replacement, text)
 
     text = text.replace('[center]', '')
     text = text.replace('[/center]', '')
@@ -1626,12 +2004,10 @@ def _update_card_text(text, lang=L_ENGLISH, skip_rules=False,  # pylint: disable
     text = text.replace('[ringa]', 'A')
     text = text.replace('[ringb]', 'B')
 
-    text = re.sub(r'\[lotr [^\]]+\]', '', text)
-    text = re.sub(r'\[lotrheader [^\]]+\]', '', text)
-    text = re.sub(r'\[size [^\]]+\]', '', text)
-    text = re.sub(r'\[defaultsize [^\]]+\]', '', text)
-    text = re.sub(r'\[img [^\]]+\]', '', text)
-    text = re.sub(r'\[inline\]\n+', ' ', text)
+    for pattern in TAGS_WITH_ATTRIBUTES_RES:
+        text = pattern.sub('', text)
+
+    text = INLINE_NEWLINES_RE.sub(' ', text)
 
     text = text.replace('[inline]', '')
     text = text.replace('[/lotr]', '')
@@ -1646,13 +2022,13 @@ def _update_card_text(text, lang=L_ENGLISH, skip_rules=False,  # pylint: disable
     text = text.replace('</i></b></i></b>', '</i></b>')
 
     text = text.strip()
-    text = re.sub(r' +(?=\n)', '', text)
-    text = re.sub(r' +', ' ', text)
+    text = SPACES_BEFORE_NEWLINE_RE.sub('', text)
+    text = MULTIPLE_SPACES_RE.sub(' ', text)
 
     if fix_linebreaks:
-        text = re.sub(r'(?<!\n)\n(?!\n)', ' ', text)
+        text = SINGLE_NEWLINE_RE.sub(' ', text)
 
-    text = re.sub(r'\n+', '\n', text)
+    text = MULTIPLE_NEWLINES_RE.sub('\n', text)
     return text
 
 
@@ -1660,7 +2036,7 @@ def _update_octgn_card_text(text, fix_linebreaks=True):
     """ Update card text for OCTGN.
     """
     text = _update_card_text(text, fix_linebreaks=fix_linebreaks)
-    text = re.sub(r'(?:<b>|<\/b>|<i>|<\/i>)', '', text)
+    text = HTML_TAGS_RE.sub('', text)
 
     text = text.replace('[willpower]', 'Ò')
     text = text.replace('[threat]', '$')
@@ -1687,7 +2063,7 @@ def _update_dragncards_card_text(text, fix_linebreaks=True):
     """ Update card text for DragnCards.
     """
     text = _update_card_text(text, fix_linebreaks=fix_linebreaks)
-    text = re.sub(r'(?:<b>|<\/b>|<i>|<\/i>)', '', text)
+    text = HTML_TAGS_RE.sub('', text)
     return text
 
 
@@ -1856,13 +2232,6 @@ def delete_folder(folder):
         shutil.rmtree(folder, ignore_errors=True)
 
 
-def _find_properties(parent, name):
-    """ Find properties with a given name.
-    """
-    properties = [p for p in parent if p.attrib.get('name') == name]
-    return properties
-
-
 def _clear_modified_images(folder, skip_ids):
     """ Delete images for outdated or modified cards inside the folder.
     """
@@ -1924,6 +2293,23 @@ def read_conf(path=CONFIGURATION_PATH):  # pylint: disable=R0912
     if not 'offline_mode' in conf:
         conf['offline_mode'] = False
 
+    if not 'incremental_extraction' in conf:
+        conf['incremental_extraction'] = False
+
+    if not 'incremental_sanity_check' in conf:
+        conf['incremental_sanity_check'] = False
+
+    if not conf.get('image_engine'):
+        conf['image_engine'] = 'gimp'
+
+    if conf['image_engine'] == 'pillow' and not Image:
+        logging.warning('Pillow is not installed, using GIMP as the image '
+                        'engine')
+        conf['image_engine'] = 'gimp'
+
+    if not 'render_cache' in conf:
+        conf['render_cache'] = False
+
     conf['validate_missing_images'] = False
 
     for lang in conf['output_languages']:
@@ -2031,13 +2417,14 @@ def reset_project_folders(conf):
                  round(time.time() - timestamp, 3))
 
 
-def get_content(url, custom_timeout=None):
+def get_content(url, custom_timeout=None, session=None):
     """ Get URL content.
     """
     timeout = custom_timeout or URL_TIMEOUT
+    get = session.get if session else requests.get
     for i in range(URL_RETRIES):
         try:
-            req = requests.get(url, timeout=timeout)
+            req = get(url, timeout=timeout)
             res = req.content
             break
         except Exception:
@@ -2049,11 +2436,17 @@ def get_content(url, custom_timeout=None):
     return res
 
 
+def _get_url_cache_name(url):
+    """ Get the name of URL's content in the cache.
+    """
+    return re.sub(r'[^A-Za-z0-9_\.\-]', '', url)
+
+
 def _get_cached_content(url, content_type):
     """ Find URL's content in the cache first.
     """
     path = os.path.join(URL_CACHE_PATH, '{}.{}.cache'.format(
-        re.sub(r'[^A-Za-z0-9_\.\-]', '', url), content_type))
+        _get_url_cache_name(url), content_type))
     if os.path.exists(path):
         with open(path, 'rb') as obj:
             content = obj.read()
@@ -2066,10 +2459,13 @@ def _save_content(url, content, content_type):
     """ Save URL's content into cache.
     """
     path = os.path.join(URL_CACHE_PATH, '{}.{}.cache'.format(
-        re.sub(r'[^A-Za-z0-9_\.\-]', '', url), content_type))
-    with open(path, 'wb') as obj:
+        _get_url_cache_name(url), content_type))
+    temp_path = '{}.{}.tmp'.format(path, uuid.uuid4().hex)
+    with open(temp_path, 'wb') as obj:
         obj.write(content)
 
+    os.replace(temp_path, path)
+
 
 def _fix_csv_value(value):
     """ Extract a single value.
@@ -2086,6 +2482,107 @@ def _fix_csv_value(value):
     return value
 
 
+def _normalize_sheet(sheet, content):
+    """ Read, truncate and convert raw CSV rows of a sheet in a single pass.
+    Return the rows and the checksum of their JSON representation.
+    """
+    data = []
+    empty_rows = []
+    none_index = None
+    checksum = hashlib.md5(b'[')
+    try:
+        for row in csv.reader(TextIOWrapper(BytesIO(content),
+                                            encoding='utf-8', newline='')):
+            if none_index is None:
+                none_index = row.index('') if '' in row else len(row)
+
+            row = [_fix_csv_value(v) for v in row[:none_index]]
+            if not any(row):
+                empty_rows.append(row)
+                continue
+
+            for value in empty_rows + [row]:
+                if data:
+                    checksum.update(b', ')
+
+                checksum.update(json.dumps(value).encode('utf-8'))
+                data.append(value)
+
+            empty_rows = []
+    except Exception as exc:
+        raise SheetError("Can't download {} from the Google Sheet"
+                         .format(sheet)) from exc
+
+    if none_index is None:
+        raise SheetError("Can't download {} from the Google Sheet"
+                         .format(sheet))
+
+    checksum.update(b']')
+    return data, checksum.hexdigest()
+
+
+def _write_sheet_json(path, data):
+    """ Write sheet rows to a JSON file row by row.
+    """
+    with open(path, 'w', encoding='utf-8') as fobj:
+        fobj.write('[')
+        for i, row in enumerate(data):
+            if i:
+                fobj.write(', ')
+
+            fobj.write(json.dumps(row))
+
+        fobj.write(']')
+
+
+def _get_sheet_url(conf, sheet):
+    """ Get CSV export URL of a sheet.
+    """
+    return ('https://docs.google.com/spreadsheets/d/{}/export?'
+            'format=csv&gid={}'.format(conf['sheet_gdid'], SHEET_IDS[sheet]))
+
+
+def _download_sheet_content(conf, sheet, session):
+    """ Download CSV content of a sheet.
+    """
+    timestamp = time.time()
+    url = _get_sheet_url(conf, sheet)
+    res = _get_cached_content(url, 'csv') if conf['offline_mode'] else None
+    if not res:
+        res = get_content(url, session=session)
+        if not res or b'<html' in res:
+            raise SheetError("Can't download {} from the Google Sheet"
+                             .format(sheet))
+
+        if conf['offline_mode']:
+            _save_content(url, res, 'csv')
+
+    return res, round(time.time() - timestamp, 3)
+
+
+def _download_sheets_content(conf, sheets, session):
+    """ Download raw CSV content of all sheets in parallel.
+    """
+    sheets = [sheet for sheet in sheets if sheet in SHEET_IDS]
+    if not sheets:
+        return {}
+
+    contents = {}
+    timings = {}
+    with ThreadPoolExecutor(
+            max_workers=min(SHEET_DOWNLOAD_THREADS, len(sheets))) as executor:
+        futures = {sheet: executor.submit(_download_sheet_content, conf,
+                                          sheet, session)
+                   for sheet in sheets}
+        for sheet in sheets:
+            contents[sheet], timings[sheet] = futures[sheet].result()
+
+    for sheet in sorted(timings, key=lambda s: timings[s], reverse=True):
+        logging.info('Downloaded sheet %s (%ss)', sheet, timings[sheet])
+
+    return contents
+
+
 def download_sheet(conf):  # pylint: disable=R0912,R0914,R0915
     """ Download cards spreadsheet from Google Sheets.
     """
@@ -2101,36 +2598,46 @@ def download_sheet(conf):  # pylint: disable=R0912,R0914,R0915
     if conf['offline_mode']:
         logging.info('SWITCHING TO OFFLINE MODE')
 
-    if [sheet for sheet in sheets if sheet not in SHEET_IDS]:
-        logging.info('Obtaining sheet IDs')
-        SHEET_IDS.clear()
-        url = (
-            'https://docs.google.com/spreadsheets/d/{}/export?format=csv'
-            .format(conf['sheet_gdid']))
-        res = _get_cached_content(url, 'csv') if conf['offline_mode'] else None
-        if res:
-            res = res.decode('utf-8')
-            SHEET_IDS.update(dict(row for row in csv.reader(res.splitlines())))
-        else:
-            res_raw = get_content(url)
-            res = res_raw.decode('utf-8')
-            if not res or '<html' in res:
-                raise SheetError("Can't download the Google Sheet")
-
-            try:
+    with requests.Session() as session:
+        session.mount('https://', requests.adapters.HTTPAdapter(
+            pool_maxsize=SHEET_DOWNLOAD_THREADS))
+        if [sheet for sheet in sheets if sheet not in SHEET_IDS]:
+            logging.info('Obtaining sheet IDs')
+            SHEET_IDS.clear()
+            url = (
+                'https://docs.google.com/spreadsheets/d/{}/export?format=csv'
+                .format(conf['sheet_gdid']))
+            res = (_get_cached_content(url, 'csv') if conf['offline_mode']
+                   else None)
+            if res:
+                res = res.decode('utf-8')
                 SHEET_IDS.update(dict(row for row in
                                       csv.reader(res.splitlines())))
-            except ValueError as exc:
-                raise SheetError("Can't download the Google Sheet") from exc
+            else:
+                res_raw = get_content(url, session=session)
+                res = res_raw.decode('utf-8')
+                if not res or '<html' in res:
+                    raise SheetError("Can't download the Google Sheet")
+
+                try:
+                    SHEET_IDS.update(dict(row for row in
+                                          csv.reader(res.splitlines())))
+                except ValueError as exc:
+                    raise SheetError("Can't download the Google Sheet"
+                                     ) from exc
+
+                if conf['offline_mode']:
+                    _save_content(url, res_raw, 'csv')
 
-            if conf['offline_mode']:
-                _save_content(url, res_raw, 'csv')
+            missing_sheets = [sheet for sheet in sheets
+                              if sheet not in SHEET_IDS
+                              and sheet != SCRATCH_SHEET]
+            if missing_sheets:
+                raise SheetError("Can't find sheet ID(s) for the following "
+                                 "sheet(s): {}".format(
+                                     ', '.join(missing_sheets)))
 
-        missing_sheets = [sheet for sheet in sheets
-                          if sheet not in SHEET_IDS and sheet != SCRATCH_SHEET]
-        if missing_sheets:
-            raise SheetError("Can't find sheet ID(s) for the following "
-                             "sheet(s): {}".format(', '.join(missing_sheets)))
+        contents = _download_sheets_content(conf, sheets, session)
 
     try:
         with open(SHEETS_JSON_PATH, 'r', encoding='utf-8') as fobj:
@@ -2140,52 +2647,21 @@ def download_sheet(conf):  # pylint: disable=R0912,R0914,R0915
 
     new_checksums = {}
     for sheet in sheets:
-        if sheet not in SHEET_IDS:
+        if sheet not in contents:
             data = []
+            new_checksums[sheet] = hashlib.md5(b'[]').hexdigest()
         else:
-            url = (
-                'https://docs.google.com/spreadsheets/d/{}/export?'
-                'format=csv&gid={}'.format(conf['sheet_gdid'],
-                                           SHEET_IDS[sheet]))
-            res = (_get_cached_content(url, 'csv') if conf['offline_mode']
-                   else None)
-            if res:
-                res = res.decode('utf-8')
-                data = list(csv.reader(StringIO(res)))
-                none_index = (data[0].index('') if '' in data[0]
-                              else len(data[0]))
-            else:
-                res_raw = get_content(url)
-                res = res_raw.decode('utf-8')
-                if not res or '<html' in res:
-                    raise SheetError("Can't download {} from the Google Sheet"
-                                     .format(sheet))
-
-                try:
-                    data = list(csv.reader(StringIO(res)))
-                    none_index = (data[0].index('') if '' in data[0]
-                                  else len(data[0]))
-                except Exception as exc:
-                    raise SheetError("Can't download {} from the Google Sheet"
-                                     .format(sheet)) from exc
-
-                if conf['offline_mode']:
-                    _save_content(url, res_raw, 'csv')
-
-        data = [row[:none_index] for row in data]
-        data = [[_fix_csv_value(v) for v in row] for row in data]
-        while data and not any(data[-1]):
-            data.pop()
+            data, new_checksums[sheet] = _normalize_sheet(sheet,
+                                                          contents[sheet])
+            del contents[sheet]
 
         JSON_CACHE[sheet] = data
-        res = json.dumps(data)
-        new_checksums[sheet] = hashlib.md5(res.encode('utf-8')).hexdigest()
+        SHEET_CHECKSUMS[sheet] = new_checksums[sheet]
         if new_checksums[sheet] != old_checksums.get(sheet, ''):
             logging.info('Sheet %s changed', sheet)
             changes = True
             path = os.path.join(DOWNLOAD_PATH, '{}.json'.format(sheet))
-            with open(path, 'w', encoding='utf-8') as fobj:
-                fobj.write(res)
+            _write_sheet_json(path, data)
 
     if changes:
         with open(SHEETS_JSON_PATH, 'w', encoding='utf-8') as fobj:
@@ -2254,6 +2730,8 @@ def read_stable_data(conf):
                          .format(stable_data_path)) from exc
 
     JSON_CACHE[CARD_SHEET] = json.loads(stable_data)
+    SHEET_CHECKSUMS[CARD_SHEET] = hashlib.md5(
+        stable_data.encode('utf-8')).hexdigest()
     download_path = os.path.join(DOWNLOAD_PATH,
                                  '{}.json'.format(CARD_SHEET))
     shutil.copyfile(stable_data_path, download_path)
@@ -2264,8 +2742,7 @@ def read_stable_data(conf):
     except Exception:
         checksums = {}
 
-    checksums[CARD_SHEET] = hashlib.md5(
-        stable_data.encode('utf-8')).hexdigest()
+    checksums[CARD_SHEET] = SHEET_CHECKSUMS[CARD_SHEET]
 
     with open(SHEETS_JSON_PATH, 'w', encoding='utf-8') as fobj:
         json.dump(checksums, fobj)
@@ -2409,8 +2886,8 @@ def _clean_value_deck_rules(value):
     value = value.replace('\t', ' ')
     value = value.replace('\r\n', '\n')
     value = value.replace('\r', '\n')
-    value = re.sub(r' +(?=\n)', '', value)
-    value = re.sub(r' +', ' ', value)
+    value = SPACES_BEFORE_NEWLINE_RE.sub('', value)
+    value = MULTIPLE_SPACES_RE.sub(' ', value)
 
     if value == '':
         value = None
@@ -2425,30 +2902,23 @@ def _clean_value(value):  # pylint: disable=R0915
         return None
 
     value = str(value).strip()
-    value = value.replace('\t', ' ')
+    value = value.translate(CLEAN_VALUE_TRANSLATION)
     value = value.replace('\r\n', '\n')
     value = value.replace('\r', '\n')
-    value = value.replace('{', '[bi]')
-    value = value.replace('}', '[/bi]')
     value = value.replace('[lfb]', '{')
     value = value.replace('[rfb]', '}')
-    value = value.replace('`', "'")
-    value = value.replace('\xa0', ' ')
     value = value.replace('...', '…')
     value = value.replace('---', '—')
     value = value.replace('--', '–')
     value = value.replace('−', '-')
-    value = re.sub(r'(?<![A-Za-z0-9])[-—](?=[0-9]|X\b)', '–', value)
+    value = CLEAN_VALUE_DASH_RE.sub('–', value)
     value = value.replace('[hyphen]', '-')
-    value = value.replace("'", '’')
-    value = value.replace('“', '"')
-    value = value.replace('”', '"')
-    value = value.replace('„', '"')
+    value = value.translate(CLEAN_VALUE_QUOTES_TRANSLATION)
     value = value.replace('« ', '"')
     value = value.replace('«', '"')
     value = value.replace(' »', '"')
     value = value.replace('»', '"')
-    value = re.sub(r'"([^"]*)"', '“\\1”', value)
+    value = CLEAN_VALUE_QUOTES_RE.sub('“\\1”', value)
     value = value.replace('"', '[unmatched quot]')
     value = value.replace('[lquot]', '“')
     value = value.replace('[rquot]', '”')
@@ -2459,21 +2929,19 @@ def _clean_value(value):  # pylint: disable=R0915
 
     value = value.replace('[[', '\t')
     value = value.replace(']]', '\r')
-    while True:
+    while CLEAN_VALUE_TAG_CHARS_RE.search(value):
         value_old = value
-        value = re.sub(r'[“”]([^\[]*)\]', '"\\1]', value)
-        value = re.sub(r'’([^\[]*)\]', "'\\1]", value)
-        value = re.sub(r'…([^\[]*)\]', "...\\1]", value)
-        value = re.sub(r'—([^\[]*)\]', "---\\1]", value)
-        value = re.sub(r'–([^\[]*)\]', "--\\1]", value)
+        for pattern, replacement in CLEAN_VALUE_TAG_CHARS_STEPS:
+            value = pattern.sub(replacement, value)
+
         if value == value_old:
             break
 
     value = value.replace('\t', '[[')
     value = value.replace('\r', ']]')
 
-    value = re.sub(r' +(?=\n)', '', value)
-    value = re.sub(r' +', ' ', value)
+    value = SPACES_BEFORE_NEWLINE_RE.sub('', value)
+    value = MULTIPLE_SPACES_RE.sub(' ', value)
 
     if len(value) == 1:
         value = value.upper()
@@ -2488,25 +2956,63 @@ def get_regex(value):
     """ Get a regex to match the string value.
     """
     value_regex = re.escape(value)
-    if re.search(r'^\w', value):
+    if WORD_START_RE.search(value):
         value_regex = r'\b' + value_regex
 
-    if re.search(r'\w$', value):
+    if WORD_END_RE.search(value):
         value_regex = value_regex + r'\b'
 
     return value_regex
 
 
+def get_compiled_regex(regex):
+    """ Get a (cached) compiled regex.
+    """
+    if regex not in REGEX_CACHE:
+        if len(REGEX_CACHE) >= REGEX_CACHE_SIZE:
+            REGEX_CACHE.clear()
+
+        REGEX_CACHE[regex] = re.compile(regex)
+
+    return REGEX_CACHE[regex]
+
+
+def get_name_index(names):
+    """ Get a (cached) name index for the collection of names.
+    """
+    if isinstance(names, NameIndex):
+        return names
+
+    key = frozenset(names)
+    if key not in NAME_INDEXES:
+        if len(NAME_INDEXES) >= NAME_INDEX_CACHE_SIZE:
+            NAME_INDEXES.clear()
+
+        NAME_INDEXES[key] = NameIndex(key)
+
+    return NAME_INDEXES[key]
+
+
+def get_allowed_names(set_and_quest_names, encounter_set_names):
+    """ Get additional names (besides card names) that can be mentioned on
+    the cards of each card type.
+    """
+    return {
+        T_CAMPAIGN: sorted(set(encounter_set_names).union(
+            ALLOWED_CAMPAIGN_NAMES)),
+        T_QUEST: sorted(set(encounter_set_names)),
+        T_RULES: sorted(set(set_and_quest_names).union(
+            ['“{}”'.format(n) for n in set_and_quest_names],
+            encounter_set_names, ALLOWED_RULES_NAMES))
+    }
+
+
 def get_similar_names_regex(value, card_names, scratch_card_names=None):
     """ Get similar card names regex.
     """
-    value_regex = get_regex(value)
-
-    res = {n for n in card_names if re.search(value_regex, n) and value != n}
+    res = get_name_index(card_names).containing(value)
     if scratch_card_names:
-        res_scratch = {n for n in scratch_card_names
-                       if re.search(value_regex, n) and value != n}
-        res.update(res_scratch)
+        res.update(get_name_index(scratch_card_names).containing(value))
 
     names = []
     for name in res:
@@ -2522,17 +3028,16 @@ def parse_flavour(value, lang, value_id=None):  # pylint: disable=R0912,R0915
     """
     errors = []
     value = value.strip()
-    value = re.sub(r'\n +', '\n', value)
+    value = FLAVOUR_INDENT_RE.sub('\n', value)
     original_value = value
     if lang in {L_GERMAN, L_POLISH, L_SPANISH}:
-        value = re.sub(r'\[right\](\s*[—–].+?)(?:\[\/right\])?$', '\\1', value,
-                       flags=re.DOTALL)
+        value = FLAVOUR_RIGHT_SOURCE_RE.sub('\\1', value)
 
     if lang in {L_FRENCH, L_POLISH}:
-        value = re.sub(r'([—–])\[nobr\]([^—–]+)$', '\\1 \\2', value)
+        value = FLAVOUR_NOBR_SOURCE_RE.sub('\\1 \\2', value)
 
     if (lang not in {L_GERMAN, L_ITALIAN} and
-            (re.search(r'\s-', value) or re.search(r'-\s', value))):
+            FLAVOUR_SHORT_DASH_RE.search(value)):
         errors.append('Incorrectly used short dashes')
 
     if lang in {L_ITALIAN, L_SPANISH}:
@@ -2540,7 +3045,7 @@ def parse_flavour(value, lang, value_id=None):  # pylint: disable=R0912,R0915
     else:
         default_separator = ' '
 
-    parts = re.split(r'[—–]', value[::-1], maxsplit=1)
+    parts = FLAVOUR_DASH_RE.split(value[::-1], maxsplit=1)
     parts = [p[::-1] for p in parts][::-1]
     if len(parts) == 2:
         if parts[0].endswith('\n\n'):
@@ -2555,7 +3060,8 @@ def parse_flavour(value, lang, value_id=None):  # pylint: disable=R0912,R0915
         separator = default_separator
 
     if lang in {L_ENGLISH, L_ITALIAN, L_SPANISH}:
-        false_split = '—' not in value and re.search(r'\s–\s[^–]+$', value)
+        false_split = ('—' not in value and
+                       FLAVOUR_FALSE_SPLIT_RE.search(value))
     else:
         false_split = False
 
@@ -2569,7 +3075,7 @@ def parse_flavour(value, lang, value_id=None):  # pylint: disable=R0912,R0915
     if len(parts) == 2:  # pylint: disable=R1702
         source_parts = parts[1][::-1].split(' ,', maxsplit=1)
         source_parts = [p[::-1].strip() for p in source_parts][::-1]
-        source_book = re.sub(r'\[[^\]]+\]$', '', source_parts[-1])
+        source_book = TRAILING_TAG_RE.sub('', source_parts[-1])
         if not KNOWN_BOOKS.get(lang):
             parts = [original_value]
         elif source_book.strip() not in KNOWN_BOOKS[lang]:
@@ -2585,29 +3091,29 @@ def parse_flavour(value, lang, value_id=None):  # pylint: disable=R0912,R0915
             if len(source_parts) == 2:
                 parts = [parts[0], source_parts[0], source_parts[1]]
 
-            parts[0] = re.sub(r'\[nobr\]$', '',
-                              re.sub(r'^\[nobr\]', '', parts[0])).strip()
-            parts[1] = re.sub(r'\[nobr\]$', '',
-                              re.sub(r'^\[nobr\]', '', parts[1])).strip()
-            parts[1] = re.sub(r'\s+', '[nobr]', parts[1])
+            parts[0] = TRAILING_NOBR_RE.sub(
+                '', LEADING_NOBR_RE.sub('', parts[0])).strip()
+            parts[1] = TRAILING_NOBR_RE.sub(
+                '', LEADING_NOBR_RE.sub('', parts[1])).strip()
+            parts[1] = WHITESPACES_RE.sub('[nobr]', parts[1])
             if len(parts) > 2:
-                parts[2] = re.sub(r'\[nobr\]$', '',
-                                  re.sub(r'^\[nobr\]', '', parts[2])).strip()
-                parts[2] = re.sub(r'\s+', '[nobr]', parts[2])
+                parts[2] = TRAILING_NOBR_RE.sub(
+                    '', LEADING_NOBR_RE.sub('', parts[2])).strip()
+                parts[2] = WHITESPACES_RE.sub('[nobr]', parts[2])
 
             if lang == L_POLISH:
-                if not re.sub(r'^\[[^\]]+\]', '', parts[0]).startswith('“'):
-                    parts[0] = re.sub(r'^((?:\[[^\]]+\])?)', '\\1“', parts[0])
+                if not LEADING_TAG_RE.sub('', parts[0]).startswith('“'):
+                    parts[0] = FLAVOUR_OPENING_QUOTE_RE.sub('\\1“', parts[0])
 
-                if not re.sub(r'\[[^\]]+\]$', '', parts[0]).endswith('”'):
-                    parts[0] = re.sub(r'(.)((?:\[[^\]]+\])?)$', '\\1”\\2',
-                                      parts[0])
+                if not TRAILING_TAG_RE.sub('', parts[0]).endswith('”'):
+                    parts[0] = FLAVOUR_CLOSING_QUOTE_RE.sub('\\1”\\2',
+                                                            parts[0])
             else:
                 if len(source_parts) == 2:
-                    if (not re.sub(r'^\[[^\]]+\]', '',
-                                   parts[0]).startswith('“') and
-                            not re.sub(r'\[[^\]]+\]$', '',
-                                       parts[0]).endswith('”')):
+                    if (not LEADING_TAG_RE.sub(
+                            '', parts[0]).startswith('“') and
+                            not TRAILING_TAG_RE.sub(
+                                '', parts[0]).endswith('”')):
                         if lang == L_ENGLISH:
                             errors.append('Possibly missing double quotes')
                             if value_id:
@@ -2617,8 +3123,8 @@ def parse_flavour(value, lang, value_id=None):  # pylint: disable=R0912,R0915
                               value_id not in
                               FLAVOUR_WARNINGS['missing_quotes']):
                             errors.append('Possibly missing double quotes')
-                elif (re.sub(r'^\[[^\]]+\]', '', parts[0]).startswith('“') or
-                      re.sub(r'\[[^\]]+\]$', '', parts[0]).endswith('”')):
+                elif (LEADING_TAG_RE.sub('', parts[0]).startswith('“') or
+                      TRAILING_TAG_RE.sub('', parts[0]).endswith('”')):
                     if lang == L_ENGLISH:
                         errors.append('Possibly unnecessary double quotes')
                         if value_id:
@@ -2652,7 +3158,7 @@ def parse_flavour(value, lang, value_id=None):  # pylint: disable=R0912,R0915
 
     if (lang in {L_GERMAN, L_POLISH, L_SPANISH} and
             separator in {'\n\n', '\n'} and len(parts) >= 2 and
-            not re.search(r'\[[^\]]+\]$', parts[-1])):
+            not TRAILING_TAG_RE.search(parts[-1])):
         dash = '[right]{}'.format(dash)
         parts[-1] = '{}[/right]'.format(parts[-1])
 
@@ -2669,6 +3175,13 @@ def parse_flavour(value, lang, value_id=None):  # pylint: disable=R0912,R0915
 def _clean_data(conf, data, lang):  # pylint: disable=R0912,R0914,R0915
     """ Clean data from the spreadsheet.
     """
+    if lang == L_ENGLISH:
+        name_index = get_name_index(ALL_CARD_NAMES[L_ENGLISH])
+        scratch_name_index = get_name_index(ALL_SCRATCH_CARD_NAMES)
+    else:
+        name_index = None
+        scratch_name_index = None
+
     auto_page_rows = []
     for i, row in enumerate(data):  # pylint: disable=R1702
         card_name = _to_str(_update_name_tag(_clean_value(row.get(CARD_NAME))))
@@ -2691,7 +3204,7 @@ def _clean_data(conf, data, lang):  # pylint: disable=R0912,R0914,R0915
                      F_IGNORENAME in extract_flags(
                          row[CARD_FLAGS], conf['ignore_ignore_flags']))):
             card_name_regex = get_regex(card_name)
-            card_name_regex = r'(?<!\[bi\])\b' + card_name_regex
+            card_name_regex = re.compile(r'(?<!\[bi\])\b' + card_name_regex)
         else:
             card_name_regex = None
 
@@ -2704,7 +3217,8 @@ def _clean_data(conf, data, lang):  # pylint: disable=R0912,R0914,R0915
                      extract_flags(row[BACK_PREFIX + CARD_FLAGS],
                                    conf['ignore_ignore_flags']))):
             card_name_regex_back = get_regex(card_name_back)
-            card_name_regex_back = r'(?<!\[bi\])\b' + card_name_regex_back
+            card_name_regex_back = re.compile(
+                r'(?<!\[bi\])\b' + card_name_regex_back)
         else:
             card_name_regex_back = None
 
@@ -2722,7 +3236,7 @@ def _clean_data(conf, data, lang):  # pylint: disable=R0912,R0914,R0915
                 continue
 
             if ALL_CARD_NAMES.get(lang):
-                refs = re.findall(CARD_NAME_REFERENCE_REGEX, value)
+                refs = CARD_NAME_REFERENCE_RE.findall(value)
                 for ref in refs:
                     if ref not in ALL_CARD_NAMES[lang]:
                         error = (
@@ -2734,19 +3248,19 @@ def _clean_data(conf, data, lang):  # pylint: disable=R0912,R0914,R0915
                             (row[ROW_COLUMN], row[CARD_SCRATCH], lang),
                             []).append(error)
 
-            value = re.sub(CARD_NAME_REFERENCE_REGEX, '\\1', value)
+            value = CARD_NAME_REFERENCE_RE.sub('\\1', value)
 
             if card_name_regex:
-                if key == CARD_TEXT and re.search(card_name_regex, value):
+                if key == CARD_TEXT and card_name_regex.search(value):
                     prepared_value = value
                     similar_names = get_similar_names_regex(
-                        card_name, ALL_CARD_NAMES[L_ENGLISH],
-                        row[CARD_SCRATCH] and ALL_SCRATCH_CARD_NAMES or None)
+                        card_name, name_index,
+                        row[CARD_SCRATCH] and scratch_name_index or None)
                     for similar_name in similar_names:
-                        prepared_value = re.sub(similar_name, '',
-                                                prepared_value)
+                        prepared_value = get_compiled_regex(
+                            similar_name).sub('', prepared_value)
 
-                    if re.search(card_name_regex, prepared_value):
+                    if card_name_regex.search(prepared_value):
                         error = (
                             'Hardcoded card name "{}" instead of [name] in '
                             'text'.format(card_name))
@@ -2754,16 +3268,16 @@ def _clean_data(conf, data, lang):  # pylint: disable=R0912,R0914,R0915
                             (row[ROW_COLUMN], row[CARD_SCRATCH]),
                             []).append(error)
                 elif (key == CARD_SHADOW and
-                      re.search(card_name_regex, value)):
+                      card_name_regex.search(value)):
                     prepared_value = value
                     similar_names = get_similar_names_regex(
-                        card_name, ALL_CARD_NAMES[L_ENGLISH],
-                        row[CARD_SCRATCH] and ALL_SCRATCH_CARD_NAMES or None)
+                        card_name, name_index,
+                        row[CARD_SCRATCH] and scratch_name_index or None)
                     for similar_name in similar_names:
-                        prepared_value = re.sub(similar_name, '',
-                                                prepared_value)
+                        prepared_value = get_compiled_regex(
+                            similar_name).sub('', prepared_value)
 
-                    if re.search(card_name_regex, prepared_value):
+                    if card_name_regex.search(prepared_value):
                         error = (
                             'Hardcoded card name "{}" instead of [name] in '
                             'shadow'.format(card_name))
@@ -2773,16 +3287,16 @@ def _clean_data(conf, data, lang):  # pylint: disable=R0912,R0914,R0915
 
             if card_name_regex_back:
                 if (key == BACK_PREFIX + CARD_TEXT and
-                        re.search(card_name_regex_back, value)):
+                        card_name_regex_back.search(value)):
                     prepared_value = value
                     similar_names = get_similar_names_regex(
-                        card_name_back, ALL_CARD_NAMES[L_ENGLISH],
-                        row[CARD_SCRATCH] and ALL_SCRATCH_CARD_NAMES or None)
+                        card_name_back, name_index,
+                        row[CARD_SCRATCH] and scratch_name_index or None)
                     for similar_name in similar_names:
-                        prepared_value = re.sub(similar_name, '',
-                                                prepared_value)
+                        prepared_value = get_compiled_regex(
+                            similar_name).sub('', prepared_value)
 
-                    if re.search(card_name_regex_back, prepared_value):
+                    if card_name_regex_back.search(prepared_value):
                         error = (
                             'Hardcoded card name "{}" instead of [name] in '
                             'text back'.format(card_name_back))
@@ -2790,16 +3304,16 @@ def _clean_data(conf, data, lang):  # pylint: disable=R0912,R0914,R0915
                             (row[ROW_COLUMN], row[CARD_SCRATCH]),
                             []).append(error)
                 elif (key == BACK_PREFIX + CARD_SHADOW and
-                          re.search(card_name_regex_back, value)):
+                          card_name_regex_back.search(value)):
                     prepared_value = value
                     similar_names = get_similar_names_regex(
-                        card_name_back, ALL_CARD_NAMES[L_ENGLISH],
-                        row[CARD_SCRATCH] and ALL_SCRATCH_CARD_NAMES or None)
+                        card_name_back, name_index,
+                        row[CARD_SCRATCH] and scratch_name_index or None)
                     for similar_name in similar_names:
-                        prepared_value = re.sub(similar_name, '',
-                                                prepared_value)
+                        prepared_value = get_compiled_regex(
+                            similar_name).sub('', prepared_value)
 
-                    if re.search(card_name_regex_back, prepared_value):
+                    if card_name_regex_back.search(prepared_value):
                         error = (
                             'Hardcoded card name "{} instead of [name] in '
                             'shadow back'.format(card_name_back))
@@ -2840,75 +3354,20 @@ def _clean_data(conf, data, lang):  # pylint: disable=R0912,R0914,R0915
                 else:
                     value = parts[0]
 
-                value = re.sub(r'\n?\[center\]\n', '\n[center]', value)
-                value = re.sub(r'\n?\[right\]\n', '\n[right]', value)
+                value = FLAVOUR_CENTER_RE.sub('\n[center]', value)
+                value = FLAVOUR_RIGHT_RE.sub('\n[right]', value)
 
-            if key in {CARD_SHADOW, BACK_PREFIX + CARD_SHADOW}:
+            if (key in {CARD_SHADOW, BACK_PREFIX + CARD_SHADOW} and
+                    lang in SHADOW_PREFIXES and
+                    not SHADOW_PREFIXES[lang][1].search(value)):
                 field = 'shadow' if key == CARD_SHADOW else 'shadow back'
-                if (lang == L_ENGLISH and
-                        not re.search(r'^(?:\[[^\]]+\])?Shadow(?:\[[^\]]+\])?:',
-                                      value)):
-                    value = 'Shadow: {}'.format(value)
-                    error = ('Appending missing "Shadow:" text to the {} '
-                             'effect'.format(field))
-                    PRE_SANITY_CHECK['shadow'].setdefault(
-                        (row[ROW_COLUMN], row[CARD_SCRATCH], lang),
-                        []).append(error)
-                elif (lang == L_FRENCH and
-                        not re.search(r'^(?:\[[^\]]+\])?Ombre(?:\[[^\]]+\])? ?:',
-                                      value)):
-                    value = 'Ombre: {}'.format(value)
-                    error = ('Appending missing "Ombre:" text to the {} '
-                             'effect'.format(field))
-                    PRE_SANITY_CHECK['shadow'].setdefault(
-                        (row[ROW_COLUMN], row[CARD_SCRATCH], lang),
-                        []).append(error)
-                elif (lang == L_GERMAN and
-                        not re.search(r'^(?:\[[^\]]+\])?Schatten(?:\[[^\]]+\])? ?:',
-                                      value)):
-                    value = 'Schatten: {}'.format(value)
-                    error = ('Appending missing "Schatten:" text to the {} '
-                             'effect'.format(field))
-                    PRE_SANITY_CHECK['shadow'].setdefault(
-                        (row[ROW_COLUMN], row[CARD_SCRATCH], lang),
-                        []).append(error)
-                elif (lang == L_ITALIAN and
-                        not re.search(r'^(?:\[[^\]]+\])?Ombra(?:\[[^\]]+\])? ?:',
-                                      value)):
-                    value = 'Ombra: {}'.format(value)
-                    error = ('Appending missing "Ombra:" text to the {} '
-                             'effect'.format(field))
-                    PRE_SANITY_CHECK['shadow'].setdefault(
-                        (row[ROW_COLUMN], row[CARD_SCRATCH], lang),
-                        []).append(error)
-                elif (lang == L_POLISH and
-                        not re.search(r'^(?:\[[^\]]+\])?Cień(?:\[[^\]]+\])? ?:',
-                                      value)):
-                    value = 'Cień: {}'.format(value)
-                    error = ('Appending missing "Cień:" text to the {} '
-                             'effect'.format(field))
-                    PRE_SANITY_CHECK['shadow'].setdefault(
-                        (row[ROW_COLUMN], row[CARD_SCRATCH], lang),
-                        []).append(error)
-                elif (lang == L_PORTUGUESE and
-                        not re.search(
-                            r'^(?:\[[^\]]+\])?Efeito Sombrio(?:\[[^\]]+\])? ?:',
-                            value)):
-                    value = 'Efeito Sombrio: {}'.format(value)
-                    error = ('Appending missing "Efeito Sombrio:" text to the {} '
-                             'effect'.format(field))
-                    PRE_SANITY_CHECK['shadow'].setdefault(
-                        (row[ROW_COLUMN], row[CARD_SCRATCH], lang),
-                        []).append(error)
-                elif (lang == L_SPANISH and
-                        not re.search(r'^(?:\[[^\]]+\])?Sombra(?:\[[^\]]+\])? ?:',
-                                      value)):
-                    value = 'Sombra: {}'.format(value)
-                    error = ('Appending missing "Sombra:" text to the {} '
-                             'effect'.format(field))
-                    PRE_SANITY_CHECK['shadow'].setdefault(
-                        (row[ROW_COLUMN], row[CARD_SCRATCH], lang),
-                        []).append(error)
+                prefix = SHADOW_PREFIXES[lang][0]
+                value = '{}: {}'.format(prefix, value)
+                error = ('Appending missing "{}:" text to the {} '
+                         'effect'.format(prefix, field))
+                PRE_SANITY_CHECK['shadow'].setdefault(
+                    (row[ROW_COLUMN], row[CARD_SCRATCH], lang),
+                    []).append(error)
 
             row[key] = value
 
@@ -3092,6 +3551,83 @@ def _update_selected_rows(data):
     return selected_sets, selected_scratch_sets
 
 
+def _build_data_index():
+    """ Index card data by set, encounter set and card ID.
+    """
+    DATA_INDEX.clear()
+    DATA_INDEX['set'] = {}
+    DATA_INDEX['encounter_set'] = {}
+    DATA_INDEX['id'] = {}
+    DATA_INDEX['set_lang'] = {}
+    DATA_INDEX['position'] = {}
+    for i, row in enumerate(DATA):
+        DATA_INDEX['set'].setdefault(row[CARD_SET], []).append(row)
+        if row[CARD_ENCOUNTER_SET]:
+            DATA_INDEX['encounter_set'].setdefault(
+                str(row[CARD_ENCOUNTER_SET]).lower(), []).append(row)
+
+        DATA_INDEX['id'][row[CARD_ID]] = row
+        DATA_INDEX['position'][id(row)] = i
+
+
+def _get_data_index():
+    """ Get the card data index, build it if needed.
+    """
+    if not DATA_INDEX:
+        _build_data_index()
+
+    return DATA_INDEX
+
+
+def get_set_data(set_id):
+    """ Get card data of the set.
+    """
+    return _get_data_index()['set'].get(set_id, [])
+
+
+def get_translated_set_data(set_id, lang):
+    """ Get card data of the set with translated columns merged (the rows
+    are shared, don't modify them).
+    """
+    index = _get_data_index()
+    if (set_id, lang) not in index['set_lang']:
+        res = []
+        for row in index['set'].get(set_id, []):
+            if row[CARD_ID] is None:
+                continue
+
+            row_copy = row.copy()
+            if lang != L_ENGLISH and TRANSLATIONS[lang].get(row[CARD_ID]):
+                for key in TRANSLATED_COLUMNS:
+                    row_copy[key] = TRANSLATIONS[lang][row[CARD_ID]][key]
+
+            res.append(row_copy)
+
+        index['set_lang'][(set_id, lang)] = res
+
+    return index['set_lang'][(set_id, lang)]
+
+
+def get_encounter_set_data(encounter_set):
+    """ Get card data of the encounter set (case insensitive).
+    """
+    return _get_data_index()['encounter_set'].get(
+        str(encounter_set).lower(), [])
+
+
+def get_card_row(card_id):
+    """ Get card data by card ID.
+    """
+    return _get_data_index()['id'].get(card_id)
+
+
+def _sort_data_rows(rows):
+    """ Sort card data rows in the order of the spreadsheet data.
+    """
+    position = _get_data_index()['position']
+    return sorted(rows, key=lambda row: position[id(row)])
+
+
 def _skip_row(row):
     """ Check whether a row should be skipped or not.
     """
@@ -3153,13 +3689,68 @@ def _read_sheet_json(sheet):
         return []
 
     with open(path, 'r', encoding='utf-8') as fobj:
-        data = json.load(fobj)
+        res = fobj.read()
 
+    data = json.loads(res)
     JSON_CACHE[sheet] = data
+    SHEET_CHECKSUMS[sheet] = hashlib.md5(res.encode('utf-8')).hexdigest()
     return data
 
 
-def extract_data(conf):  # pylint: disable=R0912,R0915
+def _get_cache_key(*values):
+    """ Get a cache key for the given values.
+    """
+    return hashlib.md5(repr(values).encode('utf-8')).hexdigest()
+
+
+def _get_code_checksum():
+    """ Get the checksum of this module's source code.
+    """
+    with open(os.path.abspath(__file__), 'rb') as fobj:
+        return hashlib.md5(fobj.read()).hexdigest()
+
+
+def _read_extract_cache(conf):
+    """ Read the cache of cleaned sheet data.
+    """
+    if not conf['incremental_extraction']:
+        return {}
+
+    try:
+        with open(EXTRACT_CACHE_PATH, 'rb') as fobj:
+            cache = pickle.load(fobj)
+    except Exception:
+        return {}
+
+    if cache.get('version') != _get_code_checksum():
+        return {}
+
+    return cache
+
+
+def _write_extract_cache(conf, cache):
+    """ Write the cache of cleaned sheet data.
+    """
+    if not conf['incremental_extraction']:
+        return
+
+    cache['version'] = _get_code_checksum()
+    with open(EXTRACT_CACHE_PATH, 'wb') as fobj:
+        pickle.dump(cache, fobj, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _get_pre_sanity_check(lang):
+    """ Get pre sanity check errors for the language.
+    """
+    res = {}
+    for check, errors in PRE_SANITY_CHECK.items():
+        res[check] = {key: value for key, value in errors.items()
+                      if (key[2] if len(key) > 2 else L_ENGLISH) == lang}
+
+    return res
+
+
+def extract_data(conf):  # pylint: disable=R0912,R0914,R0915
     """ Extract data from the spreadsheet.
     """
     logging.info('Extracting data from the spreadsheet...')
@@ -3170,6 +3761,7 @@ def extract_data(conf):  # pylint: disable=R0912,R0915
     FOUND_SETS.clear()
     FOUND_SCRATCH_SETS.clear()
     DATA[:] = []
+    DATA_INDEX.clear()
     TRANSLATIONS.clear()
     SELECTED_CARDS.clear()
 
@@ -3207,31 +3799,8 @@ def extract_data(conf):  # pylint: disable=R0912,R0915
             SETS[row[SET_ID]] = row
             set_names.add(row[SET_NAME])
 
-    data = _read_sheet_json(CARD_SHEET)
-    if data:
-        CARD_COLUMNS.update(_extract_column_names(data[0]))
-        data = _transform_to_dict(data)
-        for row in data:
-            row[CARD_SCRATCH] = None
-
-        DATA.extend(data)
-
-    data = _read_sheet_json(SCRATCH_SHEET)
-    if data:
-        if not CARD_COLUMNS:
-            CARD_COLUMNS.update(_extract_column_names(data[0]))
-
-        data = _transform_to_dict(data)
-        for row in data:
-            row[CARD_SCRATCH] = 1
-
-        DATA.extend(data)
-
-    try:
-        DATA[:] = [row for row in DATA if not _skip_row(row)]
-    except KeyError as exc:
-        raise SheetError(
-            'Broken Google Sheet columns: {}'.format(exc)) from exc
+    cache = _read_extract_cache(conf)
+    new_cache = {}
 
     PRE_SANITY_CHECK['name'] = {}
     PRE_SANITY_CHECK['ref'] = {}
@@ -3240,8 +3809,67 @@ def extract_data(conf):  # pylint: disable=R0912,R0915
     FLAVOUR_BOOKS.clear()
     FLAVOUR_WARNINGS['missing_quotes'] = set()
     FLAVOUR_WARNINGS['redundant_quotes'] = set()
-    _extract_all_card_names(DATA, L_ENGLISH)
-    _clean_data(conf, DATA, L_ENGLISH)
+
+    card_data = _read_sheet_json(CARD_SHEET)
+    scratch_data = _read_sheet_json(SCRATCH_SHEET)
+    english_key = _get_cache_key(
+        SHEET_CHECKSUMS.get(CARD_SHEET) if card_data else None,
+        SHEET_CHECKSUMS.get(SCRATCH_SHEET) if scratch_data else None,
+        sorted(ALL_SCRATCH_TRAITS), L_ENGLISH in conf['output_languages'],
+        conf['ignore_ignore_flags'])
+    entry = cache.get(L_ENGLISH, {})
+    if entry.get('key') == english_key:
+        logging.info('Reusing cleaned data for %s and %s sheets',
+                     CARD_SHEET, SCRATCH_SHEET)
+        CARD_COLUMNS.update(entry['columns'])
+        DATA.extend(pickle.loads(entry['data']))
+        ALL_CARD_NAMES[L_ENGLISH] = set(entry['card_names'])
+        ALL_SCRATCH_CARD_NAMES.clear()
+        ALL_SCRATCH_CARD_NAMES.update(entry['scratch_card_names'])
+        FLAVOUR_BOOKS.update(entry['flavour_books'])
+        FLAVOUR_WARNINGS['missing_quotes'] = set(entry['missing_quotes'])
+        FLAVOUR_WARNINGS['redundant_quotes'] = set(entry['redundant_quotes'])
+        for check, errors in entry['pre_sanity_check'].items():
+            PRE_SANITY_CHECK[check].update(errors)
+    else:
+        if card_data:
+            CARD_COLUMNS.update(_extract_column_names(card_data[0]))
+            data = _transform_to_dict(card_data)
+            for row in data:
+                row[CARD_SCRATCH] = None
+
+            DATA.extend(data)
+
+        if scratch_data:
+            if not CARD_COLUMNS:
+                CARD_COLUMNS.update(_extract_column_names(scratch_data[0]))
+
+            data = _transform_to_dict(scratch_data)
+            for row in data:
+                row[CARD_SCRATCH] = 1
+
+            DATA.extend(data)
+
+        try:
+            DATA[:] = [row for row in DATA if not _skip_row(row)]
+        except KeyError as exc:
+            raise SheetError(
+                'Broken Google Sheet columns: {}'.format(exc)) from exc
+
+        _extract_all_card_names(DATA, L_ENGLISH)
+        _clean_data(conf, DATA, L_ENGLISH)
+        entry = {'key': english_key,
+                 'columns': dict(CARD_COLUMNS),
+                 'data': pickle.dumps(DATA, protocol=pickle.HIGHEST_PROTOCOL),
+                 'card_names': set(ALL_CARD_NAMES[L_ENGLISH]),
+                 'scratch_card_names': set(ALL_SCRATCH_CARD_NAMES),
+                 'flavour_books': dict(FLAVOUR_BOOKS),
+                 'missing_quotes': set(FLAVOUR_WARNINGS['missing_quotes']),
+                 'redundant_quotes': set(
+                     FLAVOUR_WARNINGS['redundant_quotes']),
+                 'pre_sanity_check': _get_pre_sanity_check(L_ENGLISH)}
+
+    new_cache[L_ENGLISH] = entry
 
     SELECTED_CARDS.update({row[CARD_ID] for row in DATA if row[CARD_SELECTED]})
     FOUND_SETS.update({row[CARD_SET] for row in DATA
@@ -3267,12 +3895,43 @@ def extract_data(conf):  # pylint: disable=R0912,R0915
         FOUND_SETS.update(selected_sets)
         FOUND_SCRATCH_SETS.update(selected_scratch_sets)
 
-    _extract_all_set_and_quest_names(DATA)
-    _extract_all_encounter_set_names(DATA)
-    _extract_all_traits(DATA)
-    _extract_all_names()
-    _extract_all_accents()
+    _build_data_index()
+
+    indexes_key = _get_cache_key(english_key, SHEET_CHECKSUMS.get(SET_SHEET),
+                                 conf['selected_only'])
+    entry = cache.get('indexes', {})
+    if entry.get('key') == indexes_key:
+        logging.info('Reusing names, traits and accents indexes')
+        for value, index in ((entry['set_and_quest_names'],
+                              ALL_SET_AND_QUEST_NAMES),
+                             (entry['encounter_set_names'],
+                              ALL_ENCOUNTER_SET_NAMES),
+                             (entry['traits'], ALL_TRAITS),
+                             (entry['scratch_traits'], ALL_SCRATCH_TRAITS),
+                             (entry['names'], ALL_NAMES),
+                             (entry['accents'], ACCENTS)):
+            index.clear()
+            index.update(value)
+    else:
+        _extract_all_set_and_quest_names(DATA)
+        _extract_all_encounter_set_names(DATA)
+        _extract_all_traits(DATA)
+        _extract_all_names()
+        _extract_all_accents()
+        entry = {'key': indexes_key,
+                 'set_and_quest_names': set(ALL_SET_AND_QUEST_NAMES),
+                 'encounter_set_names': set(ALL_ENCOUNTER_SET_NAMES),
+                 'traits': set(ALL_TRAITS),
+                 'scratch_traits': set(ALL_SCRATCH_TRAITS),
+                 'names': set(ALL_NAMES),
+                 'accents': set(ACCENTS)}
+
+    new_cache['indexes'] = entry
     card_types = {row[CARD_ID]: row[CARD_TYPE] for row in DATA}
+    flavour_key = _get_cache_key(
+        sorted(FLAVOUR_BOOKS.items(), key=repr),
+        sorted(FLAVOUR_WARNINGS['missing_quotes'], key=repr),
+        sorted(FLAVOUR_WARNINGS['redundant_quotes'], key=repr))
 
     for lang in conf['languages']:
         if lang == L_ENGLISH:
@@ -3281,12 +3940,30 @@ def extract_data(conf):  # pylint: disable=R0912,R0915
         TRANSLATIONS[lang] = {}
         data = _read_sheet_json(lang)
         if data:
-            data = _transform_to_dict(data)
-            for row in data:
-                row[CARD_SCRATCH] = None
-
-            _extract_all_card_names(data, lang)
-            _clean_data(conf, data, lang)
+            lang_key = _get_cache_key(SHEET_CHECKSUMS.get(lang), flavour_key,
+                                      lang in conf['output_languages'],
+                                      conf['ignore_ignore_flags'])
+            entry = cache.get(lang, {})
+            if entry.get('key') == lang_key:
+                logging.info('Reusing cleaned data for %s sheet', lang)
+                data = pickle.loads(entry['data'])
+                ALL_CARD_NAMES[lang] = set(entry['card_names'])
+                for check, errors in entry['pre_sanity_check'].items():
+                    PRE_SANITY_CHECK[check].update(errors)
+            else:
+                data = _transform_to_dict(data)
+                for row in data:
+                    row[CARD_SCRATCH] = None
+
+                _extract_all_card_names(data, lang)
+                _clean_data(conf, data, lang)
+                entry = {'key': lang_key,
+                         'data': pickle.dumps(
+                             data, protocol=pickle.HIGHEST_PROTOCOL),
+                         'card_names': set(ALL_CARD_NAMES[lang]),
+                         'pre_sanity_check': _get_pre_sanity_check(lang)}
+
+            new_cache[lang] = entry
             for row in data:
                 if row[CARD_ID] in TRANSLATIONS[lang]:
                     logging.error(
@@ -3301,6 +3978,8 @@ def extract_data(conf):  # pylint: disable=R0912,R0915
                     row[BACK_PREFIX + CARD_NAME] = row[CARD_SIDE_B]
                     TRANSLATIONS[lang][row[CARD_ID]] = row
 
+    _write_extract_cache(conf, new_cache)
+
     logging.info('...Extracting data from the spreadsheet (%ss)',
                  round(time.time() - timestamp, 3))
 
@@ -4026,17 +4705,21 @@ def _clean_value_for_hash(value):
     """ Clean the value before generating its hash.
     """
     value = value.replace('[br]', '').replace('[nobr]', ' ')
-    value = re.sub(r'\n{1}', ' ', value)
+    value = value.replace('\n', ' ')
     return value
 
 
 def _replace_numbers(value, lang=L_ENGLISH):
     """ Replace numbers as text.
     """
-    for key, translations in NUMBER_TRANSLATIONS.items():
-        translation = translations.get(lang, [])
-        for word in translation:
-            value = re.sub(get_regex(word), key, value, flags=re.IGNORECASE)
+    if lang not in NUMBER_TRANSLATIONS_RES:
+        NUMBER_TRANSLATIONS_RES[lang] = [
+            (re.compile(get_regex(word), flags=re.IGNORECASE), key)
+            for key, translations in NUMBER_TRANSLATIONS.items()
+            for word in translations.get(lang, [])]
+
+    for pattern, key in NUMBER_TRANSLATIONS_RES[lang]:
+        value = pattern.sub(key, value)
 
     return value
 
@@ -4044,87 +4727,8 @@ def _replace_numbers(value, lang=L_ENGLISH):
 def _add_automatic_tags(value, lang=L_ENGLISH):
     """ Add automatic tags.
     """
-    if lang == L_ENGLISH:
-        value = re.sub(
-            r'\b(Valour )?(Resource |Planning |Quest |Travel |Encounter '
-            r'|Combat |Refresh )?(Action):', '[b]\\1\\2\\3[/b]:', value)
-        value = re.sub(
-            r'\b(When Revealed|Forced|Valour Response|Response|Travel|Shadow'
-            r'|Resolution):', '[b]\\1[/b]:', value)
-        value = re.sub(
-            r'\b(Setup)( \([^\)]+\))?:', '[b]\\1[/b]\\2:', value)
-        value = re.sub(r'\b(Condition)\b', '[bi]\\1[/bi]', value)
-    elif lang == L_FRENCH:
-        value = re.sub(
-            r'(\[Vaillance\] )?(\[Ressource\] |\[Organisation\] '
-            r'|\[Qu\u00eate\] |\[Voyage\] |\[Rencontre\] |\[Combat\] '
-            r'|\[Restauration\] )?\b(Action) ?:', '[b]\\1\\2\\3[/b] :', value)
-        value = re.sub(
-            r'\b(Une fois r\u00e9v\u00e9l\u00e9e|Forc\u00e9'
-            r'|\[Vaillance\] R\u00e9ponse|R\u00e9ponse|Trajet|Ombre'
-            r'|R\u00e9solution) ?:', '[b]\\1[/b] :', value)
-        value = re.sub(
-            r'\b(Mise en place)( \([^\)]+\))? ?:', '[b]\\1[/b]\\2 :', value)
-        value = re.sub(r'\b(Condition)\b', '[bi]\\1[/bi]', value)
-    elif lang == L_GERMAN:
-        value = re.sub(
-            r'\b(Ehrenvolle )?(Ressourcenaktion|Planungsaktion'
-            r'|Abenteueraktion|Reiseaktion|Begegnungsaktion|Kampfaktion'
-            r'|Auffrischungsaktion|Aktion):', '[b]\\1\\2[/b]:', value)
-        value = re.sub(
-            r'\b(Wenn aufgedeckt|Erzwungen|Ehrenvolle Reaktion|Reaktion|Reise'
-            r'|Schatten|Aufl\u00f6sung):', '[b]\\1[/b]:', value)
-        value = re.sub(
-            r'\b(Vorbereitung)( \([^\)]+\))?:', '[b]\\1[/b]\\2:', value)
-        value = re.sub(r'\b(Zustand)\b', '[bi]\\1[/bi]', value)
-    elif lang == L_ITALIAN:
-        value = re.sub(
-            r'\b(Azione)( Valorosa)?( di Risorse| di Pianificazione'
-            r'| di Ricerca| di Viaggio| di Incontri| di Combattimento'
-            r'| di Riordino)?:', '[b]\\1\\2\\3[/b]:', value)
-        value = re.sub(
-            r'\b(Quando Rivelata|Obbligato|Risposta Valorosa|Risposta'
-            r'|Viaggio|Ombra|Risoluzione):', '[b]\\1[/b]:', value)
-        value = re.sub(
-            r'\b(Preparazione)( \([^\)]+\))?:', '[b]\\1[/b]\\2:', value)
-        value = re.sub(r'\b(Condizione)\b', '[bi]\\1[/bi]', value)
-    elif lang == L_POLISH:
-        value = re.sub(
-            r'\b(Akcja)( Zasob\u00f3w| Planowania| Wyprawy| Podr\u00f3\u017cy'
-            r'| Spotkania| Walki| Odpoczynku)?( M\u0119stwa)?:',
-            '[b]\\1\\2\\3[/b]:', value)
-        value = re.sub(
-            r'\b(Po odkryciu|Wymuszony|Odpowied\u017a M\u0119stwa'
-            r'|Odpowied\u017a|Podr\u00f3\u017c|Cie\u0144|Nast\u0119pstwa):',
-            '[b]\\1[/b]:', value)
-        value = re.sub(
-            r'\b(Przygotowanie)( \([^\)]+\))?:', '[b]\\1[/b]\\2:', value)
-        value = re.sub(r'\b(Stan)\b', '[bi]\\1[/bi]', value)
-    elif lang == L_PORTUGUESE:
-        value = re.sub(
-            r'\b(A\u00e7\u00e3o)( Valorosa)?( de Recursos| de Planejamento'
-            r'| de Miss\u00e3o| de Viagem| de Encontro| de Combate'
-            r'| de Renova\u00e7\u00e3o)?:', '[b]\\1\\2\\3[/b]:', value)
-        value = re.sub(
-            r'\b(Efeito Revelado|Efeito For\u00e7ado|Resposta Valorosa'
-            r'|Resposta|Viagem|Efeito Sombrio|Resolu\u00e7\u00e3o):',
-            '[b]\\1[/b]:', value)
-        value = re.sub(
-            r'\b(Prepara\u00e7\u00e3o)( \([^\)]+\))?:', '[b]\\1[/b]\\2:',
-            value)
-        value = re.sub(r'\b(Condi\u00e7\u00e3o)\b', '[bi]\\1[/bi]', value)
-    elif lang == L_SPANISH:
-        value = re.sub(
-            r'\b(Acci\u00f3n)( de Recursos| de Planificaci\u00f3n'
-            r'| de Misi\u00f3n| de Viaje| de Encuentro| de Combate'
-            r'| de Recuperaci\u00f3n)?( de Valor)?:', '[b]\\1\\2\\3[/b]:',
-            value)
-        value = re.sub(
-            r'\b(Al ser revelada|Obligado|Respuesta de Valor|Respuesta|Viaje'
-            r'|Sombra|Resoluci\u00f3n):', '[b]\\1[/b]:', value)
-        value = re.sub(
-            r'\b(Preparaci\u00f3n)( \([^\)]+\))?:', '[b]\\1[/b]\\2:', value)
-        value = re.sub(r'\b(Estado)\b', '[bi]\\1[/bi]', value)
+    for pattern, replacement in AUTOMATIC_TAGS_RES.get(lang, []):
+        value = pattern.sub(replacement, value)
 
     value = value.replace('[bi][bi]', '[bi]')
     value = value.replace('[/bi][/bi]', '[/bi]')
@@ -4133,151 +4737,487 @@ def _add_automatic_tags(value, lang=L_ENGLISH):
     return value
 
 
-def sanity_check(conf, sets):  # pylint: disable=R0912,R0914,R0915
-    """ Perform a sanity check of the spreadsheet and return "healthy" sets.
+def _get_sanity_check_row_info(row):
+    """ Get card row details for sanity check messages.
     """
-    logging.info('Performing a sanity check of the spreadsheet...')
-    logging.info('')
-    timestamp = time.time()
+    return '{}{}{}{}'.format(
+        ', {}'.format(row[CARD_NAME]) if row[CARD_NAME] else '',
+        ' ({})'.format(row[CARD_SET_NAME]) if row[CARD_SET_NAME] else '',
+        ' [Card GUID: {}]'.format(row[CARD_ID]) if row[CARD_ID] else '',
+        ' (Scratch)' if row[CARD_SCRATCH] else '')
 
+
+def _sanity_check_row(conf, row, set_ids, all_set_ids, accents_regex):  # pylint: disable=R0912,R0914,R0915,R1702
+    """ Perform a sanity check of a single card row and return a tuple of
+    errors and broken set IDs.
+    """
     errors = []
-    card_ids = set()
-    card_scratch_ids = set()
-    card_set_numbers = set()
-    set_ids = {s[0] for s in sets}
-    all_set_ids = set(SETS.keys())
     broken_set_ids = set()
-    deck_rules = set()
-    quest_adventures = {}
-    hash_by_key = {}
-    keys_by_hash = {}
-    card_data = DATA[:]
-    card_data = sorted(card_data, key=lambda row: (row[CARD_SCRATCH] or 0,
-                                                   row[ROW_COLUMN]))
 
-    accents_regex = (
-        r'\b(?:' + '|'.join([re.escape(a) for a in ACCENTS]) + r')\b')
+    i = row[ROW_COLUMN]
+    set_id = row[CARD_SET]
+    card_id = row[CARD_ID]
+    card_number = row[CARD_NUMBER]
+    card_quantity = row[CARD_QUANTITY]
+    card_encounter_set = row[CARD_ENCOUNTER_SET]
+
+    card_name = row[CARD_NAME]
+    card_unique = row[CARD_UNIQUE]
+    card_type = row[CARD_TYPE]
+    card_sphere = row[CARD_SPHERE]
+    card_traits = row[CARD_TRAITS]
+    card_keywords = row[CARD_KEYWORDS]
+    card_cost = row[CARD_COST]
+    card_engagement = row[CARD_ENGAGEMENT]
+    card_threat = row[CARD_THREAT]
+    card_willpower = row[CARD_WILLPOWER]
+    card_attack = row[CARD_ATTACK]
+    card_defense = row[CARD_DEFENSE]
+    card_health = row[CARD_HEALTH]
+    card_quest = row[CARD_QUEST]
+    card_victory = row[CARD_VICTORY]
+    card_text = row[CARD_TEXT]
+    card_shadow = row[CARD_SHADOW]
+    card_flavour = row[CARD_FLAVOUR]
+    card_printed_number = row[CARD_PRINTED_NUMBER]
+    card_encounter_set_number = row[CARD_ENCOUNTER_SET_NUMBER]
+    card_encounter_set_icon = row[CARD_ENCOUNTER_SET_ICON]
+    card_flags = row[CARD_FLAGS]
+    card_icons = row[CARD_ICONS]
+    card_info = row[CARD_INFO]
+    card_artist = row[CARD_ARTIST]
+    card_panx = row[CARD_PANX]
+    card_pany = row[CARD_PANY]
+    card_scale = row[CARD_SCALE]
+    card_portrait_shadow = row[CARD_PORTRAIT_SHADOW]
+
+    card_name_back = row[BACK_PREFIX + CARD_NAME]
+    card_unique_back = row[BACK_PREFIX + CARD_UNIQUE]
+    card_type_back = row[BACK_PREFIX + CARD_TYPE]
+    card_sphere_back = row[BACK_PREFIX + CARD_SPHERE]
+    card_traits_back = row[BACK_PREFIX + CARD_TRAITS]
+    card_keywords_back = row[BACK_PREFIX + CARD_KEYWORDS]
+    card_cost_back = row[BACK_PREFIX + CARD_COST]
+    card_engagement_back = row[BACK_PREFIX + CARD_ENGAGEMENT]
+    card_threat_back = row[BACK_PREFIX + CARD_THREAT]
+    card_willpower_back = row[BACK_PREFIX + CARD_WILLPOWER]
+    card_attack_back = row[BACK_PREFIX + CARD_ATTACK]
+    card_defense_back = row[BACK_PREFIX + CARD_DEFENSE]
+    card_health_back = row[BACK_PREFIX + CARD_HEALTH]
+    card_quest_back = row[BACK_PREFIX + CARD_QUEST]
+    card_victory_back = row[BACK_PREFIX + CARD_VICTORY]
+    card_text_back = row[BACK_PREFIX + CARD_TEXT]
+    card_shadow_back = row[BACK_PREFIX + CARD_SHADOW]
+    card_flavour_back = row[BACK_PREFIX + CARD_FLAVOUR]
+    card_printed_number_back = row[BACK_PREFIX + CARD_PRINTED_NUMBER]
+    card_encounter_set_number_back = row[
+        BACK_PREFIX + CARD_ENCOUNTER_SET_NUMBER]
+    card_encounter_set_icon_back = row[
+        BACK_PREFIX + CARD_ENCOUNTER_SET_ICON]
+    card_flags_back = row[BACK_PREFIX + CARD_FLAGS]
+    card_icons_back = row[BACK_PREFIX + CARD_ICONS]
+    card_info_back = row[BACK_PREFIX + CARD_INFO]
+    card_artist_back = row[BACK_PREFIX + CARD_ARTIST]
+    card_panx_back = row[BACK_PREFIX + CARD_PANX]
+    card_pany_back = row[BACK_PREFIX + CARD_PANY]
+    card_scale_back = row[BACK_PREFIX + CARD_SCALE]
+    card_portrait_shadow_back = row[BACK_PREFIX + CARD_PORTRAIT_SHADOW]
+
+    card_easy_mode = row[CARD_EASY_MODE]
+    card_additional_encounter_sets = row[CARD_ADDITIONAL_ENCOUNTER_SETS]
+    card_adventure = row[CARD_ADVENTURE]
+    card_collection_icon = row[CARD_COLLECTION_ICON]
+    card_copyright = row[CARD_COPYRIGHT]
+    card_back = row[CARD_BACK]
+    card_deck_rules = row[CARD_DECK_RULES]
+    card_scratch = row[CARD_SCRATCH]
+    card_selected = row[CARD_SELECTED]
+    card_last_design_change_date = row[CARD_LAST_DESIGN_CHANGE_DATE]
+    row_info = _get_sanity_check_row_info(row)
+
+    if set_id is None:
+        message = 'Missing set ID for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+    elif set_id == '[filtered set]':
+        message = (
+            'Reusing non-scratch set ID for row #{}{} (which is '
+            'prohibited)'.format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+    elif set_id not in all_set_ids:
+        message = 'Unknown set ID for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+
+    if not conf['run_sanity_check_for_all_sets'] and set_id not in set_ids:
+        return errors, broken_set_ids
+
+    for error in PRE_SANITY_CHECK['name'].get((i, card_scratch), []):
+        message = ('{} for row #{}{} (use IgnoreName flag to ignore)'
+                   .format(error, i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+
+    for error in PRE_SANITY_CHECK['ref'].get(
+            (i, card_scratch, L_ENGLISH), []):
+        message = '{} for row #{}{}'.format(error, i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+
+    for error in PRE_SANITY_CHECK['flavour'].get(
+            (i, card_scratch, L_ENGLISH), []):
+        message = '{} for row #{}{}'.format(error, i, row_info)
+        if not [l for l in conf['languages'] if l != L_ENGLISH]:
+            if message.startswith('Possibly '):
+                logging.warning(message)
+            else:
+                logging.error(message)
 
-    for row in card_data:  # pylint: disable=R1702
-        i = row[ROW_COLUMN]
-        set_id = row[CARD_SET]
-        card_id = row[CARD_ID]
-        card_number = row[CARD_NUMBER]
-        card_quantity = row[CARD_QUANTITY]
-        card_encounter_set = row[CARD_ENCOUNTER_SET]
+    for error in PRE_SANITY_CHECK['shadow'].get(
+            (i, card_scratch, L_ENGLISH), []):
+        message = '{} for row #{}{}'.format(error, i, row_info)
+        if not [l for l in conf['languages'] if l != L_ENGLISH]:
+            logging.warning(message)
+
+    if card_number is None:
+        message = 'Missing card number for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif len(_handle_int_str(card_number)) > 3:
+        message = 'Card number is too long for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
 
-        card_name = row[CARD_NAME]
-        card_unique = row[CARD_UNIQUE]
-        card_type = row[CARD_TYPE]
-        card_sphere = row[CARD_SPHERE]
-        card_traits = row[CARD_TRAITS]
-        card_keywords = row[CARD_KEYWORDS]
-        card_cost = row[CARD_COST]
-        card_engagement = row[CARD_ENGAGEMENT]
-        card_threat = row[CARD_THREAT]
-        card_willpower = row[CARD_WILLPOWER]
-        card_attack = row[CARD_ATTACK]
-        card_defense = row[CARD_DEFENSE]
-        card_health = row[CARD_HEALTH]
-        card_quest = row[CARD_QUEST]
-        card_victory = row[CARD_VICTORY]
-        card_text = row[CARD_TEXT]
-        card_shadow = row[CARD_SHADOW]
-        card_flavour = row[CARD_FLAVOUR]
-        card_printed_number = row[CARD_PRINTED_NUMBER]
-        card_encounter_set_number = row[CARD_ENCOUNTER_SET_NUMBER]
-        card_encounter_set_icon = row[CARD_ENCOUNTER_SET_ICON]
-        card_flags = row[CARD_FLAGS]
-        card_icons = row[CARD_ICONS]
-        card_info = row[CARD_INFO]
-        card_artist = row[CARD_ARTIST]
-        card_panx = row[CARD_PANX]
-        card_pany = row[CARD_PANY]
-        card_scale = row[CARD_SCALE]
-        card_portrait_shadow = row[CARD_PORTRAIT_SHADOW]
-
-        card_name_back = row[BACK_PREFIX + CARD_NAME]
-        card_unique_back = row[BACK_PREFIX + CARD_UNIQUE]
-        card_type_back = row[BACK_PREFIX + CARD_TYPE]
-        card_sphere_back = row[BACK_PREFIX + CARD_SPHERE]
-        card_traits_back = row[BACK_PREFIX + CARD_TRAITS]
-        card_keywords_back = row[BACK_PREFIX + CARD_KEYWORDS]
-        card_cost_back = row[BACK_PREFIX + CARD_COST]
-        card_engagement_back = row[BACK_PREFIX + CARD_ENGAGEMENT]
-        card_threat_back = row[BACK_PREFIX + CARD_THREAT]
-        card_willpower_back = row[BACK_PREFIX + CARD_WILLPOWER]
-        card_attack_back = row[BACK_PREFIX + CARD_ATTACK]
-        card_defense_back = row[BACK_PREFIX + CARD_DEFENSE]
-        card_health_back = row[BACK_PREFIX + CARD_HEALTH]
-        card_quest_back = row[BACK_PREFIX + CARD_QUEST]
-        card_victory_back = row[BACK_PREFIX + CARD_VICTORY]
-        card_text_back = row[BACK_PREFIX + CARD_TEXT]
-        card_shadow_back = row[BACK_PREFIX + CARD_SHADOW]
-        card_flavour_back = row[BACK_PREFIX + CARD_FLAVOUR]
-        card_printed_number_back = row[BACK_PREFIX + CARD_PRINTED_NUMBER]
-        card_encounter_set_number_back = row[
-            BACK_PREFIX + CARD_ENCOUNTER_SET_NUMBER]
-        card_encounter_set_icon_back = row[
-            BACK_PREFIX + CARD_ENCOUNTER_SET_ICON]
-        card_flags_back = row[BACK_PREFIX + CARD_FLAGS]
-        card_icons_back = row[BACK_PREFIX + CARD_ICONS]
-        card_info_back = row[BACK_PREFIX + CARD_INFO]
-        card_artist_back = row[BACK_PREFIX + CARD_ARTIST]
-        card_panx_back = row[BACK_PREFIX + CARD_PANX]
-        card_pany_back = row[BACK_PREFIX + CARD_PANY]
-        card_scale_back = row[BACK_PREFIX + CARD_SCALE]
-        card_portrait_shadow_back = row[BACK_PREFIX + CARD_PORTRAIT_SHADOW]
-
-        card_easy_mode = row[CARD_EASY_MODE]
-        card_additional_encounter_sets = row[CARD_ADDITIONAL_ENCOUNTER_SETS]
-        card_adventure = row[CARD_ADVENTURE]
-        card_collection_icon = row[CARD_COLLECTION_ICON]
-        card_copyright = row[CARD_COPYRIGHT]
-        card_back = row[CARD_BACK]
-        card_deck_rules = row[CARD_DECK_RULES]
-        card_scratch = row[CARD_SCRATCH]
-        card_selected = row[CARD_SELECTED]
-        card_last_design_change_date = row[CARD_LAST_DESIGN_CHANGE_DATE]
-        row_info = '{}{}{}{}'.format(
-            ', {}'.format(card_name) if card_name else '',
-            ' ({})'.format(row[CARD_SET_NAME]) if row[CARD_SET_NAME] else '',
-            ' [Card GUID: {}]'.format(card_id) if card_id else '',
-            ' (Scratch)' if card_scratch else '')
-
-        if set_id is None:
-            message = 'Missing set ID for row #{}{}'.format(i, row_info)
+    if card_quantity is None:
+        message = 'Missing card quantity for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif not is_positive_int(card_quantity):
+        message = ('Incorrect format for card quantity for row '
+                   '#{}{}'.format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_type in CARD_TYPES_ONE_COPY and card_quantity != 1 and
+          not (card_flags and
+               F_ADDITIONALCOPIES in extract_flags(card_flags))):
+        message = ('Incorrect card quantity according to its card type '
+                   'for row #{}{}'.format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_type in CARD_TYPES_THREE_COPIES and
+          card_sphere not in CARD_SPHERES_BOON and
+          card_quantity not in {1, 3} and
+          not (card_flags and
+               F_ADDITIONALCOPIES in extract_flags(card_flags))):
+        message = ('Incorrect card quantity according to its card type '
+                   'for row #{}{}'.format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if (card_encounter_set is None and  # pylint: disable=R0916
+            ((card_type in CARD_TYPES_ENCOUNTER_SET and
+              card_sphere not in CARD_SPHERES_NO_ENCOUNTER_SET) or
+             (card_name_back is not None and
+              card_type_back in CARD_TYPES_ENCOUNTER_SET and
+              card_sphere_back not in CARD_SPHERES_NO_ENCOUNTER_SET))):
+        message = 'Missing encounter set for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_encounter_set is not None and  # pylint: disable=R0916
+          ((card_type in CARD_TYPES_NO_ENCOUNTER_SET or
+            card_sphere in CARD_SPHERES_NO_ENCOUNTER_SET) and
+           (card_name_back is None or
+            card_type_back in CARD_TYPES_NO_ENCOUNTER_SET or
+            card_sphere_back in CARD_SPHERES_NO_ENCOUNTER_SET))):
+        message = 'Unnecessary encounter set for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_encounter_set is not None and
+          not (card_flags and F_IGNORENAME in extract_flags(
+              card_flags, conf['ignore_ignore_flags']))):
+        capitalization_errors = _get_capitalization_errors(
+            card_encounter_set)
+        if capitalization_errors:
+            message = (
+                'Capitalization error(s) in encounter set for row #{}{}: '
+                '{} (use IgnoreName flag to ignore)'.format(
+                    i, row_info, ', '.join(capitalization_errors)))
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
-        elif set_id == '[filtered set]':
+            else:
+                broken_set_ids.add(set_id)
+
+    if card_name is None:
+        message = 'Missing card name for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_name is not None and
+          not (card_flags and F_IGNORENAME in extract_flags(
+              card_flags, conf['ignore_ignore_flags']))):
+        capitalization_errors = _get_capitalization_errors(card_name)
+        if capitalization_errors:
             message = (
-                'Reusing non-scratch set ID for row #{}{} (which is '
-                'prohibited)'.format(i, row_info))
+                'Capitalization error(s) in card name for row #{}{}: {} '
+                '(use IgnoreName flag to ignore)'.format(
+                    i, row_info, ', '.join(capitalization_errors)))
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
-        elif set_id not in all_set_ids:
-            message = 'Unknown set ID for row #{}{}'.format(i, row_info)
+            else:
+                broken_set_ids.add(set_id)
+
+    if card_name_back is not None and card_type_back is None:
+        message = 'Unnecessary card name back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_name_back is None and card_type_back is not None:
+        message = 'Missing card name back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_name_back is not None and
+          not (card_flags_back and
+               F_IGNORENAME in extract_flags(
+                   card_flags_back, conf['ignore_ignore_flags']))):
+        capitalization_errors = _get_capitalization_errors(card_name_back)
+        if capitalization_errors:
+            message = (
+                'Capitalization error(s) in card name back for row #{}{}: '
+                '{} (use IgnoreName flag to ignore)'.format(
+                    i, row_info, ', '.join(capitalization_errors)))
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
+            else:
+                broken_set_ids.add(set_id)
 
-        if card_id is None:
-            message = 'Missing card ID for row #{}{}'.format(i, row_info)
+    if card_unique is not None and card_unique not in {'1', 1}:
+        message = 'Incorrect format for unique flag for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif ((card_unique is None and card_type in CARD_TYPES_UNIQUE) or
+          (card_unique in {'1', 1} and
+           card_type in CARD_TYPES_NO_UNIQUE)):
+        message = (
+            'Incorrect unique flag according to its card type for '
+            'row #{}{}'.format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_unique_back is not None and card_type_back is None:
+        message = 'Unnecessary unique flag back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_unique_back is not None and card_unique_back not in {'1', 1}:
+        message = ('Incorrect format for unique flag back for row #{}{}'
+                   .format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif ((card_unique_back is None and
+           card_type_back in CARD_TYPES_UNIQUE) or
+          (card_unique_back in {'1', 1} and
+           card_type_back in CARD_TYPES_NO_UNIQUE)):
+        message = ('Incorrect unique flag back according to its card type '
+                   'for row #{}{}'.format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_type is None:
+        message = 'Missing card type for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_type not in CARD_TYPES:
+        message = 'Unknown card type for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_type_back is not None and card_type_back not in CARD_TYPES:
+        message = 'Unknown card type back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_type in CARD_TYPES_DOUBLESIDE_DEFAULT
+          and card_type_back is not None and card_type_back != card_type):
+        message = ('Incorrect card type back according to its card type '
+                   'front for row #{}{}'.format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_type not in CARD_TYPES_DOUBLESIDE_DEFAULT
+          and card_type_back in CARD_TYPES_DOUBLESIDE_DEFAULT):
+        message = ('Incorrect card type back according to its card type '
+                   'front for row #{}{}'.format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_type == T_CAMPAIGN:
+        spheres = SPHERES_CAMPAIGN.copy()
+    elif card_type == T_OBJECTIVE:
+        spheres = SPHERES_OBJECTIVE.copy()
+    elif card_type == T_ENCOUNTER_SIDE_QUEST:
+        spheres = SPHERES_SIDE_QUEST.copy()
+    elif card_type == T_RULES:
+        spheres = SPHERES_RULES.copy()
+    elif card_type == T_PRESENTATION:
+        spheres = SPHERES_PRESENTATION.copy()
+    elif card_type == T_SHIP_OBJECTIVE:
+        spheres = SPHERES_SHIP_OBJECTIVE.copy()
+    elif card_type in CARD_TYPES_PLAYER_SPHERE:
+        spheres = SPHERES_PLAYER.copy()
+    else:
+        spheres = SPHERES.copy()
+
+    if card_type in CARD_TYPES_BOON:
+        spheres.add(S_BOON)
+
+    if card_type in CARD_TYPES_BOON_SPHERE:
+        spheres.update([S_BOONLEADERSHIP, S_BOONLORE, S_BOONSPIRIT,
+                        S_BOONTACTICS])
+
+    if card_type in CARD_TYPES_BURDEN:
+        spheres.add(S_BURDEN)
+
+    if card_type in CARD_TYPES_NIGHTMARE:
+        spheres.add(S_NIGHTMARE)
+
+    if card_type in CARD_TYPES_NOSTAT:
+        spheres.add(S_NOSTAT)
+
+    if (card_sphere is None and
+            (card_type in CARD_TYPES_PLAYER_SPHERE or
+             card_type == T_PRESENTATION)):
+        message = 'Missing sphere for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_sphere is not None and card_sphere not in spheres:
+        message = 'Unknown sphere for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if not is_doubleside(card_type, card_type_back):
+        if card_type_back == T_SHIP_OBJECTIVE:
+            spheres_back = SPHERES_SHIP_OBJECTIVE.copy()
+        elif card_type_back in CARD_TYPES_PLAYER_SPHERE:
+            spheres_back = SPHERES_PLAYER.copy()
+        else:
+            spheres_back = SPHERES.copy()
+
+        if card_type_back in CARD_TYPES_BOON:
+            spheres_back.add(S_BOON)
+
+        if card_type_back in CARD_TYPES_BOON_SPHERE:
+            spheres_back.update([S_BOONLEADERSHIP, S_BOONLORE,
+                                 S_BOONSPIRIT, S_BOONTACTICS])
+
+        if card_type_back in CARD_TYPES_BURDEN:
+            spheres_back.add(S_BURDEN)
+
+        if card_type_back in CARD_TYPES_NIGHTMARE:
+            spheres_back.add(S_NIGHTMARE)
+
+        if card_type_back in CARD_TYPES_NOSTAT:
+            spheres_back.add(S_NOSTAT)
+
+        if card_sphere_back is not None and card_type_back is None:
+            message = 'Unnecessary sphere back for row #{}{}'.format(
+                i, row_info)
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
-        elif card_id in card_ids or card_id in card_scratch_ids:
-            message = 'Duplicate card ID for row #{}{}'.format(i, row_info)
+        elif (card_sphere_back is None and
+              card_type_back in CARD_TYPES_PLAYER_SPHERE):
+            message = 'Missing sphere back for row #{}{}'.format(
+                i, row_info)
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
-        elif not re.match(UUID_REGEX, card_id):
-            message = 'Incorrect card ID format for row #{}{}'.format(
+        elif (card_sphere_back is not None and
+              card_sphere_back not in spheres_back):
+            message = 'Unknown sphere back for row #{}{}'.format(
                 i, row_info)
             logging.error(message)
             if not card_scratch:
@@ -4285,2324 +5225,2182 @@ def sanity_check(conf, sets):  # pylint: disable=R0912,R0914,R0915
             else:
                 broken_set_ids.add(set_id)
 
-        if card_scratch:
-            card_scratch_ids.add(card_id)
+    if (card_type == T_QUEST and card_sphere == T_NIGHTMARE and
+            card_sphere_back is None):
+        message = 'Sphere back must be "Nightmare" for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
         else:
-            card_ids.add(card_id)
-
-        if not conf['run_sanity_check_for_all_sets'] and set_id not in set_ids:
-            continue
-
-        for error in PRE_SANITY_CHECK['name'].get((i, card_scratch), []):
-            message = ('{} for row #{}{} (use IgnoreName flag to ignore)'
-                       .format(error, i, row_info))
+            broken_set_ids.add(set_id)
+
+    if (card_traits is None and
+            card_type in CARD_TYPES_TRAITS and
+            not (card_flags and F_NOTRAITS in extract_flags(card_flags))):
+        message = 'Missing traits for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_traits is not None and card_type in CARD_TYPES_NO_TRAITS:
+        message = 'Unnecessary traits for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_traits is None and
+          card_sphere in CARD_SPHERES_TRAITS and
+          not (card_flags and F_NOTRAITS in extract_flags(card_flags))):
+        message = 'Missing traits for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_traits is not None and
+          not str(card_traits).endswith('.') and
+          not str(card_traits).endswith('.[/size]')):
+        message = 'Missing period in traits for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_traits is not None and
+          re.sub(r'\[[^\]]+\]', '', card_traits.replace('.', '')
+                 .replace(' ', '')) == ''):
+        message = 'Incorrect traits for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_traits is not None and
+          not (card_flags and F_IGNORENAME in extract_flags(
+              card_flags, conf['ignore_ignore_flags']))):
+        capitalization_errors = _get_capitalization_errors(
+            re.sub(r'\[[^\]]+\]', '', card_traits))
+        if capitalization_errors:
+            message = (
+                'Capitalization error(s) in traits for row #{}{}: {} '
+                '(use IgnoreName flag to ignore)'.format(
+                    i, row_info, ', '.join(capitalization_errors)))
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
+            else:
+                broken_set_ids.add(set_id)
 
-        for error in PRE_SANITY_CHECK['ref'].get(
-                (i, card_scratch, L_ENGLISH), []):
-            message = '{} for row #{}{}'.format(error, i, row_info)
+    if card_traits_back is not None and card_type_back is None:
+        message = 'Unnecessary traits back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_traits_back is None and
+          card_type_back in CARD_TYPES_TRAITS and
+          not (card_flags_back and
+               F_NOTRAITS in extract_flags(card_flags_back))):
+        message = 'Missing traits back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_traits_back is not None and
+          card_type_back in CARD_TYPES_NO_TRAITS):
+        message = 'Unnecessary traits back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_traits_back is None and
+          card_sphere_back in CARD_SPHERES_TRAITS and
+          not (card_flags_back and
+               F_NOTRAITS in extract_flags(card_flags_back))):
+        message = 'Missing traits back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_traits_back is not None and
+          not str(card_traits_back).endswith('.') and
+          not str(card_traits_back).endswith('.[/size]')):
+        message = 'Missing period in traits back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_traits_back is not None and
+          re.sub(r'\[[^\]]+\]', '', card_traits_back.replace('.', '')
+                 .replace(' ', '')) == ''):
+        message = 'Incorrect traits back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_traits_back is not None and
+          not (card_flags_back and
+               F_IGNORENAME in extract_flags(
+                   card_flags_back, conf['ignore_ignore_flags']))):
+        capitalization_errors = _get_capitalization_errors(
+            re.sub(r'\[[^\]]+\]', '', card_traits_back))
+        if capitalization_errors:
+            message = (
+                'Capitalization error(s) in traits back for row #{}{}: {} '
+                '(use IgnoreName flag to ignore)'.format(
+                    i, row_info, ', '.join(capitalization_errors)))
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
+            else:
+                broken_set_ids.add(set_id)
 
-        for error in PRE_SANITY_CHECK['flavour'].get(
-                (i, card_scratch, L_ENGLISH), []):
-            message = '{} for row #{}{}'.format(error, i, row_info)
-            if not [l for l in conf['languages'] if l != L_ENGLISH]:
-                if message.startswith('Possibly '):
-                    logging.warning(message)
-                else:
-                    logging.error(message)
+    if card_keywords is not None and card_type in CARD_TYPES_NO_KEYWORDS:
+        message = 'Unnecessary keywords for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_keywords is not None and
+          not str(card_keywords).endswith('.') and
+          not str(card_keywords).endswith('.[inline]')):
+        message = 'Missing period in keywords for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_keywords is not None and
+          card_keywords.replace('[inline]', '').replace('.', '')
+          .replace(' ', '') == ''):
+        message = 'Incorrect keywords for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_keywords is not None and not
+          re.match(KEYWORDS_REGEX,
+                   card_keywords.replace('[inline]', ''))):
+        message = 'Incorrect keywords for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_keywords_back is not None and card_type_back is None:
+        message = 'Unnecessary keywords back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_keywords_back is not None and
+          card_type_back in CARD_TYPES_NO_KEYWORDS):
+        message = 'Unnecessary keywords back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_keywords_back is not None and
+          not str(card_keywords_back).endswith('.') and
+          not str(card_keywords_back).endswith('.[inline]')):
+        message = 'Missing period in keywords back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_keywords_back is not None and
+          card_keywords_back.replace('[inline]', '').replace('.', '')
+          .replace(' ', '') == ''):
+        message = 'Incorrect keywords back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_keywords_back is not None and not
+          re.match(KEYWORDS_REGEX,
+                   card_keywords_back.replace('[inline]', ''))):
+        message = 'Incorrect keywords back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
 
-        for error in PRE_SANITY_CHECK['shadow'].get(
-                (i, card_scratch, L_ENGLISH), []):
-            message = '{} for row #{}{}'.format(error, i, row_info)
-            if not [l for l in conf['languages'] if l != L_ENGLISH]:
-                logging.warning(message)
+    if card_cost is None and card_type in CARD_TYPES_COST:
+        message = 'Missing cost for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_cost is not None and card_type not in CARD_TYPES_COST:
+        message = 'Unnecessary cost for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_type == T_HERO and
+          not re.match(r'^[1-9]?[0-9]$', str(card_cost))):
+        message = 'Incorrect cost value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_type == T_QUEST and not re.match(r'^[1-9]$', str(card_cost)):
+        message = 'Incorrect cost value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_type not in {T_HERO, T_QUEST} and card_cost is not None and
+          not re.match(r'^[1-9]?[0-9]$', str(card_cost)) and
+          card_cost not in ALLOWED_NON_INT):
+        message = 'Incorrect cost value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_type not in {T_HERO, T_QUEST} and card_cost is not None and
+          (B_ENCOUNTER in extract_keywords(card_keywords) or
+           card_back == B_ENCOUNTER) and
+          card_cost != '-'):
+        message = 'Incorrect cost value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_cost_back is not None and card_type_back is None:
+        message = 'Unnecessary cost back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_cost_back is None and card_type_back in CARD_TYPES_COST:
+        message = 'Missing cost back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_cost_back is not None and
+          card_type_back not in CARD_TYPES_COST):
+        message = 'Unnecessary cost back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_type_back == T_HERO and
+          not re.match(r'^[1-9]?[0-9]$', str(card_cost_back))):
+        message = 'Incorrect cost back value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_type_back == T_QUEST and
+          not re.match(r'^[1-9]$', str(card_cost_back))):
+        message = 'Incorrect cost back value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_type_back not in {T_HERO, T_QUEST} and
+          card_cost_back is not None and
+          not re.match(r'^[1-9]?[0-9]$', str(card_cost_back)) and
+          card_cost_back not in ALLOWED_NON_INT):
+        message = 'Incorrect cost back value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_type_back not in {T_HERO, T_QUEST} and
+          card_cost_back is not None and
+          B_ENCOUNTER in extract_keywords(card_keywords_back) and
+          card_cost_back != '-'):
+        message = 'Incorrect cost back value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_engagement is None and card_type in CARD_TYPES_ENGAGEMENT:
+        message = 'Missing engagement cost for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_engagement is not None and
+          card_type not in CARD_TYPES_ENGAGEMENT):
+        message = 'Unnecessary engagement cost for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_type == T_QUEST and
+          not re.match(r'^[ACEG]$', str(card_engagement))):
+        message = 'Incorrect engagement cost value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_type != T_QUEST and card_engagement is not None and
+          not re.match(r'^[1-9]?[0-9]$', str(card_engagement)) and
+          card_engagement not in ALLOWED_NON_INT):
+        message = 'Incorrect engagement cost value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_engagement_back is not None and card_type_back is None:
+        message = 'Unnecessary engagement cost back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_engagement_back is None and
+          card_type_back in CARD_TYPES_ENGAGEMENT):
+        message = 'Missing engagement cost back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_engagement_back is not None and
+          card_type_back not in CARD_TYPES_ENGAGEMENT):
+        message = 'Unnecessary engagement cost back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_type_back == T_QUEST and
+          not re.match(r'^[BDFH]$', str(card_engagement_back))):
+        message = ('Incorrect engagement cost back value for row #{}{}'
+                   .format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_type_back != T_QUEST and
+          card_engagement_back is not None and
+          not re.match(r'^[1-9]?[0-9]$', str(card_engagement_back)) and
+          card_engagement_back not in ALLOWED_NON_INT):
+        message = (
+            'Incorrect engagement cost back value for row #{}{}'.format(
+                i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_threat is None and card_type in CARD_TYPES_THREAT:
+        message = 'Missing threat for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_threat is not None and card_type not in CARD_TYPES_THREAT:
+        message = 'Unnecessary threat for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_threat is not None and
+          not re.match(r'^[1-9]?[0-9]$', str(card_threat)) and
+          card_threat not in ALLOWED_NON_INT):
+        message = 'Incorrect threat value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_threat_back is not None and card_type_back is None:
+        message = 'Unnecessary threat back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_threat_back is None and card_type_back in CARD_TYPES_THREAT:
+        message = 'Missing threat back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_threat_back is not None and
+          card_type_back not in CARD_TYPES_THREAT):
+        message = 'Unnecessary threat back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_threat_back is not None and
+          not re.match(r'^[1-9]?[0-9]$', str(card_threat_back)) and
+          card_threat_back not in ALLOWED_NON_INT):
+        message = 'Incorrect threat back value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_willpower is None and card_type in CARD_TYPES_WILLPOWER:
+        message = 'Missing willpower for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_willpower is not None and
+          card_type not in CARD_TYPES_WILLPOWER):
+        message = 'Unnecessary willpower for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_willpower is not None and
+          not re.match(r'^[1-9]?[0-9]$', str(card_willpower)) and
+          card_willpower not in ALLOWED_NON_INT):
+        message = 'Incorrect willpower value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_willpower_back is not None and card_type_back is None:
+        message = 'Unnecessary willpower back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_willpower_back is None and
+          card_type_back in CARD_TYPES_WILLPOWER):
+        message = 'Missing willpower back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_willpower_back is not None and
+          card_type_back not in CARD_TYPES_WILLPOWER):
+        message = 'Unnecessary willpower back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_willpower_back is not None and
+          not re.match(r'^[1-9]?[0-9]$', str(card_willpower_back)) and
+          card_willpower_back not in ALLOWED_NON_INT):
+        message = 'Incorrect willpower back value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_attack is None and card_type in CARD_TYPES_COMBAT:
+        message = 'Missing attack for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_attack is not None and
+          card_type not in CARD_TYPES_COMBAT):
+        message = 'Unnecessary attack for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_attack is not None and
+          not re.match(r'^[1-9]?[0-9]$', str(card_attack)) and
+          card_attack not in ALLOWED_NON_INT):
+        message = 'Incorrect attack value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_attack_back is not None and card_type_back is None:
+        message = 'Unnecessary attack back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_attack_back is None and
+          card_type_back in CARD_TYPES_COMBAT):
+        message = 'Missing attack back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_attack_back is not None and
+          card_type_back not in CARD_TYPES_COMBAT):
+        message = 'Unnecessary attack back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_attack_back is not None and
+          not re.match(r'^[1-9]?[0-9]$', str(card_attack_back)) and
+          card_attack_back not in ALLOWED_NON_INT):
+        message = 'Incorrect attack back value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_defense is None and card_type in CARD_TYPES_COMBAT:
+        message = 'Missing defense for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_defense is not None and
+          card_type not in CARD_TYPES_COMBAT):
+        message = 'Unnecessary defense for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_defense is not None and
+          not re.match(r'^[1-9]?[0-9]$', str(card_defense)) and
+          card_defense not in ALLOWED_NON_INT):
+        message = 'Incorrect defense value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_defense_back is not None and card_type_back is None:
+        message = 'Unnecessary defense back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_defense_back is None and
+          card_type_back in CARD_TYPES_COMBAT):
+        message = 'Missing defense back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_defense_back is not None and
+          card_type_back not in CARD_TYPES_COMBAT):
+        message = 'Unnecessary defense back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_defense_back is not None and
+          not re.match(r'^[1-9]?[0-9]$', str(card_defense_back)) and
+          card_defense_back not in ALLOWED_NON_INT):
+        message = 'Incorrect defense back value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_health is None and card_type in CARD_TYPES_COMBAT:
+        message = 'Missing health for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_health is not None and
+          card_type not in CARD_TYPES_COMBAT):
+        message = 'Unnecessary health for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_health is not None and
+          not re.match(r'^[1-9]?[0-9]$', str(card_health)) and
+          card_health not in ALLOWED_NON_INT):
+        message = 'Incorrect health value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_health_back is not None and card_type_back is None:
+        message = 'Unnecessary health back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_health_back is None and
+          card_type_back in CARD_TYPES_COMBAT):
+        message = 'Missing health back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_health_back is not None and
+          card_type_back not in CARD_TYPES_COMBAT):
+        message = 'Unnecessary health back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_health_back is not None and
+          not re.match(r'^[1-9]?[0-9]$', str(card_health_back)) and
+          card_health_back not in ALLOWED_NON_INT):
+        message = 'Incorrect health back value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if (card_quest is None and card_type in CARD_TYPES_QUEST and
+            card_sphere not in CARD_SPHERES_NO_QUEST):
+        message = 'Missing quest points for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_quest is not None and
+          (card_type not in CARD_TYPES_QUEST or
+           card_sphere in CARD_SPHERES_NO_QUEST)):
+        message = 'Unnecessary quest points for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_quest is not None and
+          not re.match(r'^[1-9]?[0-9]$', str(card_quest)) and
+          card_quest not in ALLOWED_NON_INT):
+        message = 'Incorrect quest points value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_quest_back is not None and card_type_back is None:
+        message = 'Unnecessary quest points back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_quest_back is None and (
+            card_type_back in CARD_TYPES_QUEST
+            or card_type in CARD_TYPES_QUEST_BACK) and
+          card_sphere_back not in CARD_SPHERES_NO_QUEST):
+        message = 'Missing quest points back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_quest_back is not None and
+          (card_type_back not in CARD_TYPES_QUEST or
+           card_sphere_back in CARD_SPHERES_NO_QUEST) and
+          card_type not in CARD_TYPES_QUEST_BACK):
+        message = 'Unnecessary quest points back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_quest_back is not None and
+          not re.match(r'^[1-9]?[0-9]$', str(card_quest_back)) and
+          card_quest_back not in ALLOWED_NON_INT):
+        message = 'Incorrect quest points back value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
 
-        if card_number is None:
-            message = 'Missing card number for row #{}{}'.format(i, row_info)
+    if card_victory is not None and card_type in CARD_TYPES_PAGES:
+        if len(str(card_victory).split('/')) != 2:
+            message = ('Incorrect format for victory points for row '
+                       '#{}{}'.format(i, row_info))
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
-        elif len(_handle_int_str(card_number)) > 3:
-            message = 'Card number is too long for row #{}{}'.format(
-                i, row_info)
+        elif not (is_positive_int(str(card_victory)
+                                  .split('/', maxsplit=1)[0]) and
+                  is_positive_int(str(card_victory).split('/')[1])):
+            message = ('Incorrect format for victory points for row '
+                       '#{}{}'.format(i, row_info))
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
-
-        if set_id is not None and card_number is not None:
-            if (set_id, card_number) in card_set_numbers:
-                message = ('Duplicate card set and card number combination '
-                           'for row #{}{}'.format(i, row_info))
-                logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
-            else:
-                card_set_numbers.add((set_id, card_number))
-
-        if card_quantity is None:
-            message = 'Missing card quantity for row #{}{}'.format(i, row_info)
+    elif card_victory is not None and card_type not in CARD_TYPES_VICTORY:
+        message = 'Unnecessary victory points for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_victory is not None and
+          card_sphere in CARD_SPHERES_NO_VICTORY):
+        message = 'Unnecessary victory points for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_victory_back is not None and card_type_back is None:
+        message = 'Unnecessary victory points back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_victory_back is not None and card_type_back == T_RULES:
+        if len(str(card_victory_back).split('/')) != 2:
+            message = ('Incorrect format for victory points back for row '
+                       '#{}{}'.format(i, row_info))
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
-        elif not is_positive_int(card_quantity):
-            message = ('Incorrect format for card quantity for row '
+        elif not (is_positive_int(str(card_victory_back)
+                                  .split('/', maxsplit=1)[0]) and
+                  is_positive_int(str(card_victory_back).split('/')[1])):
+            message = ('Incorrect format for victory points back for row '
                        '#{}{}'.format(i, row_info))
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
-        elif (card_type in CARD_TYPES_ONE_COPY and card_quantity != 1 and
-              not (card_flags and
-                   F_ADDITIONALCOPIES in extract_flags(card_flags))):
-            message = ('Incorrect card quantity according to its card type '
-                       'for row #{}{}'.format(i, row_info))
+    elif (card_victory_back is not None and
+          card_type_back not in CARD_TYPES_VICTORY and
+          card_type not in CARD_TYPES_VICTORY_BACK):
+        message = 'Unnecessary victory points back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_victory_back is not None and
+          card_sphere_back in CARD_SPHERES_NO_VICTORY):
+        message = 'Unnecessary victory points back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_text is not None and card_type in CARD_TYPES_NO_TEXT:
+        message = 'Unnecessary text for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_text is not None and card_sphere in CARD_SPHERES_NO_TEXT:
+        message = 'Unnecessary text for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_text is not None and card_text != 'TBD' and
+          card_type not in CARD_TYPES_NO_PERIOD_CHECK and
+          not _verify_period(card_text)):
+        message = ('Missing period at the end of the text paragraph for '
+                   'row #{}{}'.format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_text is not None and
+          card_type != T_PRESENTATION and card_sphere != S_BACK and
+          not (card_flags and F_IGNORERULES in extract_flags(
+              card_flags, conf['ignore_ignore_flags']))):
+        rules_errors = _get_rules_errors(card_text, CARD_TEXT, row)
+        if rules_errors:
+            message = (
+                'Rules error(s) in text for row #{}{}: {} (use '
+                'IgnoreRules flag to ignore)'.format(
+                    i, row_info, ', '.join(rules_errors)))
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
-        elif (card_type in CARD_TYPES_THREE_COPIES and
-              card_sphere not in CARD_SPHERES_BOON and
-              card_quantity not in {1, 3} and
-              not (card_flags and
-                   F_ADDITIONALCOPIES in extract_flags(card_flags))):
-            message = ('Incorrect card quantity according to its card type '
-                       'for row #{}{}'.format(i, row_info))
+
+    if card_text_back is not None and card_type_back is None:
+        message = 'Unnecessary text back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_text_back is not None and
+          card_type_back in CARD_TYPES_NO_TEXT_BACK):
+        message = 'Unnecessary text back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_text_back is not None and
+          card_sphere_back in CARD_SPHERES_NO_TEXT):
+        message = 'Unnecessary text back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_text_back is not None and card_text_back != 'TBD' and
+          card_type_back not in CARD_TYPES_NO_PERIOD_CHECK and
+          not _verify_period(card_text_back)):
+        message = ('Missing period at the end of the text back paragraph '
+                   'for row #{}{}'.format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_text_back is not None and
+          card_type_back != T_PRESENTATION and
+          card_sphere != S_BACK and
+          not (card_flags_back and
+               F_IGNORERULES in extract_flags(
+                   card_flags_back, conf['ignore_ignore_flags']))):
+        rules_errors = _get_rules_errors(card_text_back,
+                                         BACK_PREFIX + CARD_TEXT, row)
+        if rules_errors:
+            message = (
+                'Rules error(s) in text back for row #{}{}: {} (use '
+                'IgnoreRules flag to ignore)'.format(
+                    i, row_info, ', '.join(rules_errors)))
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
 
-        if (card_encounter_set is None and  # pylint: disable=R0916
-                ((card_type in CARD_TYPES_ENCOUNTER_SET and
-                  card_sphere not in CARD_SPHERES_NO_ENCOUNTER_SET) or
-                 (card_name_back is not None and
-                  card_type_back in CARD_TYPES_ENCOUNTER_SET and
-                  card_sphere_back not in CARD_SPHERES_NO_ENCOUNTER_SET))):
-            message = 'Missing encounter set for row #{}{}'.format(i, row_info)
+    if (card_text is not None and '[split]' in card_text and
+            card_sphere != S_CAVE):
+        message = 'Invalid [split] tag in text for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if (card_text_back is not None and '[split]' in card_text_back and
+            card_sphere_back != S_CAVE):
+        message = 'Invalid [split] tag in text back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if (card_shadow is not None and card_type not in CARD_TYPES_SHADOW and
+            not (card_type in CARD_TYPES_SHADOW_ENCOUNTER and
+                 (B_ENCOUNTER in extract_keywords(card_keywords) or
+                  card_back == B_ENCOUNTER))):
+        message = 'Unnecessary shadow for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_shadow is not None and
+          not _verify_shadow_case(card_shadow, L_ENGLISH)):
+        message = ('Shadow effect should start with a capital letter for '
+                   'row #{}{}'.format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_shadow is not None and card_shadow != 'TBD' and
+          not _verify_period(card_shadow)):
+        message = ('Missing period at the end of shadow for row #{}{}'
+                   .format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_shadow is not None and
+          not (card_flags and F_IGNORERULES in extract_flags(
+              card_flags, conf['ignore_ignore_flags']))):
+        rules_errors = _get_rules_errors(card_shadow, CARD_SHADOW, row)
+        if rules_errors:
+            message = (
+                'Rules error(s) in shadow for row #{}{}: {} (use '
+                'IgnoreRules flag to ignore)'.format(
+                    i, row_info, ', '.join(rules_errors)))
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
-        elif (card_encounter_set is not None and  # pylint: disable=R0916
-              ((card_type in CARD_TYPES_NO_ENCOUNTER_SET or
-                card_sphere in CARD_SPHERES_NO_ENCOUNTER_SET) and
-               (card_name_back is None or
-                card_type_back in CARD_TYPES_NO_ENCOUNTER_SET or
-                card_sphere_back in CARD_SPHERES_NO_ENCOUNTER_SET))):
-            message = 'Unnecessary encounter set for row #{}{}'.format(
-                i, row_info)
+
+    if card_shadow_back is not None and card_type_back is None:
+        message = 'Unnecessary shadow back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_shadow_back is not None:
+        message = 'Unnecessary shadow back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_shadow_back is not None and
+          not _verify_shadow_case(card_shadow_back, L_ENGLISH)):
+        message = ('Shadow back effect should start with a capital letter '
+                   'for row #{}{}'.format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_shadow_back is not None and card_shadow_back != 'TBD' and
+          not _verify_period(card_shadow_back)):
+        message = ('Missing period at the end of shadow back for row '
+                   '#{}{}'.format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_shadow_back is not None and
+          not (card_flags_back and
+               F_IGNORERULES in extract_flags(
+                   card_flags_back, conf['ignore_ignore_flags']))):
+        rules_errors = _get_rules_errors(card_shadow_back,
+                                         BACK_PREFIX + CARD_SHADOW, row)
+        if rules_errors:
+            message = (
+                'Rules error(s) in shadow back for row #{}{}: {} (use '
+                'IgnoreRules flag to ignore)'.format(
+                    i, row_info, ', '.join(rules_errors)))
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
-        elif (card_encounter_set is not None and
-              not (card_flags and F_IGNORENAME in extract_flags(
-                  card_flags, conf['ignore_ignore_flags']))):
-            capitalization_errors = _get_capitalization_errors(
-                card_encounter_set)
-            if capitalization_errors:
-                message = (
-                    'Capitalization error(s) in encounter set for row #{}{}: '
-                    '{} (use IgnoreName flag to ignore)'.format(
-                        i, row_info, ', '.join(capitalization_errors)))
-                logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
 
-        if card_name is None:
-            message = 'Missing card name for row #{}{}'.format(i, row_info)
+    if (card_flavour is not None and
+            (card_type in CARD_TYPES_NO_FLAVOUR or
+             card_sphere in CARD_SPHERES_NO_FLAVOUR)):
+        message = 'Unnecessary flavour for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_flavour_back is not None and card_type_back is None:
+        message = 'Unnecessary flavour back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_flavour_back is not None and
+          (card_type_back in CARD_TYPES_NO_FLAVOUR_BACK or
+           card_sphere_back in CARD_SPHERES_NO_FLAVOUR)):
+        message = 'Unnecessary flavour back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if (card_printed_number is not None and
+            card_type in CARD_TYPES_NO_PRINTED_NUMBER):
+        message = 'Unnecessary printed number for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_printed_number_back is not None and card_type_back is None:
+        message = 'Unnecessary printed number back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_printed_number_back is not None and
+          card_type_back in CARD_TYPES_NO_PRINTED_NUMBER_BACK):
+        message = 'Unnecessary printed number back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if (card_encounter_set_number is not None and
+            (card_type not in CARD_TYPES_ENCOUNTER_SET_NUMBER or
+             card_sphere in CARD_SPHERES_NO_ENCOUNTER_SET_NUMBER)):
+        message = 'Unnecessary encounter set number for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if (card_encounter_set_number_back is not None and
+            card_type_back is None):
+        message = ('Unnecessary encounter set number back for row #{}{}'
+                   .format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_encounter_set_number_back is not None and
+          (card_type_back not in CARD_TYPES_ENCOUNTER_SET_NUMBER or
+           card_sphere_back in CARD_SPHERES_NO_ENCOUNTER_SET_NUMBER)):
+        message = ('Unnecessary encounter set number back for row #{}{}'
+                   .format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if (card_encounter_set_icon is not None and
+            (card_type not in CARD_TYPES_ENCOUNTER_SET or
+             card_sphere in CARD_SPHERES_NO_ENCOUNTER_SET)):
+        message = 'Unnecessary encounter set icon for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if (card_encounter_set_icon_back is not None and
+            card_type_back is None):
+        message = ('Unnecessary encounter set icon back for row #{}{}'
+                   .format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_encounter_set_icon_back is not None and
+          (card_type_back not in CARD_TYPES_ENCOUNTER_SET or
+           card_sphere_back in CARD_SPHERES_NO_ENCOUNTER_SET)):
+        message = ('Unnecessary encounter set icon back for row #{}{}'
+                   .format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_flags is not None:
+        flags = extract_flags(card_flags)
+        if not flags:
+            message = 'Incorrect flags for row #{}{}'.format(i, row_info)
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
-        elif (card_name is not None and
-              not (card_flags and F_IGNORENAME in extract_flags(
-                  card_flags, conf['ignore_ignore_flags']))):
-            capitalization_errors = _get_capitalization_errors(card_name)
-            if capitalization_errors:
-                message = (
-                    'Capitalization error(s) in card name for row #{}{}: {} '
-                    '(use IgnoreName flag to ignore)'.format(
-                        i, row_info, ', '.join(capitalization_errors)))
-                logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
-
-        if card_name_back is not None and card_type_back is None:
-            message = 'Unnecessary card name back for row #{}{}'.format(
-                i, row_info)
+        elif len(flags) != len(set(flags)):
+            message = 'Duplicate flags for row #{}{}'.format(i, row_info)
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
-        elif card_name_back is None and card_type_back is not None:
-            message = 'Missing card name back for row #{}{}'.format(
-                i, row_info)
+        elif [f for f in flags if f not in FLAGS]:
+            message = 'Incorrect flags for row #{}{}'.format(i, row_info)
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
-        elif (card_name_back is not None and
-              not (card_flags_back and
-                   F_IGNORENAME in extract_flags(
-                       card_flags_back, conf['ignore_ignore_flags']))):
-            capitalization_errors = _get_capitalization_errors(card_name_back)
-            if capitalization_errors:
-                message = (
-                    'Capitalization error(s) in card name back for row #{}{}: '
-                    '{} (use IgnoreName flag to ignore)'.format(
-                        i, row_info, ', '.join(capitalization_errors)))
+
+        found_ring_flag = False
+        for flag in flags:
+            if ((flag in CARD_TYPES_FLAGS and  # pylint: disable=R0916
+                 card_type not in CARD_TYPES_FLAGS[flag]) or
+                    (flag in CARD_TYPES_NO_FLAGS and
+                     card_type in CARD_TYPES_NO_FLAGS[flag]) or
+                    (flag in CARD_SPHERES_NO_FLAGS and
+                     card_sphere in CARD_SPHERES_NO_FLAGS[flag])):
+                message = 'Unnecessary flag "{}" for row #{}{}'.format(
+                    flag, i, row_info)
                 logging.error(message)
                 if not card_scratch:
                     errors.append(message)
                 else:
                     broken_set_ids.add(set_id)
+            elif flag in RING_FLAGS:
+                if found_ring_flag:
+                    message = ('More than one ring flag for row #{}{}'
+                               .format(i, row_info))
+                    logging.error(message)
+                    if not card_scratch:
+                        errors.append(message)
+                    else:
+                        broken_set_ids.add(set_id)
+                else:
+                    found_ring_flag = True
 
-        if card_unique is not None and card_unique not in {'1', 1}:
-            message = 'Incorrect format for unique flag for row #{}{}'.format(
+    if card_flags_back is not None:
+        flags = extract_flags(card_flags_back)
+        if not flags:
+            message = 'Incorrect flags back for row #{}{}'.format(
                 i, row_info)
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
-        elif ((card_unique is None and card_type in CARD_TYPES_UNIQUE) or
-              (card_unique in {'1', 1} and
-               card_type in CARD_TYPES_NO_UNIQUE)):
-            message = (
-                'Incorrect unique flag according to its card type for '
-                'row #{}{}'.format(i, row_info))
+        elif len(flags) != len(set(flags)):
+            message = 'Duplicate flags back for row #{}{}'.format(
+                i, row_info)
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
-
-        if card_unique_back is not None and card_type_back is None:
-            message = 'Unnecessary unique flag back for row #{}{}'.format(
+        elif [f for f in flags if f not in FLAGS]:
+            message = 'Incorrect flags back for row #{}{}'.format(
                 i, row_info)
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
-        elif card_unique_back is not None and card_unique_back not in {'1', 1}:
-            message = ('Incorrect format for unique flag back for row #{}{}'
+
+        found_ring_flag = False
+        for flag in flags:
+            if ((flag in CARD_TYPES_FLAGS_BACK and  # pylint: disable=R0916
+                 card_type_back not in CARD_TYPES_FLAGS_BACK[flag]) or
+                    (flag in CARD_TYPES_NO_FLAGS_BACK and
+                     card_type_back in CARD_TYPES_NO_FLAGS_BACK[flag]) or
+                    (flag in CARD_SPHERES_NO_FLAGS and
+                     card_sphere_back in CARD_SPHERES_NO_FLAGS[flag])):
+                message = 'Unnecessary flag back "{}" for row #{}{}'.format(
+                    flag, i, row_info)
+                logging.error(message)
+                if not card_scratch:
+                    errors.append(message)
+                else:
+                    broken_set_ids.add(set_id)
+            elif flag in RING_FLAGS:
+                if found_ring_flag:
+                    message = ('More than one ring flag back for row #{}{}'
+                               .format(i, row_info))
+                    logging.error(message)
+                    if not card_scratch:
+                        errors.append(message)
+                    else:
+                        broken_set_ids.add(set_id)
+                else:
+                    found_ring_flag = True
+
+    if card_icons is not None and card_type not in CARD_TYPES_ICONS:
+        message = 'Unnecessary icons for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_icons is not None and card_sphere in CARD_SPHERES_NO_ICONS:
+        message = 'Unnecessary icons for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_icons_back is not None and card_type_back is None:
+        message = 'Unnecessary icons back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_icons_back is not None and
+          card_type_back not in CARD_TYPES_ICONS):
+        message = 'Unnecessary icons back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_icons_back is not None and
+          card_sphere_back in CARD_SPHERES_NO_ICONS):
+        message = 'Unnecessary icons back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_info is not None and card_type in CARD_TYPES_NO_INFO:
+        message = 'Unnecessary info for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_info_back is not None and card_type_back is None:
+        message = 'Unnecessary info back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_info_back is not None and
+          card_type_back in CARD_TYPES_NO_INFO_BACK):
+        message = 'Unnecessary info back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if (card_artist is not None and
+            card_type in CARD_TYPES_NO_ARTIST):
+        message = 'Unnecessary artist for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_artist is not None and 'Hogdson' in card_artist:
+        message = 'Hodgson not Hogdson in row #{}{}!'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_artist_back is not None and card_type_back is None:
+        message = 'Unnecessary artist back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_artist_back is not None and
+          card_type_back in CARD_TYPES_NO_ARTIST_BACK):
+        message = 'Unnecessary artist back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_artist_back is not None and 'Hogdson' in card_artist_back:
+        message = 'Hodgson not Hogdson in row #{}{}!'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if (card_panx is not None and
+            card_type in CARD_TYPES_NO_ARTWORK):
+        message = 'Unnecessary panx for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_panx is None and
+          (card_pany is not None or card_scale is not None)):
+        message = 'Missing panx for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_panx is not None and not _is_float(card_panx):
+        message = 'Incorrect format for panx value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_panx_back is not None and card_type_back is None:
+        message = 'Unnecessary panx back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_panx_back is not None and
+          card_type_back in CARD_TYPES_NO_ARTWORK_BACK):
+        message = 'Unnecessary panx back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_panx_back is None and
+          (card_pany_back is not None or card_scale_back is not None)):
+        message = 'Missing panx back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_panx_back is not None and not _is_float(card_panx_back):
+        message = ('Incorrect format for panx back value for row #{}{}'
+                   .format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if (card_pany is not None and
+            card_type in CARD_TYPES_NO_ARTWORK):
+        message = 'Unnecessary pany for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_pany is None and
+          (card_panx is not None or card_scale is not None)):
+        message = 'Missing pany for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_pany is not None and not _is_float(card_pany):
+        message = 'Incorrect format for pany value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_pany_back is not None and card_type_back is None:
+        message = 'Unnecessary pany back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_pany_back is not None and
+          card_type_back in CARD_TYPES_NO_ARTWORK_BACK):
+        message = 'Unnecessary pany back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_pany_back is None and
+          (card_panx_back is not None or card_scale_back is not None)):
+        message = 'Missing pany back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_pany_back is not None and not _is_float(card_pany_back):
+        message = ('Incorrect format for pany back value for row #{}{}'
+                   .format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if (card_scale is not None and
+            card_type in CARD_TYPES_NO_ARTWORK):
+        message = 'Unnecessary scale for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_scale is None and
+          (card_panx is not None or card_pany is not None)):
+        message = 'Missing scale for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_scale is not None and not _is_positive_float(card_scale):
+        message = 'Incorrect format for scale value for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_scale_back is not None and card_type_back is None:
+        message = 'Unnecessary scale back for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_scale_back is not None and
+          card_type_back in CARD_TYPES_NO_ARTWORK_BACK):
+        message = 'Unnecessary scale back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_scale_back is None and
+          (card_panx_back is not None or card_pany_back is not None)):
+        message = 'Missing scale back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_scale_back is not None and
+          not _is_positive_float(card_scale_back)):
+        message = ('Incorrect format for scale back value for row #{}{}'
+                   .format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if (card_portrait_shadow is not None and
+            card_type not in CARD_TYPES_LANDSCAPE):
+        message = 'Unnecessary portrait shadow for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_portrait_shadow not in {None, 'Black', 'PortraitTint'}:
+        message = ('Incorrect value for portrait shadow for row #{}{}'
+                   .format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_type != T_QUEST and card_portrait_shadow == 'PortraitTint':
+        message = ('Incorrect value for portrait shadow for row #{}{}'
+                   .format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_portrait_shadow_back is not None and card_type_back is None:
+        message = 'Unnecessary portrait shadow back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_portrait_shadow_back is not None and
+          card_type_back not in CARD_TYPES_LANDSCAPE):
+        message = 'Unnecessary portrait shadow back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_portrait_shadow_back not in {None, 'Black'}:
+        message = ('Incorrect value for portrait shadow back for row '
+                   '#{}{}'.format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if (card_easy_mode is not None and  # pylint: disable=R0916
+            (card_type not in CARD_TYPES_EASY_MODE
+             or card_sphere in CARD_SPHERES_NO_EASY_MODE) and
+            (card_type_back not in CARD_TYPES_EASY_MODE or
+             card_type_back is None or
+             card_sphere_back in CARD_SPHERES_NO_EASY_MODE)):
+        message = 'Unnecessary removed for easy mode for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_easy_mode is not None and
+          not is_positive_int(card_easy_mode)):
+        message = ('Incorrect format for removed for easy mode for row '
+                   '#{}{}'.format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_easy_mode is not None and
+          is_positive_int(card_quantity) and
+          int(card_easy_mode) > int(card_quantity)):
+        message = ('Removed for easy mode is greater than card quantity '
+                   'for row #{}{}'.format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_additional_encounter_sets is not None:
+        all_sets = [
+            s.strip() for s in card_additional_encounter_sets.split(';')
+            if s.strip()]
+        if card_type not in CARD_TYPES_ADDITIONAL_ENCOUNTER_SETS:
+            message = ('Unnecessary additional encounter sets for row #{}{}'
                        .format(i, row_info))
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
-        elif ((card_unique_back is None and
-               card_type_back in CARD_TYPES_UNIQUE) or
-              (card_unique_back in {'1', 1} and
-               card_type_back in CARD_TYPES_NO_UNIQUE)):
-            message = ('Incorrect unique flag back according to its card type '
-                       'for row #{}{}'.format(i, row_info))
+        elif len(all_sets) > 6:
+            message = ('Too many additional encounter sets for row #{}{}: '
+                       '{} instead of the maximum 6'.format(i, row_info,
+                                                            len(all_sets)))
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
+        else:
+            unknown_sets = [
+                s for s in all_sets if s not in ALL_ENCOUNTER_SET_NAMES]
+            if (unknown_sets and
+                    not (card_flags and
+                         F_IGNORENAME in extract_flags(
+                             card_flags, conf['ignore_ignore_flags']))):
+                message = (
+                    'Unknown additional encounter sets for row #{}{}: {} '
+                    '(use IgnoreName flag to ignore)'.format(
+                        i, row_info, '; '.join(unknown_sets)))
+                logging.error(message)
+                if not card_scratch:
+                    errors.append(message)
+                else:
+                    broken_set_ids.add(set_id)
 
-        if card_type is None:
-            message = 'Missing card type for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_type not in CARD_TYPES:
-            message = 'Unknown card type for row #{}{}'.format(i, row_info)
+    if (card_adventure is not None and  # pylint: disable=R0916
+            (card_type not in CARD_TYPES_ADVENTURE or
+             card_sphere in CARD_SPHERES_NO_ADVENTURE) and
+            (card_type_back not in CARD_TYPES_ADVENTURE or
+             card_sphere_back in CARD_SPHERES_NO_ADVENTURE or
+             card_type_back is None)):
+        message = 'Unnecessary adventure for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_adventure is None and
+          ((card_type in CARD_TYPES_ADVENTURE and
+            card_sphere not in CARD_SPHERES_NO_ADVENTURE) or
+           (card_type_back in CARD_TYPES_ADVENTURE and
+            card_sphere_back not in CARD_SPHERES_NO_ADVENTURE))):
+        message = 'Missing adventure for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif (card_adventure is not None and
+          not (card_flags and F_IGNORENAME in extract_flags(
+              card_flags, conf['ignore_ignore_flags']))):
+        capitalization_errors = _get_capitalization_errors(card_adventure)
+        if capitalization_errors:
+            message = (
+                'Capitalization error(s) in adventure for row #{}{}: '
+                '{} (use IgnoreName flag to ignore)'.format(
+                    i, row_info, ', '.join(capitalization_errors)))
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
 
-        if card_type_back is not None and card_type_back not in CARD_TYPES:
-            message = 'Unknown card type back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_type in CARD_TYPES_DOUBLESIDE_DEFAULT
-              and card_type_back is not None and card_type_back != card_type):
-            message = ('Incorrect card type back according to its card type '
-                       'front for row #{}{}'.format(i, row_info))
+    if (card_collection_icon is not None and
+            card_type in CARD_TYPES_NO_COLLECTION_ICON):
+        message = 'Unnecessary collection icon for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if card_copyright is not None and card_type in CARD_TYPES_NO_COPYRIGHT:
+        message = 'Unnecessary copyright for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if (card_back is not None and
+            (card_type in CARD_TYPES_DOUBLESIDE_DEFAULT or
+             card_type_back is not None)):
+        message = 'Unnecessary custom card back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_back not in {None, B_ENCOUNTER, B_PLAYER}:
+        message = 'Incorrect custom card back for row #{}{}'.format(
+            i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    if (card_last_design_change_date is not None and (
+            not isinstance(card_last_design_change_date, str) or
+            not re.match(r'^[0-9]{4}-[0-9]{2}-[0-9]{2}$',
+                         card_last_design_change_date))):
+        message = ('Incorrect last design change date format for row '
+                   '#{}{}: must be YYYY-MM-DD'.format(i, row_info))
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+
+    for key, value in row.items():
+        if value == '#REF!':
+            message = ('Reference error in {} column for row '
+                       '#{}{}'.format(key.replace(BACK_PREFIX,
+                                                  BACK_PREFIX_LOG), i,
+                                      row_info))
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
-        elif (card_type not in CARD_TYPES_DOUBLESIDE_DEFAULT
-              and card_type_back in CARD_TYPES_DOUBLESIDE_DEFAULT):
-            message = ('Incorrect card type back according to its card type '
-                       'front for row #{}{}'.format(i, row_info))
+        elif isinstance(value, str) and '[unmatched quot]' in value:
+            message = (
+                'Unmatched quote character in {} column for row #{}{} '
+                '(use "[quot]" tag if needed)'.format(
+                    key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
+                    row_info))
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
 
-        if card_type == T_CAMPAIGN:
-            spheres = SPHERES_CAMPAIGN.copy()
-        elif card_type == T_OBJECTIVE:
-            spheres = SPHERES_OBJECTIVE.copy()
-        elif card_type == T_ENCOUNTER_SIDE_QUEST:
-            spheres = SPHERES_SIDE_QUEST.copy()
-        elif card_type == T_RULES:
-            spheres = SPHERES_RULES.copy()
-        elif card_type == T_PRESENTATION:
-            spheres = SPHERES_PRESENTATION.copy()
-        elif card_type == T_SHIP_OBJECTIVE:
-            spheres = SPHERES_SHIP_OBJECTIVE.copy()
-        elif card_type in CARD_TYPES_PLAYER_SPHERE:
-            spheres = SPHERES_PLAYER.copy()
-        else:
-            spheres = SPHERES.copy()
-
-        if card_type in CARD_TYPES_BOON:
-            spheres.add(S_BOON)
-
-        if card_type in CARD_TYPES_BOON_SPHERE:
-            spheres.update([S_BOONLEADERSHIP, S_BOONLORE, S_BOONSPIRIT,
-                            S_BOONTACTICS])
-
-        if card_type in CARD_TYPES_BURDEN:
-            spheres.add(S_BURDEN)
-
-        if card_type in CARD_TYPES_NIGHTMARE:
-            spheres.add(S_NIGHTMARE)
-
-        if card_type in CARD_TYPES_NOSTAT:
-            spheres.add(S_NOSTAT)
-
-        if (card_sphere is None and
-                (card_type in CARD_TYPES_PLAYER_SPHERE or
-                 card_type == T_PRESENTATION)):
-            message = 'Missing sphere for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_sphere is not None and card_sphere not in spheres:
-            message = 'Unknown sphere for row #{}{}'.format(i, row_info)
+        if (key in ONE_LINE_COLUMNS and isinstance(value, str) and
+                '\n' in value):
+            message = ('Unnecessary line break in {} column for row #{}{}'
+                       .format(key.replace(BACK_PREFIX, BACK_PREFIX_LOG),
+                               i, row_info))
             logging.error(message)
             if not card_scratch:
                 errors.append(message)
             else:
                 broken_set_ids.add(set_id)
 
-        if not is_doubleside(card_type, card_type_back):
-            if card_type_back == T_SHIP_OBJECTIVE:
-                spheres_back = SPHERES_SHIP_OBJECTIVE.copy()
-            elif card_type_back in CARD_TYPES_PLAYER_SPHERE:
-                spheres_back = SPHERES_PLAYER.copy()
-            else:
-                spheres_back = SPHERES.copy()
+        if key != CARD_DECK_RULES and isinstance(value, str):
+            match = re.search(r' ((?:\[[^\]]+\])+)(?:\n\n|$)', value)
+            if match:
+                if match.groups()[0] not in ('[ringa]', '[ringb]'):
+                    message = (
+                        'Unnecessary space before "{}" in {} column for '
+                        'row #{}{}'.format(
+                            match.groups()[0],
+                            key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
+                            row_info))
+                    logging.error(message)
+                    if not card_scratch:
+                        errors.append(message)
+                    else:
+                        broken_set_ids.add(set_id)
 
-            if card_type_back in CARD_TYPES_BOON:
-                spheres_back.add(S_BOON)
+            cleaned_value = _clean_tags(value)
+            if key == CARD_SET:
+                cleaned_value = cleaned_value.replace('[filtered set]', '')
+            elif key in {CARD_FLAVOUR, BACK_PREFIX + CARD_FLAVOUR}:
+                cleaned_value = cleaned_value.replace('[...]', '')
+
+            unknown_tags = re.findall(r'\[[^\]\n]+\]', cleaned_value)
+            if unknown_tags:
+                message = ('Unknown tag(s) in {} column for row #{}{}: {}'
+                           .format(key.replace(BACK_PREFIX,
+                                               BACK_PREFIX_LOG), i,
+                                   row_info, ', '.join(unknown_tags)))
+                logging.error(message)
+                if not card_scratch:
+                    errors.append(message)
+                else:
+                    broken_set_ids.add(set_id)
+            elif '[' in cleaned_value or ']' in cleaned_value:
+                message = ('Unmatched square bracket(s) in {} '
+                           'column for row #{}{} (use "[lsb]" and "[rsb]" '
+                           'tags if needed)'.format(
+                               key.replace(BACK_PREFIX, BACK_PREFIX_LOG),
+                               i, row_info))
+                logging.error(message)
+                if not card_scratch:
+                    errors.append(message)
+                else:
+                    broken_set_ids.add(set_id)
 
-            if card_type_back in CARD_TYPES_BOON_SPHERE:
-                spheres_back.update([S_BOONLEADERSHIP, S_BOONLORE,
-                                     S_BOONSPIRIT, S_BOONTACTICS])
+            if key in (CARD_SHADOW, CARD_FLAVOUR,
+                       BACK_PREFIX + CARD_FLAVOUR):
+                unmatched_tags = _detect_unmatched_tags(
+                    '[i]{}[/i]'.format(value))
+            else:
+                unmatched_tags = _detect_unmatched_tags(value)
+
+            if unmatched_tags:
+                message = ('Unmatched tag(s) in {} column for row #{}{}: '
+                           '{}'.format(key.replace(BACK_PREFIX,
+                                                   BACK_PREFIX_LOG),
+                                       i, row_info,
+                                       ', '.join(unmatched_tags)))
+                logging.error(message)
+                if not card_scratch:
+                    errors.append(message)
+                else:
+                    broken_set_ids.add(set_id)
 
-            if card_type_back in CARD_TYPES_BURDEN:
-                spheres_back.add(S_BURDEN)
+            match = re.search(
+                r'[0-9X]\[(attack|defense|willpower|threat)\]', value)
+            if match:
+                message = (
+                    'Missing space before [{}] in {} column for row #{}{}'
+                    .format(match.groups()[0],
+                            key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
+                            row_info))
+                logging.error(message)
+                if not card_scratch:
+                    errors.append(message)
+                else:
+                    broken_set_ids.add(set_id)
 
-            if card_type_back in CARD_TYPES_NIGHTMARE:
-                spheres_back.add(S_NIGHTMARE)
+            if re.search(r'[0-9X ]pp[ .]', value):
+                message = (
+                    '"[pp]" not "pp" in {} column for row #{}{}'
+                    .format(key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
+                            row_info))
+                logging.error(message)
+                if not card_scratch:
+                    errors.append(message)
+                else:
+                    broken_set_ids.add(set_id)
 
-            if card_type_back in CARD_TYPES_NOSTAT:
-                spheres_back.add(S_NOSTAT)
+            if re.search(r'[0-9X] \[pp\]', value):
+                message = (
+                    'Unnecessary space before [pp] in {} column for row '
+                    '#{}{}'.format(
+                        key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
+                        row_info))
+                logging.error(message)
+                if not card_scratch:
+                    errors.append(message)
+                else:
+                    broken_set_ids.add(set_id)
 
-            if card_sphere_back is not None and card_type_back is None:
-                message = 'Unnecessary sphere back for row #{}{}'.format(
-                    i, row_info)
+            if 'Middle-Earth' in value:
+                message = (
+                    '"Middle-earth" not "Middle-Earth" in {} column for '
+                    'row #{}{}'.format(
+                        key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
+                        row_info))
                 logging.error(message)
                 if not card_scratch:
                     errors.append(message)
                 else:
                     broken_set_ids.add(set_id)
-            elif (card_sphere_back is None and
-                  card_type_back in CARD_TYPES_PLAYER_SPHERE):
-                message = 'Missing sphere back for row #{}{}'.format(
-                    i, row_info)
+
+            if ':[/b] ' in value:
+                message = (
+                    '"[/b]:" not ":[/b]" in {} column for row #{}{}'
+                    .format(key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
+                            row_info))
                 logging.error(message)
                 if not card_scratch:
                     errors.append(message)
                 else:
                     broken_set_ids.add(set_id)
-            elif (card_sphere_back is not None and
-                  card_sphere_back not in spheres_back):
-                message = 'Unknown sphere back for row #{}{}'.format(
-                    i, row_info)
+
+            if ':[/bi] ' in value:
+                message = (
+                    '"[/bi]:" not ":[/bi]" in {} column for row #{}{}'
+                    .format(key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
+                            row_info))
                 logging.error(message)
                 if not card_scratch:
                     errors.append(message)
                 else:
                     broken_set_ids.add(set_id)
 
-        if (card_type == T_QUEST and card_sphere == T_NIGHTMARE and
-                card_sphere_back is None):
-            message = 'Sphere back must be "Nightmare" for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
+            if '“ ' in value:
+                message = (
+                    'Unnecessary space after “ in {} column for row #{}{}'
+                    .format(key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
+                            row_info))
+                logging.error(message)
+                if not card_scratch:
+                    errors.append(message)
+                else:
+                    broken_set_ids.add(set_id)
 
-        if (card_traits is None and
-                card_type in CARD_TYPES_TRAITS and
-                not (card_flags and F_NOTRAITS in extract_flags(card_flags))):
-            message = 'Missing traits for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_traits is not None and card_type in CARD_TYPES_NO_TRAITS:
-            message = 'Unnecessary traits for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_traits is None and
-              card_sphere in CARD_SPHERES_TRAITS and
-              not (card_flags and F_NOTRAITS in extract_flags(card_flags))):
-            message = 'Missing traits for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_traits is not None and
-              not str(card_traits).endswith('.') and
-              not str(card_traits).endswith('.[/size]')):
-            message = 'Missing period in traits for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_traits is not None and
-              re.sub(r'\[[^\]]+\]', '', card_traits.replace('.', '')
-                     .replace(' ', '')) == ''):
-            message = 'Incorrect traits for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_traits is not None and
-              not (card_flags and F_IGNORENAME in extract_flags(
-                  card_flags, conf['ignore_ignore_flags']))):
-            capitalization_errors = _get_capitalization_errors(
-                re.sub(r'\[[^\]]+\]', '', card_traits))
-            if capitalization_errors:
+            if ' ”' in value:
                 message = (
-                    'Capitalization error(s) in traits for row #{}{}: {} '
-                    '(use IgnoreName flag to ignore)'.format(
-                        i, row_info, ', '.join(capitalization_errors)))
+                    'Unnecessary space before ” in {} column for row #{}{}'
+                    .format(key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
+                            row_info))
                 logging.error(message)
                 if not card_scratch:
                     errors.append(message)
                 else:
                     broken_set_ids.add(set_id)
 
-        if card_traits_back is not None and card_type_back is None:
-            message = 'Unnecessary traits back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_traits_back is None and
-              card_type_back in CARD_TYPES_TRAITS and
-              not (card_flags_back and
-                   F_NOTRAITS in extract_flags(card_flags_back))):
-            message = 'Missing traits back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_traits_back is not None and
-              card_type_back in CARD_TYPES_NO_TRAITS):
-            message = 'Unnecessary traits back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_traits_back is None and
-              card_sphere_back in CARD_SPHERES_TRAITS and
-              not (card_flags_back and
-                   F_NOTRAITS in extract_flags(card_flags_back))):
-            message = 'Missing traits back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_traits_back is not None and
-              not str(card_traits_back).endswith('.') and
-              not str(card_traits_back).endswith('.[/size]')):
-            message = 'Missing period in traits back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_traits_back is not None and
-              re.sub(r'\[[^\]]+\]', '', card_traits_back.replace('.', '')
-                     .replace(' ', '')) == ''):
-            message = 'Incorrect traits back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_traits_back is not None and
-              not (card_flags_back and
-                   F_IGNORENAME in extract_flags(
-                       card_flags_back, conf['ignore_ignore_flags']))):
-            capitalization_errors = _get_capitalization_errors(
-                re.sub(r'\[[^\]]+\]', '', card_traits_back))
-            if capitalization_errors:
+            if (key not in (CARD_NUMBER, CARD_ARTIST,
+                            BACK_PREFIX + CARD_ARTIST) and
+                    card_sphere != S_BACK and
+                    re.search(r'(?<!\b[A-Z]|\.)\.[A-Z]', value)):
                 message = (
-                    'Capitalization error(s) in traits back for row #{}{}: {} '
-                    '(use IgnoreName flag to ignore)'.format(
-                        i, row_info, ', '.join(capitalization_errors)))
+                    'Missing space after "." in {} column for row '
+                    '#{}{}'.format(
+                        key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
+                        row_info))
                 logging.error(message)
                 if not card_scratch:
                     errors.append(message)
                 else:
                     broken_set_ids.add(set_id)
 
-        if card_keywords is not None and card_type in CARD_TYPES_NO_KEYWORDS:
-            message = 'Unnecessary keywords for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_keywords is not None and
-              not str(card_keywords).endswith('.') and
-              not str(card_keywords).endswith('.[inline]')):
-            message = 'Missing period in keywords for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_keywords is not None and
-              card_keywords.replace('[inline]', '').replace('.', '')
-              .replace(' ', '') == ''):
-            message = 'Incorrect keywords for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_keywords is not None and not
-              re.match(KEYWORDS_REGEX,
-                       card_keywords.replace('[inline]', ''))):
-            message = 'Incorrect keywords for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_keywords_back is not None and card_type_back is None:
-            message = 'Unnecessary keywords back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_keywords_back is not None and
-              card_type_back in CARD_TYPES_NO_KEYWORDS):
-            message = 'Unnecessary keywords back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_keywords_back is not None and
-              not str(card_keywords_back).endswith('.') and
-              not str(card_keywords_back).endswith('.[inline]')):
-            message = 'Missing period in keywords back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_keywords_back is not None and
-              card_keywords_back.replace('[inline]', '').replace('.', '')
-              .replace(' ', '') == ''):
-            message = 'Incorrect keywords back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_keywords_back is not None and not
-              re.match(KEYWORDS_REGEX,
-                       card_keywords_back.replace('[inline]', ''))):
-            message = 'Incorrect keywords back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_cost is None and card_type in CARD_TYPES_COST:
-            message = 'Missing cost for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_cost is not None and card_type not in CARD_TYPES_COST:
-            message = 'Unnecessary cost for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_type == T_HERO and
-              not re.match(r'^[1-9]?[0-9]$', str(card_cost))):
-            message = 'Incorrect cost value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_type == T_QUEST and not re.match(r'^[1-9]$', str(card_cost)):
-            message = 'Incorrect cost value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_type not in {T_HERO, T_QUEST} and card_cost is not None and
-              not re.match(r'^[1-9]?[0-9]$', str(card_cost)) and
-              card_cost not in ALLOWED_NON_INT):
-            message = 'Incorrect cost value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_type not in {T_HERO, T_QUEST} and card_cost is not None and
-              (B_ENCOUNTER in extract_keywords(card_keywords) or
-               card_back == B_ENCOUNTER) and
-              card_cost != '-'):
-            message = 'Incorrect cost value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_cost_back is not None and card_type_back is None:
-            message = 'Unnecessary cost back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_cost_back is None and card_type_back in CARD_TYPES_COST:
-            message = 'Missing cost back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_cost_back is not None and
-              card_type_back not in CARD_TYPES_COST):
-            message = 'Unnecessary cost back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_type_back == T_HERO and
-              not re.match(r'^[1-9]?[0-9]$', str(card_cost_back))):
-            message = 'Incorrect cost back value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_type_back == T_QUEST and
-              not re.match(r'^[1-9]$', str(card_cost_back))):
-            message = 'Incorrect cost back value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_type_back not in {T_HERO, T_QUEST} and
-              card_cost_back is not None and
-              not re.match(r'^[1-9]?[0-9]$', str(card_cost_back)) and
-              card_cost_back not in ALLOWED_NON_INT):
-            message = 'Incorrect cost back value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_type_back not in {T_HERO, T_QUEST} and
-              card_cost_back is not None and
-              B_ENCOUNTER in extract_keywords(card_keywords_back) and
-              card_cost_back != '-'):
-            message = 'Incorrect cost back value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_engagement is None and card_type in CARD_TYPES_ENGAGEMENT:
-            message = 'Missing engagement cost for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_engagement is not None and
-              card_type not in CARD_TYPES_ENGAGEMENT):
-            message = 'Unnecessary engagement cost for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_type == T_QUEST and
-              not re.match(r'^[ACEG]$', str(card_engagement))):
-            message = 'Incorrect engagement cost value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_type != T_QUEST and card_engagement is not None and
-              not re.match(r'^[1-9]?[0-9]$', str(card_engagement)) and
-              card_engagement not in ALLOWED_NON_INT):
-            message = 'Incorrect engagement cost value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_engagement_back is not None and card_type_back is None:
-            message = 'Unnecessary engagement cost back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_engagement_back is None and
-              card_type_back in CARD_TYPES_ENGAGEMENT):
-            message = 'Missing engagement cost back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_engagement_back is not None and
-              card_type_back not in CARD_TYPES_ENGAGEMENT):
-            message = 'Unnecessary engagement cost back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_type_back == T_QUEST and
-              not re.match(r'^[BDFH]$', str(card_engagement_back))):
-            message = ('Incorrect engagement cost back value for row #{}{}'
-                       .format(i, row_info))
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_type_back != T_QUEST and
-              card_engagement_back is not None and
-              not re.match(r'^[1-9]?[0-9]$', str(card_engagement_back)) and
-              card_engagement_back not in ALLOWED_NON_INT):
-            message = (
-                'Incorrect engagement cost back value for row #{}{}'.format(
-                    i, row_info))
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_threat is None and card_type in CARD_TYPES_THREAT:
-            message = 'Missing threat for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_threat is not None and card_type not in CARD_TYPES_THREAT:
-            message = 'Unnecessary threat for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_threat is not None and
-              not re.match(r'^[1-9]?[0-9]$', str(card_threat)) and
-              card_threat not in ALLOWED_NON_INT):
-            message = 'Incorrect threat value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_threat_back is not None and card_type_back is None:
-            message = 'Unnecessary threat back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_threat_back is None and card_type_back in CARD_TYPES_THREAT:
-            message = 'Missing threat back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_threat_back is not None and
-              card_type_back not in CARD_TYPES_THREAT):
-            message = 'Unnecessary threat back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_threat_back is not None and
-              not re.match(r'^[1-9]?[0-9]$', str(card_threat_back)) and
-              card_threat_back not in ALLOWED_NON_INT):
-            message = 'Incorrect threat back value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_willpower is None and card_type in CARD_TYPES_WILLPOWER:
-            message = 'Missing willpower for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_willpower is not None and
-              card_type not in CARD_TYPES_WILLPOWER):
-            message = 'Unnecessary willpower for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_willpower is not None and
-              not re.match(r'^[1-9]?[0-9]$', str(card_willpower)) and
-              card_willpower not in ALLOWED_NON_INT):
-            message = 'Incorrect willpower value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_willpower_back is not None and card_type_back is None:
-            message = 'Unnecessary willpower back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_willpower_back is None and
-              card_type_back in CARD_TYPES_WILLPOWER):
-            message = 'Missing willpower back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_willpower_back is not None and
-              card_type_back not in CARD_TYPES_WILLPOWER):
-            message = 'Unnecessary willpower back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_willpower_back is not None and
-              not re.match(r'^[1-9]?[0-9]$', str(card_willpower_back)) and
-              card_willpower_back not in ALLOWED_NON_INT):
-            message = 'Incorrect willpower back value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_attack is None and card_type in CARD_TYPES_COMBAT:
-            message = 'Missing attack for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_attack is not None and
-              card_type not in CARD_TYPES_COMBAT):
-            message = 'Unnecessary attack for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_attack is not None and
-              not re.match(r'^[1-9]?[0-9]$', str(card_attack)) and
-              card_attack not in ALLOWED_NON_INT):
-            message = 'Incorrect attack value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_attack_back is not None and card_type_back is None:
-            message = 'Unnecessary attack back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_attack_back is None and
-              card_type_back in CARD_TYPES_COMBAT):
-            message = 'Missing attack back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_attack_back is not None and
-              card_type_back not in CARD_TYPES_COMBAT):
-            message = 'Unnecessary attack back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_attack_back is not None and
-              not re.match(r'^[1-9]?[0-9]$', str(card_attack_back)) and
-              card_attack_back not in ALLOWED_NON_INT):
-            message = 'Incorrect attack back value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_defense is None and card_type in CARD_TYPES_COMBAT:
-            message = 'Missing defense for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_defense is not None and
-              card_type not in CARD_TYPES_COMBAT):
-            message = 'Unnecessary defense for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_defense is not None and
-              not re.match(r'^[1-9]?[0-9]$', str(card_defense)) and
-              card_defense not in ALLOWED_NON_INT):
-            message = 'Incorrect defense value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_defense_back is not None and card_type_back is None:
-            message = 'Unnecessary defense back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_defense_back is None and
-              card_type_back in CARD_TYPES_COMBAT):
-            message = 'Missing defense back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_defense_back is not None and
-              card_type_back not in CARD_TYPES_COMBAT):
-            message = 'Unnecessary defense back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_defense_back is not None and
-              not re.match(r'^[1-9]?[0-9]$', str(card_defense_back)) and
-              card_defense_back not in ALLOWED_NON_INT):
-            message = 'Incorrect defense back value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_health is None and card_type in CARD_TYPES_COMBAT:
-            message = 'Missing health for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_health is not None and
-              card_type not in CARD_TYPES_COMBAT):
-            message = 'Unnecessary health for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_health is not None and
-              not re.match(r'^[1-9]?[0-9]$', str(card_health)) and
-              card_health not in ALLOWED_NON_INT):
-            message = 'Incorrect health value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_health_back is not None and card_type_back is None:
-            message = 'Unnecessary health back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_health_back is None and
-              card_type_back in CARD_TYPES_COMBAT):
-            message = 'Missing health back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_health_back is not None and
-              card_type_back not in CARD_TYPES_COMBAT):
-            message = 'Unnecessary health back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_health_back is not None and
-              not re.match(r'^[1-9]?[0-9]$', str(card_health_back)) and
-              card_health_back not in ALLOWED_NON_INT):
-            message = 'Incorrect health back value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if (card_quest is None and card_type in CARD_TYPES_QUEST and
-                card_sphere not in CARD_SPHERES_NO_QUEST):
-            message = 'Missing quest points for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_quest is not None and
-              (card_type not in CARD_TYPES_QUEST or
-               card_sphere in CARD_SPHERES_NO_QUEST)):
-            message = 'Unnecessary quest points for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_quest is not None and
-              not re.match(r'^[1-9]?[0-9]$', str(card_quest)) and
-              card_quest not in ALLOWED_NON_INT):
-            message = 'Incorrect quest points value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_quest_back is not None and card_type_back is None:
-            message = 'Unnecessary quest points back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_quest_back is None and (
-                card_type_back in CARD_TYPES_QUEST
-                or card_type in CARD_TYPES_QUEST_BACK) and
-              card_sphere_back not in CARD_SPHERES_NO_QUEST):
-            message = 'Missing quest points back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_quest_back is not None and
-              (card_type_back not in CARD_TYPES_QUEST or
-               card_sphere_back in CARD_SPHERES_NO_QUEST) and
-              card_type not in CARD_TYPES_QUEST_BACK):
-            message = 'Unnecessary quest points back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_quest_back is not None and
-              not re.match(r'^[1-9]?[0-9]$', str(card_quest_back)) and
-              card_quest_back not in ALLOWED_NON_INT):
-            message = 'Incorrect quest points back value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_victory is not None and card_type in CARD_TYPES_PAGES:
-            if len(str(card_victory).split('/')) != 2:
-                message = ('Incorrect format for victory points for row '
-                           '#{}{}'.format(i, row_info))
-                logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
-            elif not (is_positive_int(str(card_victory)
-                                      .split('/', maxsplit=1)[0]) and
-                      is_positive_int(str(card_victory).split('/')[1])):
-                message = ('Incorrect format for victory points for row '
-                           '#{}{}'.format(i, row_info))
-                logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
-        elif card_victory is not None and card_type not in CARD_TYPES_VICTORY:
-            message = 'Unnecessary victory points for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_victory is not None and
-              card_sphere in CARD_SPHERES_NO_VICTORY):
-            message = 'Unnecessary victory points for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_victory_back is not None and card_type_back is None:
-            message = 'Unnecessary victory points back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_victory_back is not None and card_type_back == T_RULES:
-            if len(str(card_victory_back).split('/')) != 2:
-                message = ('Incorrect format for victory points back for row '
-                           '#{}{}'.format(i, row_info))
-                logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
-            elif not (is_positive_int(str(card_victory_back)
-                                      .split('/', maxsplit=1)[0]) and
-                      is_positive_int(str(card_victory_back).split('/')[1])):
-                message = ('Incorrect format for victory points back for row '
-                           '#{}{}'.format(i, row_info))
-                logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
-        elif (card_victory_back is not None and
-              card_type_back not in CARD_TYPES_VICTORY and
-              card_type not in CARD_TYPES_VICTORY_BACK):
-            message = 'Unnecessary victory points back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_victory_back is not None and
-              card_sphere_back in CARD_SPHERES_NO_VICTORY):
-            message = 'Unnecessary victory points back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_text is not None and card_type in CARD_TYPES_NO_TEXT:
-            message = 'Unnecessary text for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_text is not None and card_sphere in CARD_SPHERES_NO_TEXT:
-            message = 'Unnecessary text for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_text is not None and card_text != 'TBD' and
-              card_type not in CARD_TYPES_NO_PERIOD_CHECK and
-              not _verify_period(card_text)):
-            message = ('Missing period at the end of the text paragraph for '
-                       'row #{}{}'.format(i, row_info))
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_text is not None and
-              card_type != T_PRESENTATION and card_sphere != S_BACK and
-              not (card_flags and F_IGNORERULES in extract_flags(
-                  card_flags, conf['ignore_ignore_flags']))):
-            rules_errors = _get_rules_errors(card_text, CARD_TEXT, row)
-            if rules_errors:
-                message = (
-                    'Rules error(s) in text for row #{}{}: {} (use '
-                    'IgnoreRules flag to ignore)'.format(
-                        i, row_info, ', '.join(rules_errors)))
-                logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
-
-        if card_text_back is not None and card_type_back is None:
-            message = 'Unnecessary text back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_text_back is not None and
-              card_type_back in CARD_TYPES_NO_TEXT_BACK):
-            message = 'Unnecessary text back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_text_back is not None and
-              card_sphere_back in CARD_SPHERES_NO_TEXT):
-            message = 'Unnecessary text back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_text_back is not None and card_text_back != 'TBD' and
-              card_type_back not in CARD_TYPES_NO_PERIOD_CHECK and
-              not _verify_period(card_text_back)):
-            message = ('Missing period at the end of the text back paragraph '
-                       'for row #{}{}'.format(i, row_info))
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_text_back is not None and
-              card_type_back != T_PRESENTATION and
-              card_sphere != S_BACK and
-              not (card_flags_back and
-                   F_IGNORERULES in extract_flags(
-                       card_flags_back, conf['ignore_ignore_flags']))):
-            rules_errors = _get_rules_errors(card_text_back,
-                                             BACK_PREFIX + CARD_TEXT, row)
-            if rules_errors:
-                message = (
-                    'Rules error(s) in text back for row #{}{}: {} (use '
-                    'IgnoreRules flag to ignore)'.format(
-                        i, row_info, ', '.join(rules_errors)))
-                logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
-
-        if (card_text is not None and '[split]' in card_text and
-                card_sphere != S_CAVE):
-            message = 'Invalid [split] tag in text for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if (card_text_back is not None and '[split]' in card_text_back and
-                card_sphere_back != S_CAVE):
-            message = 'Invalid [split] tag in text back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if (card_shadow is not None and card_type not in CARD_TYPES_SHADOW and
-                not (card_type in CARD_TYPES_SHADOW_ENCOUNTER and
-                     (B_ENCOUNTER in extract_keywords(card_keywords) or
-                      card_back == B_ENCOUNTER))):
-            message = 'Unnecessary shadow for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_shadow is not None and
-              not _verify_shadow_case(card_shadow, L_ENGLISH)):
-            message = ('Shadow effect should start with a capital letter for '
-                       'row #{}{}'.format(i, row_info))
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_shadow is not None and card_shadow != 'TBD' and
-              not _verify_period(card_shadow)):
-            message = ('Missing period at the end of shadow for row #{}{}'
-                       .format(i, row_info))
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_shadow is not None and
-              not (card_flags and F_IGNORERULES in extract_flags(
-                  card_flags, conf['ignore_ignore_flags']))):
-            rules_errors = _get_rules_errors(card_shadow, CARD_SHADOW, row)
-            if rules_errors:
-                message = (
-                    'Rules error(s) in shadow for row #{}{}: {} (use '
-                    'IgnoreRules flag to ignore)'.format(
-                        i, row_info, ', '.join(rules_errors)))
-                logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
-
-        if card_shadow_back is not None and card_type_back is None:
-            message = 'Unnecessary shadow back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_shadow_back is not None:
-            message = 'Unnecessary shadow back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_shadow_back is not None and
-              not _verify_shadow_case(card_shadow_back, L_ENGLISH)):
-            message = ('Shadow back effect should start with a capital letter '
-                       'for row #{}{}'.format(i, row_info))
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_shadow_back is not None and card_shadow_back != 'TBD' and
-              not _verify_period(card_shadow_back)):
-            message = ('Missing period at the end of shadow back for row '
-                       '#{}{}'.format(i, row_info))
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_shadow_back is not None and
-              not (card_flags_back and
-                   F_IGNORERULES in extract_flags(
-                       card_flags_back, conf['ignore_ignore_flags']))):
-            rules_errors = _get_rules_errors(card_shadow_back,
-                                             BACK_PREFIX + CARD_SHADOW, row)
-            if rules_errors:
-                message = (
-                    'Rules error(s) in shadow back for row #{}{}: {} (use '
-                    'IgnoreRules flag to ignore)'.format(
-                        i, row_info, ', '.join(rules_errors)))
-                logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
-
-        if (card_flavour is not None and
-                (card_type in CARD_TYPES_NO_FLAVOUR or
-                 card_sphere in CARD_SPHERES_NO_FLAVOUR)):
-            message = 'Unnecessary flavour for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_flavour_back is not None and card_type_back is None:
-            message = 'Unnecessary flavour back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_flavour_back is not None and
-              (card_type_back in CARD_TYPES_NO_FLAVOUR_BACK or
-               card_sphere_back in CARD_SPHERES_NO_FLAVOUR)):
-            message = 'Unnecessary flavour back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if (card_printed_number is not None and
-                card_type in CARD_TYPES_NO_PRINTED_NUMBER):
-            message = 'Unnecessary printed number for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_printed_number_back is not None and card_type_back is None:
-            message = 'Unnecessary printed number back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_printed_number_back is not None and
-              card_type_back in CARD_TYPES_NO_PRINTED_NUMBER_BACK):
-            message = 'Unnecessary printed number back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if (card_encounter_set_number is not None and
-                (card_type not in CARD_TYPES_ENCOUNTER_SET_NUMBER or
-                 card_sphere in CARD_SPHERES_NO_ENCOUNTER_SET_NUMBER)):
-            message = 'Unnecessary encounter set number for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if (card_encounter_set_number_back is not None and
-                card_type_back is None):
-            message = ('Unnecessary encounter set number back for row #{}{}'
-                       .format(i, row_info))
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_encounter_set_number_back is not None and
-              (card_type_back not in CARD_TYPES_ENCOUNTER_SET_NUMBER or
-               card_sphere_back in CARD_SPHERES_NO_ENCOUNTER_SET_NUMBER)):
-            message = ('Unnecessary encounter set number back for row #{}{}'
-                       .format(i, row_info))
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if (card_encounter_set_icon is not None and
-                (card_type not in CARD_TYPES_ENCOUNTER_SET or
-                 card_sphere in CARD_SPHERES_NO_ENCOUNTER_SET)):
-            message = 'Unnecessary encounter set icon for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if (card_encounter_set_icon_back is not None and
-                card_type_back is None):
-            message = ('Unnecessary encounter set icon back for row #{}{}'
-                       .format(i, row_info))
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_encounter_set_icon_back is not None and
-              (card_type_back not in CARD_TYPES_ENCOUNTER_SET or
-               card_sphere_back in CARD_SPHERES_NO_ENCOUNTER_SET)):
-            message = ('Unnecessary encounter set icon back for row #{}{}'
-                       .format(i, row_info))
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_flags is not None:
-            flags = extract_flags(card_flags)
-            if not flags:
-                message = 'Incorrect flags for row #{}{}'.format(i, row_info)
-                logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
-            elif len(flags) != len(set(flags)):
-                message = 'Duplicate flags for row #{}{}'.format(i, row_info)
-                logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
-            elif [f for f in flags if f not in FLAGS]:
-                message = 'Incorrect flags for row #{}{}'.format(i, row_info)
-                logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
-
-            found_ring_flag = False
-            for flag in flags:
-                if ((flag in CARD_TYPES_FLAGS and  # pylint: disable=R0916
-                     card_type not in CARD_TYPES_FLAGS[flag]) or
-                        (flag in CARD_TYPES_NO_FLAGS and
-                         card_type in CARD_TYPES_NO_FLAGS[flag]) or
-                        (flag in CARD_SPHERES_NO_FLAGS and
-                         card_sphere in CARD_SPHERES_NO_FLAGS[flag])):
-                    message = 'Unnecessary flag "{}" for row #{}{}'.format(
-                        flag, i, row_info)
-                    logging.error(message)
-                    if not card_scratch:
-                        errors.append(message)
-                    else:
-                        broken_set_ids.add(set_id)
-                elif flag in RING_FLAGS:
-                    if found_ring_flag:
-                        message = ('More than one ring flag for row #{}{}'
-                                   .format(i, row_info))
-                        logging.error(message)
-                        if not card_scratch:
-                            errors.append(message)
-                        else:
-                            broken_set_ids.add(set_id)
-                    else:
-                        found_ring_flag = True
-
-        if card_flags_back is not None:
-            flags = extract_flags(card_flags_back)
-            if not flags:
-                message = 'Incorrect flags back for row #{}{}'.format(
-                    i, row_info)
-                logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
-            elif len(flags) != len(set(flags)):
-                message = 'Duplicate flags back for row #{}{}'.format(
-                    i, row_info)
-                logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
-            elif [f for f in flags if f not in FLAGS]:
-                message = 'Incorrect flags back for row #{}{}'.format(
-                    i, row_info)
-                logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
-
-            found_ring_flag = False
-            for flag in flags:
-                if ((flag in CARD_TYPES_FLAGS_BACK and  # pylint: disable=R0916
-                     card_type_back not in CARD_TYPES_FLAGS_BACK[flag]) or
-                        (flag in CARD_TYPES_NO_FLAGS_BACK and
-                         card_type_back in CARD_TYPES_NO_FLAGS_BACK[flag]) or
-                        (flag in CARD_SPHERES_NO_FLAGS and
-                         card_sphere_back in CARD_SPHERES_NO_FLAGS[flag])):
-                    message = 'Unnecessary flag back "{}" for row #{}{}'.format(
-                        flag, i, row_info)
-                    logging.error(message)
-                    if not card_scratch:
-                        errors.append(message)
-                    else:
-                        broken_set_ids.add(set_id)
-                elif flag in RING_FLAGS:
-                    if found_ring_flag:
-                        message = ('More than one ring flag back for row #{}{}'
-                                   .format(i, row_info))
-                        logging.error(message)
-                        if not card_scratch:
-                            errors.append(message)
-                        else:
-                            broken_set_ids.add(set_id)
-                    else:
-                        found_ring_flag = True
-
-        if card_icons is not None and card_type not in CARD_TYPES_ICONS:
-            message = 'Unnecessary icons for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_icons is not None and card_sphere in CARD_SPHERES_NO_ICONS:
-            message = 'Unnecessary icons for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_icons_back is not None and card_type_back is None:
-            message = 'Unnecessary icons back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_icons_back is not None and
-              card_type_back not in CARD_TYPES_ICONS):
-            message = 'Unnecessary icons back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_icons_back is not None and
-              card_sphere_back in CARD_SPHERES_NO_ICONS):
-            message = 'Unnecessary icons back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_info is not None and card_type in CARD_TYPES_NO_INFO:
-            message = 'Unnecessary info for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_info_back is not None and card_type_back is None:
-            message = 'Unnecessary info back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_info_back is not None and
-              card_type_back in CARD_TYPES_NO_INFO_BACK):
-            message = 'Unnecessary info back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if (card_artist is not None and
-                card_type in CARD_TYPES_NO_ARTIST):
-            message = 'Unnecessary artist for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_artist is not None and 'Hogdson' in card_artist:
-            message = 'Hodgson not Hogdson in row #{}{}!'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_artist_back is not None and card_type_back is None:
-            message = 'Unnecessary artist back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_artist_back is not None and
-              card_type_back in CARD_TYPES_NO_ARTIST_BACK):
-            message = 'Unnecessary artist back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_artist_back is not None and 'Hogdson' in card_artist_back:
-            message = 'Hodgson not Hogdson in row #{}{}!'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if (card_panx is not None and
-                card_type in CARD_TYPES_NO_ARTWORK):
-            message = 'Unnecessary panx for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_panx is None and
-              (card_pany is not None or card_scale is not None)):
-            message = 'Missing panx for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_panx is not None and not _is_float(card_panx):
-            message = 'Incorrect format for panx value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_panx_back is not None and card_type_back is None:
-            message = 'Unnecessary panx back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_panx_back is not None and
-              card_type_back in CARD_TYPES_NO_ARTWORK_BACK):
-            message = 'Unnecessary panx back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_panx_back is None and
-              (card_pany_back is not None or card_scale_back is not None)):
-            message = 'Missing panx back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_panx_back is not None and not _is_float(card_panx_back):
-            message = ('Incorrect format for panx back value for row #{}{}'
-                       .format(i, row_info))
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if (card_pany is not None and
-                card_type in CARD_TYPES_NO_ARTWORK):
-            message = 'Unnecessary pany for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_pany is None and
-              (card_panx is not None or card_scale is not None)):
-            message = 'Missing pany for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_pany is not None and not _is_float(card_pany):
-            message = 'Incorrect format for pany value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_pany_back is not None and card_type_back is None:
-            message = 'Unnecessary pany back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_pany_back is not None and
-              card_type_back in CARD_TYPES_NO_ARTWORK_BACK):
-            message = 'Unnecessary pany back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_pany_back is None and
-              (card_panx_back is not None or card_scale_back is not None)):
-            message = 'Missing pany back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_pany_back is not None and not _is_float(card_pany_back):
-            message = ('Incorrect format for pany back value for row #{}{}'
-                       .format(i, row_info))
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if (card_scale is not None and
-                card_type in CARD_TYPES_NO_ARTWORK):
-            message = 'Unnecessary scale for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_scale is None and
-              (card_panx is not None or card_pany is not None)):
-            message = 'Missing scale for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_scale is not None and not _is_positive_float(card_scale):
-            message = 'Incorrect format for scale value for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_scale_back is not None and card_type_back is None:
-            message = 'Unnecessary scale back for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_scale_back is not None and
-              card_type_back in CARD_TYPES_NO_ARTWORK_BACK):
-            message = 'Unnecessary scale back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_scale_back is None and
-              (card_panx_back is not None or card_pany_back is not None)):
-            message = 'Missing scale back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_scale_back is not None and
-              not _is_positive_float(card_scale_back)):
-            message = ('Incorrect format for scale back value for row #{}{}'
-                       .format(i, row_info))
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if (card_portrait_shadow is not None and
-                card_type not in CARD_TYPES_LANDSCAPE):
-            message = 'Unnecessary portrait shadow for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_portrait_shadow not in {None, 'Black', 'PortraitTint'}:
-            message = ('Incorrect value for portrait shadow for row #{}{}'
-                       .format(i, row_info))
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_type != T_QUEST and card_portrait_shadow == 'PortraitTint':
-            message = ('Incorrect value for portrait shadow for row #{}{}'
-                       .format(i, row_info))
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_portrait_shadow_back is not None and card_type_back is None:
-            message = 'Unnecessary portrait shadow back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_portrait_shadow_back is not None and
-              card_type_back not in CARD_TYPES_LANDSCAPE):
-            message = 'Unnecessary portrait shadow back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_portrait_shadow_back not in {None, 'Black'}:
-            message = ('Incorrect value for portrait shadow back for row '
-                       '#{}{}'.format(i, row_info))
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if (card_easy_mode is not None and  # pylint: disable=R0916
-                (card_type not in CARD_TYPES_EASY_MODE
-                 or card_sphere in CARD_SPHERES_NO_EASY_MODE) and
-                (card_type_back not in CARD_TYPES_EASY_MODE or
-                 card_type_back is None or
-                 card_sphere_back in CARD_SPHERES_NO_EASY_MODE)):
-            message = 'Unnecessary removed for easy mode for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_easy_mode is not None and
-              not is_positive_int(card_easy_mode)):
-            message = ('Incorrect format for removed for easy mode for row '
-                       '#{}{}'.format(i, row_info))
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_easy_mode is not None and
-              is_positive_int(card_quantity) and
-              int(card_easy_mode) > int(card_quantity)):
-            message = ('Removed for easy mode is greater than card quantity '
-                       'for row #{}{}'.format(i, row_info))
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_additional_encounter_sets is not None:
-            all_sets = [
-                s.strip() for s in card_additional_encounter_sets.split(';')
-                if s.strip()]
-            if card_type not in CARD_TYPES_ADDITIONAL_ENCOUNTER_SETS:
-                message = ('Unnecessary additional encounter sets for row #{}{}'
-                           .format(i, row_info))
-                logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
-            elif len(all_sets) > 6:
-                message = ('Too many additional encounter sets for row #{}{}: '
-                           '{} instead of the maximum 6'.format(i, row_info,
-                                                                len(all_sets)))
-                logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
-            else:
-                unknown_sets = [
-                    s for s in all_sets if s not in ALL_ENCOUNTER_SET_NAMES]
-                if (unknown_sets and
-                        not (card_flags and
-                             F_IGNORENAME in extract_flags(
-                                 card_flags, conf['ignore_ignore_flags']))):
-                    message = (
-                        'Unknown additional encounter sets for row #{}{}: {} '
-                        '(use IgnoreName flag to ignore)'.format(
-                            i, row_info, '; '.join(unknown_sets)))
-                    logging.error(message)
-                    if not card_scratch:
-                        errors.append(message)
-                    else:
-                        broken_set_ids.add(set_id)
-
-        if (card_adventure is not None and  # pylint: disable=R0916
-                (card_type not in CARD_TYPES_ADVENTURE or
-                 card_sphere in CARD_SPHERES_NO_ADVENTURE) and
-                (card_type_back not in CARD_TYPES_ADVENTURE or
-                 card_sphere_back in CARD_SPHERES_NO_ADVENTURE or
-                 card_type_back is None)):
-            message = 'Unnecessary adventure for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif (card_adventure is None and
-              ((card_type in CARD_TYPES_ADVENTURE and
-                card_sphere not in CARD_SPHERES_NO_ADVENTURE) or
-               (card_type_back in CARD_TYPES_ADVENTURE and
-                card_sphere_back not in CARD_SPHERES_NO_ADVENTURE))):
-            message = 'Missing adventure for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
+            ignore_accents = False
+            if key.startswith(BACK_PREFIX):
+                if (card_flags_back and
+                        F_IGNORENAME in extract_flags(
+                            card_flags_back, conf['ignore_ignore_flags'])):
+                    ignore_accents = True
             else:
-                broken_set_ids.add(set_id)
-        elif (card_adventure is not None and
-              not (card_flags and F_IGNORENAME in extract_flags(
-                  card_flags, conf['ignore_ignore_flags']))):
-            capitalization_errors = _get_capitalization_errors(card_adventure)
-            if capitalization_errors:
-                message = (
-                    'Capitalization error(s) in adventure for row #{}{}: '
-                    '{} (use IgnoreName flag to ignore)'.format(
-                        i, row_info, ', '.join(capitalization_errors)))
-                logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
-
-        if card_type == T_QUEST and card_adventure is not None:
-            if (set_id, card_encounter_set) in quest_adventures:
-                if (quest_adventures[(set_id, card_encounter_set)] !=
-                        card_adventure):
+                if (card_flags and
+                        F_IGNORENAME in extract_flags(
+                            card_flags, conf['ignore_ignore_flags'])):
+                    ignore_accents = True
+
+            if not ignore_accents:
+                accents = set(re.findall(accents_regex, value))
+                if accents:
                     message = (
-                        'Different adventure values for the quest in row '
-                        '#{}{}: "{}" and "{}"'.format(
-                            i, row_info, card_adventure,
-                            quest_adventures[(set_id, card_encounter_set)]))
+                        'Missing accents in {} column for row #{}{}: {} '
+                        '(use IgnoreName flag to ignore)'
+                        .format(key.replace(BACK_PREFIX, BACK_PREFIX_LOG),
+                                i, row_info, ', '.join(accents)))
                     logging.error(message)
                     if not card_scratch:
                         errors.append(message)
                     else:
                         broken_set_ids.add(set_id)
-            else:
-                quest_adventures[(set_id, card_encounter_set)] = card_adventure
-
-        if (card_collection_icon is not None and
-                card_type in CARD_TYPES_NO_COLLECTION_ICON):
-            message = 'Unnecessary collection icon for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if card_copyright is not None and card_type in CARD_TYPES_NO_COPYRIGHT:
-            message = 'Unnecessary copyright for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if (card_back is not None and
-                (card_type in CARD_TYPES_DOUBLESIDE_DEFAULT or
-                 card_type_back is not None)):
-            message = 'Unnecessary custom card back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_back not in {None, B_ENCOUNTER, B_PLAYER}:
-            message = 'Incorrect custom card back for row #{}{}'.format(
-                i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        if (card_last_design_change_date is not None and (
-                not isinstance(card_last_design_change_date, str) or
-                not re.match(r'^[0-9]{4}-[0-9]{2}-[0-9]{2}$',
-                             card_last_design_change_date))):
-            message = ('Incorrect last design change date format for row '
-                       '#{}{}: must be YYYY-MM-DD'.format(i, row_info))
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-
-        for key, value in row.items():
-            if value == '#REF!':
-                message = ('Reference error in {} column for row '
-                           '#{}{}'.format(key.replace(BACK_PREFIX,
-                                                      BACK_PREFIX_LOG), i,
-                                          row_info))
-                logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
-            elif isinstance(value, str) and '[unmatched quot]' in value:
-                message = (
-                    'Unmatched quote character in {} column for row #{}{} '
-                    '(use "[quot]" tag if needed)'.format(
-                        key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
-                        row_info))
-                logging.error(message)
+
+    if (card_deck_rules is not None and
+            card_type not in CARD_TYPES_DECK_RULES):
+        message = 'Unnecessary deck rules for row #{}{}'.format(i, row_info)
+        logging.error(message)
+        if not card_scratch:
+            errors.append(message)
+        else:
+            broken_set_ids.add(set_id)
+    elif card_deck_rules is not None and set_id != card_selected:
+        deck_rules_errors = _generate_octgn_o8d_quest(row)[2]
+        for error in deck_rules_errors:
+            message = '{} in deck rules in row #{}{}'.format(
+                error, i, row_info)
+            logging.error(message)
+            if conf['octgn_o8d']:
                 if not card_scratch:
                     errors.append(message)
                 else:
                     broken_set_ids.add(set_id)
 
-            if (key in ONE_LINE_COLUMNS and isinstance(value, str) and
-                    '\n' in value):
-                message = ('Unnecessary line break in {} column for row #{}{}'
-                           .format(key.replace(BACK_PREFIX, BACK_PREFIX_LOG),
-                                   i, row_info))
+    for lang in conf['languages']:
+        if lang == L_ENGLISH or card_scratch:
+            continue
+
+        if not TRANSLATIONS[lang].get(card_id):
+            logging.error(
+                'Missing card ID %s in %s translations', card_id, lang)
+            continue
+
+        for error in PRE_SANITY_CHECK['ref'].get(
+                (TRANSLATIONS[lang][card_id][ROW_COLUMN],
+                 card_scratch, lang), []):
+            logging.error(
+                '%s for card ID %s in %s translations, row #%s', error,
+                card_id, lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+        for error in PRE_SANITY_CHECK['flavour'].get(
+                (TRANSLATIONS[lang][card_id][ROW_COLUMN],
+                 card_scratch, lang), []):
+            message = (
+                '{} for card ID {} in {} translations, row #{}'
+                .format(error, card_id, lang,
+                        TRANSLATIONS[lang][card_id][ROW_COLUMN]))
+            if message.startswith('Possibly '):
+                logging.warning(message)
+            else:
                 logging.error(message)
-                if not card_scratch:
-                    errors.append(message)
-                else:
-                    broken_set_ids.add(set_id)
 
-            if key != CARD_DECK_RULES and isinstance(value, str):
-                if key in TRANSLATED_COLUMNS:
-                    value_key = (row[CARD_ID], key)
-                    value_hash = hashlib.md5(_clean_value_for_hash(value)
-                                             .encode()).hexdigest()
-                    hash_by_key[(L_ENGLISH, value_key)] = value_hash
-                    keys_by_hash[(L_ENGLISH, row[CARD_SET], value_hash)] = (
-                        keys_by_hash.get((L_ENGLISH, row[CARD_SET],
-                                          value_hash), []) + [value_key])
+        for error in PRE_SANITY_CHECK['shadow'].get(
+                (TRANSLATIONS[lang][card_id][ROW_COLUMN],
+                 card_scratch, lang), []):
+            logging.warning(
+                '%s for card ID %s in %s translations, row #%s', error,
+                card_id, lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+        for key, value in TRANSLATIONS[lang][card_id].items():
+            if key not in TRANSLATED_COLUMNS:
+                continue
+
+            if value == '#REF!':
+                logging.error(
+                    'Reference error in %s column for card ID %s in %s '
+                    'translations, row #%s', key.replace(BACK_PREFIX,
+                                                         BACK_PREFIX_LOG),
+                    card_id, lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+            elif isinstance(value, str) and '[unmatched quot]' in value:
+                logging.error(
+                    'Unmatched quote character in %s column for card '
+                    'ID %s in %s translations, row #%s (use "[quot]" tag '
+                    'if needed)', key.replace(BACK_PREFIX,
+                                              BACK_PREFIX_LOG),
+                    card_id, lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+            if (key in ONE_LINE_COLUMNS and isinstance(value, str) and
+                    '\n' in value):
+                logging.error(
+                    'Unnecessary line break in %s column for card ID %s in '
+                    '%s translations, row #%s',
+                    key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
+                    lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
 
+            if isinstance(value, str):
                 match = re.search(r' ((?:\[[^\]]+\])+)(?:\n\n|$)', value)
                 if match:
                     if match.groups()[0] not in ('[ringa]', '[ringb]'):
-                        message = (
-                            'Unnecessary space before "{}" in {} column for '
-                            'row #{}{}'.format(
-                                match.groups()[0],
-                                key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
-                                row_info))
-                        logging.error(message)
-                        if not card_scratch:
-                            errors.append(message)
-                        else:
-                            broken_set_ids.add(set_id)
+                        logging.error(
+                            'Unnecessary space before "%s" in %s column '
+                            'for card ID %s in %s translations, row #%s',
+                            match.groups()[0],
+                            key.replace(BACK_PREFIX, BACK_PREFIX_LOG),
+                            card_id, lang,
+                            TRANSLATIONS[lang][card_id][ROW_COLUMN])
 
                 cleaned_value = _clean_tags(value)
-                if key == CARD_SET:
-                    cleaned_value = cleaned_value.replace('[filtered set]', '')
-                elif key in {CARD_FLAVOUR, BACK_PREFIX + CARD_FLAVOUR}:
+                if key in {CARD_FLAVOUR, BACK_PREFIX + CARD_FLAVOUR}:
                     cleaned_value = cleaned_value.replace('[...]', '')
 
+                if lang == L_FRENCH:
+                    cleaned_value = re.sub(
+                        r'(?:\[Vaillance\]|\[Ressource\]|\[Organisation\]|'
+                        r'\[Qu\u00eate\]|\[Voyage\]|\[Rencontre\]|'
+                        r'\[Combat\]|\[Restauration\]) ', '',
+                        cleaned_value)
+
                 unknown_tags = re.findall(r'\[[^\]\n]+\]', cleaned_value)
                 if unknown_tags:
-                    message = ('Unknown tag(s) in {} column for row #{}{}: {}'
-                               .format(key.replace(BACK_PREFIX,
-                                                   BACK_PREFIX_LOG), i,
-                                       row_info, ', '.join(unknown_tags)))
-                    logging.error(message)
-                    if not card_scratch:
-                        errors.append(message)
-                    else:
-                        broken_set_ids.add(set_id)
+                    logging.error(
+                        'Unknown tag(s) in %s column for card ID %s in %s '
+                        'translations, row #%s: %s',
+                        key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
+                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN],
+                        ', '.join(unknown_tags))
                 elif '[' in cleaned_value or ']' in cleaned_value:
-                    message = ('Unmatched square bracket(s) in {} '
-                               'column for row #{}{} (use "[lsb]" and "[rsb]" '
-                               'tags if needed)'.format(
-                                   key.replace(BACK_PREFIX, BACK_PREFIX_LOG),
-                                   i, row_info))
-                    logging.error(message)
-                    if not card_scratch:
-                        errors.append(message)
-                    else:
-                        broken_set_ids.add(set_id)
+                    logging.error(
+                        'Unmatched square bracket(s) in %s '
+                        'column for card ID %s in %s translations, '
+                        'row #%s (use "[lsb]" and "[rsb]" tags if needed)',
+                        key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
+                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
 
                 if key in (CARD_SHADOW, CARD_FLAVOUR,
                            BACK_PREFIX + CARD_FLAVOUR):
@@ -6612,160 +7410,599 @@ def sanity_check(conf, sets):  # pylint: disable=R0912,R0914,R0915
                     unmatched_tags = _detect_unmatched_tags(value)
 
                 if unmatched_tags:
-                    message = ('Unmatched tag(s) in {} column for row #{}{}: '
-                               '{}'.format(key.replace(BACK_PREFIX,
-                                                       BACK_PREFIX_LOG),
-                                           i, row_info,
-                                           ', '.join(unmatched_tags)))
-                    logging.error(message)
-                    if not card_scratch:
-                        errors.append(message)
-                    else:
-                        broken_set_ids.add(set_id)
+                    logging.error(
+                        'Unmatched tag(s) in %s column for card ID %s in '
+                        '%s translations, row #%s: %s',
+                        key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
+                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN],
+                        ', '.join(unmatched_tags))
 
                 match = re.search(
                     r'[0-9X]\[(attack|defense|willpower|threat)\]', value)
                 if match:
-                    message = (
-                        'Missing space before [{}] in {} column for row #{}{}'
-                        .format(match.groups()[0],
-                                key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
-                                row_info))
-                    logging.error(message)
-                    if not card_scratch:
-                        errors.append(message)
-                    else:
-                        broken_set_ids.add(set_id)
+                    logging.error(
+                        'Missing space before [%s] in %s column for card '
+                        'ID %s in %s translations, row #%s',
+                        match.groups()[0],
+                        key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
+                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
 
                 if re.search(r'[0-9X ]pp[ .]', value):
-                    message = (
-                        '"[pp]" not "pp" in {} column for row #{}{}'
-                        .format(key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
-                                row_info))
-                    logging.error(message)
-                    if not card_scratch:
-                        errors.append(message)
-                    else:
-                        broken_set_ids.add(set_id)
+                    logging.error(
+                        '"[pp]" not "pp" in %s column for card'
+                        ' ID %s in %s translations, row #%s',
+                        key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
+                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
 
                 if re.search(r'[0-9X] \[pp\]', value):
-                    message = (
-                        'Unnecessary space before [pp] in {} column for row '
-                        '#{}{}'.format(
-                            key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
-                            row_info))
-                    logging.error(message)
-                    if not card_scratch:
-                        errors.append(message)
+                    logging.error(
+                        'Unnecessary space before [pp] in %s column for card'
+                        ' ID %s in %s translations, row #%s',
+                        key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
+                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+                if ':[/b] ' in value:
+                    logging.error(
+                        '"[/b]:" not ":[/b]" in %s column for card ID %s '
+                        'in %s translations, row #%s',
+                        key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
+                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+                if ':[/bi] ' in value:
+                    logging.error(
+                        '"[/bi]:" not ":[/bi]" in %s column for card ID '
+                        '%s in %s translations, row #%s',
+                        key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
+                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+                if lang != L_FRENCH and '“ ' in value:
+                    logging.error(
+                        'Unnecessary space after “ in %s column for card'
+                        ' ID %s in %s translations, row #%s',
+                        key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
+                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+                if lang != L_FRENCH and ' ”' in value:
+                    logging.error(
+                        'Unnecessary space before ” in %s column for card'
+                        ' ID %s in %s translations, row #%s',
+                        key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
+                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+                if (card_sphere != S_BACK and
+                        re.search(r'(?<!\b[A-Z]|\.)\.[A-Z]', value)):
+                    logging.error(
+                        'Missing space after "." in %s column for card'
+                        ' ID %s in %s translations, row #%s',
+                        key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
+                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+
+                if (key in {CARD_TEXT, BACK_PREFIX + CARD_TEXT,
+                            CARD_SHADOW, BACK_PREFIX + CARD_SHADOW} and
+                        row.get(CARD_TYPE) != T_PRESENTATION and
+                        isinstance(row.get(key), str)):
+                    value_english = row[key]
+                    if key in {CARD_TEXT, CARD_SHADOW}:
+                        value_english = value_english.replace(
+                            _to_str(row.get(CARD_NAME)), '')
                     else:
-                        broken_set_ids.add(set_id)
+                        value_english = value_english.replace(
+                            _to_str(row.get(BACK_PREFIX + CARD_NAME)), '')
+
+                    value_translated = value
+                    for term_english, lang_dict in TRANSLATION_MATCH:
+                        regex_english = get_regex(term_english)
+                        regex_translated = lang_dict.get(lang)
+                        if not regex_translated:
+                            continue
 
-                if 'Middle-Earth' in value:
-                    message = (
-                        '"Middle-earth" not "Middle-Earth" in {} column for '
-                        'row #{}{}'.format(
-                            key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
-                            row_info))
-                    logging.error(message)
-                    if not card_scratch:
-                        errors.append(message)
+                        if re.search(regex_english, value_english):
+                            value_english = re.sub(regex_english, '',
+                                                   value_english)
+                            if re.search(regex_translated,
+                                         value_translated):
+                                value_translated = re.sub(
+                                    regex_translated, '', value_translated)
+                            else:
+                                logging.error(
+                                    'Missing translation for "%s" in %s '
+                                    'column for card ID %s in %s '
+                                    'translations, row #%s',
+                                    term_english,
+                                    key.replace(BACK_PREFIX,
+                                                BACK_PREFIX_LOG),
+                                    card_id, lang,
+                                    TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+                    value_english = row[key]
+                    value_translated = value
+                    if key in {CARD_TEXT, CARD_SHADOW}:
+                        value_translated = value_translated.replace(
+                            _to_str(TRANSLATIONS[lang][card_id].get(
+                                CARD_NAME)), '')
                     else:
-                        broken_set_ids.add(set_id)
+                        value_translated = value_translated.replace(
+                            _to_str(TRANSLATIONS[lang][card_id].get(
+                                BACK_PREFIX + CARD_NAME)), '')
+
+                    for term_english, lang_dict in TRANSLATION_MATCH:
+                        regex_english = lang_dict.get(L_ENGLISH)
+                        regex_translated = lang_dict.get(lang)
+                        if not regex_english or not regex_translated:
+                            continue
+
+                        if re.search(regex_translated, value_translated):
+                            value_translated = re.sub(
+                                regex_translated, '', value_translated)
+                            if re.search(regex_english, value_english,
+                                         flags=re.IGNORECASE):
+                                value_english = re.sub(
+                                    regex_english, '', value_english,
+                                    flags=re.IGNORECASE)
+                            else:
+                                logging.error(
+                                    'Unnecessary translation for "%s" in %s '
+                                    'column for card ID %s in %s '
+                                    'translations, row #%s',
+                                    term_english,
+                                    key.replace(BACK_PREFIX,
+                                                BACK_PREFIX_LOG),
+                                    card_id, lang,
+                                    TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+                    value_english = re.sub(
+                        r'\n +\n', '\n\n', _clean_tags(row[key])).strip()
+                    value_translated = re.sub(
+                        r'\n +\n', '\n\n', _clean_tags(value)).strip()
+
+                    paragraphs_english = len(
+                        re.split(r'\n{2,}', value_english))
+                    paragraphs_translated = len(
+                        re.split(r'\n{2,}', value_translated))
+                    if paragraphs_english != paragraphs_translated:
+                        if row.get(CARD_TYPE) == T_RULES:
+                            # logging.warning(
+                            #     'Different number of paragraphs in %s '
+                            #     'column for card ID %s in %s '
+                            #     'translations, row #%s: %s compared to %s '
+                            #     'in the English source',
+                            #     key.replace(BACK_PREFIX, BACK_PREFIX_LOG),
+                            #     card_id, lang,
+                            #     TRANSLATIONS[lang][card_id][ROW_COLUMN],
+                            #     paragraphs_translated, paragraphs_english)
+                            pass
+                        else:
+                            logging.warning(
+                                'Different number of paragraphs in %s '
+                                'column for card ID %s in %s '
+                                'translations, row #%s: %s compared to %s '
+                                'in the English source',
+                                key.replace(BACK_PREFIX, BACK_PREFIX_LOG),
+                                card_id, lang,
+                                TRANSLATIONS[lang][card_id][ROW_COLUMN],
+                                paragraphs_translated, paragraphs_english)
+
+                    value_english = _add_automatic_tags(row[key],
+                                                        lang=L_ENGLISH)
+                    value_translated = _add_automatic_tags(value,
+                                                           lang=lang)
+                    for tag in ('[b]', '[i]', '[bi]'):
+                        tags_english = value_english.count(tag)
+                        tags_translated = value_translated.count(tag)
+                        if tags_english != tags_translated:
+                            if (row.get(CARD_TYPE) == T_RULES and
+                                    tag != '[bi]'):
+                                # logging.warning(
+                                #     'Different number of %s tags in %s '
+                                #     'column for card ID %s in %s '
+                                #     'translations, row #%s: %s compared '
+                                #     'to %s in the English source', tag,
+                                #     key.replace(BACK_PREFIX,
+                                #                 BACK_PREFIX_LOG),
+                                #     card_id, lang,
+                                #     TRANSLATIONS[lang][card_id][ROW_COLUMN],
+                                #     tags_translated, tags_english)
+                                pass
+                            else:
+                                logging.warning(
+                                    'Different number of %s tags in %s '
+                                    'column for card ID %s in %s '
+                                    'translations, row #%s: %s compared '
+                                    'to %s in the English source', tag,
+                                    key.replace(BACK_PREFIX,
+                                                BACK_PREFIX_LOG),
+                                    card_id, lang,
+                                    TRANSLATIONS[lang][card_id][ROW_COLUMN],
+                                    tags_translated, tags_english)
+
+                if (key in {CARD_TEXT, BACK_PREFIX + CARD_TEXT,
+                            CARD_SHADOW, BACK_PREFIX + CARD_SHADOW,
+                            CARD_KEYWORDS, BACK_PREFIX + CARD_KEYWORDS,
+                            CARD_VICTORY, BACK_PREFIX + CARD_VICTORY} and
+                        row.get(CARD_TYPE) != T_PRESENTATION and
+                        isinstance(row.get(key), str)):
+                    value_english = re.sub(TAGS_WITH_NUMBERS_REGEX, '',
+                                           row[key])
+                    if key in {CARD_TEXT, CARD_SHADOW}:
+                        value_english = value_english.replace(
+                            _to_str(row.get(CARD_NAME)), '')
+                    else:
+                        value_english = value_english.replace(
+                            _to_str(row.get(BACK_PREFIX + CARD_NAME)), '')
+
+                    value_translated = re.sub(TAGS_WITH_NUMBERS_REGEX, '',
+                                              value)
+                    if key in {CARD_TEXT, CARD_SHADOW}:
+                        value_translated = value_translated.replace(
+                            _to_str(TRANSLATIONS[lang][card_id].get(
+                                CARD_NAME)), '')
+                    else:
+                        value_translated = value_translated.replace(
+                            _to_str(TRANSLATIONS[lang][card_id].get(
+                                BACK_PREFIX + CARD_NAME)), '')
+
+                    anchors_issue = False
+                    anchors_english = re.findall(ANCHORS_REGEX,
+                                                 value_english)
+                    anchors_translated = re.findall(ANCHORS_REGEX,
+                                                    value_translated)
+                    if (sorted(anchors_english) !=
+                            sorted(anchors_translated)):
+                        _remove_common_elements(anchors_english,
+                                                anchors_translated)
+                        anchors_issue = True
+
+                    if (anchors_issue and
+                            _split_combined_elements(anchors_english) ==
+                            _split_combined_elements(anchors_translated)):
+                        anchors_issue = False
+
+                    if ((anchors_issue and not anchors_english and  # pylint: disable=R0916
+                         not [a for a in anchors_translated
+                              if a not in {'2', '3'}]) or
+                            (anchors_issue and not anchors_translated and
+                             not [a for a in anchors_english
+                                  if a not in {'2', '3'}])):
+                        if not anchors_english:
+                            value_english = _replace_numbers(
+                                value_english, lang=L_ENGLISH)
+                        else:
+                            value_translated = _replace_numbers(
+                                value_translated, lang=lang)
+
+                        anchors_english = re.findall(ANCHORS_REGEX,
+                                                     value_english)
+                        anchors_translated = re.findall(ANCHORS_REGEX,
+                                                        value_translated)
+                        if (sorted(anchors_english) ==
+                                sorted(anchors_translated)):
+                            anchors_issue = False
+                        else:
+                            _remove_common_elements(anchors_english,
+                                                    anchors_translated)
+
+                        if (anchors_issue and
+                                _split_combined_elements(
+                                    anchors_english) ==
+                                _split_combined_elements(
+                                    anchors_translated)):
+                            anchors_issue = False
+
+                    if anchors_issue:
+                        if (row.get(CARD_TYPE) == T_RULES and
+                                '[' not in ', '.join(anchors_english) and
+                                '[' not in ', '.join(anchors_translated)):
+                            # logging.warning(
+                            #     'Possibly different content in %s column '
+                            #     'for card ID %s in %s translations, row '
+                            #     '#%s: "%s" compared to "%s" in the '
+                            #     'English source',
+                            #     key.replace(BACK_PREFIX, BACK_PREFIX_LOG),
+                            #     card_id, lang,
+                            #     TRANSLATIONS[lang][card_id][ROW_COLUMN],
+                            #     ', '.join(anchors_translated),
+                            #     ', '.join(anchors_english))
+                            pass
+                        else:
+                            logging.warning(
+                                'Possibly different content in %s column '
+                                'for card ID %s in %s translations, row '
+                                '#%s: "%s" compared to "%s" in the '
+                                'English source',
+                                key.replace(BACK_PREFIX, BACK_PREFIX_LOG),
+                                card_id, lang,
+                                TRANSLATIONS[lang][card_id][ROW_COLUMN],
+                                ', '.join(anchors_translated),
+                                ', '.join(anchors_english))
+
+            if not value and row.get(key):
+                logging.error(
+                    'Missing value for %s column for card ID %s in %s '
+                    'translations, row #%s',
+                    key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
+                    lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+            elif value and not row.get(key):
+                logging.error(
+                    'Unnecessary value for %s column for card '
+                    'ID %s in %s translations, row #%s',
+                    key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
+                    lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+        if (card_traits is not None and
+                TRANSLATIONS[lang][card_id].get(CARD_TRAITS)):
+            card_traits_tr = TRANSLATIONS[lang][card_id][CARD_TRAITS]
+            if (len(extract_traits(card_traits_tr)) !=
+                    len(extract_traits(card_traits))):
+                logging.error(
+                    'Incorrect number of traits for card '
+                    'ID %s in %s translations, row #%s', card_id,
+                    lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+            elif (not str(card_traits_tr).endswith('.') and
+                  not str(card_traits_tr).endswith('.[/size]')):
+                logging.error(
+                    'Missing period in traits for card '
+                    'ID %s in %s translations, row #%s', card_id,
+                    lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+        if (card_traits_back is not None and
+                TRANSLATIONS[lang][card_id].get(
+                    BACK_PREFIX + CARD_TRAITS)):
+            card_traits_back_tr = (
+                TRANSLATIONS[lang][card_id][BACK_PREFIX + CARD_TRAITS])
+            if (len(extract_traits(card_traits_back_tr)) !=
+                    len(extract_traits(card_traits_back))):
+                logging.error(
+                    'Incorrect number of traits back for card '
+                    'ID %s in %s translations, row #%s', card_id,
+                    lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+            elif (not str(card_traits_back_tr).endswith('.') and
+                  not str(card_traits_back_tr).endswith('.[/size]')):
+                logging.error(
+                    'Missing period in traits back for card '
+                    'ID %s in %s translations, row #%s', card_id,
+                    lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+        if (card_keywords is not None and
+                TRANSLATIONS[lang][card_id].get(CARD_KEYWORDS)):
+            card_keywords_tr = TRANSLATIONS[lang][card_id][CARD_KEYWORDS]
+            if (len(extract_keywords(card_keywords_tr)) !=
+                    len(extract_keywords(card_keywords))):
+                logging.error(
+                    'Incorrect number of keywords for card '
+                    'ID %s in %s translations, row #%s', card_id,
+                    lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+            elif not (str(card_keywords_tr).endswith('.') or
+                      str(card_keywords_tr).endswith('.[inline]')):
+                logging.error(
+                    'Missing period in keywords for card '
+                    'ID %s in %s translations, row #%s', card_id,
+                    lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+        if (card_keywords_back is not None and
+                TRANSLATIONS[lang][card_id].get(
+                    BACK_PREFIX + CARD_KEYWORDS)):
+            card_keywords_back_tr = (
+                TRANSLATIONS[lang][card_id][BACK_PREFIX + CARD_KEYWORDS])
+            if (len(extract_keywords(card_keywords_back_tr)) !=
+                    len(extract_keywords(card_keywords_back))):
+                logging.error(
+                    'Incorrect number of keywords back for card '
+                    'ID %s in %s translations, row #%s', card_id,
+                    lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+            elif not (str(card_keywords_back_tr).endswith('.') or
+                      str(card_keywords_back_tr).endswith('.[inline]')):
+                logging.error(
+                    'Missing period in keywords back for card '
+                    'ID %s in %s translations, row #%s', card_id,
+                    lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+        if (card_victory is not None and
+                TRANSLATIONS[lang][card_id].get(CARD_VICTORY) and
+                (is_int(card_victory) or card_type in CARD_TYPES_PAGES) and
+                card_victory !=
+                TRANSLATIONS[lang][card_id][CARD_VICTORY]):
+            logging.error(
+                'Incorrect victory points for card '
+                'ID %s in %s translations, row #%s', card_id,
+                lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+        if (card_victory_back is not None and
+                TRANSLATIONS[lang][card_id].get(
+                    BACK_PREFIX + CARD_VICTORY) and
+                (is_int(card_victory_back) or card_type == T_RULES) and
+                card_victory_back !=
+                TRANSLATIONS[lang][card_id][BACK_PREFIX + CARD_VICTORY]):
+            logging.error(
+                'Incorrect victory points back for card '
+                'ID %s in %s translations, row #%s', card_id,
+                lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+        if (card_text is not None and
+                TRANSLATIONS[lang][card_id].get(CARD_TEXT)):
+            card_text_tr = TRANSLATIONS[lang][card_id][CARD_TEXT]
+            if (card_type not in CARD_TYPES_NO_PERIOD_CHECK and
+                  not _verify_period(card_text_tr)):
+                logging.error(
+                    'Missing period at the end of the text paragraph for '
+                    'card ID %s in %s translations, row #%s', card_id,
+                    lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+            if '[split]' in card_text and '[split]' not in card_text_tr:
+                logging.error(
+                    'Missing [split] tag in text for card ID %s in %s '
+                    'translations, row #%s', card_id, lang,
+                    TRANSLATIONS[lang][card_id][ROW_COLUMN])
+            elif '[split]' not in card_text and '[split]' in card_text_tr:
+                logging.error(
+                    'Invalid [split] tag in text for card ID %s in %s '
+                    'translations, row #%s', card_id, lang,
+                    TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+        if (card_text_back is not None and
+                TRANSLATIONS[lang][card_id].get(BACK_PREFIX + CARD_TEXT)):
+            card_text_back_tr = (
+                TRANSLATIONS[lang][card_id][BACK_PREFIX + CARD_TEXT])
+            if (card_type_back not in CARD_TYPES_NO_PERIOD_CHECK and
+                  not _verify_period(card_text_back_tr)):
+                logging.error(
+                    'Missing period at the end of the text back paragraph '
+                    'for card ID %s in %s translations, row #%s', card_id,
+                    lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+            if ('[split]' in card_text_back and
+                    '[split]' not in card_text_back_tr):
+                logging.error(
+                    'Missing [split] tag in text back for card ID %s in '
+                    '%s translations, row #%s', card_id, lang,
+                    TRANSLATIONS[lang][card_id][ROW_COLUMN])
+            elif ('[split]' not in card_text_back and
+                  '[split]' in card_text_back_tr):
+                logging.error(
+                    'Invalid [split] tag in text back for card ID %s in '
+                    '%s translations, row #%s', card_id, lang,
+                    TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+        if (card_shadow is not None and
+                TRANSLATIONS[lang][card_id].get(CARD_SHADOW)):
+            card_shadow_tr = TRANSLATIONS[lang][card_id][CARD_SHADOW]
+            if not _verify_shadow_case(card_shadow_tr, lang):
+                if lang == L_FRENCH:
+                    logging.warning(
+                        'Shadow effect should probably start with a '
+                        'lowercase letter for card ID %s in %s '
+                        'translations, row #%s', card_id, lang,
+                        TRANSLATIONS[lang][card_id][ROW_COLUMN])
+                else:
+                    logging.error(
+                        'Shadow effect should start with a capital letter '
+                        'for card ID %s in %s translations, row #%s',
+                        card_id, lang,
+                        TRANSLATIONS[lang][card_id][ROW_COLUMN])
+            elif not _verify_period(card_shadow_tr):
+                logging.error(
+                    'Missing period at the end of shadow for card ID %s '
+                    'in %s translations, row #%s', card_id, lang,
+                    TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+        if (card_shadow_back is not None and
+                TRANSLATIONS[lang][card_id].get(
+                    BACK_PREFIX + CARD_SHADOW)):
+            card_shadow_back_tr = (
+                TRANSLATIONS[lang][card_id][BACK_PREFIX + CARD_SHADOW])
+            if not _verify_shadow_case(card_shadow_back_tr, lang):
+                if lang == L_FRENCH:
+                    logging.warning(
+                        'Shadow back effect should probably start with a '
+                        'lowercase letter for card ID %s in %s '
+                        'translations, row #%s', card_id, lang,
+                        TRANSLATIONS[lang][card_id][ROW_COLUMN])
+                else:
+                    logging.error(
+                        'Shadow back effect should start with a capital '
+                        'letter for card ID %s in %s translations, row '
+                        '#%s', card_id, lang,
+                        TRANSLATIONS[lang][card_id][ROW_COLUMN])
+            elif not _verify_period(card_shadow_back_tr):
+                logging.error(
+                    'Missing period at the end of shadow back for card ID '
+                    '%s in %s translations, row #%s', card_id, lang,
+                    TRANSLATIONS[lang][card_id][ROW_COLUMN])
+
+    return errors, broken_set_ids
+
+
+def _sanity_check_cross_rows(conf, card_data, set_ids):  # pylint: disable=R0912,R0914,R0915
+    """ Perform the sanity checks which compare card rows with each other
+    and return a tuple of errors and broken set IDs.
+    """
+    errors = []
+    broken_set_ids = set()
+    card_ids = set()
+    card_scratch_ids = set()
+    card_set_numbers = set()
+    deck_rules = set()
+    quest_adventures = {}
+    hash_by_key = {}
+    keys_by_hash = {}
+
+    for row in card_data:  # pylint: disable=R1702
+        i = row[ROW_COLUMN]
+        set_id = row[CARD_SET]
+        card_id = row[CARD_ID]
+        card_number = row[CARD_NUMBER]
+        card_encounter_set = row[CARD_ENCOUNTER_SET]
+        card_name = row[CARD_NAME]
+        card_type = row[CARD_TYPE]
+        card_adventure = row[CARD_ADVENTURE]
+        card_deck_rules = row[CARD_DECK_RULES]
+        card_scratch = row[CARD_SCRATCH]
+        card_selected = row[CARD_SELECTED]
+        row_info = _get_sanity_check_row_info(row)
 
-                if ':[/b] ' in value:
-                    message = (
-                        '"[/b]:" not ":[/b]" in {} column for row #{}{}'
-                        .format(key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
-                                row_info))
-                    logging.error(message)
-                    if not card_scratch:
-                        errors.append(message)
-                    else:
-                        broken_set_ids.add(set_id)
+        if card_id is None:
+            message = 'Missing card ID for row #{}{}'.format(i, row_info)
+            logging.error(message)
+            if not card_scratch:
+                errors.append(message)
+            else:
+                broken_set_ids.add(set_id)
+        elif card_id in card_ids or card_id in card_scratch_ids:
+            message = 'Duplicate card ID for row #{}{}'.format(i, row_info)
+            logging.error(message)
+            if not card_scratch:
+                errors.append(message)
+            else:
+                broken_set_ids.add(set_id)
+        elif not re.match(UUID_REGEX, card_id):
+            message = 'Incorrect card ID format for row #{}{}'.format(
+                i, row_info)
+            logging.error(message)
+            if not card_scratch:
+                errors.append(message)
+            else:
+                broken_set_ids.add(set_id)
 
-                if ':[/bi] ' in value:
-                    message = (
-                        '"[/bi]:" not ":[/bi]" in {} column for row #{}{}'
-                        .format(key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
-                                row_info))
-                    logging.error(message)
-                    if not card_scratch:
-                        errors.append(message)
-                    else:
-                        broken_set_ids.add(set_id)
+        if card_scratch:
+            card_scratch_ids.add(card_id)
+        else:
+            card_ids.add(card_id)
 
-                if '“ ' in value:
-                    message = (
-                        'Unnecessary space after “ in {} column for row #{}{}'
-                        .format(key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
-                                row_info))
-                    logging.error(message)
-                    if not card_scratch:
-                        errors.append(message)
-                    else:
-                        broken_set_ids.add(set_id)
+        if not conf['run_sanity_check_for_all_sets'] and set_id not in set_ids:
+            continue
 
-                if ' ”' in value:
-                    message = (
-                        'Unnecessary space before ” in {} column for row #{}{}'
-                        .format(key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
-                                row_info))
-                    logging.error(message)
-                    if not card_scratch:
-                        errors.append(message)
-                    else:
-                        broken_set_ids.add(set_id)
+        if set_id is not None and card_number is not None:
+            if (set_id, card_number) in card_set_numbers:
+                message = ('Duplicate card set and card number combination '
+                           'for row #{}{}'.format(i, row_info))
+                logging.error(message)
+                if not card_scratch:
+                    errors.append(message)
+                else:
+                    broken_set_ids.add(set_id)
+            else:
+                card_set_numbers.add((set_id, card_number))
 
-                if (key not in (CARD_NUMBER, CARD_ARTIST,
-                                BACK_PREFIX + CARD_ARTIST) and
-                        card_sphere != S_BACK and
-                        re.search(r'(?<!\b[A-Z]|\.)\.[A-Z]', value)):
+        if card_type == T_QUEST and card_adventure is not None:
+            if (set_id, card_encounter_set) in quest_adventures:
+                if (quest_adventures[(set_id, card_encounter_set)] !=
+                        card_adventure):
                     message = (
-                        'Missing space after "." in {} column for row '
-                        '#{}{}'.format(
-                            key.replace(BACK_PREFIX, BACK_PREFIX_LOG), i,
-                            row_info))
+                        'Different adventure values for the quest in row '
+                        '#{}{}: "{}" and "{}"'.format(
+                            i, row_info, card_adventure,
+                            quest_adventures[(set_id, card_encounter_set)]))
                     logging.error(message)
                     if not card_scratch:
                         errors.append(message)
                     else:
                         broken_set_ids.add(set_id)
-
-                ignore_accents = False
-                if key.startswith(BACK_PREFIX):
-                    if (card_flags_back and
-                            F_IGNORENAME in extract_flags(
-                                card_flags_back, conf['ignore_ignore_flags'])):
-                        ignore_accents = True
-                else:
-                    if (card_flags and
-                            F_IGNORENAME in extract_flags(
-                                card_flags, conf['ignore_ignore_flags'])):
-                        ignore_accents = True
-
-                if not ignore_accents:
-                    accents = set(re.findall(accents_regex, value))
-                    if accents:
-                        message = (
-                            'Missing accents in {} column for row #{}{}: {} '
-                            '(use IgnoreName flag to ignore)'
-                            .format(key.replace(BACK_PREFIX, BACK_PREFIX_LOG),
-                                    i, row_info, ', '.join(accents)))
-                        logging.error(message)
-                        if not card_scratch:
-                            errors.append(message)
-                        else:
-                            broken_set_ids.add(set_id)
+            else:
+                quest_adventures[(set_id, card_encounter_set)] = card_adventure
 
         if (card_deck_rules is not None and
-                card_type not in CARD_TYPES_DECK_RULES):
-            message = 'Unnecessary deck rules for row #{}{}'.format(i, row_info)
-            logging.error(message)
-            if not card_scratch:
-                errors.append(message)
-            else:
-                broken_set_ids.add(set_id)
-        elif card_deck_rules is not None and set_id != card_selected:
+                card_type in CARD_TYPES_DECK_RULES and
+                set_id != card_selected):
             quest_id = (set_id, card_adventure or card_name)
             if quest_id in deck_rules:
                 message = (
@@ -6780,79 +8017,24 @@ def sanity_check(conf, sets):  # pylint: disable=R0912,R0914,R0915
             else:
                 deck_rules.add(quest_id)
 
-            deck_rules_errors = _generate_octgn_o8d_quest(row)[2]
-            for error in deck_rules_errors:
-                message = '{} in deck rules in row #{}{}'.format(
-                    error, i, row_info)
-                logging.error(message)
-                if conf['octgn_o8d']:
-                    if not card_scratch:
-                        errors.append(message)
-                    else:
-                        broken_set_ids.add(set_id)
+        for key, value in row.items():
+            if (key != CARD_DECK_RULES and key in TRANSLATED_COLUMNS and
+                    isinstance(value, str)):
+                value_key = (row[CARD_ID], key)
+                value_hash = hashlib.md5(_clean_value_for_hash(value)
+                                         .encode()).hexdigest()
+                hash_by_key[(L_ENGLISH, value_key)] = value_hash
+                keys_by_hash[(L_ENGLISH, row[CARD_SET], value_hash)] = (
+                    keys_by_hash.get((L_ENGLISH, row[CARD_SET],
+                                      value_hash), []) + [value_key])
 
         for lang in conf['languages']:
-            if lang == L_ENGLISH or card_scratch:
-                continue
-
-            if not TRANSLATIONS[lang].get(card_id):
-                logging.error(
-                    'Missing card ID %s in %s translations', card_id, lang)
+            if (lang == L_ENGLISH or card_scratch or
+                    not TRANSLATIONS[lang].get(card_id)):
                 continue
 
-            for error in PRE_SANITY_CHECK['ref'].get(
-                    (TRANSLATIONS[lang][card_id][ROW_COLUMN],
-                     card_scratch, lang), []):
-                logging.error(
-                    '%s for card ID %s in %s translations, row #%s', error,
-                    card_id, lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
-
-            for error in PRE_SANITY_CHECK['flavour'].get(
-                    (TRANSLATIONS[lang][card_id][ROW_COLUMN],
-                     card_scratch, lang), []):
-                message = (
-                    '{} for card ID {} in {} translations, row #{}'
-                    .format(error, card_id, lang,
-                            TRANSLATIONS[lang][card_id][ROW_COLUMN]))
-                if message.startswith('Possibly '):
-                    logging.warning(message)
-                else:
-                    logging.error(message)
-
-            for error in PRE_SANITY_CHECK['shadow'].get(
-                    (TRANSLATIONS[lang][card_id][ROW_COLUMN],
-                     card_scratch, lang), []):
-                logging.warning(
-                    '%s for card ID %s in %s translations, row #%s', error,
-                    card_id, lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
-
             for key, value in TRANSLATIONS[lang][card_id].items():
-                if key not in TRANSLATED_COLUMNS:
-                    continue
-
-                if value == '#REF!':
-                    logging.error(
-                        'Reference error in %s column for card ID %s in %s '
-                        'translations, row #%s', key.replace(BACK_PREFIX,
-                                                             BACK_PREFIX_LOG),
-                        card_id, lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
-                elif isinstance(value, str) and '[unmatched quot]' in value:
-                    logging.error(
-                        'Unmatched quote character in %s column for card '
-                        'ID %s in %s translations, row #%s (use "[quot]" tag '
-                        'if needed)', key.replace(BACK_PREFIX,
-                                                  BACK_PREFIX_LOG),
-                        card_id, lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
-
-                if (key in ONE_LINE_COLUMNS and isinstance(value, str) and
-                        '\n' in value):
-                    logging.error(
-                        'Unnecessary line break in %s column for card ID %s in '
-                        '%s translations, row #%s',
-                        key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
-                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
-
-                if isinstance(value, str):
+                if key in TRANSLATED_COLUMNS and isinstance(value, str):
                     value_key = (row[CARD_ID], key)
                     value_hash = hashlib.md5(_clean_value_for_hash(value)
                                              .encode()).hexdigest()
@@ -6861,603 +8043,495 @@ def sanity_check(conf, sets):  # pylint: disable=R0912,R0914,R0915
                         keys_by_hash.get((lang, row[CARD_SET],
                                           value_hash), []) + [value_key])
 
-                    match = re.search(r' ((?:\[[^\]]+\])+)(?:\n\n|$)', value)
-                    if match:
-                        if match.groups()[0] not in ('[ringa]', '[ringb]'):
-                            logging.error(
-                                'Unnecessary space before "%s" in %s column '
-                                'for card ID %s in %s translations, row #%s',
-                                match.groups()[0],
-                                key.replace(BACK_PREFIX, BACK_PREFIX_LOG),
-                                card_id, lang,
-                                TRANSLATIONS[lang][card_id][ROW_COLUMN])
+            for key, value in TRANSLATIONS[lang][card_id].items():
+                if key not in TRANSLATED_COLUMNS:
+                    continue
+
+                if isinstance(value, str):
+                    value_key = (row[CARD_ID], key)
+                    translated_keys = [k for k in keys_by_hash[
+                        (lang, row[CARD_SET], hash_by_key[(lang, value_key)])]
+                                       if k != value_key]
+                    english_keys = None
+                    if hash_by_key.get((L_ENGLISH, value_key)):
+                        english_keys = [k for k in keys_by_hash[
+                            (L_ENGLISH, row[CARD_SET], hash_by_key[
+                                (L_ENGLISH, value_key)])]
+                                    if k != value_key]
 
-                    cleaned_value = _clean_tags(value)
-                    if key in {CARD_FLAVOUR, BACK_PREFIX + CARD_FLAVOUR}:
-                        cleaned_value = cleaned_value.replace('[...]', '')
+                    if (english_keys is not None and
+                            sorted(translated_keys) != sorted(english_keys)):
+                        if translated_keys:
+                            translated_keys = ', '.join([
+                                '{} for card ID {}'.format(
+                                    k[1].replace(BACK_PREFIX, BACK_PREFIX_LOG),
+                                    k[0])
+                                for k in translated_keys])
+                        else:
+                            translated_keys = '[nothing]'
 
-                    if lang == L_FRENCH:
-                        cleaned_value = re.sub(
-                            r'(?:\[Vaillance\]|\[Ressource\]|\[Organisation\]|'
-                            r'\[Qu\u00eate\]|\[Voyage\]|\[Rencontre\]|'
-                            r'\[Combat\]|\[Restauration\]) ', '',
-                            cleaned_value)
+                        if english_keys:
+                            english_keys = ', '.join([
+                                '{} for card ID {}'.format(
+                                    k[1].replace(BACK_PREFIX, BACK_PREFIX_LOG),
+                                    k[0])
+                                for k in english_keys])
+                        else:
+                            english_keys = '[nothing]'
 
-                    unknown_tags = re.findall(r'\[[^\]\n]+\]', cleaned_value)
-                    if unknown_tags:
                         logging.error(
-                            'Unknown tag(s) in %s column for card ID %s in %s '
-                            'translations, row #%s: %s',
+                            'Suspicious value in %s column for card ID %s in '
+                            '%s translations, row #%s: it\'s the same as %s, '
+                            'but the English source is the same as %s',
                             key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
                             lang, TRANSLATIONS[lang][card_id][ROW_COLUMN],
-                            ', '.join(unknown_tags))
-                    elif '[' in cleaned_value or ']' in cleaned_value:
-                        logging.error(
-                            'Unmatched square bracket(s) in %s '
-                            'column for card ID %s in %s translations, '
-                            'row #%s (use "[lsb]" and "[rsb]" tags if needed)',
-                            key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
-                            lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+                            translated_keys, english_keys)
 
-                    if key in (CARD_SHADOW, CARD_FLAVOUR,
-                               BACK_PREFIX + CARD_FLAVOUR):
-                        unmatched_tags = _detect_unmatched_tags(
-                            '[i]{}[/i]'.format(value))
-                    else:
-                        unmatched_tags = _detect_unmatched_tags(value)
+    return errors, broken_set_ids
 
-                    if unmatched_tags:
-                        logging.error(
-                            'Unmatched tag(s) in %s column for card ID %s in '
-                            '%s translations, row #%s: %s',
-                            key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
-                            lang, TRANSLATIONS[lang][card_id][ROW_COLUMN],
-                            ', '.join(unmatched_tags))
 
-                    match = re.search(
-                        r'[0-9X]\[(attack|defense|willpower|threat)\]', value)
-                    if match:
-                        logging.error(
-                            'Missing space before [%s] in %s column for card '
-                            'ID %s in %s translations, row #%s',
-                            match.groups()[0],
-                            key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
-                            lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+class SanityCheckLogHandler(logging.Handler):
+    """ Collect log messages of a sanity check worker process.
+    """
 
-                    if re.search(r'[0-9X ]pp[ .]', value):
-                        logging.error(
-                            '"[pp]" not "pp" in %s column for card'
-                            ' ID %s in %s translations, row #%s',
-                            key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
-                            lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+    def __init__(self):
+        super().__init__()
+        self.records = []
 
-                    if re.search(r'[0-9X] \[pp\]', value):
-                        logging.error(
-                            'Unnecessary space before [pp] in %s column for card'
-                            ' ID %s in %s translations, row #%s',
-                            key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
-                            lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+    def emit(self, record):
+        """ Save the log message.
+        """
+        self.records.append((record.levelno, record.getMessage()))
 
-                    if ':[/b] ' in value:
-                        logging.error(
-                            '"[/b]:" not ":[/b]" in %s column for card ID %s '
-                            'in %s translations, row #%s',
-                            key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
-                            lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
 
-                    if ':[/bi] ' in value:
-                        logging.error(
-                            '"[/bi]:" not ":[/bi]" in %s column for card ID '
-                            '%s in %s translations, row #%s',
-                            key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
-                            lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+def get_data_state():
+    """ Get the extracted spreadsheet data needed by output worker processes.
+    """
+    return {name: globals()[name] for name in DATA_STATE}
 
-                    if lang != L_FRENCH and '“ ' in value:
-                        logging.error(
-                            'Unnecessary space after “ in %s column for card'
-                            ' ID %s in %s translations, row #%s',
-                            key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
-                            lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
 
-                    if lang != L_FRENCH and ' ”' in value:
-                        logging.error(
-                            'Unnecessary space before ” in %s column for card'
-                            ' ID %s in %s translations, row #%s',
-                            key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
-                            lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+def set_data_state(state):
+    """ Load the extracted spreadsheet data in a worker process.
+    """
+    if state['DATA'] is not DATA:
+        DATA_INDEX.clear()
 
-                    if (card_sphere != S_BACK and
-                            re.search(r'(?<!\b[A-Z]|\.)\.[A-Z]', value)):
-                        logging.error(
-                            'Missing space after "." in %s column for card'
-                            ' ID %s in %s translations, row #%s',
-                            key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
-                            lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+    globals().update(state)
+
+
+def _init_sanity_check_worker(state, args, level):
+    """ Initialize a sanity check worker process.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    set_data_state(state)
+    SANITY_CHECK_WORKER['args'] = args
+    SANITY_CHECK_WORKER['handler'] = SanityCheckLogHandler()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+
+    root.addHandler(SANITY_CHECK_WORKER['handler'])
+    root.setLevel(level)
+
+
+def _sanity_check_rows(conf, rows, set_ids, all_set_ids, accents_regex):
+    """ Perform a sanity check of card rows and return a list of
+    (errors, broken set IDs, log messages) tuples.
+    """
+    handler = SanityCheckLogHandler()
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    for old_handler in handlers:
+        root.removeHandler(old_handler)
+
+    root.addHandler(handler)
+    try:
+        res = []
+        for row in rows:
+            handler.records = []
+            errors, broken_set_ids = _sanity_check_row(
+                conf, row, set_ids, all_set_ids, accents_regex)
+            res.append((errors, broken_set_ids, handler.records))
+    finally:
+        root.removeHandler(handler)
+        for old_handler in handlers:
+            root.addHandler(old_handler)
+
+    return res
+
+
+def _sanity_check_row_worker(row):
+    """ Perform a sanity check of a single card row in a worker process and
+    return a tuple of errors, broken set IDs and log messages.
+    """
+    handler = SANITY_CHECK_WORKER['handler']
+    handler.records = []
+    conf, set_ids, all_set_ids, accents_regex = SANITY_CHECK_WORKER['args']
+    errors, broken_set_ids = _sanity_check_row(conf, row, set_ids,
+                                               all_set_ids, accents_regex)
+    return errors, broken_set_ids, handler.records
+
+
+def _get_canonical_value(value):
+    """ Get a representation of the value which doesn't depend on the order
+    of dictionary and set items.
+    """
+    if isinstance(value, dict):
+        return sorted((repr(k), _get_canonical_value(v))
+                      for k, v in value.items())
+
+    if isinstance(value, (set, frozenset)):
+        return sorted(repr(_get_canonical_value(v)) for v in value)
+
+    if isinstance(value, (list, tuple)):
+        return [_get_canonical_value(v) for v in value]
+
+    return value
+
+
+def _get_sanity_check_global_key(conf, set_ids, all_set_ids, accents_regex):
+    """ Get a cache key of everything (except the card row itself) the
+    sanity check of a card row depends on.
+    """
+    conf = {key: conf[key] for key in ('ignore_ignore_flags', 'languages',
+                                       'octgn_o8d',
+                                       'run_sanity_check_for_all_sets')}
+    state = {name: globals()[name] for name in SANITY_CHECK_STATE
+             if name not in {'PRE_SANITY_CHECK', 'TRANSLATIONS'}}
+    return _get_cache_key(_get_canonical_value(conf),
+                          _get_canonical_value(set_ids),
+                          _get_canonical_value(all_set_ids), accents_regex,
+                          _get_canonical_value(state))
+
+
+def _get_sanity_check_row_key(conf, row):
+    """ Get a cache key of the card row content (including its translations
+    and pre sanity check errors) or None if the row must always be checked.
+    Deck rules are validated against other card rows and external XML
+    files, so their results are never cached.
+    """
+    if row[CARD_DECK_RULES] is not None:
+        return None
+
+    card_id = row[CARD_ID]
+    card_scratch = row[CARD_SCRATCH]
+    translations = {}
+    pre_sanity_check = {
+        'name': PRE_SANITY_CHECK['name'].get((row[ROW_COLUMN], card_scratch))}
+    keys = [(row[ROW_COLUMN], card_scratch, L_ENGLISH)]
+    for lang in conf['languages']:
+        if lang != L_ENGLISH and TRANSLATIONS.get(lang, {}).get(card_id):
+            translations[lang] = TRANSLATIONS[lang][card_id]
+            keys.append((TRANSLATIONS[lang][card_id][ROW_COLUMN],
+                         card_scratch, lang))
+
+    for check in ('ref', 'flavour', 'shadow'):
+        pre_sanity_check[check] = [PRE_SANITY_CHECK[check].get(key)
+                                   for key in keys]
+
+    return _get_cache_key(_get_canonical_value(row),
+                          _get_canonical_value(translations),
+                          _get_canonical_value(pre_sanity_check))
+
+
+def _read_sanity_check_cache(conf, global_key):
+    """ Read the cache of card row sanity check results.
+    """
+    if not conf['incremental_sanity_check']:
+        return {}
+
+    try:
+        with open(SANITY_CHECK_CACHE_PATH, 'rb') as fobj:
+            cache = pickle.load(fobj)
+    except Exception:
+        return {}
+
+    if (cache.get('version') != _get_code_checksum() or
+            cache.get('global') != global_key):
+        logging.info('Sanity check inputs changed, checking all rows')
+        return {}
 
+    return cache['rows']
+
+
+def _write_sanity_check_cache(conf, global_key, rows):
+    """ Write the cache of card row sanity check results.
+    """
+    if not conf['incremental_sanity_check']:
+        return
+
+    cache = {'version': _get_code_checksum(),
+             'global': global_key,
+             'rows': rows}
+    with open(SANITY_CHECK_CACHE_PATH, 'wb') as fobj:
+        pickle.dump(cache, fobj, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def sanity_check(conf, sets):  # pylint: disable=R0914
+    """ Perform a sanity check of the spreadsheet and return "healthy" sets.
+    """
+    logging.info('Performing a sanity check of the spreadsheet...')
+    logging.info('')
+    timestamp = time.time()
+
+    errors = []
+    set_ids = {s[0] for s in sets}
+    all_set_ids = set(SETS.keys())
+    broken_set_ids = set()
+    card_data = DATA[:]
+    card_data = sorted(card_data, key=lambda row: (row[CARD_SCRATCH] or 0,
+                                                   row[ROW_COLUMN]))
+
+    accents_regex = (
+        r'\b(?:' + '|'.join([re.escape(a) for a in ACCENTS]) + r')\b')
+
+    if conf['incremental_sanity_check']:
+        global_key = _get_sanity_check_global_key(conf, set_ids, all_set_ids,
+                                                  accents_regex)
+        row_keys = [_get_sanity_check_row_key(conf, row) for row in card_data]
+        cache = _read_sanity_check_cache(conf, global_key)
+    else:
+        global_key = None
+        row_keys = [None] * len(card_data)
+        cache = {}
+
+    rows = [row for row, key in zip(card_data, row_keys)
+            if key is None or key not in cache]
+    if conf['incremental_sanity_check']:
+        logging.info('Checking %s changed or deck rules row(s) out of %s',
+                     len(rows), len(card_data))
+
+    processes = min(get_parallelism(conf),
+                    len(rows) // SANITY_CHECK_MIN_ROWS_PER_PROCESS)
+    if processes > 1:
+        args = (conf, set_ids, all_set_ids, accents_regex)
+        chunksize = math.ceil(len(rows) / (processes * 4))
+        with Pool(processes=processes, initializer=_init_sanity_check_worker,
+                  initargs=(get_data_state(), args,
+                            logging.getLogger().getEffectiveLevel())
+                  ) as pool:
+            try:
+                results = pool.map(_sanity_check_row_worker, rows,
+                                   chunksize=chunksize)
+            except KeyboardInterrupt as exc:
+                logging.info('Program was terminated!')
+                pool.terminate()
+                raise KeyboardInterrupt from exc
+    else:
+        results = _sanity_check_rows(conf, rows, set_ids, all_set_ids,
+                                     accents_regex)
+
+    results = iter(results)
+    new_cache = {}
+    for key in row_keys:
+        result = (cache[key] if key is not None and key in cache
+                  else next(results))
+        row_errors, row_broken_set_ids, records = result
+        for level, message in records:
+            logging.log(level, message)
+
+        errors.extend(row_errors)
+        broken_set_ids.update(row_broken_set_ids)
+        if key is not None:
+            new_cache[key] = result
+
+    _write_sanity_check_cache(conf, global_key, new_cache)
+
+    row_errors, row_broken_set_ids = _sanity_check_cross_rows(
+        conf, card_data, set_ids)
+    errors.extend(row_errors)
+    broken_set_ids.update(row_broken_set_ids)
+
+    logging.info('')
+    if errors:
+        raise SanityCheckError('Sanity check failed:\n{}'.format(
+            '\n'.join(errors)))
 
-                    if (key in {CARD_TEXT, BACK_PREFIX + CARD_TEXT,
-                                CARD_SHADOW, BACK_PREFIX + CARD_SHADOW} and
-                            row.get(CARD_TYPE) != T_PRESENTATION and
-                            isinstance(row.get(key), str)):
-                        value_english = row[key]
-                        if key in {CARD_TEXT, CARD_SHADOW}:
-                            value_english = value_english.replace(
-                                _to_str(row.get(CARD_NAME)), '')
-                        else:
-                            value_english = value_english.replace(
-                                _to_str(row.get(BACK_PREFIX + CARD_NAME)), '')
-
-                        value_translated = value
-                        for term_english, lang_dict in TRANSLATION_MATCH:
-                            regex_english = get_regex(term_english)
-                            regex_translated = lang_dict.get(lang)
-                            if not regex_translated:
-                                continue
-
-                            if re.search(regex_english, value_english):
-                                value_english = re.sub(regex_english, '',
-                                                       value_english)
-                                if re.search(regex_translated,
-                                             value_translated):
-                                    value_translated = re.sub(
-                                        regex_translated, '', value_translated)
-                                else:
-                                    logging.error(
-                                        'Missing translation for "%s" in %s '
-                                        'column for card ID %s in %s '
-                                        'translations, row #%s',
-                                        term_english,
-                                        key.replace(BACK_PREFIX,
-                                                    BACK_PREFIX_LOG),
-                                        card_id, lang,
-                                        TRANSLATIONS[lang][card_id][ROW_COLUMN])
-
-                        value_english = row[key]
-                        value_translated = value
-                        if key in {CARD_TEXT, CARD_SHADOW}:
-                            value_translated = value_translated.replace(
-                                _to_str(TRANSLATIONS[lang][card_id].get(
-                                    CARD_NAME)), '')
-                        else:
-                            value_translated = value_translated.replace(
-                                _to_str(TRANSLATIONS[lang][card_id].get(
-                                    BACK_PREFIX + CARD_NAME)), '')
+    sets = [s for s in sets if s[0] not in broken_set_ids]
+    logging.info('...Performing a sanity check of the spreadsheet (%ss)',
+                 round(time.time() - timestamp, 3))
+    return sets
 
-                        for term_english, lang_dict in TRANSLATION_MATCH:
-                            regex_english = lang_dict.get(L_ENGLISH)
-                            regex_translated = lang_dict.get(lang)
-                            if not regex_english or not regex_translated:
-                                continue
 
-                            if re.search(regex_translated, value_translated):
-                                value_translated = re.sub(
-                                    regex_translated, '', value_translated)
-                                if re.search(regex_english, value_english,
-                                             flags=re.IGNORECASE):
-                                    value_english = re.sub(
-                                        regex_english, '', value_english,
-                                        flags=re.IGNORECASE)
-                                else:
-                                    logging.error(
-                                        'Unnecessary translation for "%s" in %s '
-                                        'column for card ID %s in %s '
-                                        'translations, row #%s',
-                                        term_english,
-                                        key.replace(BACK_PREFIX,
-                                                    BACK_PREFIX_LOG),
-                                        card_id, lang,
-                                        TRANSLATIONS[lang][card_id][ROW_COLUMN])
-
-                        value_english = re.sub(
-                            r'\n +\n', '\n\n', _clean_tags(row[key])).strip()
-                        value_translated = re.sub(
-                            r'\n +\n', '\n\n', _clean_tags(value)).strip()
-
-                        paragraphs_english = len(
-                            re.split(r'\n{2,}', value_english))
-                        paragraphs_translated = len(
-                            re.split(r'\n{2,}', value_translated))
-                        if paragraphs_english != paragraphs_translated:
-                            if row.get(CARD_TYPE) == T_RULES:
-                                # logging.warning(
-                                #     'Different number of paragraphs in %s '
-                                #     'column for card ID %s in %s '
-                                #     'translations, row #%s: %s compared to %s '
-                                #     'in the English source',
-                                #     key.replace(BACK_PREFIX, BACK_PREFIX_LOG),
-                                #     card_id, lang,
-                                #     TRANSLATIONS[lang][card_id][ROW_COLUMN],
-                                #     paragraphs_translated, paragraphs_english)
-                                pass
-                            else:
-                                logging.warning(
-                                    'Different number of paragraphs in %s '
-                                    'column for card ID %s in %s '
-                                    'translations, row #%s: %s compared to %s '
-                                    'in the English source',
-                                    key.replace(BACK_PREFIX, BACK_PREFIX_LOG),
-                                    card_id, lang,
-                                    TRANSLATIONS[lang][card_id][ROW_COLUMN],
-                                    paragraphs_translated, paragraphs_english)
-
-                        value_english = _add_automatic_tags(row[key],
-                                                            lang=L_ENGLISH)
-                        value_translated = _add_automatic_tags(value,
-                                                               lang=lang)
-                        for tag in ('[b]', '[i]', '[bi]'):
-                            tags_english = value_english.count(tag)
-                            tags_translated = value_translated.count(tag)
-                            if tags_english != tags_translated:
-                                if (row.get(CARD_TYPE) == T_RULES and
-                                        tag != '[bi]'):
-                                    # logging.warning(
-                                    #     'Different number of %s tags in %s '
-                                    #     'column for card ID %s in %s '
-                                    #     'translations, row #%s: %s compared '
-                                    #     'to %s in the English source', tag,
-                                    #     key.replace(BACK_PREFIX,
-                                    #                 BACK_PREFIX_LOG),
-                                    #     card_id, lang,
-                                    #     TRANSLATIONS[lang][card_id][ROW_COLUMN],
-                                    #     tags_translated, tags_english)
-                                    pass
-                                else:
-                                    logging.warning(
-                                        'Different number of %s tags in %s '
-                                        'column for card ID %s in %s '
-                                        'translations, row #%s: %s compared '
-                                        'to %s in the English source', tag,
-                                        key.replace(BACK_PREFIX,
-                                                    BACK_PREFIX_LOG),
-                                        card_id, lang,
-                                        TRANSLATIONS[lang][card_id][ROW_COLUMN],
-                                        tags_translated, tags_english)
-
-                    if (key in {CARD_TEXT, BACK_PREFIX + CARD_TEXT,
-                                CARD_SHADOW, BACK_PREFIX + CARD_SHADOW,
-                                CARD_KEYWORDS, BACK_PREFIX + CARD_KEYWORDS,
-                                CARD_VICTORY, BACK_PREFIX + CARD_VICTORY} and
-                            row.get(CARD_TYPE) != T_PRESENTATION and
-                            isinstance(row.get(key), str)):
-                        value_english = re.sub(TAGS_WITH_NUMBERS_REGEX, '',
-                                               row[key])
-                        if key in {CARD_TEXT, CARD_SHADOW}:
-                            value_english = value_english.replace(
-                                _to_str(row.get(CARD_NAME)), '')
-                        else:
-                            value_english = value_english.replace(
-                                _to_str(row.get(BACK_PREFIX + CARD_NAME)), '')
-
-                        value_translated = re.sub(TAGS_WITH_NUMBERS_REGEX, '',
-                                                  value)
-                        if key in {CARD_TEXT, CARD_SHADOW}:
-                            value_translated = value_translated.replace(
-                                _to_str(TRANSLATIONS[lang][card_id].get(
-                                    CARD_NAME)), '')
-                        else:
-                            value_translated = value_translated.replace(
-                                _to_str(TRANSLATIONS[lang][card_id].get(
-                                    BACK_PREFIX + CARD_NAME)), '')
+def get_parallelism(conf):
+    """ Get the number of parallel processes to use.
+    """
+    return (min(4, max(1, cpu_count() - 1))
+            if conf['parallelism'] == 'default'
+            else conf['parallelism'])
 
-                        anchors_issue = False
-                        anchors_english = re.findall(ANCHORS_REGEX,
-                                                     value_english)
-                        anchors_translated = re.findall(ANCHORS_REGEX,
-                                                        value_translated)
-                        if (sorted(anchors_english) !=
-                                sorted(anchors_translated)):
-                            _remove_common_elements(anchors_english,
-                                                    anchors_translated)
-                            anchors_issue = True
 
-                        if (anchors_issue and
-                                _split_combined_elements(anchors_english) ==
-                                _split_combined_elements(anchors_translated)):
-                            anchors_issue = False
+def init_cpu_budget(semaphore):
+    """ Set the semaphore of CPU slots shared by all processes of the run.
+    """
+    CPU_BUDGET['semaphore'] = semaphore
 
-                        if ((anchors_issue and not anchors_english and  # pylint: disable=R0916
-                             not [a for a in anchors_translated
-                                  if a not in {'2', '3'}]) or
-                                (anchors_issue and not anchors_translated and
-                                 not [a for a in anchors_english
-                                      if a not in {'2', '3'}])):
-                            if not anchors_english:
-                                value_english = _replace_numbers(
-                                    value_english, lang=L_ENGLISH)
-                            else:
-                                value_translated = _replace_numbers(
-                                    value_translated, lang=lang)
-
-                            anchors_english = re.findall(ANCHORS_REGEX,
-                                                         value_english)
-                            anchors_translated = re.findall(ANCHORS_REGEX,
-                                                            value_translated)
-                            if (sorted(anchors_english) ==
-                                    sorted(anchors_translated)):
-                                anchors_issue = False
-                            else:
-                                _remove_common_elements(anchors_english,
-                                                        anchors_translated)
 
-                            if (anchors_issue and
-                                    _split_combined_elements(
-                                        anchors_english) ==
-                                    _split_combined_elements(
-                                        anchors_translated)):
-                                anchors_issue = False
+def acquire_cpu_slots(conf, wanted, block=False):
+    """ Acquire up to the wanted number of CPU slots and return the number
+    of acquired slots.
+    """
+    semaphore = CPU_BUDGET.get('semaphore')
+    if semaphore is None:
+        return wanted if block else max(0, min(wanted,
+                                               get_parallelism(conf) - 1))
 
-                        if anchors_issue:
-                            if (row.get(CARD_TYPE) == T_RULES and
-                                    '[' not in ', '.join(anchors_english) and
-                                    '[' not in ', '.join(anchors_translated)):
-                                # logging.warning(
-                                #     'Possibly different content in %s column '
-                                #     'for card ID %s in %s translations, row '
-                                #     '#%s: "%s" compared to "%s" in the '
-                                #     'English source',
-                                #     key.replace(BACK_PREFIX, BACK_PREFIX_LOG),
-                                #     card_id, lang,
-                                #     TRANSLATIONS[lang][card_id][ROW_COLUMN],
-                                #     ', '.join(anchors_translated),
-                                #     ', '.join(anchors_english))
-                                pass
-                            else:
-                                logging.warning(
-                                    'Possibly different content in %s column '
-                                    'for card ID %s in %s translations, row '
-                                    '#%s: "%s" compared to "%s" in the '
-                                    'English source',
-                                    key.replace(BACK_PREFIX, BACK_PREFIX_LOG),
-                                    card_id, lang,
-                                    TRANSLATIONS[lang][card_id][ROW_COLUMN],
-                                    ', '.join(anchors_translated),
-                                    ', '.join(anchors_english))
+    acquired = 0
+    while acquired < wanted and semaphore.acquire(block):
+        acquired += 1
 
-                if not value and row.get(key):
-                    logging.error(
-                        'Missing value for %s column for card ID %s in %s '
-                        'translations, row #%s',
-                        key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
-                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
-                elif value and not row.get(key):
-                    logging.error(
-                        'Unnecessary value for %s column for card '
-                        'ID %s in %s translations, row #%s',
-                        key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
-                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+    return acquired
 
-            for key, value in TRANSLATIONS[lang][card_id].items():
-                if key not in TRANSLATED_COLUMNS:
-                    continue
 
-                if isinstance(value, str):
-                    value_key = (row[CARD_ID], key)
-                    translated_keys = [k for k in keys_by_hash[
-                        (lang, row[CARD_SET], hash_by_key[(lang, value_key)])]
-                                       if k != value_key]
-                    if hash_by_key.get((L_ENGLISH, value_key)):
-                        english_keys = [k for k in keys_by_hash[
-                            (L_ENGLISH, row[CARD_SET], hash_by_key[
-                                (L_ENGLISH, value_key)])]
-                                    if k != value_key]
+def release_cpu_slots(slots):
+    """ Release previously acquired CPU slots.
+    """
+    semaphore = CPU_BUDGET.get('semaphore')
+    if semaphore is None:
+        return
 
-                    if (english_keys is not None and
-                            sorted(translated_keys) != sorted(english_keys)):
-                        if translated_keys:
-                            translated_keys = ', '.join([
-                                '{} for card ID {}'.format(
-                                    k[1].replace(BACK_PREFIX, BACK_PREFIX_LOG),
-                                    k[0])
-                                for k in translated_keys])
-                        else:
-                            translated_keys = '[nothing]'
+    for _ in range(slots):
+        semaphore.release()
 
-                        if english_keys:
-                            english_keys = ', '.join([
-                                '{} for card ID {}'.format(
-                                    k[1].replace(BACK_PREFIX, BACK_PREFIX_LOG),
-                                    k[0])
-                                for k in english_keys])
-                        else:
-                            english_keys = '[nothing]'
 
-                        logging.error(
-                            'Suspicious value in %s column for card ID %s in '
-                            '%s translations, row #%s: it\'s the same as %s, '
-                            'but the English source is the same as %s',
-                            key.replace(BACK_PREFIX, BACK_PREFIX_LOG), card_id,
-                            lang, TRANSLATIONS[lang][card_id][ROW_COLUMN],
-                            translated_keys, english_keys)
+def _connect_timings():
+    """ Connect to the timing history.
+    """
+    connection = sqlite3.connect(TIMINGS_PATH, timeout=60)
+    connection.execute("""CREATE TABLE IF NOT EXISTS timings (
+        run_id TEXT, script TEXT, step TEXT, set_id TEXT, lang TEXT,
+        inputs INTEGER, bytes INTEGER, started REAL, finished REAL,
+        wall REAL, cpu REAL, status TEXT, step_id TEXT, deps TEXT)""")
+    columns = [row[1] for row in
+               connection.execute('PRAGMA table_info(timings)')]
+    for column in ('step_id', 'deps'):
+        if column not in columns:
+            connection.execute(
+                'ALTER TABLE timings ADD COLUMN {} TEXT'.format(column))
+
+    connection.execute("""CREATE INDEX IF NOT EXISTS timings_step
+        ON timings (script, step, set_id, lang)""")
+    connection.execute("""CREATE INDEX IF NOT EXISTS timings_run
+        ON timings (run_id)""")
+    return connection
+
+
+def init_timings(script, run_id):
+    """ Set the run of the script, the timings of the steps are saved to.
+    """
+    TIMINGS['script'] = script
+    TIMINGS['run_id'] = run_id
+    TIMINGS['stack'] = []
+    TIMINGS['deps'] = []
 
-            if (card_traits is not None and
-                    TRANSLATIONS[lang][card_id].get(CARD_TRAITS)):
-                card_traits_tr = TRANSLATIONS[lang][card_id][CARD_TRAITS]
-                if (len(extract_traits(card_traits_tr)) !=
-                        len(extract_traits(card_traits))):
-                    logging.error(
-                        'Incorrect number of traits for card '
-                        'ID %s in %s translations, row #%s', card_id,
-                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
-                elif (not str(card_traits_tr).endswith('.') and
-                      not str(card_traits_tr).endswith('.[/size]')):
-                    logging.error(
-                        'Missing period in traits for card '
-                        'ID %s in %s translations, row #%s', card_id,
-                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
 
-            if (card_traits_back is not None and
-                    TRANSLATIONS[lang][card_id].get(
-                        BACK_PREFIX + CARD_TRAITS)):
-                card_traits_back_tr = (
-                    TRANSLATIONS[lang][card_id][BACK_PREFIX + CARD_TRAITS])
-                if (len(extract_traits(card_traits_back_tr)) !=
-                        len(extract_traits(card_traits_back))):
-                    logging.error(
-                        'Incorrect number of traits back for card '
-                        'ID %s in %s translations, row #%s', card_id,
-                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
-                elif (not str(card_traits_back_tr).endswith('.') and
-                      not str(card_traits_back_tr).endswith('.[/size]')):
-                    logging.error(
-                        'Missing period in traits back for card '
-                        'ID %s in %s translations, row #%s', card_id,
-                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+def get_step_deps():
+    """ Get IDs of the steps the next step depends on.
+    """
+    return list(TIMINGS.get('deps', []))
 
-            if (card_keywords is not None and
-                    TRANSLATIONS[lang][card_id].get(CARD_KEYWORDS)):
-                card_keywords_tr = TRANSLATIONS[lang][card_id][CARD_KEYWORDS]
-                if (len(extract_keywords(card_keywords_tr)) !=
-                        len(extract_keywords(card_keywords))):
-                    logging.error(
-                        'Incorrect number of keywords for card '
-                        'ID %s in %s translations, row #%s', card_id,
-                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
-                elif not (str(card_keywords_tr).endswith('.') or
-                          str(card_keywords_tr).endswith('.[inline]')):
-                    logging.error(
-                        'Missing period in keywords for card '
-                        'ID %s in %s translations, row #%s', card_id,
-                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
 
-            if (card_keywords_back is not None and
-                    TRANSLATIONS[lang][card_id].get(
-                        BACK_PREFIX + CARD_KEYWORDS)):
-                card_keywords_back_tr = (
-                    TRANSLATIONS[lang][card_id][BACK_PREFIX + CARD_KEYWORDS])
-                if (len(extract_keywords(card_keywords_back_tr)) !=
-                        len(extract_keywords(card_keywords_back))):
-                    logging.error(
-                        'Incorrect number of keywords back for card '
-                        'ID %s in %s translations, row #%s', card_id,
-                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
-                elif not (str(card_keywords_back_tr).endswith('.') or
-                          str(card_keywords_back_tr).endswith('.[inline]')):
-                    logging.error(
-                        'Missing period in keywords back for card '
-                        'ID %s in %s translations, row #%s', card_id,
-                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+def set_step_deps(deps):
+    """ Set IDs of the steps the next step depends on.
+    """
+    TIMINGS['deps'] = list(deps)
 
-            if (card_victory is not None and
-                    TRANSLATIONS[lang][card_id].get(CARD_VICTORY) and
-                    (is_int(card_victory) or card_type in CARD_TYPES_PAGES) and
-                    card_victory !=
-                    TRANSLATIONS[lang][card_id][CARD_VICTORY]):
-                logging.error(
-                    'Incorrect victory points for card '
-                    'ID %s in %s translations, row #%s', card_id,
-                    lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
 
-            if (card_victory_back is not None and
-                    TRANSLATIONS[lang][card_id].get(
-                        BACK_PREFIX + CARD_VICTORY) and
-                    (is_int(card_victory_back) or card_type == T_RULES) and
-                    card_victory_back !=
-                    TRANSLATIONS[lang][card_id][BACK_PREFIX + CARD_VICTORY]):
-                logging.error(
-                    'Incorrect victory points back for card '
-                    'ID %s in %s translations, row #%s', card_id,
-                    lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
+def start_timings(script):
+    """ Start a new run of the script in the timing history and return its
+    ID.
+    """
+    run_id = '{}-{}'.format(datetime.now().strftime('%Y%m%d%H%M%S'),
+                            uuid.uuid4().hex[:8])
+    init_timings(script, run_id)
+    return run_id
 
-            if (card_text is not None and
-                    TRANSLATIONS[lang][card_id].get(CARD_TEXT)):
-                card_text_tr = TRANSLATIONS[lang][card_id][CARD_TEXT]
-                if (card_type not in CARD_TYPES_NO_PERIOD_CHECK and
-                      not _verify_period(card_text_tr)):
-                    logging.error(
-                        'Missing period at the end of the text paragraph for '
-                        'card ID %s in %s translations, row #%s', card_id,
-                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
 
-                if '[split]' in card_text and '[split]' not in card_text_tr:
-                    logging.error(
-                        'Missing [split] tag in text for card ID %s in %s '
-                        'translations, row #%s', card_id, lang,
-                        TRANSLATIONS[lang][card_id][ROW_COLUMN])
-                elif '[split]' not in card_text and '[split]' in card_text_tr:
-                    logging.error(
-                        'Invalid [split] tag in text for card ID %s in %s '
-                        'translations, row #%s', card_id, lang,
-                        TRANSLATIONS[lang][card_id][ROW_COLUMN])
+def count_step_inputs(cnt, size):
+    """ Add processed input files to the current step.
+    """
+    if TIMINGS.get('stack'):
+        TIMINGS['stack'][-1]['inputs'] += cnt
+        TIMINGS['stack'][-1]['bytes'] += size
 
-            if (card_text_back is not None and
-                    TRANSLATIONS[lang][card_id].get(BACK_PREFIX + CARD_TEXT)):
-                card_text_back_tr = (
-                    TRANSLATIONS[lang][card_id][BACK_PREFIX + CARD_TEXT])
-                if (card_type_back not in CARD_TYPES_NO_PERIOD_CHECK and
-                      not _verify_period(card_text_back_tr)):
-                    logging.error(
-                        'Missing period at the end of the text back paragraph '
-                        'for card ID %s in %s translations, row #%s', card_id,
-                        lang, TRANSLATIONS[lang][card_id][ROW_COLUMN])
 
-                if ('[split]' in card_text_back and
-                        '[split]' not in card_text_back_tr):
-                    logging.error(
-                        'Missing [split] tag in text back for card ID %s in '
-                        '%s translations, row #%s', card_id, lang,
-                        TRANSLATIONS[lang][card_id][ROW_COLUMN])
-                elif ('[split]' not in card_text_back and
-                      '[split]' in card_text_back_tr):
-                    logging.error(
-                        'Invalid [split] tag in text back for card ID %s in '
-                        '%s translations, row #%s', card_id, lang,
-                        TRANSLATIONS[lang][card_id][ROW_COLUMN])
+def _get_cpu_time():
+    """ Get CPU time of the process and its finished child processes.
+    """
+    times = os.times()
+    return (times.user + times.system + times.children_user +
+            times.children_system)
 
-            if (card_shadow is not None and
-                    TRANSLATIONS[lang][card_id].get(CARD_SHADOW)):
-                card_shadow_tr = TRANSLATIONS[lang][card_id][CARD_SHADOW]
-                if not _verify_shadow_case(card_shadow_tr, lang):
-                    if lang == L_FRENCH:
-                        logging.warning(
-                            'Shadow effect should probably start with a '
-                            'lowercase letter for card ID %s in %s '
-                            'translations, row #%s', card_id, lang,
-                            TRANSLATIONS[lang][card_id][ROW_COLUMN])
-                    else:
-                        logging.error(
-                            'Shadow effect should start with a capital letter '
-                            'for card ID %s in %s translations, row #%s',
-                            card_id, lang,
-                            TRANSLATIONS[lang][card_id][ROW_COLUMN])
-                elif not _verify_period(card_shadow_tr):
-                    logging.error(
-                        'Missing period at the end of shadow for card ID %s '
-                        'in %s translations, row #%s', card_id, lang,
-                        TRANSLATIONS[lang][card_id][ROW_COLUMN])
 
-            if (card_shadow_back is not None and
-                    TRANSLATIONS[lang][card_id].get(
-                        BACK_PREFIX + CARD_SHADOW)):
-                card_shadow_back_tr = (
-                    TRANSLATIONS[lang][card_id][BACK_PREFIX + CARD_SHADOW])
-                if not _verify_shadow_case(card_shadow_back_tr, lang):
-                    if lang == L_FRENCH:
-                        logging.warning(
-                            'Shadow back effect should probably start with a '
-                            'lowercase letter for card ID %s in %s '
-                            'translations, row #%s', card_id, lang,
-                            TRANSLATIONS[lang][card_id][ROW_COLUMN])
-                    else:
-                        logging.error(
-                            'Shadow back effect should start with a capital '
-                            'letter for card ID %s in %s translations, row '
-                            '#%s', card_id, lang,
-                            TRANSLATIONS[lang][card_id][ROW_COLUMN])
-                elif not _verify_period(card_shadow_back_tr):
-                    logging.error(
-                        'Missing period at the end of shadow back for card ID '
-                        '%s in %s translations, row #%s', card_id, lang,
-                        TRANSLATIONS[lang][card_id][ROW_COLUMN])
+def timed_step(func, *args, **kwargs):
+    """ Run the step and save its timing to the history.
+    """
+    if not TIMINGS.get('run_id'):
+        return func(*args, **kwargs)
+
+    arguments = inspect.signature(func).bind_partial(*args, **kwargs
+                                                     ).arguments
+    record = {'inputs': 0, 'bytes': 0}
+    step_id = uuid.uuid4().hex
+    deps = get_step_deps()
+    TIMINGS['stack'].append(record)
+    status = 'failed'
+    started = time.time()
+    cpu = _get_cpu_time()
+    try:
+        result = func(*args, **kwargs)
+        status = 'ok'
+        return result
+    finally:
+        finished = time.time()
+        cpu = _get_cpu_time() - cpu
+        TIMINGS['stack'].pop()
+        set_step_deps([step_id])
+        try:
+            connection = _connect_timings()
+            try:
+                with connection:
+                    connection.execute(
+                        'INSERT INTO timings (run_id, script, step, set_id, '
+                        'lang, inputs, bytes, started, finished, wall, cpu, '
+                        'status, step_id, deps) VALUES '
+                        '(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                        (TIMINGS['run_id'], TIMINGS['script'], func.__name__,
+                         arguments.get('set_id'), arguments.get('lang'),
+                         record['inputs'] or None, record['bytes'] or None,
+                         started, finished, round(finished - started, 3),
+                         round(cpu, 3), status, step_id, json.dumps(deps)))
+            finally:
+                connection.close()
+        except sqlite3.Error as exc:
+            logging.warning('Can\'t save the timing of %s: %s',
+                            func.__name__, str(exc))
+
+
+def get_step_durations(script):
+    """ Get average durations of the successful steps of the script over the
+    last runs.
+    """
+    try:
+        connection = _connect_timings()
+        try:
+            rows = connection.execute(
+                """SELECT step, set_id, lang, wall FROM timings
+                WHERE script = ? AND status = 'ok' AND run_id IN (
+                    SELECT run_id FROM timings WHERE script = ?
+                    GROUP BY run_id ORDER BY MAX(started) DESC LIMIT ?)""",
+                (script, script, TIMINGS_BASELINE_RUNS)).fetchall()
+        finally:
+            connection.close()
+    except sqlite3.Error as exc:
+        logging.warning('Can\'t read the timing history: %s', str(exc))
+        rows = []
 
-    logging.info('')
-    if errors:
-        raise SanityCheckError('Sanity check failed:\n{}'.format(
-            '\n'.join(errors)))
+    durations = {}
+    for step, set_id, lang, wall in rows:
+        durations.setdefault((step, set_id, lang), []).append(wall)
 
-    sets = [s for s in sets if s[0] not in broken_set_ids]
-    logging.info('...Performing a sanity check of the spreadsheet (%ss)',
-                 round(time.time() - timestamp, 3))
-    return sets
+    return {k:sum(v) / len(v) for k, v in durations.items()}
 
 
 def _verify_shadow_case(shadow_text, lang):  # pylint: disable=R0911
@@ -7850,6 +8924,8 @@ def save_data_for_bot(conf, sets):  # pylint: disable=R0912,R0914,R0915
               'encounter_set_names': list(ALL_ENCOUNTER_SET_NAMES),
               'card_names': list(ALL_CARD_NAMES[L_ENGLISH]),
               'traits': list(ALL_TRAITS),
+              'allowed_names': get_allowed_names(ALL_SET_AND_QUEST_NAMES,
+                                                 ALL_ENCOUNTER_SET_NAMES),
               'artwork_ids': artwork_ids,
               'data': data}
     with open(DISCORD_CARD_DATA_PATH, 'w', encoding='utf-8') as obj:
@@ -8056,9 +9132,8 @@ def generate_octgn_set_xml(conf, set_id, set_name):  # pylint: disable=R0912,R09
     cards = root.findall("./cards")[0]
 
     chosen_data = []
-    for row in DATA:
+    for row in get_set_data(set_id):
         if (row[CARD_ID] is None
-                or row[CARD_SET] != set_id
                 or not _needed_for_octgn(row)
                 or (conf['selected_only']
                     and row[CARD_ID] not in SELECTED_CARDS)):
@@ -8183,64 +9258,29 @@ def generate_octgn_set_xml(conf, set_id, set_name):  # pylint: disable=R0912,R09
                  set_name, round(time.time() - timestamp, 3))
 
 
-def load_external_xml(url, sets=None, encounter_sets=None):  # pylint: disable=R0912,R0914,R0915
-    """ Load cards from an external XML file.
+def _parse_external_xml(root):  # pylint: disable=R0912,R0914,R0915
+    """ Parse cards from an external XML file.
     """
     res = []
-    if url in XML_CACHE:
-        content = XML_CACHE[url]
-        root = ET.fromstring(content)
-    else:
-        content = _get_cached_content(url, 'xml')
-        if content:
-            XML_CACHE[url] = content
-            root = ET.fromstring(content)
-        else:
-            content = get_content(url)
-            if not content or not b'<?xml' in content:
-                logging.error("Can't download XML from %s, ignoring", url)
-                return res
-
-            try:
-                root = ET.fromstring(content)
-            except ET.ParseError:
-                logging.error("Can't download XML from %s, ignoring", url)
-                return res
-
-            if not root.attrib.get('name'):
-                logging.error("Can't find the set name in XML from %s, "
-                              "ignoring", url)
-                return res
-
-            XML_CACHE[url] = content
-            _save_content(url, content, 'xml')
-
     set_name = str(root.attrib.get('name', '')).lower()
-    if sets and set_name not in sets:
-        return res
-
     for card in root[0]:
         row = {}
-        encounter_set = _find_properties(card, 'Encounter Set')
+        properties = CardProperties(card)
+        encounter_set = properties.get('Encounter Set')
         if encounter_set:
-            encounter_set = str(encounter_set[0].attrib['value'])
-            if encounter_sets and encounter_set.lower() not in encounter_sets:
-                continue
+            encounter_set = str(encounter_set)
         else:
             encounter_set = None
 
-        quantity = _find_properties(card, 'Quantity')
-        if not quantity:
+        quantity = properties.get('Quantity')
+        if quantity is None:
             continue
 
-        card_type = _find_properties(card, 'Type')
-        if not card_type:
+        card_type = properties.get('Type')
+        if card_type is None:
             continue
 
-        traits = _find_properties(card, 'Traits')
-        traits = traits[0].attrib['value'] if traits else None
-
-        card_type = card_type[0].attrib['value']
+        traits = properties.get('Traits')
         if card_type == T_ALIAS_SIDE_QUEST:
             if encounter_set:
                 card_type = T_ENCOUNTER_SIDE_QUEST
@@ -8253,9 +9293,7 @@ def load_external_xml(url, sets=None, encounter_sets=None):  # pylint: disable=R
             if 'Ship' in [t.strip() for t in str(traits).split('.')]:
                 card_type = T_SHIP_OBJECTIVE
 
-        sphere = _find_properties(card, 'Sphere')
-        sphere = sphere[0].attrib['value'] if sphere else None
-
+        sphere = properties.get('Sphere')
         if (not sphere and encounter_set
                 and encounter_set.lower().endswith(' - nightmare')
                 and card_type in {T_ENCOUNTER_SIDE_QUEST, T_ENEMY, T_LOCATION,
@@ -8265,32 +9303,26 @@ def load_external_xml(url, sets=None, encounter_sets=None):  # pylint: disable=R
         elif sphere == S_NEUTRAL and card_type == T_TREASURE:
             sphere = None
 
-        keywords = _find_properties(card, 'Keywords')
-        keywords = keywords[0].attrib['value'] if keywords else None
-
-        text = _find_properties(card, 'Text')
-        text = text[0].attrib['value'] if text else ''
+        keywords = properties.get('Keywords')
+        text = properties.get('Text', '')
         if ' Restricted.' in text or '\nRestricted.' in text:
             if keywords:
                 keywords = 'Restricted. {}'.format(keywords)
             else:
                 keywords = 'Restricted.'
 
-        card_number = _find_properties(card, 'Card Number')
-        card_number = (
-            int(card_number[0].attrib['value'])
-            if card_number
-            and is_positive_or_zero_int(card_number[0].attrib['value'])
-            else 0)
+        card_number = properties.get('Card Number')
+        card_number = (int(card_number)
+                       if card_number is not None
+                       and is_positive_or_zero_int(card_number)
+                       else 0)
 
-        unique = _find_properties(card, 'Unique')
-        unique = 1 if unique else None
+        unique = 1 if 'Unique' in properties else None
 
-        cost = _find_properties(card, 'Cost')
-        cost = handle_int(cost[0].attrib['value']) if cost else None
+        cost = properties.get('Cost')
+        cost = handle_int(cost) if cost is not None else None
 
-        victory = _find_properties(card, 'Victory Points')
-        victory = victory[0].attrib['value'] if victory else None
+        victory = properties.get('Victory Points')
 
         if not card.attrib.get('size'):
             row[CARD_BACK] = B_PLAYER
@@ -8307,7 +9339,7 @@ def load_external_xml(url, sets=None, encounter_sets=None):  # pylint: disable=R
         row[CARD_SPHERE] = sphere
         row[CARD_TRAITS] = traits
         row[CARD_KEYWORDS] = keywords
-        row[CARD_QUANTITY] = int(quantity[0].attrib['value'])
+        row[CARD_QUANTITY] = int(quantity)
         row[CARD_SET_NAME] = set_name
         row[CARD_UNIQUE] = unique
         row[CARD_COST] = cost
@@ -8315,9 +9347,131 @@ def load_external_xml(url, sets=None, encounter_sets=None):  # pylint: disable=R
         row[CARD_EASY_MODE] = None
         res.append(row)
 
+    return set_name, res
+
+
+def _read_external_xml_index():
+    """ Read the persisted index of parsed external XML files.
+    """
+    if EXTERNAL_XML_INDEX:
+        return EXTERNAL_XML_INDEX
+
+    try:
+        with open(EXTERNAL_XML_CACHE_PATH, 'rb') as fobj:
+            index = pickle.load(fobj)
+    except Exception:
+        index = {}
+
+    if index.get('version') != _get_code_checksum():
+        index = {'version': _get_code_checksum(), 'files': {}}
+
+    index['changed'] = False
+    EXTERNAL_XML_INDEX.update(index)
+    return EXTERNAL_XML_INDEX
+
+
+def _write_external_xml_index():
+    """ Persist the index of parsed external XML files if it changed.
+    """
+    if not EXTERNAL_XML_INDEX.get('changed'):
+        return
+
+    index = {'version': EXTERNAL_XML_INDEX['version'],
+             'files': EXTERNAL_XML_INDEX['files']}
+    temp_path = '{}.{}.tmp'.format(EXTERNAL_XML_CACHE_PATH, uuid.uuid4().hex)
+    try:
+        with open(temp_path, 'wb') as fobj:
+            pickle.dump(index, fobj, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temp_path, EXTERNAL_XML_CACHE_PATH)
+    except Exception as exc:
+        logging.warning("Can't save the external XML cache: %s", str(exc))
+        return
+
+    EXTERNAL_XML_INDEX['changed'] = False
+
+
+def _get_external_cards(url):
+    """ Get the set name and parsed cards from an external XML file (either
+    from a local cache or from the URL).
+    """
+    key = _get_url_cache_name(url)
+    if key in EXTERNAL_XML_CACHE:
+        return EXTERNAL_XML_CACHE[key]
+
+    content = _get_cached_content(url, 'xml')
+    if not content:
+        content = get_content(url)
+        if not content or not b'<?xml' in content:
+            logging.error("Can't download XML from %s, ignoring", url)
+            return None
+
+        try:
+            root = ET.fromstring(content)
+        except ET.ParseError:
+            logging.error("Can't download XML from %s, ignoring", url)
+            return None
+
+        if not root.attrib.get('name'):
+            logging.error("Can't find the set name in XML from %s, "
+                          "ignoring", url)
+            return None
+
+        _save_content(url, content, 'xml')
+
+    checksum = hashlib.md5(content).hexdigest()
+    index = _read_external_xml_index()
+    if key in index['files'] and index['files'][key][0] == checksum:
+        res = index['files'][key][1]
+    else:
+        res = _parse_external_xml(ET.fromstring(content))
+        index['files'][key] = (checksum, res)
+        index['changed'] = True
+
+    EXTERNAL_XML_CACHE[key] = res
     return res
 
 
+def load_external_xml(url, sets=None, encounter_sets=None):
+    """ Load cards from an external XML file.
+    """
+    data = _get_external_cards(url)
+    _write_external_xml_index()
+    if not data:
+        return []
+
+    set_name, cards = data
+    if sets and set_name not in sets:
+        return []
+
+    return [dict(row) for row in cards
+            if not (encounter_sets and row[CARD_ENCOUNTER_SET] and
+                    row[CARD_ENCOUNTER_SET].lower() not in encounter_sets)]
+
+
+def get_external_card_dict():
+    """ Get card dictionary with data from all cached external XML files.
+    """
+    filenames = []
+    for _, _, filenames in os.walk(URL_CACHE_PATH):
+        filenames = sorted(f for f in filenames if f.endswith('.xml.cache'))
+        break
+
+    key = tuple(filenames)
+    if EXTERNAL_CARD_DICT.get('key') != key:
+        card_dict = {}
+        for filename in filenames:
+            data = _get_external_cards(re.sub(r'\.xml\.cache$', '', filename))
+            if data:
+                card_dict.update({r[CARD_ID]:r for r in data[1]})
+
+        _write_external_xml_index()
+        EXTERNAL_CARD_DICT['key'] = key
+        EXTERNAL_CARD_DICT['data'] = card_dict
+
+    return EXTERNAL_CARD_DICT['data']
+
+
 def _update_card_for_rules(card):
     """ Update card structure to simplify rules matching.
     """
@@ -8482,10 +9636,9 @@ def _filter_section_cards(section):
 def _generate_octgn_o8d_player(conf, set_id, set_name):
     """ Generate O8D file with player cards for OCTGN.
     """
-    rows = [row for row in DATA
+    rows = [row for row in get_set_data(set_id)
             if row[CARD_ID] is not None
             and _needed_for_octgn(row)
-            and row[CARD_SET] == set_id
             and row[CARD_TYPE] in CARD_TYPES_PLAYER
             and (not conf['selected_only'] or row[CARD_ID] in SELECTED_CARDS)]
     if not rows:
@@ -8622,13 +9775,16 @@ def _generate_octgn_o8d_quest(row):  # pylint: disable=R0912,R0914,R0915
             quest['encounter sets'].update(
                 [str(s).lower() for s in rules[('encounter sets', 0)]])
 
-        cards = [r for r in DATA
+        cards = [r for s in SETS
+                 if _to_str(SETS[s][SET_NAME]).lower() in quest['sets']
+                 for r in get_set_data(s)
+                 if not r[CARD_ENCOUNTER_SET]]
+        cards.extend(r for e in quest['encounter sets']
+                     for r in get_encounter_set_data(e)
+                     if _to_str(r[CARD_SET_NAME]).lower() in quest['sets'])
+        cards = [r for r in _sort_data_rows(cards)
                  if r[CARD_ID] is not None
                  and _needed_for_octgn(r)
-                 and _to_str(r[CARD_SET_NAME]).lower() in quest['sets']
-                 and (not r[CARD_ENCOUNTER_SET] or
-                      str(r[CARD_ENCOUNTER_SET]).lower()
-                      in quest['encounter sets'])
                  and (r[CARD_TYPE] != T_RULES or
                       _to_str(r.get(CARD_TEXT)) not in {'', 'T.B.D.'} or
                       _to_str(r.get(BACK_PREFIX + CARD_TEXT))
@@ -8960,9 +10116,8 @@ def generate_octgn_o8d(conf, set_id, set_name):
 
     files = []
     menus = []
-    rows = [row for row in DATA
-            if row[CARD_SET] == set_id
-            and row[CARD_TYPE] in CARD_TYPES_DECK_RULES
+    rows = [row for row in get_set_data(set_id)
+            if row[CARD_TYPE] in CARD_TYPES_DECK_RULES
             and row[CARD_DECK_RULES]
             and (not conf['selected_only'] or row[CARD_ID] in SELECTED_CARDS)]
     for row in rows:
@@ -9079,9 +10234,8 @@ def generate_ringsdb_csv(conf, set_id, set_name):  # pylint: disable=R0912,R0914
                       'octgnid', 'hasErrata']
         writer = csv.DictWriter(obj, fieldnames=fieldnames)
         writer.writeheader()
-        for row in DATA:
+        for row in get_set_data(set_id):
             if (row[CARD_ID] is None
-                    or row[CARD_SET] != set_id
                     or not _needed_for_ringsdb(row)
                     or (conf['selected_only']
                         and row[CARD_ID] not in SELECTED_CARDS)):
@@ -9370,9 +10524,8 @@ def generate_dragncards_json(conf, set_id, set_name):  # pylint: disable=R0912,R
                 dragncards_timestamps[card.attrib['id']] = download_time
 
     json_data = {}
-    for row in DATA:
+    for row in get_set_data(set_id):
         if (row[CARD_ID] is None
-                or row[CARD_SET] != set_id
                 or not _needed_for_dragncards(row)
                 or (conf['selected_only']
                     and row[CARD_ID] not in SELECTED_CARDS)):
@@ -9572,8 +10725,8 @@ def generate_hallofbeorn_json(conf, set_id, set_name, lang):  # pylint: disable=
         output_path, escape_filename('{}.{}.json'.format(set_name, lang)))
 
     json_data = []
-    card_data = DATA[:]
-    for row in DATA:
+    card_data = get_set_data(set_id)[:]
+    for row in get_set_data(set_id):
         if (row[BACK_PREFIX + CARD_NAME] is not None and
                 not is_doubleside(row[CARD_TYPE],
                                   row[BACK_PREFIX + CARD_TYPE])):
@@ -9873,10 +11026,9 @@ def generate_frenchdb_csv(conf, set_id, set_name):  # pylint: disable=R0912,R091
                                  escape_filename(set_name))
     create_folder(output_folder)
 
-    data = DATA[:]
     data = sorted(
-        [row for row in data if row[CARD_SET] == set_id
-         and _needed_for_frenchdb(row)
+        [row for row in get_set_data(set_id)
+         if _needed_for_frenchdb(row)
          and (not conf['selected_only'] or row[CARD_ID] in SELECTED_CARDS)
         ], key=lambda r: str(int(r[CARD_NUMBER])).zfill(3)
         if is_positive_or_zero_int(r[CARD_NUMBER])
@@ -10129,17 +11281,16 @@ def generate_spanishdb_csv(conf, set_id, set_name):  # pylint: disable=R0912,R09
     create_folder(output_folder)
 
     cycle = set_name
-    presentations = [row for row in DATA
-                     if row[CARD_SET] == set_id and
-                     row[CARD_TYPE] == T_PRESENTATION]
+    presentations = [row for row in get_set_data(set_id)
+                     if row[CARD_TYPE] == T_PRESENTATION]
     if presentations:
         spanish_name = _update_card_name(TRANSLATIONS[L_SPANISH].get(
             presentations[0][CARD_ID], {}).get(CARD_NAME, ''))
         if spanish_name:
             cycle = spanish_name
 
-    data = DATA[:]
-    for row in DATA:
+    data = get_set_data(set_id)[:]
+    for row in get_set_data(set_id):
         if (row[BACK_PREFIX + CARD_NAME] is not None and
                 not is_doubleside(row[CARD_TYPE],
                                   row[BACK_PREFIX + CARD_TYPE])):
@@ -10458,13 +11609,10 @@ def translated_data(set_id, lang):
     """ Get card data with a few translated columns (only the needed ones).
     """
     res = []
-    for row in DATA:
+    for row in get_set_data(set_id):
         if row[CARD_ID] is None:
             continue
 
-        if row[CARD_SET] != set_id:
-            continue
-
         row_copy = row.copy()
         if lang != L_ENGLISH and TRANSLATIONS[lang].get(row[CARD_ID]):
             row_copy[CARD_NAME] = TRANSLATIONS[lang][row[CARD_ID]][CARD_NAME]
@@ -10487,26 +11635,12 @@ def generate_xml(conf, set_id, set_name, lang):  # pylint: disable=R0912,R0914,R
     root = ET.fromstring(XML_TEMPLATE)
     root.set('name', set_name)
     root.set('id', set_id)
-    root.set('icon', _to_str(SETS[set_id][SET_COLLECTION_ICON]))
-    root.set('copyright', _to_str(SETS[set_id][SET_COPYRIGHT]))
-    root.set('language', lang)
-    cards = root.findall("./cards")[0]
-
-    chosen_data = []
-    for row in DATA:
-        if row[CARD_ID] is None:
-            continue
-
-        if row[CARD_SET] != set_id:
-            continue
-
-        row_copy = row.copy()
-        if lang != L_ENGLISH and TRANSLATIONS[lang].get(row[CARD_ID]):
-            for key in TRANSLATED_COLUMNS:
-                row_copy[key] = TRANSLATIONS[lang][row[CARD_ID]][key]
-
-        chosen_data.append(row_copy)
+    root.set('icon', _to_str(SETS[set_id][SET_COLLECTION_ICON]))
+    root.set('copyright', _to_str(SETS[set_id][SET_COPYRIGHT]))
+    root.set('language', lang)
+    cards = root.findall("./cards")[0]
 
+    chosen_data = get_translated_set_data(set_id, lang)
     tab_appended = False
     for i, row in enumerate(chosen_data):
         if not tab_appended:
@@ -10701,19 +11835,6 @@ def _set_outputs(conf, lang, root):
         root.set('png800Bleed', '1')
 
 
-def _get_property(parent, name):
-    """ Get new or existing property with a given name.
-    """
-    properties = _find_properties(parent, name)
-    if properties:
-        prop = properties[0]
-    else:
-        prop = ET.SubElement(parent, 'property')
-        prop.set('name', name)
-
-    return prop
-
-
 def update_xml(conf, set_id, set_name, lang):  # pylint: disable=R0912,R0914,R0915
     """ Update the xml file with additional data.
     """
@@ -10745,13 +11866,10 @@ def update_xml(conf, set_id, set_name, lang):  # pylint: disable=R0912,R0914,R09
             external_data = json.load(fobj)
 
     for card in root[0]:
-        card_type = _find_properties(card, 'Type')
-        card_type = card_type and card_type[0].attrib['value']
-        card_sphere = _find_properties(card, 'Sphere')
-        card_sphere = card_sphere and card_sphere[0].attrib['value']
-        encounter_set = _find_properties(card, 'Encounter Set')
-        if encounter_set:
-            encounter_set = encounter_set[0].attrib['value']
+        card_properties = CardProperties(card)
+        card_type = card_properties.get('Type')
+        card_sphere = card_properties.get('Sphere')
+        encounter_set = card_properties.get('Encounter Set')
 
         properties = [p for p in card]  # pylint: disable=R1721
         if properties:
@@ -10768,33 +11886,29 @@ def update_xml(conf, set_id, set_name, lang):  # pylint: disable=R0912,R0914,R09
         if image_id in images:
             images[image_id][1] = True
             filename = images[image_id][0]
-            prop = _get_property(card, 'Artwork')
-            prop.set('value', os.path.split(filename)[-1])
-            prop.tail = '\n      '
-            prop = _get_property(card, 'Artwork Size')
-            prop.set('value', str(os.path.getsize(filename)))
-            prop.tail = '\n      '
-            prop = _get_property(card, 'Artwork Modified')
-            prop.set('value', str(int(os.path.getmtime(filename))))
-            prop.tail = '\n      '
-
-            artist = _find_properties(card, 'Artist')
-            if not artist and '_Artist_' in os.path.split(filename)[-1]:
-                prop = _get_property(card, 'Artist')
-                prop.set('value', '.'.join(
+            card_properties.set('Artwork', os.path.split(filename)[-1],
+                                '\n      ')
+            card_properties.set('Artwork Size',
+                                str(os.path.getsize(filename)), '\n      ')
+            card_properties.set('Artwork Modified',
+                                str(int(os.path.getmtime(filename))),
+                                '\n      ')
+
+            if ('Artist' not in card_properties and
+                    '_Artist_' in os.path.split(filename)[-1]):
+                artist = '.'.join(
                     '_Artist_'.join(
                         os.path.split(filename)[-1].split('_Artist_')[1:]
-                        ).split('.')[:-1]).replace('_', ' '))
-                prop.tail = '\n      '
+                        ).split('.')[:-1]).replace('_', ' ')
+                card_properties.set('Artist', artist, '\n      ')
         elif card_type != T_RULES and conf['validate_missing_images']:
             logging.error('No image detected for card %s (%s)',
                           card.attrib['id'], card.attrib['name'])
 
-        artist = _find_properties(card, 'Artist')
-        if not artist and card.attrib['id'] in external_data:
-            prop = _get_property(card, 'Artist')
-            prop.set('value', external_data[card.attrib['id']])
-            prop.tail = '\n      '
+        if ('Artist' not in card_properties and
+                card.attrib['id'] in external_data):
+            card_properties.set('Artist', external_data[card.attrib['id']],
+                                '\n      ')
 
         if card_type == T_PRESENTATION:
             image_id = '{}_{}_{}'.format(card.attrib['id'], 'Top', lang)
@@ -10804,15 +11918,14 @@ def update_xml(conf, set_id, set_name, lang):  # pylint: disable=R0912,R0914,R09
             if image_id in images:
                 filename = images[image_id][0]
                 images[image_id][1] = True
-                prop = _get_property(card, 'ArtworkTop')
-                prop.set('value', os.path.split(filename)[-1])
-                prop.tail = '\n      '
-                prop = _get_property(card, 'ArtworkTop Size')
-                prop.set('value', str(os.path.getsize(filename)))
-                prop.tail = '\n      '
-                prop = _get_property(card, 'ArtworkTop Modified')
-                prop.set('value', str(int(os.path.getmtime(filename))))
-                prop.tail = '\n      '
+                card_properties.set('ArtworkTop', os.path.split(filename)[-1],
+                                    '\n      ')
+                card_properties.set('ArtworkTop Size',
+                                    str(os.path.getsize(filename)),
+                                    '\n      ')
+                card_properties.set('ArtworkTop Modified',
+                                    str(int(os.path.getmtime(filename))),
+                                    '\n      ')
             elif conf['validate_missing_images']:
                 logging.error('No top image detected for card %s (%s)',
                               card.attrib['id'], card.attrib['name'])
@@ -10824,23 +11937,20 @@ def update_xml(conf, set_id, set_name, lang):  # pylint: disable=R0912,R0914,R09
             if image_id in images:
                 filename = images[image_id][0]
                 images[image_id][1] = True
-                prop = _get_property(card, 'ArtworkBottom')
-                prop.set('value', os.path.split(filename)[-1])
-                prop.tail = '\n      '
-                prop = _get_property(card, 'ArtworkBottom Size')
-                prop.set('value', str(os.path.getsize(filename)))
-                prop.tail = '\n      '
-                prop = _get_property(card, 'ArtworkBottom Modified')
-                prop.set('value', str(int(os.path.getmtime(filename))))
-                prop.tail = '\n      '
+                card_properties.set('ArtworkBottom',
+                                    os.path.split(filename)[-1], '\n      ')
+                card_properties.set('ArtworkBottom Size',
+                                    str(os.path.getsize(filename)),
+                                    '\n      ')
+                card_properties.set('ArtworkBottom Modified',
+                                    str(int(os.path.getmtime(filename))),
+                                    '\n      ')
             elif conf['validate_missing_images']:
                 logging.error('No bottom image detected for card %s (%s)',
                               card.attrib['id'], card.attrib['name'])
 
-        alternate = [a for a in card if a.attrib.get('type') == 'B']
-        if alternate:
-            alternate = alternate[0]
-
+        alternate = card_properties.alternate
+        alternate_properties = CardProperties(alternate)
         image_id = '{}_{}'.format(card.attrib['id'], 'B')
         if alternate:
             if image_id in images:
@@ -10850,46 +11960,36 @@ def update_xml(conf, set_id, set_name, lang):  # pylint: disable=R0912,R0914,R09
                 if properties:
                     properties[-1].tail = '{}  '.format(properties[-1].tail)
 
-                prop = _get_property(alternate, 'Artwork')
-                prop.set('value', os.path.split(filename)[-1])
-                prop.tail = '\n        '
-                prop = _get_property(alternate, 'Artwork Size')
-                prop.set('value', str(os.path.getsize(filename)))
-                prop.tail = '\n        '
-                prop = _get_property(alternate, 'Artwork Modified')
-                prop.set('value', str(int(os.path.getmtime(filename))))
-                prop.tail = '\n        '
-
-                artist = _find_properties(alternate, 'Artist')
-                if not artist and '_Artist_' in os.path.split(filename)[-1]:
-                    prop = _get_property(alternate, 'Artist')
-                    prop.set('value', '.'.join(
+                alternate_properties.set('Artwork',
+                                         os.path.split(filename)[-1],
+                                         '\n        ')
+                alternate_properties.set('Artwork Size',
+                                         str(os.path.getsize(filename)),
+                                         '\n        ')
+                alternate_properties.set('Artwork Modified',
+                                         str(int(os.path.getmtime(filename))),
+                                         '\n        ')
+
+                if ('Artist' not in alternate_properties and
+                        '_Artist_' in os.path.split(filename)[-1]):
+                    artist = '.'.join(
                         '_Artist_'.join(
                             os.path.split(filename)[-1].split('_Artist_')[1:]
-                            ).split('.')[:-1]).replace('_', ' '))
-                    prop.tail = '\n        '
+                            ).split('.')[:-1]).replace('_', ' ')
+                    alternate_properties.set('Artist', artist, '\n        ')
 
-            artist = _find_properties(alternate, 'Artist')
             artist_id = '{}.B'.format(card.attrib['id'])
-            if not artist and artist_id in external_data:
-                prop = _get_property(alternate, 'Artist')
-                prop.set('value', external_data[artist_id])
-                prop.tail = '\n      '
+            if ('Artist' not in alternate_properties and
+                    artist_id in external_data):
+                alternate_properties.set('Artist', external_data[artist_id],
+                                         '\n      ')
 
             properties = [p for p in alternate]  # pylint: disable=R1721
             if properties:
                 properties[-1].tail = re.sub(r'  $', '', properties[-1].tail)
 
-        try:
-            text = _find_properties(card, 'Text')[0].attrib['value']
-        except IndexError:
-            text = ''
-
-        try:
-            alternate_text = _find_properties(alternate,
-                                              'Text')[0].attrib['value']
-        except IndexError:
-            alternate_text = ''
+        text = card_properties.get('Text', '')
+        alternate_text = alternate_properties.get('Text', '')
 
         referred_custom_images = []
         res = re.search(r'\[img custom\/([^ ]+)', text + alternate_text, re.I)
@@ -10903,22 +12003,21 @@ def update_xml(conf, set_id, set_name, lang):  # pylint: disable=R0912,R0914,R09
         image_counter = 0
         for image in referred_custom_images:
             if image in custom_images:
-                prop = _get_property(card,
-                                     'Custom Image_{}'.format(image_counter))
+                card_properties.set(
+                    'Custom Image_{}'.format(image_counter),
+                    '{}|{}|{}'.format(
+                        image,
+                        os.path.getsize(custom_images[image]),
+                        int(os.path.getmtime(custom_images[image]))),
+                    '\n      ')
                 image_counter += 1
-                prop.set('value', '{}|{}|{}'.format(
-                    image,
-                    os.path.getsize(custom_images[image]),
-                    int(os.path.getmtime(custom_images[image]))))
-                prop.tail = '\n      '
 
         if card_type in CARD_TYPES_NO_COLLECTION_ICON:
             continue
 
         target_icon_images = []
-        collection_icon = _find_properties(card, 'Collection Icon')
-        if collection_icon:
-            collection_icon = collection_icon[0].attrib['value']
+        collection_icon = card_properties.get('Collection Icon')
+        if 'Collection Icon' in card_properties:
             target_icon_images.append(collection_icon)
             target_icon_images.append('{}_stroke'.format(collection_icon))
         else:
@@ -10933,9 +12032,8 @@ def update_xml(conf, set_id, set_name, lang):  # pylint: disable=R0912,R0914,R09
         if encounter_set and card_sphere != S_BOON:
             target_icon_images.append(encounter_set)
 
-        additional_sets = _find_properties(card, 'Additional Encounter Sets')
-        if additional_sets:
-            additional_sets = additional_sets[0].attrib['value']
+        additional_sets = card_properties.get('Additional Encounter Sets')
+        if 'Additional Encounter Sets' in card_properties:
             for additional_set in additional_sets.split(';'):
                 if additional_set.strip():
                     target_icon_images.append(additional_set.strip())
@@ -10945,13 +12043,14 @@ def update_xml(conf, set_id, set_name, lang):  # pylint: disable=R0912,R0914,R09
         image_counter = 0
         for image in target_icon_images:
             if image in icon_images:
-                prop = _get_property(card, 'Icon_{}'.format(image_counter))
+                card_properties.set(
+                    'Icon_{}'.format(image_counter),
+                    '{}|{}|{}'.format(
+                        image,
+                        os.path.getsize(icon_images[image]),
+                        int(os.path.getmtime(icon_images[image]))),
+                    '\n      ')
                 image_counter += 1
-                prop.set('value', '{}|{}|{}'.format(
-                    image,
-                    os.path.getsize(icon_images[image]),
-                    int(os.path.getmtime(icon_images[image]))))
-                prop.tail = '\n      '
 
     for card in root[0]:
         properties = [p for p in card]  # pylint: disable=R1721
@@ -11072,10 +12171,7 @@ def calculate_hashes(set_id, set_name, lang):  # pylint: disable=R0912,R0914
             old_hashes[card.attrib['id']] = card.attrib['hash']
 
         changed_cards = set()
-        for row in DATA:
-            if row[CARD_SET] != set_id:
-                continue
-
+        for row in get_set_data(set_id):
             if row[CARD_CHANGED] or SETS[set_id].get(SET_CHANGED):
                 changed_cards.add(row[CARD_ID])
 
@@ -11183,21 +12279,18 @@ def copy_raw_images(conf, set_id, set_name, lang):
     root = tree.getroot()
     for card in root[0]:
         if card.attrib.get('skip') != '1':
+            properties = CardProperties(card)
             for prop in ('Artwork', 'ArtworkTop', 'ArtworkBottom'):
-                filename = _find_properties(card, prop)
-                if filename:
-                    filename = filename[0].attrib['value']
+                filename = properties.get(prop)
+                if filename is not None:
                     input_path = os.path.join(artwork_path, filename)
                     output_path = os.path.join(IMAGES_RAW_PATH, filename)
                     if not os.path.exists(output_path):
                         shutil.copyfile(input_path, output_path)
 
-            alternate = [a for a in card if a.attrib.get('type') == 'B']
-            if alternate:
-                alternate = alternate[0]
-                filename = _find_properties(alternate, 'Artwork')
-                if filename:
-                    filename = filename[0].attrib['value']
+            if properties.alternate is not None:
+                filename = CardProperties(properties.alternate).get('Artwork')
+                if filename is not None:
                     input_path = os.path.join(artwork_path, filename)
                     output_path = os.path.join(IMAGES_RAW_PATH, filename)
                     if not os.path.exists(output_path):
@@ -11250,133 +12343,812 @@ def run_cmd(cmd, log_prefix=''):
                            .format(cmd, exc.returncode, exc.output)) from exc
 
 
-def generate_dragncards_proxies(sets):
-    """ Generate DragnCards proxies.
+def generate_dragncards_proxies(sets):
+    """ Generate DragnCards proxies.
+    """
+    logging.info('Generating DragnCards proxies...')
+    timestamp = time.time()
+
+    cmd = GENERATE_DRAGNCARDS_COMMAND.format(','.join(sets))
+    run_cmd(cmd)
+
+    if os.path.exists(GENERATE_DRAGNCARDS_LOG_PATH):
+        with open(GENERATE_DRAGNCARDS_LOG_PATH, 'r', encoding='utf-8') as fobj:
+            content = fobj.read()
+
+        card_ids = {c.split('/')[-1].split('.')[0]
+                    for c in content.split('\n') if c}
+        cards = {}
+        for set_id in sets:
+            xml_path = os.path.join(SET_EONS_PATH,
+                                    '{}.English.xml'.format(set_id))
+            if not os.path.exists(xml_path):
+                continue
+
+            tree = ET.parse(xml_path)
+            root = tree.getroot()
+            for card in root[0]:
+                if (card.attrib.get('id') in card_ids and
+                        card.attrib.get('hashDragncards')):
+                    cards[card.attrib['id']] = card.attrib['hashDragncards']
+                    card_ids.remove(card.attrib['id'])
+
+        if card_ids:
+            logging.warning('No DragnCards hashes for the following '
+                            'generated cards: %s', ', '.join(card_ids))
+
+        if cards:
+            try:
+                with open(GENERATE_DRAGNCARDS_JSON_PATH, 'r',
+                          encoding='utf-8') as fobj:
+                    old_cards = json.load(fobj)
+            except Exception:
+                old_cards = {}
+
+            if os.path.exists(GENERATE_DRAGNCARDS_JSON_PATH):
+                shutil.copyfile(
+                    GENERATE_DRAGNCARDS_JSON_PATH,
+                    re.sub(r'\.json$', '.json.backup',
+                           GENERATE_DRAGNCARDS_JSON_PATH))
+
+            cards = {**old_cards, **cards}
+            with open(GENERATE_DRAGNCARDS_JSON_PATH, 'w',
+                      encoding='utf-8') as fobj:
+                json.dump(cards, fobj)
+
+    logging.info('...Generating DragnCards proxies (%ss)',
+                 round(time.time() - timestamp, 3))
+
+
+def _get_file_crc(path):
+    """ Calculate CRC-32 of the file.
+    """
+    checksum = 0
+    with open(path, 'rb') as fobj:
+        while True:
+            chunk = fobj.read(SEPROJECT_CHUNK_SIZE)
+            if not chunk:
+                break
+
+            checksum = zlib.crc32(chunk, checksum)
+
+    return checksum
+
+
+def _seek_zip_member_data(fobj, header_offset, filename):
+    """ Skip the local file header of an archive member and seek to its
+    compressed data.
+    """
+    fobj.seek(header_offset)
+    header = struct.unpack(zipfile.structFileHeader,
+                           fobj.read(zipfile.sizeFileHeader))
+    if header[0] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(
+            'Bad local file header for {}'.format(filename))
+
+    fobj.seek(header[10] + header[11], os.SEEK_CUR)
+
+
+def _copy_zip_member(source_obj, source_info, zip_obj, zip_info):
+    """ Copy compressed data of an archive member to another archive without
+    recompressing it.
+    """
+    _seek_zip_member_data(source_obj.fp, source_info.header_offset,
+                          source_info.filename)
+    zip_info.compress_type = source_info.compress_type
+    zip_info.compress_size = source_info.compress_size
+    zip_info.CRC = source_info.CRC
+    zip_info.header_offset = zip_obj.fp.tell()
+    zip_obj.fp.write(zip_info.FileHeader(
+        zip_info.file_size > zipfile.ZIP64_LIMIT or
+        zip_info.compress_size > zipfile.ZIP64_LIMIT))
+    remaining = source_info.compress_size
+    while remaining > 0:
+        chunk = source_obj.fp.read(min(remaining, SEPROJECT_CHUNK_SIZE))
+        if not chunk:
+            raise zipfile.BadZipFile('Truncated archive member {}'.format(
+                source_info.filename))
+
+        remaining -= len(chunk)
+        zip_obj.fp.write(chunk)
+
+    zip_obj.filelist.append(zip_info)
+    zip_obj.NameToInfo[zip_info.filename] = zip_info
+    zip_obj.start_dir = zip_obj.fp.tell()
+
+
+def _open_previous_project():
+    """ Open the previous project archive if it's valid.
+    """
+    if not os.path.exists(SEPROJECT_PATH):
+        return None
+
+    try:
+        return zipfile.ZipFile(SEPROJECT_PATH)
+    except Exception as exc:
+        logging.warning('Can\'t reuse the previous project archive: %s', exc)
+        return None
+
+
+def create_project():  # pylint: disable=R0914
+    """ Create a project archive. Unchanged members are copied from the
+    previous archive without recompressing them.
+    """
+    logging.info('Creating a project archive...')
+    timestamp = time.time()
+
+    if os.path.exists(MAKECARDS_FINISHED_PATH):
+        os.remove(MAKECARDS_FINISHED_PATH)
+
+    try:
+        with open(SEPROJECT_MANIFEST_PATH, 'r', encoding='utf-8') as fobj:
+            manifest = json.load(fobj)
+    except Exception:
+        manifest = {}
+
+    new_manifest = {}
+    copied_cnt = 0
+    written_cnt = 0
+    written_size = 0
+    temp_path = '{}.{}.tmp'.format(SEPROJECT_PATH, os.getpid())
+    previous_obj = _open_previous_project()
+    try:
+        with zipfile.ZipFile(temp_path, 'w') as zip_obj:
+            for root, _, filenames in os.walk(PROJECT_PATH):
+                for filename in filenames:
+                    path = os.path.join(root, filename)
+                    zip_info = zipfile.ZipInfo.from_file(path)
+                    stat = os.stat(path)
+                    entry = manifest.get(zip_info.filename)
+                    if (entry and entry[0] == stat.st_size and
+                            entry[1] == stat.st_mtime_ns):
+                        checksum = entry[2]
+                    else:
+                        checksum = _get_file_crc(path)
+
+                    new_manifest[zip_info.filename] = [
+                        stat.st_size, stat.st_mtime_ns, checksum]
+                    previous_info = (
+                        previous_obj.NameToInfo.get(zip_info.filename)
+                        if previous_obj else None)
+                    if (previous_info and
+                            previous_info.file_size == stat.st_size and
+                            previous_info.CRC == checksum and
+                            previous_info.compress_type in {
+                                zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED}):
+                        _copy_zip_member(previous_obj, previous_info,
+                                         zip_obj, zip_info)
+                        copied_cnt += 1
+                        continue
+
+                    compress_type = (
+                        zipfile.ZIP_STORED
+                        if os.path.splitext(filename)[1].lower()
+                        in SEPROJECT_STORED_EXTENSIONS
+                        else zipfile.ZIP_DEFLATED)
+                    zip_obj.write(path, compress_type=compress_type)
+                    written_cnt += 1
+                    written_size += stat.st_size
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+        raise
+    finally:
+        if previous_obj:
+            previous_obj.close()
+
+    os.replace(temp_path, SEPROJECT_PATH)
+    temp_path = '{}.{}.tmp'.format(SEPROJECT_MANIFEST_PATH, uuid.uuid4().hex)
+    with open(temp_path, 'w', encoding='utf-8') as fobj:
+        json.dump(new_manifest, fobj)
+
+    os.replace(temp_path, SEPROJECT_MANIFEST_PATH)
+
+    logging.info('Copied %s unchanged file(s), written %s changed file(s) '
+                 '(%s bytes)', copied_cnt, written_cnt, written_size)
+    logging.info('...Creating a project archive (%ss)',
+                 round(time.time() - timestamp, 3))
+
+
+def get_skip_info(set_id, lang):
+    """ Get skip information for the set and individual cards.
+    """
+    path = os.path.join(SET_EONS_PATH, '{}.{}.xml'.format(set_id, lang))
+    if not os.path.exists(path):
+        return True, set()
+
+    tree = ET.parse(path)
+    root = tree.getroot()
+    skip_set = root.attrib.get('skip') == '1'
+    skip_ids = set()
+    for card in root[0]:
+        if card.attrib.get('skip') == '1':
+            skip_ids.add(card.attrib['id'])
+
+    return skip_set, skip_ids
+
+
+def _build_seproject_index():
+    """ Build an index of the project archive members.
+    """
+    logging.info('Indexing the project archive...')
+    timestamp = time.time()
+
+    images = {}
+    sets = set()
+    messages = []
+    with zipfile.ZipFile(SEPROJECT_PATH) as zip_obj:
+        for info in zip_obj.infolist():
+            filename = info.filename
+            parts = filename.split('/')[-1].split('.')
+            if filename.startswith(IMAGES_ZIP_PATH):
+                if len(parts) < 3 or parts[-1] != 'png':
+                    continue
+
+                image_format = filename[len(IMAGES_ZIP_PATH):].split('/')[0]
+                images.setdefault((image_format, parts[-3], parts[-2]),
+                                  []).append(
+                                      (filename, info.header_offset,
+                                       info.compress_type, info.compress_size,
+                                       info.CRC))
+            elif filename.startswith(XML_ZIP_PATH):
+                if len(parts) == 3 and parts[-1] == 'xml':
+                    sets.add((parts[0], parts[1]))
+            elif filename.startswith(MESSAGES_ZIP_PATH):
+                if parts[-1] == 'overflow':
+                    messages.append(parts[0])
+
+    logging.info('...Indexing the project archive (%ss)',
+                 round(time.time() - timestamp, 3))
+    return {'images': images, 'sets': sets, 'messages': messages}
+
+
+def get_seproject_index():
+    """ Get the index of the project archive members (built once per archive
+    and shared between processes through a file).
+    """
+    stat = os.stat(SEPROJECT_PATH)
+    key = (stat.st_size, stat.st_mtime_ns)
+    if SEPROJECT_INDEX.get('key') == key:
+        return SEPROJECT_INDEX
+
+    try:
+        with open(SEPROJECT_INDEX_PATH, 'rb') as fobj:
+            index = pickle.load(fobj)
+    except Exception:
+        index = {}
+
+    if (index.get('version') != _get_code_checksum() or
+            index.get('key') != key):
+        index = _build_seproject_index()
+        index['version'] = _get_code_checksum()
+        index['key'] = key
+        temp_path = '{}.{}'.format(SEPROJECT_INDEX_PATH, os.getpid())
+        with open(temp_path, 'wb') as fobj:
+            pickle.dump(index, fobj, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temp_path, SEPROJECT_INDEX_PATH)
+
+    SEPROJECT_INDEX.clear()
+    SEPROJECT_INDEX.update(index)
+    return SEPROJECT_INDEX
+
+
+def _copy_seproject_member(project_obj, member, output_path):
+    """ Copy a member of the project archive using its indexed offset.
+    """
+    filename, offset, compress_type, compress_size, crc = member
+    if compress_type == zipfile.ZIP_STORED:
+        decompressor = None
+    elif compress_type == zipfile.ZIP_DEFLATED:
+        decompressor = zlib.decompressobj(-15)
+    else:
+        with zipfile.ZipFile(SEPROJECT_PATH) as zip_obj:
+            with zip_obj.open(filename) as zip_file:
+                with open(output_path, 'wb') as output_file:
+                    shutil.copyfileobj(zip_file, output_file)
+
+        return
+
+    _seek_zip_member_data(project_obj, offset, filename)
+    checksum = 0
+    remaining = compress_size
+    with open(output_path, 'wb') as output_file:
+        while remaining > 0:
+            chunk = project_obj.read(min(remaining, SEPROJECT_CHUNK_SIZE))
+            if not chunk:
+                raise zipfile.BadZipFile(
+                    'Truncated project archive member {}'.format(filename))
+
+            remaining -= len(chunk)
+            if decompressor:
+                chunk = decompressor.decompress(chunk)
+
+            checksum = zlib.crc32(chunk, checksum)
+            output_file.write(chunk)
+
+        if decompressor:
+            chunk = decompressor.flush()
+            checksum = zlib.crc32(chunk, checksum)
+            output_file.write(chunk)
+
+    if checksum != crc:
+        raise zipfile.BadZipFile('Bad CRC-32 for {}'.format(filename))
+
+
+def _extract_seproject_images(image_format, set_id, lang, output_path,
+                              suffix=None):
+    """ Extract rendered images of the set from the project archive and
+    return their number.
+    """
+    members = get_seproject_index()['images'].get(
+        (image_format, set_id, lang), [])
+    cnt = 0
+    with open(SEPROJECT_PATH, 'rb') as project_obj:
+        for member in members:
+            output_filename = _update_zip_filename(member[0])
+            if suffix and not output_filename.endswith(suffix):
+                continue
+
+            cnt += 1
+            output_filename = os.path.join(output_path, output_filename)
+            _copy_seproject_member(project_obj, member, output_filename)
+            count_step_inputs(1, os.path.getsize(output_filename))
+
+    return cnt
+
+
+def get_actual_sets():
+    """ Get actual sets from the project.
+    """
+    return set(get_seproject_index()['sets'])
+
+
+def check_messages():
+    """ Check messages in the archive and log them.
+    """
+    logging.info('Checking messages in the archive...')
+    timestamp = time.time()
+
+    for card_id in get_seproject_index()['messages']:
+        logging.error('Too long text for card %s', card_id)
+
+    logging.info('...Checking messages in the archive (%ss)',
+                 round(time.time() - timestamp, 3))
+
+
+def _get_image_size_value(table, width, height):
+    """ Get a value from an image size table for either orientation.
+    """
+    return table.get((width, height), table.get((height, width), 0))
+
+
+def _clip_image(img, clip_size, rotated_back):
+    """ Clip an image in the same way as _clip in GIMP/scripts.py.
+    """
+    new_width = int(img.width - 2 * clip_size)
+    new_height = int(img.height - 2 * clip_size)
+    if rotated_back:
+        off = math.floor(clip_size)
+    else:
+        off = math.ceil(clip_size)
+
+    return img.crop((off, off, off + new_width, off + new_height))
+
+
+def _save_engine_image(img, path, file_type, dpi):
+    """ Save an image processed by the Pillow image engine.
+    """
+    params = {'dpi': dpi} if dpi else {}
+    if file_type == 'jpg':
+        if img.mode in ('RGBA', 'LA', 'P'):
+            img = img.convert('RGBA')
+            background = Image.new('RGBA', img.size, (255, 255, 255, 255))
+            img = Image.alpha_composite(background, img)
+
+        img.convert('RGB').save(path, 'JPEG', quality=100, subsampling=0,
+                                optimize=True, **params)
+    else:
+        img.save(path, 'PNG', compress_level=9, **params)
+
+
+def _transform_image(procedure, input_path, output_folder):  # pylint: disable=R0912
+    """ Transform an image in the same way as the GIMP procedure.
+    """
+    file_name = '.'.join(os.path.split(input_path)[-1].split('.')[:-1])
+    back_side = file_name.endswith('-Back-Face') or file_name.endswith('-2')
+    file_type = 'jpg' if procedure in IMAGE_ENGINE_JPG_PROCEDURES else 'png'
+    file_name = '{}.{}'.format(file_name, file_type)
+    if procedure == 'python-prepare-pdf-front-folder' and back_side:
+        logging.error('%s is a back side image', file_name)
+        return
+
+    if procedure == 'python-prepare-pdf-back-folder' and not back_side:
+        logging.error('%s is not a back side image', file_name)
+        return
+
+    with Image.open(input_path) as img:
+        img.load()
+        dpi = img.info.get('dpi')
+        width, height = img.size
+        if procedure == 'python-cut-bleed-margins-folder':
+            clip_size = _get_image_size_value(IMAGE_BLEED_MARGIN_SIZES,
+                                              width, height)
+            rotation = False
+        else:
+            rotation = (height, width) in IMAGE_ROTATION_SIZES
+            if procedure in {'python-prepare-pdf-front-folder',
+                             'python-prepare-pdf-back-folder'}:
+                clip_size = _get_image_size_value(IMAGE_PDF_CLIP_SIZES,
+                                                  width, height)
+            elif procedure == 'python-prepare-drivethrucards-jpg-folder':
+                clip_size = _get_image_size_value(IMAGE_DTC_CLIP_SIZES,
+                                                  width, height)
+            else:
+                clip_size = 0
+
+        if rotation:
+            img = img.transpose(Image.ROTATE_270 if back_side
+                                else Image.ROTATE_90)
+
+        if clip_size:
+            img = _clip_image(img, clip_size, rotation and back_side)
+
+        _save_engine_image(img, os.path.join(output_folder, file_name),
+                           file_type, dpi)
+
+
+def _run_image_engine(conf, procedure, input_path, output_path):
+    """ Run an image procedure over a folder with the Pillow image engine.
+    """
+    filenames = [f for f in os.listdir(input_path)
+                 if f.split('.')[-1] in {'png', 'jpg', 'tif'}]
+    paths = [os.path.join(input_path, f) for f in filenames]
+    slots = acquire_cpu_slots(conf, len(paths) - 1)
+    try:
+        if slots:
+            with ThreadPoolExecutor(max_workers=slots + 1) as executor:
+                for _ in executor.map(
+                        lambda path: _transform_image(procedure, path,
+                                                      output_path),
+                        paths):
+                    pass
+        else:
+            for path in paths:
+                _transform_image(procedure, path, output_path)
+    finally:
+        release_cpu_slots(slots)
+
+
+def _run_sharded(conf, input_path, filenames, func):
+    """ Split the files of a folder into shards and run the function over
+    the shard folders in parallel, as far as the CPU budget allows.  All
+    files (including the outputs written next to the inputs) are moved back
+    into the folder afterwards.
+    """
+    slots = acquire_cpu_slots(
+        conf, max(0, len(filenames) // MIN_IMAGES_PER_SHARD - 1))
+    try:
+        if not slots:
+            func(input_path)
+            return
+
+        shard_paths = []
+        for i in range(slots + 1):
+            shard_path = '{}.shard{}'.format(input_path.rstrip('\\/'), i)
+            create_folder(shard_path)
+            clear_folder(shard_path)
+            shard_paths.append(shard_path)
+
+        for i, filename in enumerate(sorted(filenames)):
+            os.replace(os.path.join(input_path, filename),
+                       os.path.join(shard_paths[i % len(shard_paths)],
+                                    filename))
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(shard_paths)) as executor:
+                for _ in executor.map(func, shard_paths):
+                    pass
+        finally:
+            for shard_path in shard_paths:
+                for filename in os.listdir(shard_path):
+                    os.replace(os.path.join(shard_path, filename),
+                               os.path.join(input_path, filename))
+
+                delete_folder(shard_path)
+    finally:
+        release_cpu_slots(slots)
+
+
+def _get_render_engine_version(conf, procedure):
+    """ Get the version of the image engine running the procedure.
+    """
+    engine = ('pillow' if conf['image_engine'] == 'pillow' and
+              procedure in IMAGE_ENGINE_PROCEDURES
+              else 'gimp')
+    if engine not in RENDER_ENGINE_VERSIONS:
+        if engine == 'pillow':
+            source = (''.join(inspect.getsource(func) for func in (
+                _get_image_size_value, _clip_image, _save_engine_image,
+                _transform_image)) + repr((
+                    Image.__version__, IMAGE_ROTATION_SIZES,
+                    IMAGE_BLEED_MARGIN_SIZES, IMAGE_PDF_CLIP_SIZES,
+                    IMAGE_DTC_CLIP_SIZES))).encode()
+        else:
+            with open(GIMP_SCRIPTS_PATH, 'rb') as fobj:
+                source = fobj.read()
+
+        RENDER_ENGINE_VERSIONS[engine] = '{}.{}'.format(
+            engine, hashlib.md5(source).hexdigest())
+
+    return RENDER_ENGINE_VERSIONS[engine]
+
+
+def _get_render_cache_key(input_hash, filename, *parts):
+    """ Get the render cache key of an input image.
+    """
+    return hashlib.md5('|'.join((input_hash, filename) + parts).encode()
+                       ).hexdigest()
+
+
+def _get_file_hash(path):
+    """ Get MD5 hash of the file content.
+    """
+    md5_hash = hashlib.md5()
+    with open(path, 'rb') as fobj:
+        for chunk in iter(lambda: fobj.read(SEPROJECT_CHUNK_SIZE), b''):
+            md5_hash.update(chunk)
+
+    return md5_hash.hexdigest()
+
+
+def _copy_render_cache_entry(key, output_path):
+    """ Copy cached outputs into the output folder and return whether the
+    entry was found.
+    """
+    entry_path = os.path.join(RENDER_CACHE_PATH, key[:2], key)
+    if not os.path.isdir(entry_path):
+        return False
+
+    for cached_filename in os.listdir(entry_path):
+        shutil.copyfile(os.path.join(entry_path, cached_filename),
+                        os.path.join(output_path, cached_filename))
+
+    os.utime(entry_path)
+    return True
+
+
+def _read_render_cache(conf, procedure, input_path, output_path):
+    """ Copy cached outputs of the procedure into the output folder, remove
+    their input images and return cache keys of the remaining inputs.
     """
-    logging.info('Generating DragnCards proxies...')
-    timestamp = time.time()
+    version = _get_render_engine_version(conf, procedure)
+    misses = {}
+    for filename in os.listdir(input_path):
+        if filename.split('.')[-1] not in {'png', 'jpg', 'tif'}:
+            continue
 
-    cmd = GENERATE_DRAGNCARDS_COMMAND.format(','.join(sets))
-    run_cmd(cmd)
+        key = _get_render_cache_key(
+            _get_file_hash(os.path.join(input_path, filename)), filename,
+            procedure, version)
+        if not _copy_render_cache_entry(key, output_path):
+            misses['.'.join(filename.split('.')[:-1])] = key
+            continue
 
-    if os.path.exists(GENERATE_DRAGNCARDS_LOG_PATH):
-        with open(GENERATE_DRAGNCARDS_LOG_PATH, 'r', encoding='utf-8') as fobj:
-            content = fobj.read()
+        os.remove(os.path.join(input_path, filename))
 
-        card_ids = {c.split('/')[-1].split('.')[0]
-                    for c in content.split('\n') if c}
-        cards = {}
-        for set_id in sets:
-            xml_path = os.path.join(SET_EONS_PATH,
-                                    '{}.English.xml'.format(set_id))
-            if not os.path.exists(xml_path):
-                continue
+    return misses
 
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
-            for card in root[0]:
-                if (card.attrib.get('id') in card_ids and
-                        card.attrib.get('hashDragncards')):
-                    cards[card.attrib['id']] = card.attrib['hashDragncards']
-                    card_ids.remove(card.attrib['id'])
 
-        if card_ids:
-            logging.warning('No DragnCards hashes for the following '
-                            'generated cards: %s', ', '.join(card_ids))
+def _write_render_cache(misses, output_path, min_size, extension=None):
+    """ Save outputs of the processed images to the render cache.  Missing
+    and suspiciously small outputs are not cached.
+    """
+    outputs = {}
+    for filename in os.listdir(output_path):
+        if extension and filename.split('.')[-1] != extension:
+            continue
 
-        if cards:
-            try:
-                with open(GENERATE_DRAGNCARDS_JSON_PATH, 'r',
-                          encoding='utf-8') as fobj:
-                    old_cards = json.load(fobj)
-            except Exception:
-                old_cards = {}
+        outputs.setdefault('.'.join(filename.split('.')[:-1]), []).append(
+            filename)
 
-            if os.path.exists(GENERATE_DRAGNCARDS_JSON_PATH):
-                shutil.copyfile(
-                    GENERATE_DRAGNCARDS_JSON_PATH,
-                    re.sub(r'\.json$', '.json.backup',
-                           GENERATE_DRAGNCARDS_JSON_PATH))
+    for name, key in misses.items():
+        if not outputs.get(name) or min(
+                os.path.getsize(os.path.join(output_path, filename))
+                for filename in outputs[name]) < min_size:
+            continue
 
-            cards = {**old_cards, **cards}
-            with open(GENERATE_DRAGNCARDS_JSON_PATH, 'w',
-                      encoding='utf-8') as fobj:
-                json.dump(cards, fobj)
+        entry_path = os.path.join(RENDER_CACHE_PATH, key[:2], key)
+        temp_path = '{}.{}'.format(entry_path, uuid.uuid4().hex)
+        os.makedirs(temp_path)
+        for filename in outputs[name]:
+            shutil.copyfile(os.path.join(output_path, filename),
+                            os.path.join(temp_path, filename))
 
-    logging.info('...Generating DragnCards proxies (%ss)',
-                 round(time.time() - timestamp, 3))
+        try:
+            os.replace(temp_path, entry_path)
+        except OSError:
+            delete_folder(temp_path)
 
 
-def create_project():
-    """ Create a project archive.
+def prune_render_cache():
+    """ Delete render cache entries not used for a while.
     """
-    logging.info('Creating a project archive...')
-    timestamp = time.time()
+    if not os.path.exists(RENDER_CACHE_PATH):
+        return
 
-    if os.path.exists(MAKECARDS_FINISHED_PATH):
-        os.remove(MAKECARDS_FINISHED_PATH)
+    logging.info('Pruning the render cache...')
+    timestamp = time.time()
 
-    with zipfile.ZipFile(SEPROJECT_PATH, 'w') as zip_obj:
-        for root, _, filenames in os.walk(PROJECT_PATH):
-            for filename in filenames:
-                zip_obj.write(os.path.join(root, filename))
+    min_time = timestamp - RENDER_CACHE_DAYS * 86400
+    cnt = 0
+    for folder in os.listdir(RENDER_CACHE_PATH):
+        folder_path = os.path.join(RENDER_CACHE_PATH, folder)
+        for key in os.listdir(folder_path):
+            entry_path = os.path.join(folder_path, key)
+            if os.path.getmtime(entry_path) < min_time:
+                delete_folder(entry_path)
+                cnt += 1
 
-    logging.info('...Creating a project archive (%ss)',
-                 round(time.time() - timestamp, 3))
+    logging.info('...Pruning the render cache, %s entries deleted (%ss)',
+                 cnt, round(time.time() - timestamp, 3))
 
 
-def get_skip_info(set_id, lang):
-    """ Get skip information for the set and individual cards.
+def run_image_procedure(conf, procedure, input_path, output_path,  # pylint: disable=R0913
+                        min_size, log_prefix=''):
+    """ Run an image procedure over a folder either in-process or in GIMP.
+    Outputs of unchanged images are taken from the render cache, new
+    outputs smaller than the minimum size are not cached.
     """
-    path = os.path.join(SET_EONS_PATH, '{}.{}.xml'.format(set_id, lang))
-    if not os.path.exists(path):
-        return True, set()
+    if conf['render_cache']:
+        input_cnt = len([f for f in os.listdir(input_path)
+                         if f.split('.')[-1] in {'png', 'jpg', 'tif'}])
+        misses = _read_render_cache(conf, procedure, input_path, output_path)
+        logging.info('%sRender cache of %s: %s hit(s), %s miss(es)',
+                     log_prefix, procedure, input_cnt - len(misses),
+                     len(misses))
+        if not misses:
+            return
 
-    tree = ET.parse(path)
-    root = tree.getroot()
-    skip_set = root.attrib.get('skip') == '1'
-    skip_ids = set()
-    for card in root[0]:
-        if card.attrib.get('skip') == '1':
-            skip_ids.add(card.attrib['id'])
+        _run_image_procedure(conf, procedure, input_path, output_path,
+                             log_prefix)
+        _write_render_cache(misses, output_path, min_size)
+        return
 
-    return skip_set, skip_ids
+    _run_image_procedure(conf, procedure, input_path, output_path,
+                         log_prefix)
 
 
-def get_actual_sets():
-    """ Get actual sets from the project.
+def run_seproject_image_procedure(conf, procedure, image_format, set_id,  # pylint: disable=R0913,R0914
+                                  lang, input_path, output_path, min_size,
+                                  log_prefix='', suffix=None):
+    """ Extract rendered images of the set from the project archive, run an
+    image procedure over them and return their number.  Unchanged images
+    are neither extracted nor processed, their outputs are taken from the
+    render cache.
     """
-    res = set()
-    with zipfile.ZipFile(SEPROJECT_PATH) as zip_obj:
-        filelist = [f for f in zip_obj.namelist()
-                    if f.startswith(XML_ZIP_PATH)
-                    and f.split('.')[-1] == 'xml']
-        for filename in filelist:
-            parts = filename.split('/')[-1].split('.')
-            if len(parts) != 3:
-                continue
+    if not conf['render_cache']:
+        input_cnt = _extract_seproject_images(image_format, set_id, lang,
+                                              input_path, suffix)
+        _run_image_procedure(conf, procedure, input_path, output_path,
+                             log_prefix)
+        return input_cnt
+
+    version = _get_render_engine_version(conf, procedure)
+    members = []
+    misses = {}
+    hits = 0
+    for member in get_seproject_index()['images'].get(
+            (image_format, set_id, lang), []):
+        filename = _update_zip_filename(member[0])
+        if suffix and not filename.endswith(suffix):
+            continue
 
-            res.add((parts[0], parts[1]))
+        key = _get_render_cache_key(
+            '{:08x}.{}'.format(member[4], member[3]), filename, procedure,
+            version)
+        if _copy_render_cache_entry(key, output_path):
+            hits += 1
+        else:
+            members.append(member)
+            misses['.'.join(filename.split('.')[:-1])] = key
+
+    logging.info('%sRender cache of %s: %s hit(s), %s miss(es)',
+                 log_prefix, procedure, hits, len(misses))
+    if not members:
+        return hits
+
+    with open(SEPROJECT_PATH, 'rb') as project_obj:
+        for member in members:
+            output_filename = os.path.join(input_path,
+                                           _update_zip_filename(member[0]))
+            _copy_seproject_member(project_obj, member, output_filename)
+            count_step_inputs(1, os.path.getsize(output_filename))
+
+    _run_image_procedure(conf, procedure, input_path, output_path,
+                         log_prefix)
+    _write_render_cache(misses, output_path, min_size)
+    return hits + len(members)
+
+
+def _run_magick_command(conf, command, input_path, extensions, min_size,  # pylint: disable=R0913,R0914
+                        log_prefix):
+    """ Run an ImageMagick mogrify command over the images of a folder
+    (input and output extensions are given).  Outputs of unchanged images
+    are taken from the render cache.
+    """
+    extension, output_extension = extensions
+    input_filenames = [f for f in os.listdir(input_path)
+                       if f.split('.')[-1] == extension]
+    if not input_filenames:
+        return
 
-    return res
+    if not conf['render_cache']:
+        _run_sharded(conf, input_path, input_filenames,
+                     lambda path: run_cmd(command.format(
+                         conf['magick_path'], path, os.sep), log_prefix))
+        return
 
+    hits_path = '{}.cached'.format(input_path.rstrip('\\/'))
+    create_folder(hits_path)
+    clear_folder(hits_path)
+    misses = {}
+    hits = []
+    for filename in input_filenames:
+        key = _get_render_cache_key(
+            _get_file_hash(os.path.join(input_path, filename)), filename,
+            command, conf['magick_path'])
+        entry_path = os.path.join(RENDER_CACHE_PATH, key[:2], key)
+        if os.path.isdir(entry_path):
+            hits.append((filename, key))
+            os.replace(os.path.join(input_path, filename),
+                       os.path.join(hits_path, filename))
+        else:
+            misses['.'.join(filename.split('.')[:-1])] = key
 
-def check_messages():
-    """ Check messages in the archive and log them.
-    """
-    logging.info('Checking messages in the archive...')
-    timestamp = time.time()
+    logging.info('%sRender cache of ImageMagick: %s hit(s), %s miss(es)',
+                 log_prefix, len(hits), len(misses))
+    try:
+        if misses:
+            _run_sharded(conf, input_path,
+                         [f for f in input_filenames
+                          if '.'.join(f.split('.')[:-1]) in misses],
+                         lambda path: run_cmd(command.format(
+                             conf['magick_path'], path, os.sep), log_prefix))
+            _write_render_cache(misses, input_path, min_size,
+                                output_extension)
+    finally:
+        for filename, _ in hits:
+            os.replace(os.path.join(hits_path, filename),
+                       os.path.join(input_path, filename))
 
-    with zipfile.ZipFile(SEPROJECT_PATH) as zip_obj:
-        filelist = [f for f in zip_obj.namelist()
-                    if f.startswith(MESSAGES_ZIP_PATH)
-                    and f.split('.')[-1] == 'overflow']
-        for filename in filelist:
-            logging.error('Too long text for card %s',
-                          filename.split('/')[-1].split('.')[0])
+        delete_folder(hits_path)
 
-    logging.info('...Checking messages in the archive (%ss)',
-                 round(time.time() - timestamp, 3))
+    for _, key in hits:
+        _copy_render_cache_entry(key, input_path)
+
+
+def _run_image_procedure(conf, procedure, input_path, output_path,
+                         log_prefix):
+    """ Run an image procedure over a folder either in-process or in GIMP.
+    """
+    if (conf['image_engine'] == 'pillow' and
+            procedure in IMAGE_ENGINE_PROCEDURES):
+        logging.info('%sRunning the image engine procedure: %s', log_prefix,
+                     procedure)
+        _run_image_engine(conf, procedure, input_path, output_path)
+        return
+
+    filenames = [f for f in os.listdir(input_path)
+                 if f.split('.')[-1] in {'png', 'jpg', 'tif'}]
+    _run_sharded(
+        conf, input_path, filenames,
+        lambda path: run_cmd(GIMP_COMMAND.format(
+            conf['gimp_console_path'],
+            procedure,
+            path.replace('\\', '\\\\'),
+            output_path.replace('\\', '\\\\')), log_prefix))
 
 
 def generate_png300_nobleed(conf, set_id, set_name, lang, skip_ids):  # pylint: disable=R0914
@@ -11398,28 +13170,10 @@ def generate_png300_nobleed(conf, set_id, set_name, lang, skip_ids):  # pylint:
     create_folder(temp_path2)
     clear_folder(temp_path2)
 
-    input_cnt = 0
-    with zipfile.ZipFile(SEPROJECT_PATH) as zip_obj:
-        filelist = [f for f in zip_obj.namelist()
-                    if f.startswith('{}{}'.format(IMAGES_ZIP_PATH,
-                                                  PNG300BLEED))
-                    and f.split('.')[-1] == 'png'
-                    and f.split('.')[-2] == lang
-                    and f.split('.')[-3] == set_id]
-        for filename in filelist:
-            input_cnt += 1
-            output_filename = _update_zip_filename(filename)
-            with zip_obj.open(filename) as zip_file:
-                with open(os.path.join(temp_path, output_filename),
-                          'wb') as output_file:
-                    shutil.copyfileobj(zip_file, output_file)
-
-    cmd = GIMP_COMMAND.format(
-        conf['gimp_console_path'],
-        'python-cut-bleed-margins-folder',
-        temp_path.replace('\\', '\\\\'),
-        temp_path2.replace('\\', '\\\\'))
-    run_cmd(cmd, '[{}, {}] '.format(set_name, lang))
+    input_cnt = run_seproject_image_procedure(
+        conf, 'python-cut-bleed-margins-folder', PNG300BLEED, set_id, lang,
+        temp_path, temp_path2, PNG_300_MIN_SIZE,
+        '[{}, {}] '.format(set_name, lang))
 
     output_cnt = 0
     for _, _, filenames in os.walk(temp_path2):
@@ -11474,28 +13228,10 @@ def generate_png480_nobleed(conf, set_id, set_name, lang, skip_ids):  # pylint:
     create_folder(temp_path2)
     clear_folder(temp_path2)
 
-    input_cnt = 0
-    with zipfile.ZipFile(SEPROJECT_PATH) as zip_obj:
-        filelist = [f for f in zip_obj.namelist()
-                    if f.startswith('{}{}'.format(IMAGES_ZIP_PATH,
-                                                  PNG480BLEED))
-                    and f.split('.')[-1] == 'png'
-                    and f.split('.')[-2] == lang
-                    and f.split('.')[-3] == set_id]
-        for filename in filelist:
-            input_cnt += 1
-            output_filename = _update_zip_filename(filename)
-            with zip_obj.open(filename) as zip_file:
-                with open(os.path.join(temp_path, output_filename),
-                          'wb') as output_file:
-                    shutil.copyfileobj(zip_file, output_file)
-
-    cmd = GIMP_COMMAND.format(
-        conf['gimp_console_path'],
-        'python-cut-bleed-margins-folder',
-        temp_path.replace('\\', '\\\\'),
-        temp_path2.replace('\\', '\\\\'))
-    run_cmd(cmd, '[{}, {}] '.format(set_name, lang))
+    input_cnt = run_seproject_image_procedure(
+        conf, 'python-cut-bleed-margins-folder', PNG480BLEED, set_id, lang,
+        temp_path, temp_path2, PNG_480_MIN_SIZE,
+        '[{}, {}] '.format(set_name, lang))
 
     output_cnt = 0
     for _, _, filenames in os.walk(temp_path2):
@@ -11551,28 +13287,10 @@ def generate_png800_nobleed(conf, set_id, set_name, lang, skip_ids):  # pylint:
     create_folder(temp_path2)
     clear_folder(temp_path2)
 
-    input_cnt = 0
-    with zipfile.ZipFile(SEPROJECT_PATH) as zip_obj:
-        filelist = [f for f in zip_obj.namelist()
-                    if f.startswith('{}{}'.format(IMAGES_ZIP_PATH,
-                                                  PNG800BLEED))
-                    and f.split('.')[-1] == 'png'
-                    and f.split('.')[-2] == lang
-                    and f.split('.')[-3] == set_id]
-        for filename in filelist:
-            input_cnt += 1
-            output_filename = _update_zip_filename(filename)
-            with zip_obj.open(filename) as zip_file:
-                with open(os.path.join(temp_path, output_filename),
-                          'wb') as output_file:
-                    shutil.copyfileobj(zip_file, output_file)
-
-    cmd = GIMP_COMMAND.format(
-        conf['gimp_console_path'],
-        'python-cut-bleed-margins-folder',
-        temp_path.replace('\\', '\\\\'),
-        temp_path2.replace('\\', '\\\\'))
-    run_cmd(cmd, '[{}, {}] '.format(set_name, lang))
+    input_cnt = run_seproject_image_procedure(
+        conf, 'python-cut-bleed-margins-folder', PNG800BLEED, set_id, lang,
+        temp_path, temp_path2, PNG_800_MIN_SIZE,
+        '[{}, {}] '.format(set_name, lang))
 
     output_cnt = 0
     for _, _, filenames in os.walk(temp_path2):
@@ -11644,12 +13362,10 @@ def generate_png300_db(conf, set_id, set_name, lang, skip_ids):  # pylint: disab
 
         break
 
-    cmd = GIMP_COMMAND.format(
-        conf['gimp_console_path'],
-        'python-prepare-db-output-folder',
-        temp_path.replace('\\', '\\\\'),
-        temp_path2.replace('\\', '\\\\'))
-    run_cmd(cmd, '[{}, {}] '.format(set_name, lang))
+    run_image_procedure(conf, 'python-prepare-db-output-folder',
+                        temp_path, temp_path2,
+                        PNG_300_MIN_SIZE,
+                        '[{}, {}] '.format(set_name, lang))
 
     output_cnt = 0
     for _, _, filenames in os.walk(temp_path2):
@@ -11820,29 +13536,10 @@ def generate_png300_pdf(conf, set_id, set_name, lang, skip_ids):  # pylint: disa
     create_folder(temp_path2)
     clear_folder(temp_path2)
 
-    input_cnt = 0
-    with zipfile.ZipFile(SEPROJECT_PATH) as zip_obj:
-        filelist = [f for f in zip_obj.namelist()
-                    if f.startswith('{}{}'.format(IMAGES_ZIP_PATH,
-                                                  PNG300BLEED))
-                    and f.split('.')[-1] == 'png'
-                    and f.split('.')[-2] == lang
-                    and f.split('.')[-3] == set_id]
-        for filename in filelist:
-            output_filename = _update_zip_filename(filename)
-            if output_filename.endswith('-2.png'):
-                input_cnt += 1
-                with zip_obj.open(filename) as zip_file:
-                    with open(os.path.join(temp_path, output_filename),
-                              'wb') as output_file:
-                        shutil.copyfileobj(zip_file, output_file)
-
-    cmd = GIMP_COMMAND.format(
-        conf['gimp_console_path'],
-        'python-prepare-pdf-back-folder',
-        temp_path.replace('\\', '\\\\'),
-        temp_path2.replace('\\', '\\\\'))
-    run_cmd(cmd, '[{}, {}] '.format(set_name, lang))
+    input_cnt = run_seproject_image_procedure(
+        conf, 'python-prepare-pdf-back-folder', PNG300BLEED, set_id, lang,
+        temp_path, temp_path2, PNG_300_MIN_SIZE,
+        '[{}, {}] '.format(set_name, lang), '-2.png')
 
     output_cnt = 0
     for _, _, filenames in os.walk(temp_path2):
@@ -11867,29 +13564,10 @@ def generate_png300_pdf(conf, set_id, set_name, lang, skip_ids):  # pylint: disa
     create_folder(temp_path3)
     clear_folder(temp_path3)
 
-    input_cnt = 0
-    with zipfile.ZipFile(SEPROJECT_PATH) as zip_obj:
-        filelist = [f for f in zip_obj.namelist()
-                    if f.startswith('{}{}'.format(IMAGES_ZIP_PATH,
-                                                  PNG300BLEED))
-                    and f.split('.')[-1] == 'png'
-                    and f.split('.')[-2] == lang
-                    and f.split('.')[-3] == set_id]
-        for filename in filelist:
-            output_filename = _update_zip_filename(filename)
-            if output_filename.endswith('-1.png'):
-                input_cnt += 1
-                with zip_obj.open(filename) as zip_file:
-                    with open(os.path.join(temp_path, output_filename),
-                              'wb') as output_file:
-                        shutil.copyfileobj(zip_file, output_file)
-
-    cmd = GIMP_COMMAND.format(
-        conf['gimp_console_path'],
-        'python-prepare-pdf-front-folder',
-        temp_path.replace('\\', '\\\\'),
-        temp_path3.replace('\\', '\\\\'))
-    run_cmd(cmd, '[{}, {}] '.format(set_name, lang))
+    input_cnt = run_seproject_image_procedure(
+        conf, 'python-prepare-pdf-front-folder', PNG300BLEED, set_id, lang,
+        temp_path, temp_path3, PNG_300_MIN_SIZE,
+        '[{}, {}] '.format(set_name, lang), '-1.png')
 
     output_cnt = 0
     for _, _, filenames in os.walk(temp_path3):
@@ -11950,29 +13628,10 @@ def generate_png800_pdf(conf, set_id, set_name, lang, skip_ids):  # pylint: disa
     create_folder(temp_path2)
     clear_folder(temp_path2)
 
-    input_cnt = 0
-    with zipfile.ZipFile(SEPROJECT_PATH) as zip_obj:
-        filelist = [f for f in zip_obj.namelist()
-                    if f.startswith('{}{}'.format(IMAGES_ZIP_PATH,
-                                                  PNG800BLEED))
-                    and f.split('.')[-1] == 'png'
-                    and f.split('.')[-2] == lang
-                    and f.split('.')[-3] == set_id]
-        for filename in filelist:
-            output_filename = _update_zip_filename(filename)
-            if output_filename.endswith('-2.png'):
-                input_cnt += 1
-                with zip_obj.open(filename) as zip_file:
-                    with open(os.path.join(temp_path, output_filename),
-                              'wb') as output_file:
-                        shutil.copyfileobj(zip_file, output_file)
-
-    cmd = GIMP_COMMAND.format(
-        conf['gimp_console_path'],
-        'python-prepare-pdf-back-folder',
-        temp_path.replace('\\', '\\\\'),
-        temp_path2.replace('\\', '\\\\'))
-    run_cmd(cmd, '[{}, {}] '.format(set_name, lang))
+    input_cnt = run_seproject_image_procedure(
+        conf, 'python-prepare-pdf-back-folder', PNG800BLEED, set_id, lang,
+        temp_path, temp_path2, PNG_800_MIN_SIZE,
+        '[{}, {}] '.format(set_name, lang), '-2.png')
 
     output_cnt = 0
     for _, _, filenames in os.walk(temp_path2):
@@ -11997,29 +13656,10 @@ def generate_png800_pdf(conf, set_id, set_name, lang, skip_ids):  # pylint: disa
     create_folder(temp_path3)
     clear_folder(temp_path3)
 
-    input_cnt = 0
-    with zipfile.ZipFile(SEPROJECT_PATH) as zip_obj:
-        filelist = [f for f in zip_obj.namelist()
-                    if f.startswith('{}{}'.format(IMAGES_ZIP_PATH,
-                                                  PNG800BLEED))
-                    and f.split('.')[-1] == 'png'
-                    and f.split('.')[-2] == lang
-                    and f.split('.')[-3] == set_id]
-        for filename in filelist:
-            output_filename = _update_zip_filename(filename)
-            if output_filename.endswith('-1.png'):
-                input_cnt += 1
-                with zip_obj.open(filename) as zip_file:
-                    with open(os.path.join(temp_path, output_filename),
-                              'wb') as output_file:
-                        shutil.copyfileobj(zip_file, output_file)
-
-    cmd = GIMP_COMMAND.format(
-        conf['gimp_console_path'],
-        'python-prepare-pdf-front-folder',
-        temp_path.replace('\\', '\\\\'),
-        temp_path3.replace('\\', '\\\\'))
-    run_cmd(cmd, '[{}, {}] '.format(set_name, lang))
+    input_cnt = run_seproject_image_procedure(
+        conf, 'python-prepare-pdf-front-folder', PNG800BLEED, set_id, lang,
+        temp_path, temp_path3, PNG_800_MIN_SIZE,
+        '[{}, {}] '.format(set_name, lang), '-1.png')
 
     output_cnt = 0
     for _, _, filenames in os.walk(temp_path3):
@@ -12081,28 +13721,10 @@ def generate_png800_bleedmpc(conf, set_id, set_name, lang, skip_ids):  # pylint:
     create_folder(temp_path2)
     clear_folder(temp_path2)
 
-    input_cnt = 0
-    with zipfile.ZipFile(SEPROJECT_PATH) as zip_obj:
-        filelist = [f for f in zip_obj.namelist()
-                    if f.startswith('{}{}'.format(IMAGES_ZIP_PATH,
-                                                  PNG800BLEED))
-                    and f.split('.')[-1] == 'png'
-                    and f.split('.')[-2] == lang
-                    and f.split('.')[-3] == set_id]
-        for filename in filelist:
-            input_cnt += 1
-            output_filename = _update_zip_filename(filename)
-            with zip_obj.open(filename) as zip_file:
-                with open(os.path.join(temp_path, output_filename),
-                          'wb') as output_file:
-                    shutil.copyfileobj(zip_file, output_file)
-
-    cmd = GIMP_COMMAND.format(
-        conf['gimp_console_path'],
-        'python-prepare-makeplayingcards-folder',
-        temp_path.replace('\\', '\\\\'),
-        temp_path2.replace('\\', '\\\\'))
-    run_cmd(cmd, '[{}, {}] '.format(set_name, lang))
+    input_cnt = run_seproject_image_procedure(
+        conf, 'python-prepare-makeplayingcards-folder', PNG800BLEED, set_id,
+        lang, temp_path, temp_path2, PNG_800_MIN_SIZE,
+        '[{}, {}] '.format(set_name, lang))
 
     output_cnt = 0
     for _, _, filenames in os.walk(temp_path2):
@@ -12156,28 +13778,10 @@ def generate_jpg300_bleeddtc(conf, set_id, set_name, lang, skip_ids):  # pylint:
     create_folder(temp_path2)
     clear_folder(temp_path2)
 
-    input_cnt = 0
-    with zipfile.ZipFile(SEPROJECT_PATH) as zip_obj:
-        filelist = [f for f in zip_obj.namelist()
-                    if f.startswith('{}{}'.format(IMAGES_ZIP_PATH,
-                                                  PNG300BLEED))
-                    and f.split('.')[-1] == 'png'
-                    and f.split('.')[-2] == lang
-                    and f.split('.')[-3] == set_id]
-        for filename in filelist:
-            input_cnt += 1
-            output_filename = _update_zip_filename(filename)
-            with zip_obj.open(filename) as zip_file:
-                with open(os.path.join(temp_path, output_filename),
-                          'wb') as output_file:
-                    shutil.copyfileobj(zip_file, output_file)
-
-    cmd = GIMP_COMMAND.format(
-        conf['gimp_console_path'],
-        'python-prepare-drivethrucards-jpg-folder',
-        temp_path.replace('\\', '\\\\'),
-        temp_path2.replace('\\', '\\\\'))
-    run_cmd(cmd, '[{}, {}] '.format(set_name, lang))
+    input_cnt = run_seproject_image_procedure(
+        conf, 'python-prepare-drivethrucards-jpg-folder', PNG300BLEED, set_id,
+        lang, temp_path, temp_path2, JPG_300_MIN_SIZE,
+        '[{}, {}] '.format(set_name, lang))
 
     output_cnt = 0
     for _, _, filenames in os.walk(temp_path2):
@@ -12234,28 +13838,10 @@ def generate_jpg800_bleedmbprint(conf, set_id, set_name, lang, skip_ids):  # pyl
     create_folder(temp_path2)
     clear_folder(temp_path2)
 
-    input_cnt = 0
-    with zipfile.ZipFile(SEPROJECT_PATH) as zip_obj:
-        filelist = [f for f in zip_obj.namelist()
-                    if f.startswith('{}{}'.format(IMAGES_ZIP_PATH,
-                                                  PNG800BLEED))
-                    and f.split('.')[-1] == 'png'
-                    and f.split('.')[-2] == lang
-                    and f.split('.')[-3] == set_id]
-        for filename in filelist:
-            input_cnt += 1
-            output_filename = _update_zip_filename(filename)
-            with zip_obj.open(filename) as zip_file:
-                with open(os.path.join(temp_path, output_filename),
-                          'wb') as output_file:
-                    shutil.copyfileobj(zip_file, output_file)
-
-    cmd = GIMP_COMMAND.format(
-        conf['gimp_console_path'],
-        'python-prepare-mbprint-jpg-folder',
-        temp_path.replace('\\', '\\\\'),
-        temp_path2.replace('\\', '\\\\'))
-    run_cmd(cmd, '[{}, {}] '.format(set_name, lang))
+    input_cnt = run_seproject_image_procedure(
+        conf, 'python-prepare-mbprint-jpg-folder', PNG800BLEED, set_id, lang,
+        temp_path, temp_path2, JPG_800_MIN_SIZE,
+        '[{}, {}] '.format(set_name, lang))
 
     output_cnt = 0
     for _, _, filenames in os.walk(temp_path2):
@@ -12311,28 +13897,10 @@ def generate_png800_bleedgeneric(conf, set_id, set_name, lang, skip_ids):  # pyl
     create_folder(temp_path2)
     clear_folder(temp_path2)
 
-    input_cnt = 0
-    with zipfile.ZipFile(SEPROJECT_PATH) as zip_obj:
-        filelist = [f for f in zip_obj.namelist()
-                    if f.startswith('{}{}'.format(IMAGES_ZIP_PATH,
-                                                  PNG800BLEED))
-                    and f.split('.')[-1] == 'png'
-                    and f.split('.')[-2] == lang
-                    and f.split('.')[-3] == set_id]
-        for filename in filelist:
-            input_cnt += 1
-            output_filename = _update_zip_filename(filename)
-            with zip_obj.open(filename) as zip_file:
-                with open(os.path.join(temp_path, output_filename),
-                          'wb') as output_file:
-                    shutil.copyfileobj(zip_file, output_file)
-
-    cmd = GIMP_COMMAND.format(
-        conf['gimp_console_path'],
-        'python-prepare-generic-png-folder',
-        temp_path.replace('\\', '\\\\'),
-        temp_path2.replace('\\', '\\\\'))
-    run_cmd(cmd, '[{}, {}] '.format(set_name, lang))
+    input_cnt = run_seproject_image_procedure(
+        conf, 'python-prepare-generic-png-folder', PNG800BLEED, set_id, lang,
+        temp_path, temp_path2, PNG_800_MIN_SIZE,
+        '[{}, {}] '.format(set_name, lang))
 
     output_cnt = 0
     for _, _, filenames in os.walk(temp_path2):
@@ -12370,17 +13938,16 @@ def generate_png800_bleedgeneric(conf, set_id, set_name, lang, skip_ids):  # pyl
 def _make_low_quality(conf, input_path, set_name, lang):
     """ Make low quality 600x429 JPG images from PNG inputs.
     """
-    input_cnt = 0
+    input_filenames = []
     for _, _, filenames in os.walk(input_path):
-        for filename in filenames:
-            input_cnt += 1
-
+        input_filenames = filenames
         break
 
+    input_cnt = len(input_filenames)
     if input_cnt:
-        cmd = MAGICK_COMMAND_LOW.format(conf['magick_path'], input_path,
-                                        os.sep)
-        run_cmd(cmd, '[{}, {}] '.format(set_name, lang))
+        _run_magick_command(
+            conf, MAGICK_COMMAND_LOW, input_path, ('png', 'jpg'),
+            JPG_PREVIEW_MIN_SIZE, '[{}, {}] '.format(set_name, lang))
 
     output_cnt = 0
     for _, _, filenames in os.walk(input_path):
@@ -12401,17 +13968,16 @@ def _make_low_quality(conf, input_path, set_name, lang):
 def _make_jpg(conf, input_path, min_size, set_name, lang):
     """ Make JPG images from PNG inputs.
     """
-    input_cnt = 0
+    input_filenames = []
     for _, _, filenames in os.walk(input_path):
-        for filename in filenames:
-            input_cnt += 1
-
+        input_filenames = filenames
         break
 
+    input_cnt = len(input_filenames)
     if input_cnt:
-        cmd = MAGICK_COMMAND_JPG.format(conf['magick_path'], input_path,
-                                        os.sep)
-        run_cmd(cmd, '[{}, {}] '.format(set_name, lang))
+        _run_magick_command(
+            conf, MAGICK_COMMAND_JPG, input_path, ('png', 'jpg'),
+            min_size, '[{}, {}] '.format(set_name, lang))
 
     output_cnt = 0
     for _, _, filenames in os.walk(input_path):
@@ -12432,17 +13998,8 @@ def _make_jpg(conf, input_path, min_size, set_name, lang):
 def full_card_dict():
     """ Get card dictionary with both spreadsheet and external data.
     """
-    card_dict = {}
-    for _, _, filenames in os.walk(URL_CACHE_PATH):
-        for filename in filenames:
-            if filename.endswith('.xml.cache'):
-                data = load_external_xml(re.sub(r'\.xml\.cache$', '',
-                                                filename))
-                card_dict.update({r[CARD_ID]:r for r in data})
-
-        break
-
-    card_dict.update({r[CARD_ID]:r for r in DATA})
+    card_dict = dict(get_external_card_dict())
+    card_dict.update(_get_data_index()['id'])
     return card_dict
 
 
@@ -12598,33 +14155,23 @@ def generate_tts(conf, set_id, set_name, lang, card_dict, scratch):  # pylint: d
                  round(time.time() - timestamp, 3))
 
 
-def _extract_image_properties(root):
+def _extract_image_properties(properties):
     """ Extract image properties from the XML file.
     """
-    artwork_path = _find_properties(root, 'Artwork')
-    artwork_path = artwork_path and artwork_path[0].attrib['value']
+    artwork_path = properties.get('Artwork')
     if not artwork_path:
         return None
 
-    artwork_size = _find_properties(root, 'Artwork Size')
-    artwork_size = (int(artwork_size[0].attrib['value'])
-                    if artwork_size else 0)
-    artwork_modified = _find_properties(root, 'Artwork Modified')
-    artwork_modified = (int(artwork_modified[0].attrib['value'])
-                        if artwork_modified else 0)
-    panx = _find_properties(root, 'PanX')
-    panx = float(panx[0].attrib['value']) if panx else 0
-    pany = _find_properties(root, 'PanY')
-    pany = float(pany[0].attrib['value']) if pany else 0
-    scale = _find_properties(root, 'Scale')
-    scale = float(scale[0].attrib['value']) if scale else 0
-    card_type = _find_properties(root, 'Type')
-    card_type = card_type[0].attrib['value'] if card_type else ''
-    card_sphere = _find_properties(root, 'Sphere')
-    card_sphere = card_sphere[0].attrib['value'] if card_sphere else ''
-    flags = _find_properties(root, 'Flags')
-    if (flags and F_PROMO in [
-            f.strip() for f in flags[0].attrib['value'].split(';')]):
+    artwork_size = int(properties.get('Artwork Size', 0))
+    artwork_modified = int(properties.get('Artwork Modified', 0))
+    panx = float(properties.get('PanX', 0))
+    pany = float(properties.get('PanY', 0))
+    scale = float(properties.get('Scale', 0))
+    card_type = properties.get('Type', '')
+    card_sphere = properties.get('Sphere', '')
+    flags = properties.get('Flags')
+    if (flags is not None and
+            F_PROMO in [f.strip() for f in flags.split(';')]):
         flags = F_PROMO
     else:
         flags = ''
@@ -12640,11 +14187,10 @@ def _extract_image_properties(root):
     return data
 
 
-def _extract_artist_name(root):
+def _extract_artist_name(properties):
     """ Extract the artist name from the XML file.
     """
-    artwork_path = _find_properties(root, 'Artwork')
-    artwork_path = artwork_path and artwork_path[0].attrib['value']
+    artwork_path = properties.get('Artwork')
     if not artwork_path or not '_Artist_' in artwork_path:
         return None
 
@@ -12653,17 +14199,17 @@ def _extract_artist_name(root):
     return artist
 
 
-def _extract_custom_images(root):
+def _extract_custom_images(properties):
     """ Extract information about custom images from the XML file.
     """
     images = set()
     i = 0
     while True:
-        custom_image = _find_properties(root, 'Custom Image_{}'.format(i))
-        if not custom_image:
+        custom_image = properties.get('Custom Image_{}'.format(i))
+        if custom_image is None:
             break
 
-        images.add(custom_image[0].attrib['value'].split('|')[0])
+        images.add(custom_image.split('|')[0])
         i += 1
 
     return images
@@ -12694,24 +14240,21 @@ def generate_renderer_artwork(conf, set_id, set_name):  # pylint: disable=R0912,
             continue
 
         card_id = card.attrib['id']
-        custom_images = custom_images.union(_extract_custom_images(card))
-        data = _extract_image_properties(card)
+        properties = CardProperties(card)
+        custom_images = custom_images.union(
+            _extract_custom_images(properties))
+        data = _extract_image_properties(properties)
         if data:
             images[card_id] = data
 
-        artist = _extract_artist_name(card)
+        artist = _extract_artist_name(properties)
         if artist:
             artists[card_id] = artist
 
-        alternate = [a for a in card if a.attrib.get('type') == 'B']
-        if alternate:
-            alternate = alternate[0]
+        if properties.alternate is not None:
+            alternate = CardProperties(properties.alternate)
             custom_images = custom_images.union(
                 _extract_custom_images(alternate))
-            card_type_back = _find_properties(alternate, 'Type')
-            card_type_back = (card_type_back[0].attrib['value']
-                              if card_type_back
-                              else '')
             data_back = _extract_image_properties(alternate)
             if data_back:
                 images['{}.B'.format(card_id)] = data_back
@@ -12735,19 +14278,16 @@ def generate_renderer_artwork(conf, set_id, set_name):  # pylint: disable=R0912,
         root = tree.getroot()
         for card in root[0]:
             card_id = card.attrib['id']
-            data = _extract_image_properties(card)
+            properties = CardProperties(card)
+            data = _extract_image_properties(properties)
             if (card_id in images and data and
                     data['snapshot'] == images[card_id]['snapshot']):
                 del images[card_id]
 
-            alternate = [a for a in card if a.attrib.get('type') == 'B']
-            if alternate and '{}.B'.format(card_id) in images:
-                alternate = alternate[0]
-                card_type_back = _find_properties(alternate, 'Type')
-                card_type_back = (card_type_back[0].attrib['value']
-                                  if card_type_back
-                                  else '')
-                data_back = _extract_image_properties(alternate)
+            if (properties.alternate is not None and
+                    '{}.B'.format(card_id) in images):
+                data_back = _extract_image_properties(
+                    CardProperties(properties.alternate))
                 if (not data_back and data and
                         data['card_type'] in {T_CONTRACT, T_PLAYER_OBJECTIVE,
                                               T_QUEST}):
@@ -13664,17 +15204,16 @@ def generate_genericpng_pdf(conf, set_id, set_name, lang, card_data):  # pylint:
 def _make_cmyk(conf, input_path, min_size, set_name, lang):
     """ Convert RGB to CMYK.
     """
-    input_cnt = 0
+    input_filenames = []
     for _, _, filenames in os.walk(input_path):
-        for filename in filenames:
-            input_cnt += 1
-
+        input_filenames = filenames
         break
 
+    input_cnt = len(input_filenames)
     if input_cnt:
-        cmd = MAGICK_COMMAND_CMYK.format(conf['magick_path'], input_path,
-                                         os.sep)
-        run_cmd(cmd, '[{}, {}] '.format(set_name, lang))
+        _run_magick_command(
+            conf, MAGICK_COMMAND_CMYK, input_path, ('jpg', 'jpg'),
+            min_size, '[{}, {}] '.format(set_name, lang))
 
     output_cnt = 0
     for _, _, filenames in os.walk(input_path):
@@ -14393,6 +15932,24 @@ def copy_db_outputs(conf, sets):
                  round(time.time() - timestamp, 3))
 
 
+def _iter_octgn_images(archive_path, set_id):
+    """ Iterate over the card images of the set in an OCTGN image archive
+    without extracting it.
+    """
+    prefix = '{}/{}/Cards/'.format(OCTGN_ZIP_PATH, set_id)
+    with zipfile.ZipFile(archive_path) as zip_obj:
+        for info in zip_obj.infolist():
+            if info.is_dir() or not info.filename.startswith(prefix):
+                continue
+
+            filename = info.filename[len(prefix):]
+            if '/' in filename:
+                continue
+
+            with zip_obj.open(info) as fobj:
+                yield filename, fobj
+
+
 def copy_octgn_image_outputs(conf, sets):
     """ Copy OCTGN image outputs to the destination folder.
     """
@@ -14406,18 +15963,11 @@ def copy_octgn_image_outputs(conf, sets):
         output_path = os.path.join(
             OUTPUT_OCTGN_IMAGES_PATH,
             escape_filename('{}.English'.format(set_name)))
-        destination_path = os.path.join(conf['octgn_image_destination_path'],
-                                        'a21af4e8-be4b-4cda-a6b6-534f9717391f')
-        create_folder(destination_path)
-        destination_path = os.path.join(destination_path,
-                                        'Sets')
-        create_folder(destination_path)
-        destination_path = os.path.join(destination_path,
-                                        set_id)
-        create_folder(destination_path)
-        destination_path = os.path.join(destination_path,
-                                        'Cards')
-        create_folder(destination_path)
+        destination_path = conf['octgn_image_destination_path']
+        for folder in OCTGN_ZIP_PATH.split('/') + [set_id, 'Cards']:
+            destination_path = os.path.join(destination_path, folder)
+            create_folder(destination_path)
+
         clear_folder(destination_path)
         for _, _, filenames in os.walk(output_path):
             for filename in filenames:
@@ -14428,10 +15978,11 @@ def copy_octgn_image_outputs(conf, sets):
                     os.path.join(output_path, filename),
                     os.path.join(conf['octgn_image_destination_path'],
                                  filename))
-                with zipfile.ZipFile(os.path.join(
-                        conf['octgn_image_destination_path'],
-                        filename)) as obj:
-                    obj.extractall(conf['octgn_image_destination_path'])
+                for image_filename, fobj in _iter_octgn_images(
+                        os.path.join(output_path, filename), set_id):
+                    with open(os.path.join(destination_path, image_filename),
+                              'wb') as output_file:
+                        shutil.copyfileobj(fobj, output_file)
 
             break
 
@@ -14714,16 +16265,100 @@ def _scp_upload(client, scp_client, conf, source_path, destination_path,  # pyli
     return (client, scp_client)
 
 
-def upload_dragncards_images(conf, sets):
+def _sftp_upload(client, sftp_client, conf, content, destination_path,  # pylint: disable=R0913
+                 beta=False):
+    """ Upload file content to DragnCards host using SFTP and verify its
+    remote size.
+    """
+    logging.info('Uploading %s', destination_path)
+    for i in range(SCP_RETRIES):
+        try:
+            sftp_client.putfo(BytesIO(content), destination_path,
+                              file_size=len(content), confirm=True)
+            break
+        except Exception:
+            if i < SCP_RETRIES - 1:
+                try:
+                    client.close()
+                except Exception:
+                    pass
+
+                time.sleep(SCP_SLEEP * (i + 1))
+                client = _get_ssh_client(conf, beta=beta)
+                sftp_client = client.open_sftp()
+            else:
+                raise
+
+    return (client, sftp_client)
+
+
+def _read_dragncards_images_manifest():
+    """ Read checksums, sizes and remote modification times of the images
+    uploaded to DragnCards.
+    """
+    try:
+        with open(DRAGNCARDS_IMAGES_MANIFEST_PATH, 'r',
+                  encoding='utf-8') as fobj:
+            return json.load(fobj)
+    except Exception:
+        return {}
+
+
+def _save_dragncards_images_manifest(manifest):
+    """ Save checksums, sizes and remote modification times of the images
+    uploaded to DragnCards.
+    """
+    temp_path = '{}.{}'.format(DRAGNCARDS_IMAGES_MANIFEST_PATH, os.getpid())
+    with open(temp_path, 'w', encoding='utf-8') as fobj:
+        json.dump(manifest, fobj, sort_keys=True)
+
+    os.replace(temp_path, DRAGNCARDS_IMAGES_MANIFEST_PATH)
+
+
+def _list_remote_dragncards_images(sftp_client, remote_folder):
+    """ Get sizes and modification times of the images in the remote
+    DragnCards folder.
+    """
+    try:
+        return {attr.filename: (attr.st_size, attr.st_mtime)
+                for attr in sftp_client.listdir_attr(remote_folder)}
+    except IOError:
+        return {}
+
+
+def _get_changed_dragncards_images(images, manifest, remote_images):
+    """ Get the images changed since the previous upload or missing or
+    different in the remote folder, and the size of the unchanged images.
+    """
+    changed = []
+    unchanged_size = 0
+    for filename, checksum, size in images:
+        known = manifest.get(filename)
+        if (isinstance(known, dict) and known['checksum'] == checksum and
+                known['size'] == size and
+                remote_images.get(filename) == (size, known['mtime'])):
+            unchanged_size += size
+        else:
+            changed.append(filename)
+
+    return changed, unchanged_size
+
+
+def upload_dragncards_images(conf, sets):  # pylint: disable=R0914
     """ Uploading pixel-perfect images to DragnCards.
     """
     logging.info('Uploading pixel-perfect images to DragnCards...')
     timestamp = time.time()
 
     remote_folder = _read_remote_dragncards_folder()
-    images_uploaded = False
+    manifest = _read_dragncards_images_manifest()
+    known_images = {} if conf['reprocess_all'] else manifest
+    remote_images = {}
+    uploaded_images = {}
+    uploaded_size = 0
+    unchanged_size = 0
     client = None
-    scp_client = None
+    sftp_client = None
     try:  # pylint: disable=R1702
         for set_id, set_name in sets:
             output_path = os.path.join(
@@ -14734,47 +16369,44 @@ def upload_dragncards_images(conf, sets):
             if (L_ENGLISH in conf['output_languages'] and
                     'octgn' in conf['outputs'][L_ENGLISH] and
                     os.path.exists(output_path)):
-                temp_path = os.path.join(
-                    TEMP_ROOT_PATH,
-                    escape_filename(
-                        'upload_dragncards_images_{}'.format(set_name)))
-                create_folder(temp_path)
-                clear_folder(temp_path)
-                with zipfile.ZipFile(output_path) as obj:
-                    obj.extractall(temp_path)
-
-                output_path = os.path.join(
-                    temp_path,
-                    'a21af4e8-be4b-4cda-a6b6-534f9717391f',
-                    'Sets',
-                    set_id,
-                    'Cards')
-                if os.path.exists(output_path):
-                    for _, _, filenames in os.walk(output_path):
-                        if filenames:
-                            images_uploaded = True
-
-                            if not client:
-                                client = _get_ssh_client(conf)
-                                scp_client = SCPClient(client.get_transport())
-
-                            for filename in filenames:
-                                client, scp_client = _scp_upload(
-                                    client,
-                                    scp_client,
-                                    conf,
-                                    os.path.join(output_path, filename),
-                                    remote_folder)
-
-                        break
-
-                    logging.info('Successfully uploaded images for %s to '
-                                 'DragnCards host', set_name)
-
-                delete_folder(temp_path)
-
-        if images_uploaded:
+                contents = {filename: fobj.read() for filename, fobj
+                            in _iter_octgn_images(output_path, set_id)}
+                checksums = {filename: hashlib.md5(content).hexdigest()
+                             for filename, content in contents.items()}
+                if contents and not client:
+                    client = _get_ssh_client(conf)
+                    sftp_client = client.open_sftp()
+                    remote_images = _list_remote_dragncards_images(
+                        sftp_client, remote_folder)
+
+                changed, size = _get_changed_dragncards_images(
+                    [(filename, checksums[filename], len(content))
+                     for filename, content in sorted(contents.items())],
+                    known_images, remote_images)
+                unchanged_size += size
+                for filename in changed:
+                    destination_path = '{}/{}'.format(remote_folder,
+                                                      filename)
+                    client, sftp_client = _sftp_upload(
+                        client,
+                        sftp_client,
+                        conf,
+                        contents[filename],
+                        destination_path)
+                    attr = sftp_client.stat(destination_path)
+                    uploaded_images[filename] = {
+                        'checksum': checksums[filename],
+                        'size': attr.st_size,
+                        'mtime': attr.st_mtime}
+                    uploaded_size += len(contents[filename])
+
+                logging.info('Successfully uploaded images for %s to '
+                             'DragnCards host', set_name)
+
+        if uploaded_images:
             _finish_uploading_dragncards_images(conf, remote_folder)
+            manifest.update(uploaded_images)
+            _save_dragncards_images_manifest(manifest)
             trigger_dragncards_build(conf)
 
     finally:
@@ -14784,6 +16416,9 @@ def upload_dragncards_images(conf, sets):
         except Exception:
             pass
 
+    logging.info('Uploaded %s changed image(s) (%s bytes), skipped unchanged '
+                 'images (%s bytes saved)', len(uploaded_images),
+                 uploaded_size, unchanged_size)
     logging.info('...Uploading pixel-perfect images to DragnCards (%ss)',
                  round(time.time() - timestamp, 3))
 
@@ -1,16 +1,19 @@
 """ LotR workflow (Part 2).
 """
+import heapq
 import logging
 import os
+import queue
 import signal
 import sys
 import time
 from functools import wraps
-from multiprocessing import Pool, cpu_count
+from multiprocessing import Pool, Semaphore
 
 import lotr
 
 
+DEFAULT_TASK_DURATION = 60
 RETRIES = 2
 
 
@@ -162,44 +165,157 @@ def generate_renderer_artwork(conf, set_id, set_name):
     lotr.generate_renderer_artwork(conf, set_id, set_name)
 
 
-def run(args):
-    """ Run the function.
+def run(args, deps):
+    """ Run the function while holding a slot of the CPU budget and return
+    IDs of its timing steps.
     """
     func = args.pop(0)
-    func(*args)
+    lotr.set_step_deps(deps)
+    lotr.acquire_cpu_slots(None, 1, block=True)
+    try:
+        lotr.timed_step(func, *args)
+    finally:
+        lotr.release_cpu_slots(1)
 
+    return lotr.get_step_deps()
 
-def initializer():
-    """ Ignore CTRL+C in the worker process.
+
+def initializer(semaphore, run_id):
+    """ Ignore CTRL+C in the worker process, share the CPU budget and the
+    run of the timing history.
     """
     signal.signal(signal.SIGINT, signal.SIG_IGN)
     init_logging()
+    lotr.init_cpu_budget(semaphore)
+    if run_id:
+        lotr.init_timings('run_after_se', run_id)
+
+
+def add_task(graph, args, set_id, lang=None, deps=()):
+    """ Add a task to the task graph and return its key.
+    """
+    key = (args[0].__name__, set_id, lang)
+    graph[key] = {'args': args, 'deps': [d for d in deps if d]}
+    return key
+
+
+def get_priorities(graph, children, durations):
+    """ Get the expected duration of the longest chain of tasks starting
+    with each task.
+    """
+    averages = {}
+    for key, duration in durations.items():
+        averages.setdefault(key[0], []).append(duration)
+
+    averages = {k:sum(v) / len(v) for k, v in averages.items()}
+    priorities = {}
+
+    def _get_priority(key):
+        if key not in priorities:
+            duration = durations.get(key, averages.get(
+                key[0], DEFAULT_TASK_DURATION))
+            priorities[key] = duration + max(
+                [_get_priority(child) for child in children[key]] or [0])
 
+        return priorities[key]
 
-def execute_tasks(conf, tasks):
-    """ Execute the list of tasks.
+    for key in graph:
+        _get_priority(key)
+
+    return priorities
+
+
+def execute_tasks(conf, graph):  # pylint: disable=R0912,R0914,R0915
+    """ Execute the graph of tasks.  Each task starts as soon as all its
+    dependencies are finished, the longest chains of tasks go first.
     """
-    if not tasks:
+    if not graph:
         logging.info('No tasks to execute, skipping')
         return
 
-    processes = (min(4, max(1, cpu_count() - 1))
-                 if conf['parallelism'] == 'default'
-                 else conf['parallelism'])
-    processes = min(processes, len(tasks))
+    children = {key:[] for key in graph}
+    waiting = {}
+    for key, node in graph.items():
+        deps = {dep for dep in node['deps'] if dep in graph}
+        waiting[key] = len(deps)
+        for dep in deps:
+            children[dep].append(key)
+
+    durations = lotr.get_step_durations('run_after_se')
+    priorities = get_priorities(graph, children, durations)
+    ready = [(-priorities[key], key) for key, cnt in waiting.items()
+             if not cnt]
+    heapq.heapify(ready)
+    start_deps = lotr.get_step_deps()
+    step_ids = {}
+
+    def _get_deps(key):
+        deps = [step_id for dep in graph[key]['deps'] if dep in graph
+                for step_id in step_ids[dep]]
+        return deps or start_deps
+
+    def _finish(key, ids):
+        step_ids[key] = ids
+        for child in children[key]:
+            waiting[child] -= 1
+            if not waiting[child]:
+                heapq.heappush(ready, (-priorities[child], child))
+
+    budget = lotr.get_parallelism(conf)
+    semaphore = Semaphore(budget)
+    processes = min(budget, len(graph))
     if processes == 1:
-        for task in tasks:
-            run(task)
-    else:
-        logging.info('Starting a pool of %s process(es) for %s task(s)',
-                     processes, len(tasks))
-        with Pool(processes=processes, initializer=initializer) as pool:
-            try:
-                pool.map(run, tasks)
-            except KeyboardInterrupt as exc:
-                logging.info('Program was terminated!')
-                pool.terminate()
-                raise KeyboardInterrupt from exc
+        lotr.init_cpu_budget(semaphore)
+        while ready:
+            _, key = heapq.heappop(ready)
+            _finish(key, run(list(graph[key]['args']), _get_deps(key)))
+
+        lotr.set_step_deps([i for ids in step_ids.values() for i in ids])
+        return
+
+    logging.info('Starting a pool of %s process(es) for %s task(s)',
+                 processes, len(graph))
+    done = queue.Queue()
+    with Pool(processes=processes, initializer=initializer,
+              initargs=(semaphore, lotr.TIMINGS.get('run_id'))) as pool:
+        try:
+            running = 0
+            error = None
+            while ready or running:
+                while ready and running < processes and error is None:
+                    _, key = heapq.heappop(ready)
+                    pool.apply_async(
+                        run, (list(graph[key]['args']), _get_deps(key)),
+                        callback=lambda ids, key=key: done.put(
+                            (key, None, ids)),
+                        error_callback=lambda exc, key=key: done.put(
+                            (key, exc, None)))
+                    running += 1
+
+                if not running:
+                    break
+
+                while True:
+                    try:
+                        key, exc, ids = done.get(timeout=1)
+                        break
+                    except queue.Empty:
+                        pass
+
+                running -= 1
+                if exc is not None:
+                    error = error or exc
+                else:
+                    _finish(key, ids)
+
+            lotr.set_step_deps([i for ids in step_ids.values()
+                                for i in ids])
+            if error is not None:
+                raise error
+        except KeyboardInterrupt as exc:
+            logging.info('Program was terminated!')
+            pool.terminate()
+            raise KeyboardInterrupt from exc
 
 
 def main():  # pylint: disable=R0912,R0914,R0915
@@ -211,16 +327,17 @@ def main():  # pylint: disable=R0912,R0914,R0915
     else:
         conf = lotr.read_conf()
 
-    lotr.extract_data(conf)
-    sets = lotr.get_sets(conf)
+    lotr.start_timings('run_after_se')
+    lotr.timed_step(lotr.extract_data, conf)
+    sets = lotr.timed_step(lotr.get_sets, conf)
     if os.path.exists(lotr.PROJECT_PATH):
-        actual_sets = lotr.get_actual_sets()
+        actual_sets = lotr.timed_step(lotr.get_actual_sets)
     else:
         actual_sets = []
 
-    pre_tasks = []
-    tasks = []
-    post_tasks = []
+    card_dict = lotr.full_card_dict()
+    graph = {}
+    tts_tasks = []
     for set_id, set_name in sets:
         scratch = set_id in lotr.FOUND_SCRATCH_SETS
         for lang in conf['output_languages']:
@@ -239,73 +356,86 @@ def main():  # pylint: disable=R0912,R0914,R0915
                 continue
 
             card_data = lotr.translated_data(set_id, lang)
-            card_dict = lotr.full_card_dict()
 
+            nobleed_300 = nobleed_480 = nobleed_800 = None
             if conf['nobleed_300'][lang]:
-                pre_tasks.append([generate_png300_nobleed, conf, set_id,
-                                  set_name, lang, skip_ids])
+                nobleed_300 = add_task(
+                    graph, [generate_png300_nobleed, conf, set_id, set_name,
+                            lang, skip_ids], set_id, lang)
 
             if conf['nobleed_480'][lang]:
-                pre_tasks.append([generate_png480_nobleed, conf, set_id,
-                                  set_name, lang, skip_ids])
+                nobleed_480 = add_task(
+                    graph, [generate_png480_nobleed, conf, set_id, set_name,
+                            lang, skip_ids], set_id, lang)
 
             if conf['nobleed_800'][lang]:
-                pre_tasks.append([generate_png800_nobleed, conf, set_id,
-                                  set_name, lang, skip_ids])
+                nobleed_800 = add_task(
+                    graph, [generate_png800_nobleed, conf, set_id, set_name,
+                            lang, skip_ids], set_id, lang)
 
             if 'db' in conf['outputs'][lang]:
-                tasks.append([generate_db, conf, set_id, set_name, lang,
-                              skip_ids, card_data])
+                add_task(graph, [generate_db, conf, set_id, set_name, lang,
+                                 skip_ids, card_data], set_id, lang,
+                         [nobleed_300])
 
             if 'dragncards_hq' in conf['outputs'][lang]:
-                tasks.append([generate_dragncards_hq, conf, set_id, set_name,
-                              lang, skip_ids, card_data])
+                add_task(graph, [generate_dragncards_hq, conf, set_id,
+                                 set_name, lang, skip_ids, card_data],
+                         set_id, lang, [nobleed_480])
 
             if 'octgn' in conf['outputs'][lang]:
-                tasks.append([generate_octgn, conf, set_id, set_name, lang,
-                              skip_ids, card_data])
+                add_task(graph, [generate_octgn, conf, set_id, set_name, lang,
+                                 skip_ids, card_data], set_id, lang,
+                         [nobleed_300])
 
             if 'rules_pdf' in conf['outputs'][lang]:
-                tasks.append([generate_rules_pdf, conf, set_id, set_name,
-                              lang, skip_ids, card_data])
+                add_task(graph, [generate_rules_pdf, conf, set_id, set_name,
+                                 lang, skip_ids, card_data], set_id, lang,
+                         [nobleed_800])
 
             if 'pdf' in conf['outputs'][lang]:
-                tasks.append([generate_pdf, conf, set_id, set_name, lang,
-                              skip_ids, card_data])
+                add_task(graph, [generate_pdf, conf, set_id, set_name, lang,
+                                 skip_ids, card_data], set_id, lang)
 
             if 'genericpng_pdf' in conf['outputs'][lang]:
-                tasks.append([generate_genericpng_pdf, conf, set_id, set_name,
-                              lang, skip_ids, card_data])
+                add_task(graph, [generate_genericpng_pdf, conf, set_id,
+                                 set_name, lang, skip_ids, card_data],
+                         set_id, lang)
 
             if 'makeplayingcards' in conf['outputs'][lang]:
-                tasks.append([generate_mpc, conf, set_id, set_name, lang,
-                              skip_ids, card_data])
+                add_task(graph, [generate_mpc, conf, set_id, set_name, lang,
+                                 skip_ids, card_data], set_id, lang)
 
             if 'drivethrucards' in conf['outputs'][lang]:
-                tasks.append([generate_dtc, conf, set_id, set_name, lang,
-                              skip_ids, card_data])
+                add_task(graph, [generate_dtc, conf, set_id, set_name, lang,
+                                 skip_ids, card_data], set_id, lang)
 
             if 'mbprint' in conf['outputs'][lang]:
-                tasks.append([generate_mbprint, conf, set_id, set_name, lang,
-                              skip_ids, card_data])
+                add_task(graph, [generate_mbprint, conf, set_id, set_name,
+                                 lang, skip_ids, card_data], set_id, lang)
 
             if 'genericpng' in conf['outputs'][lang]:
-                tasks.append([generate_genericpng, conf, set_id, set_name,
-                              lang, skip_ids, card_data])
+                add_task(graph, [generate_genericpng, conf, set_id, set_name,
+                                 lang, skip_ids, card_data], set_id, lang)
 
             if 'tts' in conf['outputs'][lang]:
-                post_tasks.append([generate_tts, conf, set_id, set_name, lang,
-                                   card_dict, scratch])
+                tts_tasks.append([generate_tts, conf, set_id, set_name, lang,
+                                  card_dict, scratch])
 
         if conf['renderer_artwork']:
-            post_tasks.append([generate_renderer_artwork, conf, set_id,
-                               set_name])
+            add_task(graph, [generate_renderer_artwork, conf, set_id,
+                             set_name], set_id)
 
-    execute_tasks(conf, pre_tasks)
-    execute_tasks(conf, tasks)
-    execute_tasks(conf, post_tasks)
+    # TTS sheets use DB images of all sets in the language (imagesTTS)
+    for task in tts_tasks:
+        lang = task[4]
+        add_task(graph, task, task[2], lang,
+                 [key for key in graph
+                  if key[0] == generate_db.__name__ and key[2] == lang])
 
-    lotr.check_messages()
+    execute_tasks(conf, graph)
+
+    lotr.timed_step(lotr.check_messages)
 
     if lotr.L_ENGLISH in conf['output_languages']:
         updated_sets = [s for s in sets
@@ -318,25 +448,28 @@ def main():  # pylint: disable=R0912,R0914,R0915
             lotr.L_ENGLISH in conf['output_languages'] and
             'db' in conf['outputs'][lotr.L_ENGLISH] and
             updated_sets):
-        lotr.copy_db_outputs(conf, updated_sets)
+        lotr.timed_step(lotr.copy_db_outputs, conf, updated_sets)
 
     if (conf['octgn_image_destination_path'] and
             lotr.L_ENGLISH in conf['output_languages'] and
             'octgn' in conf['outputs'][lotr.L_ENGLISH] and
             updated_sets):
-        lotr.copy_octgn_image_outputs(conf, updated_sets)
+        lotr.timed_step(lotr.copy_octgn_image_outputs, conf, updated_sets)
 
     if (conf['tts_destination_path'] and
             lotr.L_ENGLISH in conf['output_languages'] and
             'tts' in conf['outputs'][lotr.L_ENGLISH] and
             updated_sets):
-        lotr.copy_tts_outputs(conf, updated_sets)
+        lotr.timed_step(lotr.copy_tts_outputs, conf, updated_sets)
 
     if (updated_sets and
             conf['upload_dragncards'] and
             conf['dragncards_hostname'] and
             conf['dragncards_id_rsa_path']):
-        lotr.upload_dragncards_images(conf, updated_sets)
+        lotr.timed_step(lotr.upload_dragncards_images, conf, updated_sets)
+
+    if conf['render_cache']:
+        lotr.timed_step(lotr.prune_render_cache)
 
     if os.path.exists(lotr.PIPELINE_STARTED_PATH):
         os.remove(lotr.PIPELINE_STARTED_PATH)
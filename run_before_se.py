@@ -3,8 +3,11 @@
 import json
 import logging
 import os
+import signal
 import sys
 import time
+from multiprocessing import Pool
+
 import lotr
 
 
@@ -35,6 +38,140 @@ def save_reprocess_count(value):
         json.dump(data, fobj)
 
 
+def generate_set_outputs(conf, set_id, set_name):  # pylint: disable=R0912
+    """ Generate outputs of the set and return whether there are Eons
+    outputs, file changes and DragnCards changes for the renderer.
+    """
+    scratch = set_id in lotr.FOUND_SCRATCH_SETS
+    eons = False
+    changes = False
+    if conf['octgn_set_xml']:
+        lotr.timed_step(lotr.generate_octgn_set_xml, conf, set_id,
+                        set_name)
+
+    if conf['octgn_o8d']:
+        lotr.timed_step(lotr.generate_octgn_o8d, conf, set_id, set_name)
+
+    if conf['ringsdb_csv']:
+        lotr.timed_step(lotr.generate_ringsdb_csv, conf, set_id, set_name)
+
+    if conf['frenchdb_csv']:
+        lotr.timed_step(lotr.generate_frenchdb_csv, conf, set_id, set_name)
+
+    if conf['spanishdb_csv']:
+        lotr.timed_step(lotr.generate_spanishdb_csv, conf, set_id,
+                        set_name)
+
+    if conf['hallofbeorn_json']:
+        for lang in (conf['output_languages'] or [lotr.L_ENGLISH]):
+            if scratch and lang != lotr.L_ENGLISH:
+                continue
+
+            lotr.timed_step(lotr.generate_hallofbeorn_json, conf, set_id,
+                            set_name, lang)
+
+    if conf['output_languages']:
+        lotr.timed_step(lotr.copy_custom_images, conf, set_id, set_name)
+
+    xml_generated = False
+    xml_changed = False
+    for lang in conf['output_languages']:
+        if scratch and lang != lotr.L_ENGLISH:
+            continue
+
+        eons = True
+        if lang == lotr.L_ENGLISH:
+            xml_generated = True
+
+        lotr.timed_step(lotr.generate_xml, conf, set_id, set_name, lang)
+        lotr.timed_step(lotr.update_xml, conf, set_id, set_name, lang)
+        file_changes, dragncards_changes = lotr.timed_step(
+            lotr.calculate_hashes, set_id, set_name, lang)
+        if file_changes:
+            changes = True
+            if dragncards_changes and lang == lotr.L_ENGLISH:
+                xml_changed = True
+
+        lotr.timed_step(lotr.copy_raw_images, conf, set_id, set_name, lang)
+        lotr.timed_step(lotr.copy_xml, set_id, set_name, lang)
+
+    if conf['renderer'] and not xml_generated:
+        lotr.timed_step(lotr.generate_xml, conf, set_id, set_name,
+                        lotr.L_ENGLISH)
+        lotr.timed_step(lotr.update_xml, conf, set_id, set_name,
+                        lotr.L_ENGLISH)
+        _, dragncards_changes = lotr.timed_step(
+            lotr.calculate_hashes, set_id, set_name, lotr.L_ENGLISH)
+        if dragncards_changes:
+            xml_changed = True
+
+        xml_generated = True
+
+    renderer = conf['renderer'] and xml_changed
+
+    if ((conf['renderer_artwork'] or conf['dragncards_json'])
+            and not xml_generated):
+        lotr.timed_step(lotr.generate_xml, conf, set_id, set_name,
+                        lotr.L_ENGLISH)
+        lotr.timed_step(lotr.update_xml, conf, set_id, set_name,
+                        lotr.L_ENGLISH)
+        lotr.timed_step(lotr.calculate_hashes, set_id, set_name,
+                        lotr.L_ENGLISH)
+
+    return eons, changes, renderer
+
+
+def generate_set_outputs_task(conf, set_id, set_name, deps):
+    """ Generate outputs of the set after the given timing steps and return
+    the result with IDs of its last timing steps.
+    """
+    lotr.set_step_deps(deps)
+    result = generate_set_outputs(conf, set_id, set_name)
+    return result, lotr.get_step_deps()
+
+
+def initializer(state, run_id):
+    """ Ignore CTRL+C in the worker process, load the extracted data and
+    share the run of the timing history.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    init_logging()
+    lotr.set_data_state(state)
+    if run_id:
+        lotr.init_timings('run_before_se', run_id)
+
+
+def generate_outputs(conf, sets):
+    """ Generate outputs of all sets, in parallel worker processes if
+    possible.
+    """
+    processes = min(lotr.get_parallelism(conf), len(sets))
+    deps = lotr.get_step_deps()
+    if processes <= 1:
+        results = [generate_set_outputs_task(conf, set_id, set_name, deps)
+                   for set_id, set_name in sets]
+        lotr.set_step_deps([i for _, ids in results for i in ids] or deps)
+        return [result for result, _ in results]
+
+    logging.info('Generating outputs of %s set(s) in %s processes',
+                 len(sets), processes)
+    with Pool(processes=processes, initializer=initializer,
+              initargs=(lotr.get_data_state(),
+                        lotr.TIMINGS.get('run_id'))) as pool:
+        try:
+            results = pool.starmap(
+                generate_set_outputs_task,
+                [(conf, set_id, set_name, deps)
+                 for set_id, set_name in sets],
+                chunksize=1)
+            lotr.set_step_deps([i for _, ids in results for i in ids])
+            return [result for result, _ in results]
+        except KeyboardInterrupt as exc:
+            logging.info('Program was terminated!')
+            pool.terminate()
+            raise KeyboardInterrupt from exc
+
+
 def main(conf=None):  # pylint: disable=R0912,R0914,R0915
     """ Main function.
     """
@@ -52,6 +189,7 @@ def main(conf=None):  # pylint: disable=R0912,R0914,R0915
         else:
             conf = lotr.read_conf()
 
+    lotr.start_timings('run_before_se')
     force_reprocessing = False
     if os.path.exists(lotr.REPROCESS_ALL_PATH):
         conf['reprocess_all'] = True
@@ -76,9 +214,9 @@ def main(conf=None):  # pylint: disable=R0912,R0914,R0915
     if (conf['upload_dragncards'] and
             conf['dragncards_hostname'] and
             conf['dragncards_id_rsa_path']):
-        lotr.write_remote_dragncards_folder(conf)
+        lotr.timed_step(lotr.write_remote_dragncards_folder, conf)
 
-    sheet_changes = lotr.download_sheet(conf)
+    sheet_changes = lotr.timed_step(lotr.download_sheet, conf)
     if force_reprocessing or not conf['exit_if_no_spreadsheet_changes']:
         sheet_changes = True
 
@@ -93,126 +231,67 @@ def main(conf=None):  # pylint: disable=R0912,R0914,R0915
     with open(lotr.PIPELINE_STARTED_PATH, 'w', encoding='utf-8'):
         pass
 
-    lotr.extract_data(conf)
-    sets = lotr.get_sets(conf)
+    lotr.timed_step(lotr.extract_data, conf)
+    sets = lotr.timed_step(lotr.get_sets, conf)
 
     if conf['stable_data_user'] == 'reader':
         try:
-            sets = lotr.sanity_check(conf, sets)
+            sets = lotr.timed_step(lotr.sanity_check, conf, sets)
         except lotr.SanityCheckError as exc:
             logging.error(str(exc))
             logging.info(
                 'Sanity check failed, retrying with the latest stable data...')
-            lotr.read_stable_data(conf)
-            lotr.extract_data(conf)
-            sets = lotr.get_sets(conf)
-            sets = lotr.sanity_check(conf, sets)
+            lotr.timed_step(lotr.read_stable_data, conf)
+            lotr.timed_step(lotr.extract_data, conf)
+            sets = lotr.timed_step(lotr.get_sets, conf)
+            sets = lotr.timed_step(lotr.sanity_check, conf, sets)
     else:
-        sets = lotr.sanity_check(conf, sets)
+        sets = lotr.timed_step(lotr.sanity_check, conf, sets)
 
     if conf['stable_data_user'] == 'writer':
-        lotr.upload_stable_data()
+        lotr.timed_step(lotr.upload_stable_data)
 
-    lotr.save_data_for_bot(conf, sets)
+    lotr.timed_step(lotr.save_data_for_bot, conf, sets)
 
     if conf['renderer']:
-        lotr.expire_dragncards_hashes()
+        lotr.timed_step(lotr.expire_dragncards_hashes)
 
     if conf['output_languages']:
-        lotr.verify_images(conf)
-        lotr.reset_project_folders(conf)
+        lotr.timed_step(lotr.verify_images, conf)
+        lotr.timed_step(lotr.reset_project_folders, conf)
 
     eons = False
     changes = False
     renderer_sets = []
-    for set_id, set_name in sets:
-        scratch = set_id in lotr.FOUND_SCRATCH_SETS
-        if conf['octgn_set_xml']:
-            lotr.generate_octgn_set_xml(conf, set_id, set_name)
-
-        if conf['octgn_o8d']:
-            lotr.generate_octgn_o8d(conf, set_id, set_name)
-
-        if conf['ringsdb_csv']:
-            lotr.generate_ringsdb_csv(conf, set_id, set_name)
-
-        if conf['frenchdb_csv']:
-            lotr.generate_frenchdb_csv(conf, set_id, set_name)
-
-        if conf['spanishdb_csv']:
-            lotr.generate_spanishdb_csv(conf, set_id, set_name)
-
-        if conf['hallofbeorn_json']:
-            for lang in (conf['output_languages'] or [lotr.L_ENGLISH]):
-                if scratch and lang != lotr.L_ENGLISH:
-                    continue
-
-                lotr.generate_hallofbeorn_json(conf, set_id, set_name, lang)
-
-        if conf['output_languages']:
-            lotr.copy_custom_images(conf, set_id, set_name)
-
-        xml_generated = False
-        xml_changed = False
-        for lang in conf['output_languages']:
-            if scratch and lang != lotr.L_ENGLISH:
-                continue
-
-            eons = True
-            if lang == lotr.L_ENGLISH:
-                xml_generated = True
-
-            lotr.generate_xml(conf, set_id, set_name, lang)
-            lotr.update_xml(conf, set_id, set_name, lang)
-            file_changes, dragncards_changes = lotr.calculate_hashes(
-                set_id, set_name, lang)
-            if file_changes:
-                changes = True
-                if dragncards_changes and lang == lotr.L_ENGLISH:
-                    xml_changed = True
-
-            lotr.copy_raw_images(conf, set_id, set_name, lang)
-            lotr.copy_xml(set_id, set_name, lang)
-
-        if conf['renderer'] and not xml_generated:
-            lotr.generate_xml(conf, set_id, set_name, lotr.L_ENGLISH)
-            lotr.update_xml(conf, set_id, set_name, lotr.L_ENGLISH)
-            _, dragncards_changes = lotr.calculate_hashes(set_id, set_name,
-                                                          lotr.L_ENGLISH)
-            if dragncards_changes:
-                xml_changed = True
-
-            xml_generated = True
-
-        if conf['renderer'] and xml_changed:
+    results = generate_outputs(conf, sets)
+    for (set_id, _), (set_eons, set_changes, renderer) in zip(sets, results):
+        eons = eons or set_eons
+        changes = changes or set_changes
+        if renderer:
             renderer_sets.append(set_id)
 
-        if ((conf['renderer_artwork'] or conf['dragncards_json'])
-                and not xml_generated):
-            lotr.generate_xml(conf, set_id, set_name, lotr.L_ENGLISH)
-            lotr.update_xml(conf, set_id, set_name, lotr.L_ENGLISH)
-            lotr.calculate_hashes(set_id, set_name, lotr.L_ENGLISH)
-            xml_generated = True
-
-        if conf['dragncards_json']:
-            lotr.generate_dragncards_json(conf, set_id, set_name)
+    if conf['dragncards_json']:
+        for set_id, set_name in sets:
+            lotr.timed_step(lotr.generate_dragncards_json, conf, set_id,
+                            set_name)
 
     if conf['octgn_set_xml'] or conf['octgn_o8d']:
-        lotr.copy_octgn_outputs(conf, sets)
+        lotr.timed_step(lotr.copy_octgn_outputs, conf, sets)
 
     if conf['ringsdb_csv'] and conf['update_ringsdb']:
-        lotr.update_ringsdb(conf, sets)
+        lotr.timed_step(lotr.update_ringsdb, conf, sets)
 
     if renderer_sets:
-        lotr.generate_dragncards_proxies(renderer_sets)
+        lotr.timed_step(lotr.generate_dragncards_proxies, renderer_sets)
 
     if (conf['upload_dragncards_lightweight'] and
             conf['dragncards_hostname'] and
             conf['dragncards_id_rsa_path']):
-        lotr.upload_dragncards_lightweight_outputs(conf, sets)
+        lotr.timed_step(lotr.upload_dragncards_lightweight_outputs, conf,
+                        sets)
 
     if changes:
-        lotr.create_project()
+        lotr.timed_step(lotr.create_project)
         with open(lotr.SEPROJECT_CREATED_PATH, 'w', encoding='utf-8'):
             pass
     else:
@@ -0,0 +1,80 @@
+""" Shared fixtures of the tests.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import lotr  # pylint: disable=C0413
+
+
+SHEET_FRONT_COLUMNS = [
+    lotr.CARD_SET, lotr.CARD_ID, lotr.CARD_NUMBER, lotr.CARD_QUANTITY,
+    lotr.CARD_ENCOUNTER_SET, lotr.CARD_NAME, lotr.CARD_UNIQUE, lotr.CARD_TYPE,
+    lotr.CARD_SPHERE, lotr.CARD_TRAITS, lotr.CARD_KEYWORDS, lotr.CARD_COST,
+    lotr.CARD_ENGAGEMENT, lotr.CARD_THREAT, lotr.CARD_WILLPOWER,
+    lotr.CARD_ATTACK, lotr.CARD_DEFENSE, lotr.CARD_HEALTH, lotr.CARD_QUEST,
+    lotr.CARD_VICTORY, lotr.CARD_TEXT, lotr.CARD_SHADOW, lotr.CARD_FLAVOUR,
+    lotr.CARD_PRINTED_NUMBER, lotr.CARD_ENCOUNTER_SET_NUMBER,
+    lotr.CARD_ENCOUNTER_SET_ICON, lotr.CARD_FLAGS, lotr.CARD_ICONS,
+    lotr.CARD_INFO, lotr.CARD_ARTIST, lotr.CARD_PANX, lotr.CARD_PANY,
+    lotr.CARD_SCALE, lotr.CARD_PORTRAIT_SHADOW, lotr.CARD_SIDE_B]
+SHEET_BACK_COLUMNS = SHEET_FRONT_COLUMNS[6:-1]
+SHEET_EXTRA_COLUMNS = [
+    lotr.CARD_EASY_MODE, lotr.CARD_ADDITIONAL_ENCOUNTER_SETS,
+    lotr.CARD_ADVENTURE, lotr.CARD_COLLECTION_ICON, lotr.CARD_COPYRIGHT,
+    lotr.CARD_BACK, lotr.CARD_DECK_RULES, lotr.CARD_SELECTED,
+    lotr.CARD_CHANGED, lotr.CARD_BOT_DISABLED,
+    lotr.CARD_LAST_DESIGN_CHANGE_DATE]
+
+
+def make_card_sheet(rows):
+    """ Make a card sheet (as saved to the Download folder) from a list of
+    dictionaries.
+    """
+    columns = SHEET_FRONT_COLUMNS + SHEET_BACK_COLUMNS + SHEET_EXTRA_COLUMNS
+    keys = (SHEET_FRONT_COLUMNS +
+            [lotr.BACK_PREFIX + c for c in SHEET_BACK_COLUMNS] +
+            SHEET_EXTRA_COLUMNS)
+    return [columns] + [[row.get(k) for k in keys] for row in rows]
+
+
+def make_card_rows(cnt):
+    """ Make a list of synthetic card rows.
+    """
+    rows = []
+    for i in range(cnt):
+        name = 'Hero {}'.format(i)
+        rows.append({
+            lotr.CARD_SET: 'set-{}'.format(i % 3),
+            lotr.CARD_ID: '00000000-0000-0000-0000-{:012d}'.format(i),
+            lotr.CARD_NUMBER: i % 100 + 1,
+            lotr.CARD_QUANTITY: 3,
+            lotr.CARD_NAME: name,
+            lotr.CARD_TYPE: lotr.T_ALLY if i % 2 else lotr.T_EVENT,
+            lotr.CARD_SPHERE: 'Leadership',
+            lotr.CARD_TRAITS: 'Dwarf. Warrior.',
+            lotr.CARD_TEXT: (
+                'Action: Exhaust {} to ready a hero.  "Quoted" -2 [threat] '
+                '{{Condition}}\tand  {}  attachment.\n\nForced: After Hero '
+                '{}X is discarded, Setup (x): deal 1 damage.'.format(
+                    name, 'Hero {}'.format(i + 1), i)),
+            lotr.CARD_SHADOW: 'Shadow: Attacking enemy gets +1 [attack].',
+            lotr.CARD_FLAVOUR: ('"Some words about the {}." '
+                                '—Gandalf, The Hobbit'.format(name)),
+            lotr.BACK_PREFIX + lotr.CARD_TEXT: 'Travel: Each player…'})
+
+    return rows
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """ Run the test in an empty working folder with the Data and Temp
+    folders.
+    """
+    monkeypatch.chdir(tmp_path)
+    os.makedirs(lotr.DATA_PATH)
+    os.makedirs(lotr.TEMP_ROOT_PATH)
+    return tmp_path
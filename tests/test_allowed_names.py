@@ -0,0 +1,68 @@
+""" Tests of the names allowed on the cards of each type in the Discord bot.
+"""
+import discord_bot
+import lotr
+
+
+CARD_NAMES = ['Gandalf', 'Bilbo Baggins']
+SET_AND_QUEST_NAMES = ['The Test Set', 'Into the Woods']
+ENCOUNTER_SET_NAMES = ['Spiders of Mirkwood']
+
+
+def _get_all_names(card_type):
+    """ Collect all known names that can be mentioned on the card the way
+    it was done before the allowed names were saved with the card data.
+    """
+    all_names = set(CARD_NAMES)
+    if card_type == lotr.T_RULES:
+        all_names.update(SET_AND_QUEST_NAMES)
+        all_names.update(['“{}”'.format(n) for n in SET_AND_QUEST_NAMES])
+        all_names.update(ENCOUNTER_SET_NAMES)
+        all_names.update(lotr.ALLOWED_RULES_NAMES)
+    elif card_type == lotr.T_CAMPAIGN:
+        all_names.update(ENCOUNTER_SET_NAMES)
+        all_names.update(lotr.ALLOWED_CAMPAIGN_NAMES)
+    elif card_type == lotr.T_QUEST:
+        all_names.update(ENCOUNTER_SET_NAMES)
+
+    return all_names
+
+
+def _get_data(saved):
+    data = {'card_names': CARD_NAMES,
+            'set_and_quest_names': SET_AND_QUEST_NAMES,
+            'encounter_set_names': ENCOUNTER_SET_NAMES}
+    if saved:
+        data['allowed_names'] = lotr.get_allowed_names(
+            SET_AND_QUEST_NAMES, ENCOUNTER_SET_NAMES)
+
+    return data
+
+
+def test_name_index_per_card_type():
+    for saved in (True, False):
+        data = _get_data(saved)
+        for card_type in (lotr.T_RULES, lotr.T_CAMPAIGN, lotr.T_QUEST,
+                          lotr.T_ALLY, None):
+            index = discord_bot.get_name_index(data, card_type)
+            assert index.names == _get_all_names(card_type)
+            assert discord_bot.get_name_index(data, card_type) is index
+
+        assert discord_bot.get_name_index(data, lotr.T_ALLY) is (
+            discord_bot.get_name_index(data))
+
+
+def test_unknown_names_depend_on_card_type():
+    data = _get_data(True)
+    text = 'Gandalf attacks the Spiders of Mirkwood.\n\nRadagast heals.'
+    res = {}
+    for card_type in (lotr.T_QUEST, lotr.T_ALLY):
+        discord_bot.get_unknown_names(
+            text, lotr.CARD_TEXT, {lotr.CARD_TYPE: card_type,
+                                   lotr.CARD_NAME: card_type,
+                                   lotr.ROW_COLUMN: 2}, res, data)
+
+    assert [(r['name'], r['text'].split('\n')) for r in res[
+        'Potentially unknown or misspelled names']] == [
+            (lotr.T_QUEST, ['Radagast']),
+            (lotr.T_ALLY, ['Radagast', 'Spiders of Mirkwood'])]
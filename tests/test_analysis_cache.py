@@ -0,0 +1,81 @@
+""" Tests of the set analysis cache of the Discord bot.
+"""
+import asyncio
+import json
+import os
+import re
+from collections import OrderedDict
+
+import pytest
+
+import discord_bot
+import lotr
+
+
+CARDS = [
+    {lotr.CARD_ID: 'card-1', lotr.CARD_SET: 'set-1',
+     lotr.CARD_SET_NAME: 'The Test Set', lotr.CARD_SET_HOB_CODE: 'TTS',
+     lotr.CARD_NAME: 'Hero 1', lotr.CARD_NORMALIZED_NAME: 'hero-1',
+     lotr.ROW_COLUMN: 2},
+    {lotr.CARD_ID: 'card-2', lotr.CARD_SET: 'set-1',
+     lotr.CARD_SET_NAME: 'The Test Set', lotr.CARD_SET_HOB_CODE: 'TTS',
+     lotr.CARD_NAME: 'Hero 2', lotr.CARD_NORMALIZED_NAME: 'hero-2',
+     lotr.CARD_KEYWORDS: 'Sentinel.', lotr.ROW_COLUMN: 3},
+    {lotr.CARD_ID: 'card-3', lotr.CARD_SET: 'set-2',
+     lotr.CARD_SET_NAME: 'Other Set', lotr.CARD_SET_HOB_CODE: 'OS',
+     lotr.CARD_NAME: 'Hero 3', lotr.CARD_NORMALIZED_NAME: 'hero-3',
+     lotr.ROW_COLUMN: 4}]
+FUNCS = (discord_bot.analyze_flavour, discord_bot.analyze_names,
+         discord_bot.analyze_text, discord_bot.analyze_traits)
+
+
+@pytest.fixture
+def analyses(workdir, monkeypatch):
+    """ Save the card data and record the analyses run.
+    """
+    os.makedirs(os.path.dirname(lotr.DISCORD_CARD_DATA_PATH))
+    with open(lotr.DISCORD_CARD_DATA_PATH, 'w', encoding='utf-8') as fobj:
+        json.dump({'data': CARDS, 'traits': [], 'url': 'url'}, fobj)
+
+    monkeypatch.setattr(discord_bot, 'CARD_DATA', {})
+    monkeypatch.setattr(discord_bot, 'ANALYSIS_CACHE', OrderedDict())
+    calls = []
+
+    async def _run_analysis(func, value):
+        calls.append((func.__name__, value))
+        return '{} of {}'.format(func.__name__, value)
+
+    monkeypatch.setattr(discord_bot, 'run_analysis', _run_analysis)
+    return calls
+
+
+def test_set_name_and_hob_code_share_analysis(analyses):
+    async def _run():
+        return [await discord_bot.get_set_analysis(
+            discord_bot.analyze_text, value)
+                for value in ('The Test Set', 'tts', 'Test Set', 'OS')]
+
+    res = asyncio.run(_run())
+    assert res[0] == res[1] == res[2]
+    assert analyses == [('analyze_text', 'The Test Set'),
+                        ('analyze_text', 'OS')]
+
+
+def test_warm_analysis_cache_once_per_set(analyses):
+    asyncio.run(discord_bot.MyClient._warm_analysis_cache(  # pylint: disable=W0212
+        None, ['card-1', 'card-2', 'card-3']))
+    assert sorted(analyses) == sorted(
+        (func.__name__, value) for func in FUNCS
+        for value in ('The Test Set', 'Other Set'))
+
+    del analyses[:]
+    asyncio.run(discord_bot.get_set_analysis(discord_bot.analyze_names,
+                                             'TTS'))
+    assert not analyses
+
+
+def test_keywords_regex_has_common_keywords(analyses):
+    data = asyncio.run(discord_bot.read_card_data())
+    regex = discord_bot.get_keywords_regex(data)
+    for keyword in lotr.COMMON_KEYWORDS | {'Sentinel'}:
+        assert re.search(regex, 'Gains {}.'.format(keyword))
@@ -0,0 +1,51 @@
+""" Tests of the pool of analysis worker processes.
+"""
+import asyncio
+import time
+
+import pytest
+
+import discord_bot
+
+
+def slow_analysis(value, duration):
+    """ Analysis taking the given time.
+    """
+    time.sleep(duration)
+    return value
+
+
+@pytest.fixture
+def analysis_pool(monkeypatch):
+    """ Use a new pool of analysis worker processes.
+    """
+    monkeypatch.setattr(discord_bot, 'ANALYSIS_POOL', {})
+    monkeypatch.setattr(discord_bot, 'analysis_semaphore', asyncio.Semaphore(
+        discord_bot.ANALYSIS_CONCURRENCY))
+    yield discord_bot.ANALYSIS_POOL
+    if 'pool' in discord_bot.ANALYSIS_POOL:
+        discord_bot._terminate_pool(  # pylint: disable=W0212
+            discord_bot.ANALYSIS_POOL['pool'])
+
+
+def test_timeout_fails_only_its_analysis(analysis_pool):
+    async def _run():
+        stuck = asyncio.ensure_future(discord_bot.run_analysis(
+            slow_analysis, 'stuck', 30, timeout=0.5))
+        await asyncio.sleep(0.1)
+        running = asyncio.ensure_future(discord_bot.run_analysis(
+            slow_analysis, 'running', 1.5))
+        with pytest.raises(discord_bot.DiscordError):
+            await stuck
+
+        retired_pool = analysis_pool['retired'][0][0]
+        new = await discord_bot.run_analysis(slow_analysis, 'new', 0)
+        assert analysis_pool['pool'] is not retired_pool
+        assert len(analysis_pool['retired']) == 1
+        assert await running == 'running'
+        assert not analysis_pool['retired']
+        return new
+
+    started = time.time()
+    assert asyncio.run(_run()) == 'new'
+    assert time.time() - started < 10
@@ -0,0 +1,94 @@
+""" Tests of the card data indexes of the Discord bot.
+"""
+import discord_bot
+import lotr
+
+
+def _card(number, name, set_name, hob_code, back_name=None, **kwargs):
+    card = {lotr.CARD_ID: 'card-{}'.format(number), lotr.ROW_COLUMN: number,
+            lotr.CARD_NUMBER: number, lotr.CARD_NAME: name,
+            lotr.CARD_NORMALIZED_NAME: lotr.normalized_name(name),
+            lotr.CARD_SET_NAME: set_name, lotr.CARD_SET_HOB_CODE: hob_code,
+            lotr.CARD_SET_RINGSDB_CODE: 1, lotr.CARD_TYPE: lotr.T_ALLY,
+            lotr.CARD_DISCORD_CHANNEL: 'channel-{}'.format(number % 2)}
+    if back_name:
+        card[lotr.BACK_PREFIX + lotr.CARD_NORMALIZED_NAME] = (
+            lotr.normalized_name(back_name))
+
+    card.update(kwargs)
+    return card
+
+
+CARDS = [
+    _card(1, 'Gandalf', 'ALeP - The Test Set', 'TTS'),
+    _card(2, 'Gandalf the Grey', 'ALeP - The Test Set', 'TTS'),
+    _card(3, 'Grey Wanderer', 'ALeP - The Test Set', 'TTS',
+          back_name='The Grey Havens'),
+    _card(4, 'Grey Grey Grey', 'Other Set', 'OS'),
+    _card(5, 'Rules', 'Other Set', 'OS', **{lotr.CARD_TYPE: lotr.T_RULES})]
+
+
+def _card_match(card_name, card_back_name, search_name):
+    """ Compare a search name with a card name with the string checks used
+    before the name index.
+    """
+    if search_name in {card_name, card_back_name}:
+        return 1
+
+    if (card_name.startswith(search_name + '-') or
+            card_back_name.startswith(search_name + '-')):
+        return 2
+
+    if ('-' + search_name + '-' in card_name or
+            '-' + search_name + '-' in card_back_name):
+        return 3
+
+    if (card_name.endswith('-' + search_name) or
+            card_back_name.endswith('-' + search_name)):
+        return 3
+
+    return 0
+
+
+def _get_data():
+    return {'data': CARDS, 'dict': {c[lotr.CARD_ID]: c for c in CARDS},
+            'index': discord_bot.build_card_index(CARDS)}
+
+
+def test_name_index_matches_string_checks():
+    data = _get_data()
+    for name in ('gandalf', 'grey', 'the', 'the-grey', 'grey-grey',
+                 'grey-havens', 'gandalf-the-grey', 'wanderer', 'gan',
+                 'rules'):
+        expected = [(card, _card_match(
+            card[lotr.CARD_NORMALIZED_NAME],
+            card.get(lotr.BACK_PREFIX + lotr.CARD_NORMALIZED_NAME, ''),
+            name)) for card in CARDS]
+        assert sorted(data['index']['name'].get(name, []),
+                      key=lambda m: m[0][lotr.ROW_COLUMN]) == [
+                          m for m in expected if m[1]]
+
+
+def test_find_card_matches():
+    data = _get_data()
+    matches, num = discord_bot.find_card_matches(data, 'Grey n:2')
+    assert num == 2
+    assert [(card[lotr.CARD_NAME], value) for card, value in matches] == [
+        ('Grey Wanderer', 2), ('Grey Grey Grey', 2), ('Gandalf the Grey', 3)]
+    assert [card[lotr.CARD_NAME] for card, _ in discord_bot.find_card_matches(
+        data, 'grey s:OS')[0]] == ['Grey Grey Grey']
+    assert [card[lotr.ROW_COLUMN] for card, _ in discord_bot.find_card_matches(
+        data, 'channel-1', this=True)[0]] == [1, 3, 5]
+    assert discord_bot.find_card_matches(data, '4')[0] == [(CARDS[3], 1)]
+
+
+def test_get_set_cards():
+    data = _get_data()
+    assert discord_bot.get_set_cards(data, 'The Test Set') == CARDS[:3]
+    assert discord_bot.get_set_cards(data, 'Test Set') == CARDS[:3]
+    assert discord_bot.get_set_cards(data, 'os') == CARDS[3:]
+    assert discord_bot.get_set_cards(
+        data, 'Other Set',
+        lambda card: card[lotr.CARD_TYPE] == lotr.T_RULES) == CARDS[4:]
+    assert not discord_bot.get_set_cards(
+        data, 'Test Set', lambda card: card[lotr.CARD_TYPE] == lotr.T_RULES)
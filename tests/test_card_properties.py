@@ -0,0 +1,59 @@
+""" Tests of the property view of card XML elements.
+"""
+import xml.etree.ElementTree as ET
+
+import lotr
+
+
+CARD = """<card id="card-1" name="Hero 1">
+  <property name="Type" value="Hero" />
+  <property name="Traits" value="Dwarf." />
+  <property name="Traits" value="Warrior." />
+  <property name="Unique" value="" />
+  <alternate name="Side A" type="A">
+    <property name="Type" value="Quest" />
+  </alternate>
+  <alternate name="Side B" type="B">
+    <property name="Type" value="Location" />
+  </alternate>
+</card>"""
+
+
+def _find_properties(parent, name):
+    return [p for p in parent
+            if p.tag == 'property' and p.attrib.get('name') == name]
+
+
+def test_lookups_match_linear_scan():
+    card = ET.fromstring(CARD)
+    properties = lotr.CardProperties(card)
+    for name in ('Type', 'Traits', 'Unique', 'Sphere'):
+        assert properties.find(name) == _find_properties(card, name)
+        assert (name in properties) == bool(_find_properties(card, name))
+
+    assert properties.get('Traits') == 'Dwarf.'
+    assert properties.get('Unique') == ''
+    assert properties.get('Sphere') is None
+    assert properties.get('Sphere', 'Neutral') == 'Neutral'
+    assert properties.alternate.attrib['name'] == 'Side B'
+    assert lotr.CardProperties(properties.alternate).get('Type') == (
+        'Location')
+    assert lotr.CardProperties(None).get('Type') is None
+
+
+def test_updates_are_written_to_the_tree():
+    card = ET.fromstring(CARD)
+    properties = lotr.CardProperties(card)
+    assert properties.get_property('Type') is _find_properties(
+        card, 'Type')[0]
+
+    properties.set('Traits', 'Noble.')
+    properties.set('Artwork', 'artwork.jpg', tail='\n')
+    assert [p.attrib['value'] for p in _find_properties(card, 'Traits')] == [
+        'Noble.', 'Warrior.']
+    artwork = _find_properties(card, 'Artwork')
+    assert len(artwork) == 1
+    assert artwork[0].attrib['value'] == 'artwork.jpg'
+    assert artwork[0].tail == '\n'
+    assert properties.get_property('Artwork') is artwork[0]
+    assert lotr.CardProperties(card).get('Artwork') == 'artwork.jpg'
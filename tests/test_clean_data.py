@@ -0,0 +1,51 @@
+""" Tests of the spreadsheet data cleaning.
+"""
+import copy
+
+from conftest import make_card_rows, make_card_sheet
+import benchmark_clean_data
+import lotr
+
+
+def _clean(lang):
+    data = lotr._transform_to_dict(  # pylint: disable=W0212
+        make_card_sheet(make_card_rows(50)))
+    for row in data:
+        row[lotr.CARD_SCRATCH] = None
+
+    conf = {'ignore_ignore_flags': False, 'output_languages': [lang]}
+    lotr._extract_all_card_names(data, lang)  # pylint: disable=W0212
+    lotr._clean_data(conf, data, lang)  # pylint: disable=W0212
+    return data, copy.deepcopy(lotr.PRE_SANITY_CHECK)
+
+
+def test_precompiled_patterns_match_baseline():
+    """ Precompiled patterns give the same cleaned data and pre sanity check
+    errors as patterns compiled on every call.
+    """
+    for lang in (lotr.L_ENGLISH, lotr.L_FRENCH):
+        for errors in lotr.PRE_SANITY_CHECK.values():
+            errors.clear()
+
+        with benchmark_clean_data.uncompiled_patterns():
+            expected = _clean(lang)
+
+        for errors in lotr.PRE_SANITY_CHECK.values():
+            errors.clear()
+
+        assert _clean(lang) == expected
+
+
+def test_clean_data_normalizes_text():
+    """ Quotes, dashes and tags are normalized and hardcoded card names are
+    reported.
+    """
+    for errors in lotr.PRE_SANITY_CHECK.values():
+        errors.clear()
+
+    data, pre_sanity_check = _clean(lotr.L_ENGLISH)
+    assert data[0][lotr.CARD_TEXT] == (
+        'Action: Exhaust Hero 0 to ready a hero. “Quoted” –2 [threat] '
+        '[bi]Condition[/bi] and Hero 1 attachment.\n\nForced: After Hero 0X '
+        'is discarded, Setup (x): deal 1 damage.')
+    assert pre_sanity_check['name']
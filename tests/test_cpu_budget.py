@@ -0,0 +1,81 @@
+""" Tests of sharding image batches within the shared CPU budget.
+"""
+import os
+import threading
+import time
+
+import pytest
+
+import lotr
+
+
+CONF = {'parallelism': 4}
+
+
+@pytest.fixture
+def batch(workdir, monkeypatch):
+    """ Make a folder of input files and a CPU budget with one slot taken
+    by the running task.
+    """
+    semaphore = threading.BoundedSemaphore(CONF['parallelism'])
+    monkeypatch.setattr(lotr, 'CPU_BUDGET', {'semaphore': semaphore})
+    assert lotr.acquire_cpu_slots(CONF, 1, block=True) == 1
+    input_path = str(workdir / 'images')
+    os.mkdir(input_path)
+    filenames = ['{:03d}.png'.format(i) for i in range(45)]
+    for filename in filenames:
+        with open(os.path.join(input_path, filename), 'w') as fobj:
+            fobj.write(filename)
+
+    return input_path, filenames, semaphore
+
+
+def _convert(calls, lock):
+    """ Fake backend writing an output next to each input.
+    """
+    def _run(path):
+        with lock:
+            calls.append((path, sorted(os.listdir(path))))
+
+        time.sleep(0.2)
+        for filename in os.listdir(path):
+            os.rename(os.path.join(path, filename),
+                      os.path.join(path, filename.replace('.png', '.jpg')))
+
+    return _run
+
+
+def test_batch_is_sharded_within_budget(batch):
+    input_path, filenames, semaphore = batch
+    calls = []
+    started = time.time()
+    lotr._run_sharded(CONF, input_path, filenames,  # pylint: disable=W0212
+                      _convert(calls, threading.Lock()))
+    assert time.time() - started < 0.5
+    assert len(calls) == CONF['parallelism']
+    assert sorted(f for _, files in calls for f in files) == filenames
+    assert min(len(files) for _, files in calls) >= 11
+    assert sorted(os.listdir(input_path)) == [
+        f.replace('.png', '.jpg') for f in filenames]
+    assert not [f for f in os.listdir(os.path.dirname(input_path))
+                if '.shard' in f]
+    assert lotr.acquire_cpu_slots(CONF, 4) == 3
+    assert not semaphore.acquire(False)
+
+
+def test_batch_is_not_sharded_without_spare_slots(batch):
+    input_path, filenames, _ = batch
+    assert lotr.acquire_cpu_slots(CONF, 3) == 3
+    calls = []
+    lotr._run_sharded(CONF, input_path, filenames,  # pylint: disable=W0212
+                      _convert(calls, threading.Lock()))
+    assert calls == [(input_path, filenames)]
+
+
+def test_small_batch_is_not_sharded(batch):
+    input_path, filenames, _ = batch
+    calls = []
+    lotr._run_sharded(CONF, input_path, filenames[:19],  # pylint: disable=W0212
+                      _convert(calls, threading.Lock()))
+    assert len(calls) == 1
+    assert lotr.acquire_cpu_slots(CONF, 4) == 3
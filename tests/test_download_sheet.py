@@ -0,0 +1,115 @@
+""" Tests of downloading the cards spreadsheet.
+"""
+import csv
+import hashlib
+from io import StringIO
+import json
+import os
+import threading
+
+import pytest
+
+import lotr
+
+
+SHEET_GIDS = {lotr.SET_SHEET: '1', lotr.CARD_SHEET: '2',
+              lotr.SCRATCH_SHEET: '3', 'French': '4'}
+CONF = {'languages': [lotr.L_ENGLISH, 'French'], 'offline_mode': False,
+        'sheet_gdid': 'gdid'}
+
+
+@pytest.fixture
+def downloads(workdir, monkeypatch):
+    """ Serve the sheets of a fake spreadsheet and record the requests.  The
+    sheet requests wait for each other, so they have to run concurrently.
+    """
+    os.makedirs(lotr.DOWNLOAD_PATH)
+    monkeypatch.setattr(lotr, 'SHEET_IDS', {})
+    monkeypatch.setattr(lotr, 'SHEET_CHECKSUMS', {})
+    monkeypatch.setattr(lotr, 'JSON_CACHE', {})
+    contents = {gid: 'Name,Value,,Ignored\r\n{},{},,x\r\n'.format(
+        sheet, gid).encode('utf-8') for sheet, gid in SHEET_GIDS.items()}
+    requests = []
+    barrier = threading.Barrier(len(SHEET_GIDS), timeout=10)
+
+    def _get_content(url, custom_timeout=None, session=None):  # pylint: disable=W0613
+        requests.append((url, session, threading.get_ident()))
+        if url.endswith('format=csv'):
+            return ''.join('{},{}\r\n'.format(sheet, gid) for sheet, gid
+                           in SHEET_GIDS.items()).encode('utf-8')
+
+        barrier.wait()
+        return contents[url.split('gid=')[-1]]
+
+    monkeypatch.setattr(lotr, 'get_content', _get_content)
+    return requests, contents
+
+
+def test_sheets_are_downloaded_concurrently(downloads):
+    requests, _ = downloads
+    assert lotr.download_sheet(CONF)
+    assert len(requests) == len(SHEET_GIDS) + 1
+    assert len({session for _, session, _ in requests}) == 1
+    assert requests[0][1] is not None
+    assert len({thread for _, _, thread in requests[1:]}) == len(SHEET_GIDS)
+    for sheet in SHEET_GIDS:
+        assert lotr.JSON_CACHE[sheet] == [['Name', 'Value'],
+                                          [sheet, int(SHEET_GIDS[sheet])]]
+
+
+def test_unchanged_sheets_are_not_saved(downloads):
+    requests, contents = downloads
+    assert lotr.download_sheet(CONF)
+    path = os.path.join(lotr.DOWNLOAD_PATH, '{}.json'.format(lotr.CARD_SHEET))
+    mtime = os.path.getmtime(path)
+    os.utime(path, (mtime - 100, mtime - 100))
+
+    del requests[:]
+    assert not lotr.download_sheet(CONF)
+    assert len(requests) == len(SHEET_GIDS)
+    assert os.path.getmtime(path) == mtime - 100
+
+    contents['2'] += b'Other,5,,\r\n'
+    assert lotr.download_sheet(CONF)
+    assert os.path.getmtime(path) != mtime - 100
+
+
+def test_sheet_error(downloads):
+    _, contents = downloads
+    contents['4'] = b'<html>Sign in</html>'
+    with pytest.raises(lotr.SheetError):
+        lotr.download_sheet(CONF)
+
+
+def _baseline_normalize_sheet(content):
+    """ Normalize a sheet the way it was done with a full copy of its rows.
+    """
+    data = list(csv.reader(StringIO(content.decode('utf-8'))))
+    none_index = data[0].index('') if '' in data[0] else len(data[0])
+    data = [[lotr._fix_csv_value(v)  # pylint: disable=W0212
+             for v in row[:none_index]] for row in data]
+    while data and not any(data[-1]):
+        data.pop()
+
+    return data, hashlib.md5(json.dumps(data).encode('utf-8')).hexdigest()
+
+
+@pytest.mark.parametrize('content', [
+    b'Name,Value,,Ignored\r\nA,1,,x\r\n,,,\r\nB,FALSE,,\r\n,,y,\r\n,,,\r\n',
+    'Name,Text\r\n"\xc9owyn","Line 1\nLine 2, ""quoted"""\r\n'
+    .encode('utf-8'),
+    b'Name,Value\r\n,\r\n',
+    b'Name,Value',
+])
+def test_normalize_sheet_matches_baseline(workdir, content):  # pylint: disable=W0613
+    res = lotr._normalize_sheet('Sheet', content)  # pylint: disable=W0212
+    assert res == _baseline_normalize_sheet(content)
+
+    lotr._write_sheet_json('Sheet.json', res[0])  # pylint: disable=W0212
+    with open('Sheet.json', 'r', encoding='utf-8') as fobj:
+        assert fobj.read() == json.dumps(res[0])
+
+
+def test_normalize_empty_sheet():
+    with pytest.raises(lotr.SheetError):
+        lotr._normalize_sheet('Sheet', b'')  # pylint: disable=W0212
@@ -0,0 +1,77 @@
+""" Tests of skipping unchanged images uploaded to DragnCards.
+"""
+from paramiko import SFTPAttributes
+
+import lotr
+
+
+REMOTE_FOLDER = '/remote/images'
+
+
+class FakeSFTPClient:
+    """ SFTP client with an in-memory remote folder.
+    """
+
+    def __init__(self, files):
+        self.files = files
+
+    def listdir_attr(self, path):
+        """ List the remote folder.
+        """
+        if path != REMOTE_FOLDER:
+            raise IOError('No such file')
+
+        result = []
+        for filename, (size, mtime) in self.files.items():
+            attr = SFTPAttributes()
+            attr.filename = filename
+            attr.st_size = size
+            attr.st_mtime = mtime
+            result.append(attr)
+
+        return result
+
+
+def _get_changed(manifest, files):
+    remote_images = lotr._list_remote_dragncards_images(  # pylint: disable=W0212
+        FakeSFTPClient(files), REMOTE_FOLDER)
+    return lotr._get_changed_dragncards_images(  # pylint: disable=W0212
+        [('a.jpg', 'aaa', 10), ('b.jpg', 'bbb', 20)], manifest,
+        remote_images)
+
+
+MANIFEST = {'a.jpg': {'checksum': 'aaa', 'size': 10, 'mtime': 100},
+            'b.jpg': {'checksum': 'bbb', 'size': 20, 'mtime': 200}}
+
+
+def test_unchanged_images_are_skipped():
+    assert _get_changed(MANIFEST, {'a.jpg': (10, 100), 'b.jpg': (20, 200),
+                                   'c.jpg': (30, 300)}) == ([], 30)
+
+
+def test_changed_images_are_uploaded():
+    manifest = dict(MANIFEST, **{'b.jpg': {'checksum': 'old', 'size': 20,
+                                           'mtime': 200}})
+    assert _get_changed(manifest, {'a.jpg': (10, 100), 'b.jpg': (20, 200)}
+                        ) == (['b.jpg'], 10)
+
+
+def test_missing_remote_images_are_uploaded():
+    assert _get_changed(MANIFEST, {'a.jpg': (10, 100)}) == (['b.jpg'], 10)
+
+
+def test_different_remote_images_are_uploaded():
+    assert _get_changed(MANIFEST, {'a.jpg': (11, 100), 'b.jpg': (20, 201)}
+                        ) == (['a.jpg', 'b.jpg'], 0)
+
+
+def test_missing_remote_folder():
+    assert lotr._list_remote_dragncards_images(  # pylint: disable=W0212
+        FakeSFTPClient({}), '/other') == {}
+    assert _get_changed(MANIFEST, {}) == (['a.jpg', 'b.jpg'], 0)
+
+
+def test_old_manifest_entries_are_uploaded():
+    assert _get_changed({'a.jpg': 'aaa', 'b.jpg': 'bbb'},
+                        {'a.jpg': (10, 100), 'b.jpg': (20, 200)}
+                        ) == (['a.jpg', 'b.jpg'], 0)
@@ -0,0 +1,103 @@
+""" Tests of loading cards from external XML files.
+"""
+import os
+
+import pytest
+
+import lotr
+
+
+URL = 'https://example.com/Set.xml'
+XML = """<?xml version="1.0" encoding="utf-8"?>
+<set name="{}" id="set-id">
+  <cards>
+    <card id="card-1" name="Hero 1">
+      <property name="Type" value="Hero" />
+      <property name="Quantity" value="1" />
+      <property name="Sphere" value="Leadership" />
+      <property name="Unique" value="" />
+      <property name="Cost" value="10" />
+      <property name="Card Number" value="1" />
+    </card>
+    <card id="card-2" name="Enemy 2" size="EncounterCard">
+      <property name="Type" value="Enemy" />
+      <property name="Quantity" value="2" />
+      <property name="Traits" value="Ship." />
+      <property name="Encounter Set" value="Encounter 1" />
+    </card>
+    <card id="card-3" name="Location 3" size="EncounterCard">
+      <property name="Type" value="Location" />
+      <property name="Quantity" value="3" />
+      <property name="Encounter Set" value="Encounter 2" />
+    </card>
+  </cards>
+</set>
+"""
+
+
+@pytest.fixture
+def external_xml(workdir, monkeypatch):
+    """ Save an external XML file to the URL cache and record the parsed
+    files.
+    """
+    os.makedirs(lotr.URL_CACHE_PATH)
+    lotr._save_content(  # pylint: disable=W0212
+        URL, XML.format('The Set').encode('utf-8'), 'xml')
+    for name in ('EXTERNAL_CARD_DICT', 'EXTERNAL_XML_CACHE',
+                 'EXTERNAL_XML_INDEX'):
+        monkeypatch.setattr(lotr, name, {})
+
+    parsed = []
+    parse_external_xml = lotr._parse_external_xml  # pylint: disable=W0212
+
+    def _parse_external_xml(root):
+        parsed.append(root.attrib['name'])
+        return parse_external_xml(root)
+
+    monkeypatch.setattr(lotr, '_parse_external_xml', _parse_external_xml)
+    monkeypatch.setattr(lotr, 'get_content', None)
+    return parsed
+
+
+def _restart():
+    for cache in (lotr.EXTERNAL_CARD_DICT, lotr.EXTERNAL_XML_CACHE,
+                  lotr.EXTERNAL_XML_INDEX):
+        cache.clear()
+
+
+def test_load_external_xml(external_xml):
+    cards = lotr.load_external_xml(URL)
+    assert [card[lotr.CARD_ID] for card in cards] == [
+        'card-1', 'card-2', 'card-3']
+    assert cards[0][lotr.CARD_BACK] == lotr.B_PLAYER
+    assert cards[0][lotr.CARD_UNIQUE] == 1
+    assert cards[0][lotr.CARD_COST] == 10
+    assert cards[1][lotr.CARD_TYPE] == lotr.T_SHIP_ENEMY
+    assert cards[1][lotr.CARD_SET_NAME] == 'the set'
+
+    assert [card[lotr.CARD_ID] for card in lotr.load_external_xml(
+        URL, sets={'the set'}, encounter_sets={'encounter 2'})] == [
+            'card-1', 'card-3']
+    assert not lotr.load_external_xml(URL, sets={'other set'})
+    assert external_xml == ['The Set']
+
+    cards[0][lotr.CARD_NAME] = 'Changed'
+    assert lotr.load_external_xml(URL)[0][lotr.CARD_NAME] == 'Hero 1'
+    assert lotr.get_external_card_dict()['card-2'][lotr.CARD_QUANTITY] == 2
+    assert external_xml == ['The Set']
+
+
+def test_parsed_files_are_persisted(external_xml):
+    expected = lotr.load_external_xml(URL)
+    assert os.path.exists(lotr.EXTERNAL_XML_CACHE_PATH)
+
+    _restart()
+    assert lotr.load_external_xml(URL) == expected
+    assert external_xml == ['The Set']
+
+    lotr._save_content(  # pylint: disable=W0212
+        URL, XML.format('Other Set').encode('utf-8'), 'xml')
+    _restart()
+    assert lotr.get_external_card_dict()['card-1'][lotr.CARD_SET_NAME] == (
+        'other set')
+    assert external_xml == ['The Set', 'Other Set']
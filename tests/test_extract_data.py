@@ -0,0 +1,120 @@
+""" Tests of extracting data from the spreadsheet.
+"""
+import copy
+import json
+import os
+
+import pytest
+
+from conftest import make_card_rows, make_card_sheet
+import lotr
+
+
+CONF = {'languages': [lotr.L_ENGLISH, lotr.L_FRENCH],
+        'output_languages': [lotr.L_ENGLISH, lotr.L_FRENCH],
+        'ignore_ignore_flags': False, 'selected_only': False,
+        'incremental_extraction': True}
+
+
+def _save_sheet(sheet, rows):
+    path = os.path.join(lotr.DOWNLOAD_PATH, '{}.json'.format(sheet))
+    with open(path, 'w', encoding='utf-8') as fobj:
+        json.dump(make_card_sheet(rows), fobj)
+
+
+@pytest.fixture
+def sheets(workdir, monkeypatch):
+    """ Save the card and translation sheets and record the cleaned
+    languages.
+    """
+    os.makedirs(lotr.DOWNLOAD_PATH)
+    monkeypatch.setattr(lotr, 'JSON_CACHE', {})
+    monkeypatch.setattr(lotr, 'SHEET_CHECKSUMS', {})
+    rows = make_card_rows(30)
+    _save_sheet(lotr.CARD_SHEET, rows)
+    _save_sheet(lotr.L_FRENCH, rows)
+    cleaned = []
+    clean_data = lotr._clean_data  # pylint: disable=W0212
+
+    def _clean_data(conf, data, lang):
+        cleaned.append(lang)
+        clean_data(conf, data, lang)
+
+    monkeypatch.setattr(lotr, '_clean_data', _clean_data)
+    return rows, cleaned
+
+
+def _extract(conf):
+    lotr.JSON_CACHE.clear()
+    lotr.extract_data(conf)
+    return (copy.deepcopy(lotr.DATA), copy.deepcopy(lotr.TRANSLATIONS),
+            copy.deepcopy(lotr.PRE_SANITY_CHECK), set(lotr.ALL_NAMES),
+            set(lotr.ALL_TRAITS))
+
+
+def test_unchanged_sheets_are_not_cleaned_again(sheets):
+    _, cleaned = sheets
+    expected = _extract(dict(CONF, incremental_extraction=False))
+    assert not os.path.exists(lotr.EXTRACT_CACHE_PATH)
+
+    del cleaned[:]
+    assert _extract(CONF) == expected
+    assert cleaned == [lotr.L_ENGLISH, lotr.L_FRENCH]
+
+    del cleaned[:]
+    assert _extract(CONF) == expected
+    assert not cleaned
+
+
+def test_changed_sheets_are_cleaned_again(sheets):
+    rows, cleaned = sheets
+    _extract(CONF)
+
+    rows[0][lotr.CARD_TEXT] = 'Response: Draw 1 card.'
+    _save_sheet(lotr.L_FRENCH, rows)
+    del cleaned[:]
+    res = _extract(CONF)
+    assert cleaned == [lotr.L_FRENCH]
+    assert res[1][lotr.L_FRENCH][rows[0][lotr.CARD_ID]][lotr.CARD_TEXT] == (
+        'Response: Draw 1 card.')
+
+    _save_sheet(lotr.CARD_SHEET, rows)
+    del cleaned[:]
+    expected = _extract(dict(CONF, incremental_extraction=False))
+    del cleaned[:]
+    assert _extract(CONF) == expected
+    assert cleaned == [lotr.L_ENGLISH]
+
+
+def test_data_index_matches_linear_scan(sheets):
+    rows, _ = sheets
+    for i, row in enumerate(rows[:12]):
+        row[lotr.CARD_ENCOUNTER_SET] = ('Encounter' if i % 2
+                                        else 'ENCOUNTER')
+
+    rows[3][lotr.CARD_NAME] = 'Héros 3'
+    _save_sheet(lotr.L_FRENCH, rows)
+    rows[3][lotr.CARD_NAME] = 'Hero 3'
+    _save_sheet(lotr.CARD_SHEET, rows)
+    _extract(CONF)
+    for set_id in ('set-0', 'set-1', 'unknown'):
+        assert lotr.get_set_data(set_id) == [
+            row for row in lotr.DATA if row[lotr.CARD_SET] == set_id]
+        for lang in (lotr.L_ENGLISH, lotr.L_FRENCH):
+            assert lotr.get_translated_set_data(set_id, lang) == [
+                dict(row, **{key: lotr.TRANSLATIONS[lang][
+                    row[lotr.CARD_ID]][key] if lang != lotr.L_ENGLISH
+                             else row[key]
+                             for key in lotr.TRANSLATED_COLUMNS})
+                for row in lotr.get_set_data(set_id)]
+
+    assert lotr.translated_data('set-0', lotr.L_FRENCH)[1][
+        lotr.CARD_NAME] == 'Héros 3'
+    assert lotr.get_encounter_set_data('encounter') == [
+        row for row in lotr.DATA if row[lotr.CARD_ENCOUNTER_SET]]
+    assert len(lotr.get_encounter_set_data('Encounter')) == 12
+    assert lotr.get_card_row(rows[5][lotr.CARD_ID]) is [
+        row for row in lotr.DATA
+        if row[lotr.CARD_ID] == rows[5][lotr.CARD_ID]][0]
+    assert lotr._sort_data_rows(  # pylint: disable=W0212
+        list(reversed(lotr.DATA))) == lotr.DATA
@@ -0,0 +1,70 @@
+""" Tests of generating the per-set outputs in run_before_se.
+"""
+import json
+import os
+import sqlite3
+import time
+
+import pytest
+
+import lotr
+import run_before_se
+
+
+SETS = [('set-{}'.format(i), 'Set {}'.format(i)) for i in range(5)]
+
+
+def fake_set_outputs(conf, set_id, set_name):
+    """ Return the set cards seen by the process, the process ID and the
+    outputs flags.
+    """
+    time.sleep(0.1)
+    lotr.timed_step(lotr.get_set_data, set_id)
+    return ([row[lotr.CARD_NAME] for row in lotr.get_set_data(set_id)],
+            os.getpid(), conf['octgn_set_xml'], set_name)
+
+
+@pytest.fixture
+def card_data(workdir, monkeypatch):
+    """ Use a few cards per set and a fake per-set generation.
+    """
+    monkeypatch.setattr(lotr, 'TIMINGS', {})
+    monkeypatch.setattr(lotr, 'DATA', [
+        {lotr.CARD_SET: set_id, lotr.CARD_NAME: '{} {}'.format(set_name, i),
+         lotr.CARD_ID: '{}-{}'.format(set_id, i),
+         lotr.CARD_ENCOUNTER_SET: None}
+        for set_id, set_name in SETS for i in range(3)])
+    monkeypatch.setattr(lotr, 'DATA_INDEX', {})
+    monkeypatch.setattr(run_before_se, 'generate_set_outputs',
+                        fake_set_outputs)
+    lotr.start_timings('run_before_se')
+    return {'parallelism': 1, 'octgn_set_xml': True}
+
+
+def test_sets_are_generated_in_parallel(card_data):
+    lotr.timed_step(lotr.get_set_data, 'set-0')
+    start_deps = lotr.get_step_deps()
+    expected = run_before_se.generate_outputs(card_data, SETS)
+    assert [res[0] for res in expected] == [
+        ['{} {}'.format(set_name, i) for i in range(3)]
+        for _, set_name in SETS]
+    assert {res[1] for res in expected} == {os.getpid()}
+    assert len(lotr.get_step_deps()) == len(SETS)
+
+    lotr.set_step_deps(start_deps)
+    res = run_before_se.generate_outputs(dict(card_data, parallelism=3),
+                                         SETS)
+    assert [r[:1] + r[2:] for r in res] == [r[:1] + r[2:] for r in expected]
+    assert len({r[1] for r in res}) > 1
+    assert os.getpid() not in {r[1] for r in res}
+    assert len(lotr.get_step_deps()) == len(SETS)
+
+    connection = sqlite3.connect(lotr.TIMINGS_PATH)
+    try:
+        deps = [json.loads(row[0]) for row in connection.execute(
+            'SELECT deps FROM timings ORDER BY started')]
+    finally:
+        connection.close()
+
+    assert len(deps) == 2 * len(SETS) + 1
+    assert deps[1:] == [start_deps] * 2 * len(SETS)
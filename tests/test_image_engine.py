@@ -0,0 +1,162 @@
+""" Tests of the Pillow image engine against the geometry of the GIMP
+procedures in GIMP/scripts.py.
+"""
+import math
+import os
+
+import pytest
+
+import lotr
+
+Image = pytest.importorskip('PIL.Image')
+ImageDraw = pytest.importorskip('PIL.ImageDraw')
+
+
+RED = (255, 0, 0)
+WHITE = (255, 255, 255)
+BLUE = (0, 0, 255)
+MARKER_SIZE = 8
+
+# procedure: (clip size table, rotation of landscape images)
+PROCEDURES = {
+    'python-cut-bleed-margins-folder': (lotr.IMAGE_BLEED_MARGIN_SIZES, False),
+    'python-prepare-pdf-front-folder': (lotr.IMAGE_PDF_CLIP_SIZES, True),
+    'python-prepare-pdf-back-folder': (lotr.IMAGE_PDF_CLIP_SIZES, True),
+    'python-prepare-drivethrucards-jpg-folder': (lotr.IMAGE_DTC_CLIP_SIZES,
+                                                 True),
+    'python-prepare-mbprint-jpg-folder': ({}, True),
+    'python-prepare-generic-png-folder': ({}, True)}
+
+
+def _get_cases():
+    cases = []
+    for procedure, (table, rotation) in sorted(PROCEDURES.items()):
+        sizes = sorted(table) or sorted(lotr.IMAGE_ROTATION_SIZES)[:3]
+        for width, height in sizes:
+            orientations = [(width, height)]
+            if rotation:
+                orientations.append((height, width))
+
+            for size in orientations:
+                for back_side in (False, True):
+                    if (procedure == 'python-prepare-pdf-front-folder' and
+                            back_side):
+                        continue
+
+                    if (procedure == 'python-prepare-pdf-back-folder' and
+                            not back_side):
+                        continue
+
+                    cases.append(pytest.param(
+                        procedure, size, back_side, id='{}-{}x{}-{}'.format(
+                            procedure, size[0], size[1],
+                            'back' if back_side else 'front')))
+
+    return cases
+
+
+def _get_source_pixel(output_pixel, size, rotated, back_side, offset):
+    """ Get the source pixel of an output pixel: GIMP rotates front sides by
+    270 and back sides by 90 degrees clockwise, then clips the image.
+    """
+    width, height = size
+    x, y = output_pixel[0] + offset, output_pixel[1] + offset
+    if not rotated:
+        return x, y
+
+    if back_side:
+        return y, height - 1 - x
+
+    return width - 1 - y, x
+
+
+def _get_source_box(corner1, corner2, size, rotated, back_side, offset):
+    points = [_get_source_pixel(c, size, rotated, back_side, offset)
+              for c in (corner1, corner2)]
+    return (min(p[0] for p in points), min(p[1] for p in points),
+            max(p[0] for p in points), max(p[1] for p in points))
+
+
+def test_all_procedures_covered():
+    """ Every engine procedure has a geometry test.
+    """
+    assert set(PROCEDURES) == lotr.IMAGE_ENGINE_PROCEDURES
+
+
+@pytest.mark.parametrize('procedure,size,back_side', _get_cases())
+def test_engine_geometry(tmp_path, procedure, size, back_side):
+    """ The output has the size, orientation and clipped region of the GIMP
+    procedure.
+    """
+    table, rotation = PROCEDURES[procedure]
+    width, height = size
+    rotated = rotation and (height, width) in lotr.IMAGE_ROTATION_SIZES
+    clip_size = table.get(size, table.get((height, width), 0))
+    offset = (math.floor(clip_size) if rotated and back_side
+              else math.ceil(clip_size))
+    if rotated:
+        output_size = (int(height - 2 * clip_size),
+                       int(width - 2 * clip_size))
+    else:
+        output_size = (int(width - 2 * clip_size),
+                       int(height - 2 * clip_size))
+
+    img = Image.new('RGB', size, RED)
+    draw = ImageDraw.Draw(img)
+    draw.rectangle(_get_source_box(
+        (0, 0), (output_size[0] - 1, output_size[1] - 1), size, rotated,
+        back_side, offset), fill=WHITE)
+    draw.rectangle(_get_source_box(
+        (0, 0), (MARKER_SIZE - 1, MARKER_SIZE - 1), size, rotated, back_side,
+        offset), fill=BLUE)
+
+    name = 'card-2' if back_side else 'card-1'
+    input_folder = tmp_path / 'input'
+    output_folder = tmp_path / 'output'
+    input_folder.mkdir()
+    output_folder.mkdir()
+    img.save(str(input_folder / '{}.png'.format(name)), dpi=(300, 300),
+             compress_level=1)
+
+    lotr._transform_image(  # pylint: disable=W0212
+        procedure, str(input_folder / '{}.png'.format(name)),
+        str(output_folder))
+
+    file_type = ('jpg' if procedure in lotr.IMAGE_ENGINE_JPG_PROCEDURES
+                 else 'png')
+    assert os.listdir(str(output_folder)) == ['{}.{}'.format(name, file_type)]
+    with Image.open(str(output_folder / '{}.{}'.format(name, file_type))
+                    ) as output:
+        assert output.size == output_size
+        assert round(output.info['dpi'][0]) == 300
+        output = output.convert('RGB')
+        if file_type == 'png':
+            assert output.getpixel((0, 0)) == BLUE
+            assert output.getpixel((MARKER_SIZE - 1, MARKER_SIZE - 1)) == BLUE
+            assert output.getpixel((MARKER_SIZE, MARKER_SIZE)) == WHITE
+            assert RED not in [c for _, c in output.getcolors(output_size[0] *
+                                                              output_size[1])]
+        else:
+            red, green, blue = output.getpixel((1, 1))
+            assert blue > 200 and red < 60 and green < 60
+            edges = [(x, y) for x in (0, output_size[0] - 1)
+                     for y in range(MARKER_SIZE * 2, output_size[1], 97)]
+            edges.extend((x, y) for y in (0, output_size[1] - 1)
+                         for x in range(MARKER_SIZE * 2, output_size[0], 97))
+            assert min(output.getpixel(p)[1] for p in edges) > 200
+
+
+def test_pdf_procedures_skip_wrong_side(tmp_path):
+    """ PDF front and back procedures skip images of the other side.
+    """
+    Image.new('RGB', (826, 1126), WHITE).save(str(tmp_path / 'card-2.png'))
+    Image.new('RGB', (826, 1126), WHITE).save(str(tmp_path / 'card-1.png'))
+    output_folder = tmp_path / 'output'
+    output_folder.mkdir()
+    lotr._transform_image(  # pylint: disable=W0212
+        'python-prepare-pdf-front-folder', str(tmp_path / 'card-2.png'),
+        str(output_folder))
+    lotr._transform_image(  # pylint: disable=W0212
+        'python-prepare-pdf-back-folder', str(tmp_path / 'card-1.png'),
+        str(output_folder))
+    assert not os.listdir(str(output_folder))
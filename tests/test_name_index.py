@@ -0,0 +1,59 @@
+""" Tests of the index of known card names.
+"""
+import re
+
+import lotr
+
+
+NAMES = ['Gandalf', 'Gandalf the Grey', 'Grey', 'Aragorn', 'Arwen',
+         'Sam', 'Samwise', 'Took', 'Pippin Took', 'Bill the Pony',
+         'Mount Doom', 'Doom', 'Éowyn', 'Snow-bourn', '"Lucky" Sam',
+         'A-1', '-1 Hit Point', '']
+TEXTS = [
+    'Action: Exhaust Gandalf the Grey to ready Aragorn.',
+    'Samwise and Sam carry Bill the Pony to Mount Doom.',
+    'Samsonite, Gandalfs and Arwens are not names. Tooky is not Took.',
+    'Éowyn rides to Snow-bourn with "Lucky" Sam.',
+    'Response: Deal -1 Hit Point to A-1 and A-10.',
+    'Nothing to see here.',
+    '']
+
+
+def _baseline_find_names(text):
+    return {name for name in NAMES
+            if name and re.search(lotr.get_regex(name), text)}
+
+
+def test_find_names_matches_regex():
+    index = lotr.NameIndex(NAMES)
+    for text in TEXTS:
+        assert index.find_names(text) == _baseline_find_names(text)
+
+
+def test_replace_names():
+    index = lotr.NameIndex(NAMES)
+    assert index.replace(TEXTS[0], 'Name') == (
+        'Action: Exhaust Name to ready Name.')
+    assert index.replace(TEXTS[1], 'Name') == (
+        'Name and Name carry Name to Name.')
+    assert index.replace(TEXTS[2], 'Name') == (
+        'Samsonite, Gandalfs and Arwens are not names. Tooky is not Name.')
+    assert index.replace(TEXTS[5], 'Name') == TEXTS[5]
+
+
+def test_containing_matches_regex():
+    index = lotr.NameIndex(NAMES)
+    for value in NAMES[:-1] + ['Gand', 'the', 'Lucky']:
+        value_regex = lotr.get_regex(value)
+        assert index.containing(value) == {
+            name for name in NAMES if name and name != value and
+            re.search(value_regex, name)}
+
+
+def test_similar_names_regex():
+    scratch_names = ['Gandalf the White']
+    assert sorted(lotr.get_similar_names_regex(
+        'Gandalf', NAMES, scratch_names)) == sorted(
+            [r'(?<!\[bi\])' + lotr.get_regex(name)
+             for name in ('Gandalf the Grey', 'Gandalf the White')])
+    assert lotr.get_name_index(NAMES) is lotr.get_name_index(set(NAMES))
@@ -0,0 +1,63 @@
+""" Tests of reading card images from OCTGN image archives.
+"""
+import os
+import zipfile
+
+import pytest
+
+import lotr
+
+
+SET_ID = 'set-1'
+IMAGES = {'card-1.jpg': os.urandom(2048), 'card-2.B.jpg': os.urandom(2048)}
+
+
+@pytest.fixture
+def archive(workdir):
+    """ Make an OCTGN image archive of the set with a few unrelated
+    members.
+    """
+    output_path = os.path.join(lotr.OUTPUT_OCTGN_IMAGES_PATH,
+                               lotr.escape_filename('Set 1.English'))
+    os.makedirs(output_path)
+    archive_path = os.path.join(output_path, 'Set 1.o8c')
+    prefix = '{}/{}/Cards/'.format(lotr.OCTGN_ZIP_PATH, SET_ID)
+    with zipfile.ZipFile(archive_path, 'w') as zip_obj:
+        zip_obj.writestr(prefix, b'')
+        for filename, content in IMAGES.items():
+            zip_obj.writestr(prefix + filename, content,
+                             compress_type=zipfile.ZIP_DEFLATED)
+
+        zip_obj.writestr(prefix + 'Crops/card-1.jpg', b'crop')
+        zip_obj.writestr('{}/set-2/Cards/card-3.jpg'.format(
+            lotr.OCTGN_ZIP_PATH), b'other set')
+
+    return archive_path
+
+
+def test_iter_octgn_images(archive):
+    assert {filename: fobj.read() for filename, fobj
+            in lotr._iter_octgn_images(archive, SET_ID)} == IMAGES  # pylint: disable=W0212
+    assert not list(lotr._iter_octgn_images(archive, 'set-3'))  # pylint: disable=W0212
+
+
+def test_copy_octgn_image_outputs(archive, workdir):
+    destination_path = str(workdir / 'OCTGN')
+    os.makedirs(destination_path)
+    cards_path = os.path.join(destination_path, *(
+        lotr.OCTGN_ZIP_PATH.split('/') + [SET_ID, 'Cards']))
+    os.makedirs(cards_path)
+    with open(os.path.join(cards_path, 'old.jpg'), 'wb') as fobj:
+        fobj.write(b'old')
+
+    lotr.copy_octgn_image_outputs(
+        {'set_ids_octgn_image_destination': [SET_ID],
+         'octgn_image_destination_path': destination_path},
+        [(SET_ID, 'Set 1'), ('set-2', 'Set 2')])
+    assert os.path.exists(os.path.join(destination_path, 'Set 1.o8c'))
+    images = {}
+    for filename in os.listdir(cards_path):
+        with open(os.path.join(cards_path, filename), 'rb') as fobj:
+            images[filename] = fobj.read()
+
+    assert images == IMAGES
@@ -0,0 +1,111 @@
+""" Tests of the project archive.
+"""
+import json
+import os
+import zipfile
+
+import pytest
+
+import lotr
+
+
+FILES = {
+    'project.seproject': b'<project/>' * 100,
+    'Export/png300Bleed/Card-1.set1.English.png': os.urandom(4096),
+    'Export/png300Bleed/Card-2.set1.English.png': os.urandom(4096),
+    'XML/set1.English.xml': b'<set/>',
+    'Messages/card-1.overflow': b''}
+
+
+def _write_files(files):
+    for path, content in files.items():
+        path = os.path.join(lotr.PROJECT_PATH, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as fobj:
+            fobj.write(content)
+
+
+def _read_archive():
+    with zipfile.ZipFile(lotr.SEPROJECT_PATH) as zip_obj:
+        assert zip_obj.testzip() is None
+        return {info.filename[len(lotr.PROJECT_PATH) + 1:]:
+                zip_obj.read(info) for info in zip_obj.infolist()}
+
+
+@pytest.fixture
+def project(workdir, monkeypatch):
+    """ Make the project folder and its archive.
+    """
+    monkeypatch.setattr(lotr, 'SEPROJECT_INDEX', {})
+    _write_files(FILES)
+    lotr.create_project()
+    return workdir
+
+
+def test_create_project(project):
+    assert _read_archive() == FILES
+    with open(lotr.SEPROJECT_MANIFEST_PATH, 'r', encoding='utf-8') as fobj:
+        manifest = json.load(fobj)
+
+    assert len(manifest) == len(FILES)
+    assert not [f for f in os.listdir(lotr.DATA_PATH) if f.endswith('.tmp')]
+
+
+def test_unchanged_members_are_copied(project, monkeypatch):
+    copied = []
+    copy_zip_member = lotr._copy_zip_member  # pylint: disable=W0212
+    monkeypatch.setattr(
+        lotr, '_copy_zip_member',
+        lambda *args: copied.append(args[1].filename) or copy_zip_member(
+            *args))
+    files = dict(FILES, **{
+        'Export/png300Bleed/Card-2.set1.English.png': os.urandom(4096)})
+    _write_files(files)
+    lotr.create_project()
+    assert _read_archive() == files
+    assert sorted(copied) == sorted(
+        '{}/{}'.format(lotr.PROJECT_PATH, path) for path in FILES
+        if not path.endswith('Card-2.set1.English.png'))
+
+
+def test_members_are_extracted(project, tmp_path):
+    members = lotr.get_seproject_index()['images'][
+        (lotr.PNG300BLEED, 'set1', 'English')]
+    assert len(members) == 2
+    with open(lotr.SEPROJECT_PATH, 'rb') as project_obj:
+        for member in members:
+            output_path = str(tmp_path / 'member.png')
+            lotr._copy_seproject_member(project_obj, member, output_path)  # pylint: disable=W0212
+            with open(output_path, 'rb') as fobj:
+                assert fobj.read() == FILES[
+                    member[0][len(lotr.PROJECT_PATH) + 1:]]
+
+
+def test_index_is_built_once(project, monkeypatch):
+    built = []
+    build_seproject_index = lotr._build_seproject_index  # pylint: disable=W0212
+    monkeypatch.setattr(lotr, '_build_seproject_index',
+                        lambda: built.append(1) or build_seproject_index())
+    assert lotr.get_actual_sets() == {('set1', 'English')}
+    assert lotr.get_seproject_index()['messages'] == ['card-1']
+    assert len(built) == 1
+
+    lotr.SEPROJECT_INDEX.clear()
+    assert lotr.get_actual_sets() == {('set1', 'English')}
+    assert len(built) == 1
+
+    _write_files({'XML/set2.French.xml': b'<set/>'})
+    lotr.create_project()
+    assert lotr.get_actual_sets() == {('set1', 'English'),
+                                      ('set2', 'French')}
+    assert len(built) == 2
+
+
+def test_member_crc_is_checked(project, tmp_path):
+    member = lotr.get_seproject_index()['images'][
+        (lotr.PNG300BLEED, 'set1', 'English')][0]
+    member = member[:-1] + (member[-1] ^ 1,)
+    with open(lotr.SEPROJECT_PATH, 'rb') as project_obj:
+        with pytest.raises(zipfile.BadZipFile):
+            lotr._copy_seproject_member(  # pylint: disable=W0212
+                project_obj, member, str(tmp_path / 'member.png'))
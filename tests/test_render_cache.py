@@ -0,0 +1,130 @@
+""" Tests of the render cache.
+"""
+import os
+import re
+import shutil
+import zipfile
+
+import pytest
+from PIL import Image
+
+import lotr
+
+
+SET_ID = 'set1'
+LANG = 'English'
+CONF = {'render_cache': True, 'image_engine': 'pillow', 'parallelism': 1,
+        'magick_path': 'magick', 'gimp_console_path': 'gimp'}
+
+
+def _make_project():
+    """ Make a project archive with rendered PNG 300 dpi images of the set.
+    """
+    with zipfile.ZipFile(lotr.SEPROJECT_PATH, 'w') as zip_obj:
+        for side in ('1', '2'):
+            img = Image.effect_noise((826, 1126), 64).convert('RGB')
+            path = 'card-{}.png'.format(side)
+            img.save(path)
+            zip_obj.write(path, '{}{}/Card-{}.{}.{}.png'.format(
+                lotr.IMAGES_ZIP_PATH, lotr.PNG300BLEED, side, SET_ID, LANG))
+            os.remove(path)
+
+
+def _fake_run_cmd(calls):
+    """ Get a replacement of run_cmd emulating ImageMagick mogrify.
+    """
+    def _run_cmd(cmd, log_prefix=''):  # pylint: disable=W0613
+        calls.append(cmd)
+        folder, extension = re.search(r'"([^"]*)\*\.(png|jpg)"$',
+                                      cmd).groups()
+        for filename in os.listdir(folder):
+            if not filename.endswith('.' + extension):
+                continue
+
+            path = os.path.join(folder, filename)
+            with Image.open(path) as img:
+                img = img.convert('CMYK' if extension == 'jpg' else 'RGB')
+
+            img.save('{}.jpg'.format(path[:-4]), 'JPEG', quality=100,
+                     subsampling=0)
+
+    return _run_cmd
+
+
+def _render(monkeypatch):
+    """ Render the set and return the engine and ImageMagick calls with the
+    outputs.
+    """
+    engine_calls = []
+    magick_calls = []
+    extracted = []
+    transform_image = lotr._transform_image  # pylint: disable=W0212
+    copy_seproject_member = lotr._copy_seproject_member  # pylint: disable=W0212
+    monkeypatch.setattr(
+        lotr, '_transform_image',
+        lambda *args: engine_calls.append(args) or transform_image(*args))
+    monkeypatch.setattr(
+        lotr, '_copy_seproject_member',
+        lambda *args: extracted.append(args) or copy_seproject_member(*args))
+    monkeypatch.setattr(lotr, 'run_cmd', _fake_run_cmd(magick_calls))
+
+    lotr.generate_png300_nobleed(CONF, SET_ID, SET_ID, LANG, [])
+    lotr.generate_jpg300_bleeddtc(CONF, SET_ID, SET_ID, LANG, [])
+    temp_path = os.path.join(lotr.TEMP_ROOT_PATH, 'jpg')
+    lotr.create_folder(temp_path)
+    lotr.clear_folder(temp_path)
+    nobleed_path = os.path.join(lotr.IMAGES_EONS_PATH, lotr.PNG300NOBLEED,
+                                '{}.{}'.format(SET_ID, LANG))
+    for filename in os.listdir(nobleed_path):
+        shutil.copyfile(os.path.join(nobleed_path, filename),
+                        os.path.join(temp_path, filename))
+
+    lotr._make_jpg(CONF, temp_path, lotr.JPG_300_MIN_SIZE, SET_ID, LANG)  # pylint: disable=W0212
+
+    outputs = {}
+    for path in (nobleed_path, temp_path,
+                 os.path.join(lotr.IMAGES_EONS_PATH, lotr.JPG300BLEEDDTC,
+                              '{}.{}'.format(SET_ID, LANG))):
+        for filename in os.listdir(path):
+            with open(os.path.join(path, filename), 'rb') as fobj:
+                outputs[os.path.join(path, filename)] = fobj.read()
+
+    return engine_calls, magick_calls, extracted, outputs
+
+
+@pytest.fixture
+def project(workdir, monkeypatch):
+    """ Use an empty project index for the new project archive.
+    """
+    monkeypatch.setattr(lotr, 'SEPROJECT_INDEX', {})
+    monkeypatch.setattr(lotr, 'CPU_BUDGET', {})
+    for image_format in (lotr.PNG300NOBLEED, lotr.JPG300BLEEDDTC):
+        os.makedirs(os.path.join(lotr.IMAGES_EONS_PATH, image_format))
+
+    _make_project()
+    return workdir
+
+
+def test_second_render_does_no_work(project, monkeypatch):
+    engine_calls, magick_calls, extracted, outputs = _render(monkeypatch)
+    assert len(engine_calls) == 4
+    assert len(magick_calls) == 2
+    assert len(extracted) == 4
+    assert len(outputs) == 8
+
+    engine_calls, magick_calls, extracted, cached_outputs = _render(
+        monkeypatch)
+    assert not engine_calls
+    assert not magick_calls
+    assert not extracted
+    assert cached_outputs == outputs
+
+
+def test_changed_image_is_rendered_again(project, monkeypatch):
+    _render(monkeypatch)
+    os.remove(lotr.SEPROJECT_PATH)
+    _make_project()
+    engine_calls, magick_calls, extracted, _ = _render(monkeypatch)
+    assert len(engine_calls) == 4
+    assert len(magick_calls) == 2
+    assert len(extracted) == 4
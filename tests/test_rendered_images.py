@@ -0,0 +1,116 @@
+""" Tests of downloading rendered images in the Discord bot.
+"""
+import asyncio
+import json
+import os
+import shutil
+import time
+
+import pytest
+
+import discord_bot
+import lotr
+
+
+SET_NAME = 'The Test Set'
+FOLDER = '{}.English'.format(SET_NAME)
+DOWNLOAD_TIME_FILE = os.path.split(lotr.DOWNLOAD_TIME_PATH)[-1]
+IMAGES = ['001-Hero.png', '002-Quest-1.png', '002-Quest-2.png']
+
+pytestmark = pytest.mark.skipif(shutil.which('rclone') is None,
+                                reason='rclone is not installed')
+
+
+@pytest.fixture
+def remote(workdir, monkeypatch):
+    """ Make a local-directory RClone remote with rendered images of the
+    set and record the RClone commands.
+    """
+    os.makedirs(discord_bot.IMAGES_PATH)
+    remote_path = workdir / 'remote'
+    os.makedirs(remote_path / FOLDER)
+    for filename in IMAGES:
+        with open(remote_path / FOLDER / filename, 'wb') as fobj:
+            fobj.write(filename.encode() * 100)
+
+    with open(remote_path / FOLDER / DOWNLOAD_TIME_FILE, 'w',
+              encoding='utf-8') as fobj:
+        fobj.write('2026-10-18 12:00:00')
+
+    monkeypatch.setenv('RCLONE_CONFIG_TESTRENDERED_TYPE', 'local')
+    monkeypatch.setattr(discord_bot, 'CONF', {
+        'rendered_images_remote': 'TestRendered:{}'.format(remote_path)})
+    monkeypatch.setattr(discord_bot, 'RENDERED_IMAGES', {})
+    mails = []
+    monkeypatch.setattr(discord_bot, 'create_mail',
+                        lambda subject, body='': mails.append(subject))
+    commands = []
+    run_shell = discord_bot.run_shell
+
+    async def _run_shell(cmd):
+        commands.append(cmd)
+        return await run_shell(cmd)
+
+    monkeypatch.setattr(discord_bot, 'run_shell', _run_shell)
+    discord_bot.RENDERED_IMAGES[SET_NAME] = {
+        'data': {}, 'download_time_file': DOWNLOAD_TIME_FILE, 'files': {},
+        'ts': time.time()}
+    return commands, mails
+
+
+def _local_path(filename=''):
+    return os.path.join(discord_bot.IMAGES_PATH,
+                        lotr.escape_filename(SET_NAME), filename)
+
+
+def test_list_rendered_images(remote):
+    stdout, _ = asyncio.run(discord_bot.run_shell(
+        discord_bot.RCLONE_RENDERED_FOLDER_CMD.format(
+            discord_bot.get_rendered_images_remote(),
+            lotr.escape_filename(FOLDER))))
+    assert sorted(i['Name'] for i in json.loads(stdout)) == sorted(
+        IMAGES + [DOWNLOAD_TIME_FILE])
+
+
+def test_download_time_file_in_same_batch(remote):
+    commands, mails = remote
+    failed, download_time = asyncio.run(
+        discord_bot.fetch_rendered_card_images(SET_NAME, IMAGES[:2]))
+    assert failed == []
+    assert download_time == '2026-10-18 12:00:00'
+    assert len(commands) == 1
+    assert not mails
+    assert sorted(os.listdir(_local_path())) == sorted(
+        IMAGES[:2] + [DOWNLOAD_TIME_FILE])
+
+    failed, _ = asyncio.run(
+        discord_bot.fetch_rendered_card_images(SET_NAME, IMAGES))
+    assert failed == []
+    assert len(commands) == 2
+    with open(_local_path(IMAGES[2]), 'rb') as fobj:
+        assert fobj.read() == IMAGES[2].encode() * 100
+
+
+def test_partial_failure(remote):
+    commands, mails = remote
+    failed, download_time = asyncio.run(
+        discord_bot.fetch_rendered_card_images(
+            SET_NAME, [IMAGES[0], '003-Missing.png']))
+    assert failed == ['003-Missing.png']
+    assert download_time == '2026-10-18 12:00:00'
+    assert len(commands) == 1
+    assert len(mails) == 1
+    assert os.path.exists(_local_path(IMAGES[0]))
+
+
+def test_expired_images_are_cleared(remote):
+    asyncio.run(discord_bot.fetch_rendered_card_images(SET_NAME, IMAGES))
+    discord_bot.clear_expired_rendered_images()
+    assert SET_NAME in discord_bot.RENDERED_IMAGES
+    assert os.path.exists(_local_path(IMAGES[0]))
+
+    discord_bot.RENDERED_IMAGES[SET_NAME]['ts'] = (
+        time.time() - discord_bot.RENDERED_IMAGES_CACHE_TTL - 1)
+    discord_bot.clear_expired_rendered_images()
+    assert SET_NAME not in discord_bot.RENDERED_IMAGES
+    assert not os.path.exists(_local_path())
@@ -0,0 +1,98 @@
+""" Tests of the sanity check of the spreadsheet.
+"""
+import json
+import logging
+import os
+
+import pytest
+
+from conftest import make_card_rows, make_card_sheet
+import lotr
+
+
+CONF = {'languages': [lotr.L_ENGLISH, lotr.L_FRENCH],
+        'output_languages': [lotr.L_ENGLISH, lotr.L_FRENCH],
+        'ignore_ignore_flags': False, 'selected_only': False,
+        'incremental_extraction': False,
+        'run_sanity_check_for_all_sets': True, 'octgn_o8d': False,
+        'parallelism': 1, 'incremental_sanity_check': False}
+SET_COLUMNS = [lotr.SET_ID, lotr.SET_NAME, lotr.SET_COLLECTION_ICON,
+               lotr.SET_RINGSDB_CODE, lotr.SET_HOB_CODE]
+SETS = [('set-0', 'Set 0'), ('set-1', 'Set 1'), ('set-2', 'Set 2')]
+
+
+@pytest.fixture
+def spreadsheet(workdir, monkeypatch):
+    """ Extract the data of a spreadsheet with sanity check errors and
+    record the rows checked in the main process.
+    """
+    os.makedirs(lotr.DOWNLOAD_PATH)
+    monkeypatch.setattr(lotr, 'JSON_CACHE', {})
+    monkeypatch.setattr(lotr, 'SHEET_CHECKSUMS', {})
+    rows = make_card_rows(60)
+    rows[5][lotr.CARD_DECK_RULES] = 'Unknown deck rules'
+    sheets = {
+        lotr.SET_SHEET: [SET_COLUMNS] + [
+            [set_id, name, None, 1000 + i, 'S{}'.format(i)]
+            for i, (set_id, name) in enumerate(SETS)],
+        lotr.CARD_SHEET: make_card_sheet(rows),
+        lotr.L_FRENCH: make_card_sheet(rows)}
+    for sheet, data in sheets.items():
+        path = os.path.join(lotr.DOWNLOAD_PATH, '{}.json'.format(sheet))
+        with open(path, 'w', encoding='utf-8') as fobj:
+            json.dump(data, fobj)
+
+    lotr.extract_data(CONF)
+    checked = []
+    sanity_check_rows = lotr._sanity_check_rows  # pylint: disable=W0212
+
+    def _sanity_check_rows(conf, rows, *args):
+        checked.append([row[lotr.CARD_ID] for row in rows])
+        return sanity_check_rows(conf, rows, *args)
+
+    monkeypatch.setattr(lotr, '_sanity_check_rows', _sanity_check_rows)
+    return rows, checked
+
+
+def _sanity_check(conf, caplog):
+    caplog.clear()
+    with caplog.at_level(logging.INFO):
+        try:
+            res = lotr.sanity_check(conf, SETS)
+        except lotr.SanityCheckError as exc:
+            res = str(exc)
+
+    return res, [(record.levelno, record.getMessage())
+                 for record in caplog.records
+                 if not record.getMessage().startswith((
+                     '...Performing', 'Checking '))]
+
+
+def test_pool_gives_the_same_result(spreadsheet, caplog, monkeypatch):
+    _, checked = spreadsheet
+    expected = _sanity_check(CONF, caplog)
+    assert 'Missing cost for row #2' in expected[0]
+    assert len(checked) == 1
+
+    monkeypatch.setattr(lotr, 'SANITY_CHECK_MIN_ROWS_PER_PROCESS', 10)
+    assert _sanity_check(dict(CONF, parallelism=3), caplog) == expected
+    assert len(checked) == 1
+
+
+def test_only_changed_rows_are_checked(spreadsheet, caplog):
+    rows, checked = spreadsheet
+    conf = dict(CONF, incremental_sanity_check=True)
+    expected = _sanity_check(CONF, caplog)
+    assert _sanity_check(conf, caplog) == expected
+    assert len(checked[-1]) == 60
+
+    assert _sanity_check(conf, caplog) == expected
+    assert checked[-1] == [rows[5][lotr.CARD_ID]]
+
+    row = [r for r in lotr.DATA if r[lotr.CARD_ID] == rows[0][lotr.CARD_ID]]
+    row[0][lotr.CARD_COST] = 1
+    res = _sanity_check(conf, caplog)
+    assert checked[-1] == [rows[0][lotr.CARD_ID],
+                               rows[5][lotr.CARD_ID]]
+    assert 'Missing cost for row #2,' not in res[0]
+    assert res == _sanity_check(CONF, caplog)
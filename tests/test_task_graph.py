@@ -0,0 +1,93 @@
+""" Tests of scheduling the run_after_se task graph.
+"""
+import os
+import time
+
+import pytest
+
+import lotr
+import run_after_se
+
+
+def record_task(path, name):
+    """ Append the task name to a file.
+    """
+    with open(path, 'a', encoding='utf-8') as fobj:
+        fobj.write('{}\n'.format(name))
+
+
+def failing_task(path, name):
+    """ Fail after a while.
+    """
+    time.sleep(0.2)
+    record_task(path, name)
+    raise ValueError(name)
+
+
+@pytest.fixture
+def tasks(workdir, monkeypatch):
+    """ Use the given task durations instead of the timing history and
+    return the file with the names of the finished tasks.
+    """
+    monkeypatch.setattr(lotr, 'TIMINGS', {})
+    monkeypatch.setattr(lotr, 'CPU_BUDGET', {})
+    durations = {}
+    monkeypatch.setattr(lotr, 'get_step_durations',
+                        lambda script: durations)
+    return str(workdir / 'tasks.txt'), durations
+
+
+def _read_tasks(path):
+    if not os.path.exists(path):
+        return []
+
+    with open(path, 'r', encoding='utf-8') as fobj:
+        return fobj.read().splitlines()
+
+
+def test_priorities_follow_longest_chain():
+    graph = {('a', 's1', None): {}, ('b', 's1', None): {},
+             ('c', 's1', None): {}, ('a', 's2', None): {}}
+    children = {('a', 's1', None): [('b', 's1', None), ('c', 's1', None)],
+                ('b', 's1', None): [], ('c', 's1', None): [],
+                ('a', 's2', None): []}
+    durations = {('a', 's1', None): 10, ('b', 's1', None): 5,
+                 ('b', 's0', None): 25}
+    assert run_after_se.get_priorities(graph, children, durations) == {
+        ('a', 's1', None): 10 + run_after_se.DEFAULT_TASK_DURATION,
+        ('b', 's1', None): 5,
+        ('c', 's1', None): run_after_se.DEFAULT_TASK_DURATION,
+        ('a', 's2', None): 10}
+
+
+def test_tasks_run_in_dependency_and_priority_order(tasks):
+    path, durations = tasks
+    graph = {}
+    short = run_after_se.add_task(graph, [record_task, path, 'short'],
+                                  'short')
+    first = run_after_se.add_task(graph, [record_task, path, 'first'],
+                                  'first')
+    run_after_se.add_task(graph, [record_task, path, 'second'], 'second',
+                          deps=[first, None])
+    run_after_se.add_task(graph, [record_task, path, 'last'], 'last',
+                          deps=[short, first])
+    durations.update({short: 5, first: 1,
+                      ('record_task', 'second', None): 10,
+                      ('record_task', 'last', None): 1})
+    run_after_se.execute_tasks({'parallelism': 1}, graph)
+    assert _read_tasks(path) == ['first', 'second', 'short', 'last']
+
+
+def test_failed_task_stops_scheduling(tasks):
+    path, _ = tasks
+    graph = {}
+    failed = run_after_se.add_task(graph, [failing_task, path, 'failed'],
+                                   'failed')
+    run_after_se.add_task(graph, [record_task, path, 'skipped'], 'skipped',
+                          deps=[failed])
+    run_after_se.add_task(graph, [record_task, path, 'independent'],
+                          'independent')
+    with pytest.raises(ValueError):
+        run_after_se.execute_tasks({'parallelism': 2}, graph)
+
+    assert sorted(_read_tasks(path)) == ['failed', 'independent']
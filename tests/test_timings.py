@@ -0,0 +1,85 @@
+""" Tests of the timing history and its critical path report.
+"""
+import sqlite3
+import time
+
+import pytest
+
+import lotr
+import run_after_se
+import timings_report
+
+
+STEP_DURATIONS = {'a': 0.05, 'b': 0.3, 'c': 0.05, 'd': 0.05}
+
+
+def sleep_step(set_id):
+    """ Sleep for the duration of the step.
+    """
+    time.sleep(STEP_DURATIONS[set_id])
+
+
+@pytest.fixture
+def timings(workdir, monkeypatch):
+    """ Start a new run with an empty timing history.
+    """
+    monkeypatch.setattr(lotr, 'TIMINGS', {})
+    monkeypatch.setattr(lotr, 'CPU_BUDGET', {})
+    return lotr.start_timings('run_after_se')
+
+
+def _get_records(run_id):
+    connection = sqlite3.connect(lotr.TIMINGS_PATH)
+    connection.row_factory = sqlite3.Row
+    try:
+        return timings_report._get_records(connection, run_id)  # pylint: disable=W0212
+    finally:
+        connection.close()
+
+
+def test_steps_depend_on_previous_step(timings):
+    lotr.timed_step(sleep_step, 'a')
+    lotr.timed_step(sleep_step, 'c')
+    first, second = _get_records(timings)
+    assert first['deps'] == '[]'
+    assert second['deps'] == '["{}"]'.format(first['step_id'])
+
+
+def test_critical_path_follows_task_graph(timings, capsys):
+    lotr.timed_step(sleep_step, 'c')
+    graph = {}
+    task_a = run_after_se.add_task(graph, [sleep_step, 'a'], 'a')
+    run_after_se.add_task(graph, [sleep_step, 'b'], 'b', deps=[task_a])
+    task_c = run_after_se.add_task(graph, [sleep_step, 'c'], 'c',
+                                   deps=[task_a])
+    run_after_se.add_task(graph, [sleep_step, 'd'], 'd', deps=[task_c])
+    run_after_se.execute_tasks({'parallelism': 1}, graph)
+    lotr.timed_step(sleep_step, 'd')
+
+    records = _get_records(timings)
+    assert len(records) == 6
+    capsys.readouterr()
+    timings_report.report_critical_path(records)
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split()[-1] for line in lines[1:-1]] == [
+        '[c]', '[a]', '[b]', '[d]']
+
+
+def test_critical_path_of_old_history(workdir, capsys):
+    connection = sqlite3.connect(lotr.TIMINGS_PATH)
+    connection.execute("""CREATE TABLE timings (
+        run_id TEXT, script TEXT, step TEXT, set_id TEXT, lang TEXT,
+        inputs INTEGER, bytes INTEGER, started REAL, finished REAL,
+        wall REAL, cpu REAL, status TEXT)""")
+    connection.execute(
+        """INSERT INTO timings VALUES ('run', 'run_after_se', 'step', NULL,
+        NULL, NULL, NULL, 1, 2, 1, 1, 'ok')""")
+    connection.commit()
+    connection.close()
+
+    lotr._connect_timings().close()  # pylint: disable=W0212
+    records = _get_records('run')
+    assert records[0]['step_id'] is None
+    timings_report.report_critical_path(records)
+    assert capsys.readouterr().out.splitlines() == ['Critical path:',
+                                                    '  None']
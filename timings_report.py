@@ -0,0 +1,176 @@
+""" Report of the workflow step timings saved to the timing history.
+"""
+import json
+import os
+import sqlite3
+import statistics
+import sys
+
+import lotr
+
+
+LIMIT = 20
+REGRESSION_RATIO = 1.5
+REGRESSION_MIN_DIFF = 5
+SCRIPTS = ('run_before_se', 'run_after_se')
+
+
+def _format_step(row):
+    """ Format the step name with its set and language.
+    """
+    name = row['step']
+    if row['set_id']:
+        name = '{} [{}{}]'.format(
+            name, row['set_id'],
+            ', {}'.format(row['lang']) if row['lang'] else '')
+
+    return name
+
+
+def _format_bytes(value):
+    """ Format the number of bytes.
+    """
+    if not value:
+        return '-'
+
+    return '{}MB'.format(round(value / 1048576, 1))
+
+
+def _get_runs(connection, script):
+    """ Get IDs of the runs of the script, the latest first.
+    """
+    rows = connection.execute(
+        """SELECT run_id FROM timings WHERE script = ?
+        GROUP BY run_id ORDER BY MAX(started) DESC""", (script,)).fetchall()
+    return [row['run_id'] for row in rows]
+
+
+def _get_records(connection, run_id):
+    """ Get all records of the run.
+    """
+    return connection.execute(
+        'SELECT * FROM timings WHERE run_id = ? ORDER BY started',
+        (run_id,)).fetchall()
+
+
+def report_slowest(records, limit):
+    """ Print the slowest steps of the run.
+    """
+    print('Slowest steps:')
+    for row in sorted(records, key=lambda r: r['wall'], reverse=True)[:limit]:
+        print('  {:>9}s wall {:>9}s CPU {:>6} input(s) {:>9}  {}{}'.format(
+            row['wall'], row['cpu'], row['inputs'] or '-',
+            _format_bytes(row['bytes']), _format_step(row),
+            '' if row['status'] == 'ok' else ' ({})'.format(row['status'])))
+
+
+def report_regressions(connection, script, runs, records):
+    """ Print the steps of the run that were much slower than the median of
+    the previous runs.
+    """
+    baseline_runs = runs[1:lotr.TIMINGS_BASELINE_RUNS + 1]
+    baseline = {}
+    if baseline_runs:
+        rows = connection.execute(
+            """SELECT step, set_id, lang, wall FROM timings
+            WHERE script = ? AND status = 'ok' AND run_id IN ({})""".format(
+                ', '.join('?' for _ in baseline_runs)),
+            [script] + baseline_runs).fetchall()
+        for row in rows:
+            baseline.setdefault((row['step'], row['set_id'], row['lang']),
+                                []).append(row['wall'])
+
+    print('Regressions against the median of {} previous run(s):'.format(
+        len(baseline_runs)))
+    found = False
+    for row in records:
+        walls = baseline.get((row['step'], row['set_id'], row['lang']))
+        if not walls or row['status'] != 'ok':
+            continue
+
+        median = statistics.median(walls)
+        if (row['wall'] > median * REGRESSION_RATIO and
+                row['wall'] - median > REGRESSION_MIN_DIFF):
+            found = True
+            print('  {:>9}s instead of {}s  {}'.format(
+                row['wall'], round(median, 3), _format_step(row)))
+
+    if not found:
+        print('  None')
+
+
+def report_critical_path(records):
+    """ Print the critical path of the run: the longest chain of dependent
+    steps, weighted by their wall time.
+    """
+    print('Critical path:')
+    steps = {row['step_id']: row for row in records
+             if 'step_id' in row.keys() and row['step_id']}
+    if not steps:
+        print('  None')
+        return
+
+    lengths = {}
+    previous = {}
+    for step_id, row in sorted(steps.items(),
+                               key=lambda item: item[1]['started']):
+        deps = [dep for dep in json.loads(row['deps'] or '[]')
+                if dep in lengths]
+        dep = max(deps, key=lambda d: lengths[d]) if deps else None
+        lengths[step_id] = row['wall'] + (lengths[dep] if dep else 0)
+        previous[step_id] = dep
+
+    step_id = max(lengths, key=lambda s: lengths[s])
+    path = []
+    while step_id:
+        path.append(steps[step_id])
+        step_id = previous[step_id]
+
+    path.reverse()
+    for row in path:
+        print('  {:>9}s  {}'.format(row['wall'], _format_step(row)))
+
+    print('  Total: {}s of steps, {}s of the run'.format(
+        round(lengths[path[-1]['step_id']], 3),
+        round(max(r['finished'] for r in records) -
+              min(r['started'] for r in records), 3)))
+
+
+def timings_report(scripts, limit):
+    """ Print the report for the last run of each script.
+    """
+    if not os.path.exists(lotr.TIMINGS_PATH):
+        print('No timing history found in {}'.format(lotr.TIMINGS_PATH))
+        return
+
+    connection = sqlite3.connect(lotr.TIMINGS_PATH)
+    connection.row_factory = sqlite3.Row
+    try:
+        for script in scripts:
+            runs = _get_runs(connection, script)
+            if not runs:
+                print('{}: no runs found\n'.format(script))
+                continue
+
+            records = _get_records(connection, runs[0])
+            print('{}: last run {}, {} step(s)'.format(script, runs[0],
+                                                       len(records)))
+            report_slowest(records, limit)
+            report_regressions(connection, script, runs, records)
+            report_critical_path(records)
+            print('')
+    finally:
+        connection.close()
+
+
+def main():
+    """ Main function.
+    """
+    scripts = [sys.argv[1]] if len(sys.argv) > 1 else SCRIPTS
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else LIMIT
+    timings_report(scripts, limit)
+
+
+if __name__ == '__main__':
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    main()